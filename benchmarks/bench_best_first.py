@@ -0,0 +1,129 @@
+"""Best-first keyword crawl vs. BFS: how soon relevant pages are reached on a generated docs site.
+
+The fixture site puts every page under a topic path (/docs/{topic}/...), and the pages under
+the target keyword's topic count as relevant. For each strategy the benchmark records in which
+order pages were fetched and how many pages (and seconds) it took to reach 50%, 90% and all of
+the relevant pages.
+
+Run with:
+    uv run python benchmarks/bench_best_first.py --pages 781 --keyword authentication
+    uv run python benchmarks/bench_best_first.py --budget 200 --delay 0.01 --output best-first.json
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import math
+import sys
+import tempfile
+import time
+from pathlib import Path
+from urllib.parse import urlparse
+
+from fixture_site import FixtureServer, FixtureSite
+
+from crawl4ai_mcp_server.core import crawl_documentation
+from crawl4ai_mcp_server.strategies.http import FETCH_MODES
+
+TOPICS = ("authentication", "billing", "webhooks", "deployment", "sdk")
+MILESTONES = (0.5, 0.9, 1.0)
+
+
+async def _crawl(server: FixtureServer, args, strategy: str, score_threshold: float | None = None) -> dict:
+    site = server.site
+    relevant = {site.path(i) for i in range(site.pages) if site.topic(i) == args.keyword}
+    # (처리 순서, 경과 시간) - 관련 페이지가 처리될 때마다 기록
+    reached: list[tuple[int, float]] = []
+    processed = 0
+
+    async def on_progress(record, progress) -> None:
+        nonlocal processed
+        if record is None:
+            return
+        processed += 1
+        if urlparse(record["url"]).path in relevant:
+            reached.append((processed, time.perf_counter() - start))
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        start = time.perf_counter()
+        results = await crawl_documentation(
+            server.url(site.path(0)),
+            output_dir=output_dir,
+            max_pages=args.budget or site.pages,
+            max_depth=site.max_depth,
+            strategy=strategy,
+            keywords=[args.keyword] if strategy == "best_first" else None,
+            score_threshold=score_threshold,
+            mode=args.mode,
+            on_progress=on_progress,
+        )
+        elapsed = time.perf_counter() - start
+        top = [urlparse(record["url"]).path in relevant for record in results[: len(relevant)]]
+
+    milestones = {}
+    for fraction in MILESTONES:
+        needed = math.ceil(len(relevant) * fraction)
+        key = f"{int(fraction * 100)}%"
+        if len(reached) >= needed:
+            pages, seconds = reached[needed - 1]
+            milestones[key] = {"pages_fetched": pages, "elapsed_s": round(seconds, 3)}
+        else:
+            milestones[key] = None
+
+    return {
+        "pages": len(results),
+        "relevant_found": len(reached),
+        "elapsed_s": round(elapsed, 3),
+        "reached": milestones,
+        # 반환된 결과 앞쪽 (관련 페이지 수만큼) 중 관련 페이지 비율 (best_first는 점수순)
+        "top_precision": round(sum(top) / len(top), 3) if top else None,
+    }
+
+
+async def run(args) -> dict:
+    site = FixtureSite(pages=args.pages, fanout=args.fanout, page_size=args.page_size, noise=args.noise, topics=TOPICS)
+    relevant = sum(1 for i in range(site.pages) if site.topic(i) == args.keyword)
+    report = {
+        "site": {"pages": site.pages, "fanout": site.fanout, "max_depth": site.max_depth, "delay_s": args.delay},
+        "keyword": args.keyword,
+        "relevant_pages": relevant,
+        "budget": args.budget or site.pages,
+        "mode": args.mode,
+        "strategies": {},
+    }
+    runs = [("bfs", "bfs", None), ("best_first", "best_first", None)]
+    if args.score_threshold is not None:
+        runs.append((f"best_first (score >= {args.score_threshold})", "best_first", args.score_threshold))
+
+    # 크롤러의 진행 출력이 JSON 결과와 섞이지 않도록 stderr로 보냄
+    with contextlib.redirect_stdout(sys.stderr):
+        for name, strategy, score_threshold in runs:
+            with FixtureServer(site, delay=args.delay) as server:
+                report["strategies"][name] = await _crawl(server, args, strategy, score_threshold)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=781, help="사이트 전체 페이지 수")
+    parser.add_argument("--fanout", type=int, default=5, help="페이지당 하위 페이지 링크 수")
+    parser.add_argument("--page-size", type=int, default=20, help="페이지당 본문 문단 수")
+    parser.add_argument("--noise", type=int, default=20, help="네비게이션/푸터 링크 수")
+    parser.add_argument("--delay", type=float, default=0.0, help="서버 응답 지연(초)")
+    parser.add_argument("--keyword", choices=TOPICS, default="authentication", help="관련 페이지를 정할 주제")
+    parser.add_argument("--budget", type=int, default=0, help="최대 크롤링 페이지 수 (0이면 사이트 전체)")
+    parser.add_argument("--score-threshold", type=float, default=0.1, help="조기 종료 비교용 best_first 점수 하한")
+    parser.add_argument("--mode", choices=FETCH_MODES, default="http", help="가져오기 방식")
+    parser.add_argument("--output", help="JSON 결과를 저장할 파일")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
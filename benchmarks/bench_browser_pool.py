@@ -0,0 +1,103 @@
+"""Cold-start vs. warm-pool latency benchmark for crawl_single_page.
+
+Run with:
+    uv run python benchmarks/bench_browser_pool.py --requests 10
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from crawl4ai_mcp_server.configs.browser import FAST_CONFIG
+from crawl4ai_mcp_server.core import crawl_single_page
+from crawl4ai_mcp_server.pool import BrowserPool
+
+PAGE = (
+    "<html><head><title>Bench</title></head><body>"
+    "<nav><a href='/'>Home</a></nav>"
+    "<main><h1>Benchmark page</h1>" + "<p>Lorem ipsum dolor sit amet.</p>" * 200 + "</main>"
+    "</body></html>"
+).encode()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(PAGE)))
+        self.end_headers()
+        self.wfile.write(PAGE)
+
+    def log_message(self, *args):
+        pass
+
+
+def _summary(latencies: list[float]) -> dict:
+    ordered = sorted(latencies)
+    return {
+        "mean_s": round(statistics.mean(ordered), 4),
+        "p50_s": round(ordered[len(ordered) // 2], 4),
+        "max_s": round(ordered[-1], 4),
+    }
+
+
+async def run(url: str, requests: int, pool_size: int) -> dict:
+    cold = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        await crawl_single_page(url, browser_config=FAST_CONFIG)
+        cold.append(time.perf_counter() - start)
+
+    pool = BrowserPool(size=pool_size)
+    try:
+        # 첫 호출은 브라우저 실행 비용을 포함하므로 별도로 기록
+        start = time.perf_counter()
+        await crawl_single_page(url, browser_config=FAST_CONFIG, pool=pool)
+        first = time.perf_counter() - start
+
+        warm = []
+        for _ in range(requests):
+            start = time.perf_counter()
+            await crawl_single_page(url, browser_config=FAST_CONFIG, pool=pool)
+            warm.append(time.perf_counter() - start)
+    finally:
+        await pool.close()
+
+    return {
+        "requests": requests,
+        "cold": _summary(cold),
+        "pool_first_call_s": round(first, 4),
+        "warm": _summary(warm),
+        "speedup_p50": round(_summary(cold)["p50_s"] / _summary(warm)["p50_s"], 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="크롤링할 URL (기본: 로컬 테스트 서버)")
+    parser.add_argument("--requests", type=int, default=10)
+    parser.add_argument("--pool-size", type=int, default=1)
+    args = parser.parse_args()
+
+    server = None
+    url = args.url
+    if url is None:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_port}/"
+
+    try:
+        report = asyncio.run(run(url, args.requests, args.pool_size))
+    finally:
+        if server is not None:
+            server.shutdown()
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
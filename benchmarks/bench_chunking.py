@@ -0,0 +1,103 @@
+"""Token-budgeted crawl_page: response size and time for very large pages, whole vs. chunked.
+
+Pages shaped like API references (many headed sections with paragraphs and code blocks) are
+returned by ``crawl_page`` with the fetch replaced by the generated markdown, once with
+``max_tokens=0`` (previous behaviour, whole page) and once with the default budget. The
+report lists response tokens, time to build the response (chunking included) and how many
+``get_chunk`` calls read the rest of the page.
+
+Run with:
+    uv run python benchmarks/bench_chunking.py
+    uv run python benchmarks/bench_chunking.py --sizes 100000 1000000 4000000 --max-tokens 8000
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import re
+import time
+from pathlib import Path
+from unittest import mock
+
+from crawl4ai_mcp_server import core, server
+from crawl4ai_mcp_server.chunking import ChunkCache, estimate_tokens
+
+_WORDS = (
+    "crawler browser markdown page config strategy depth filter cache request response "
+    "session context element selector render document section example install usage"
+).split()
+_CONTINUE_RE = re.compile(r'chunk_id="([^"]+)"\)\]$')
+
+
+def _page(size: int) -> str:
+    rng = random.Random(size)
+    parts, length, n = ["# API Reference"], 0, 0
+    while length < size:
+        part = f"## method_{n}\n\n" + " ".join(rng.choices(_WORDS, k=80)) + "."
+        if n % 3 == 0:
+            part += f"\n\n```python\nclient.method_{n}(depth=2, cache=True)\n```"
+        parts.append(part)
+        length += len(part)
+        n += 1
+    return "\n\n".join(parts)
+
+
+async def _bench(markdown: str, max_tokens: int) -> dict:
+    ctx = mock.MagicMock()
+    ctx.request_context.lifespan_context.chunks = ChunkCache()
+    url = "https://docs.example.com/api"
+
+    async def fetch(*args, **kwargs):
+        return markdown
+
+    with mock.patch.object(core, "crawl_single_page", fetch):
+        start = time.perf_counter()
+        whole = await server.crawl_page(url, max_tokens=0, ctx=ctx)
+        whole_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        first = await server.crawl_page(url, max_tokens=max_tokens, ctx=ctx)
+        first_s = time.perf_counter() - start
+
+    calls, response, timings = 0, first, []
+    while match := _CONTINUE_RE.search(response):
+        start = time.perf_counter()
+        response = await server.get_chunk(url, match.group(1), max_tokens=max_tokens, ctx=ctx)
+        timings.append(time.perf_counter() - start)
+        calls += 1
+
+    return {
+        "page_tokens": estimate_tokens(markdown),
+        "whole": {"response_tokens": estimate_tokens(whole), "ms": round(whole_s * 1000, 3)},
+        "chunked": {
+            "response_tokens": estimate_tokens(first),
+            "ms": round(first_s * 1000, 3),
+            "get_chunk_calls_to_read_all": calls,
+            "get_chunk_ms_mean": round(sum(timings) / len(timings) * 1000, 3) if timings else None,
+        },
+    }
+
+
+async def run(args) -> dict:
+    report = {"max_tokens": args.max_tokens, "pages": {}}
+    for size in args.sizes:
+        report["pages"][str(size)] = await _bench(_page(size), args.max_tokens)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[20_000, 200_000, 2_000_000], help="페이지 크기(문자 수)")
+    parser.add_argument("--max-tokens", type=int, default=4000, help="crawl_page/get_chunk의 토큰 예산")
+    parser.add_argument("--output", help="JSON 결과를 저장할 파일")
+    args = parser.parse_args()
+
+    text = json.dumps(asyncio.run(run(args)), indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""Navigation cleaner benchmark: golden-corpus equivalence and speed vs. the previous implementation.
+
+Run with:
+    uv run python benchmarks/bench_cleaner.py --lines 5000
+    uv run python benchmarks/bench_cleaner.py --corpus output/docs_crawl4ai_com
+"""
+
+import argparse
+import json
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+from crawl4ai_mcp_server.strategies.content import clean_navigation_content
+
+
+def legacy_clean_navigation_content(markdown: str) -> str:
+    """이전 구현 (골든 출력 기준)"""
+    lines = markdown.split("\n")
+    content_start = 0
+    content_end = len(lines)
+
+    for i, line in enumerate(lines):
+        stripped = line.strip()
+        if not stripped or stripped.startswith("*") or stripped.startswith("["):
+            continue
+        if stripped.startswith("#") and i > 0:
+            content_start = i
+            break
+
+    footer_patterns = [
+        r"Was this page helpful\?",
+        r"ON THIS PAGE",
+        r"\[Next\s+.*\]",
+        r"\[Previous\s+.*\]",
+        r"Community Forum",
+        r"Discord Server",
+        r"GitHub Samples",
+        r"FigJam.*Enterprise.*Learn",
+    ]
+
+    for i in range(len(lines) - 1, content_start, -1):
+        line = lines[i]
+        for pattern in footer_patterns:
+            if re.search(pattern, line):
+                content_end = i
+                break
+        if content_end < len(lines):
+            break
+
+    result = "\n".join(lines[content_start:content_end]).strip()
+    result = re.sub(r"\n{3,}", "\n\n", result)
+    return result
+
+
+# 코퍼스 생성에 쓰는 줄 (네비게이션, 본문, 푸터 마커, 공백 변형)
+_LINES = [
+    "",
+    "",
+    "   ",
+    "\t",
+    "\r",
+    "* [Home](/)",
+    "  * [Guides](/guides)",
+    "[Skip to content](#main)",
+    "# Title",
+    "## Section",
+    "  ### Indented heading",
+    "　# Full-width space heading",
+    "#no-space heading",
+    "Plain paragraph text with `code` and **bold**.",
+    "Lorem ipsum dolor sit amet, consectetur adipiscing elit.",
+    "```python",
+    "print('hello')",
+    "```",
+    "Was this page helpful?",
+    "ON THIS PAGE",
+    "[Next Getting started](/next)",
+    "[Previous Install](/prev)",
+    "[Next\tpage](/x)",
+    "[Nextpage](/x)",
+    "Community Forum",
+    "Join our Discord Server",
+    "GitHub Samples",
+    "FigJam | Enterprise | Learn",
+    "Enterprise FigJam Learn",
+]
+
+
+def golden_corpus(documents: int, seed: int = 0) -> list[str]:
+    """경계 사례와 무작위 문서로 이루어진 골든 코퍼스"""
+    corpus = [
+        "",
+        "\n",
+        "# Only heading",
+        "# First\n## Second\nbody",
+        "intro\n# Heading\nbody\nWas this page helpful?\nfooter",
+        "# Heading\nWas this page helpful?",
+        "nav\n\n\n\n# Heading\n\n\n\nbody\n\n\n\n",
+        "* [a](/a)\n# H\ntext [Next  step](/n) trailing\nmore\n[Previous x]\n",
+        "no heading at all\nCommunity Forum\nlast line",
+        "\r\n# CRLF heading\r\nbody\r\nON THIS PAGE\r\n",
+    ]
+    rng = random.Random(seed)
+    for _ in range(documents):
+        size = rng.randint(1, 60)
+        corpus.append("\n".join(rng.choice(_LINES) for _ in range(size)))
+    return corpus
+
+
+def large_page(lines: int) -> str:
+    """네비게이션, 긴 본문, 푸터로 이루어진 큰 문서"""
+    header = ["* [Home](/)", "* [Docs](/docs)", "[Skip to content](#main)", ""]
+    body = []
+    for i in range(lines):
+        if i % 40 == 0:
+            body.append(f"## Section {i // 40}")
+        body.append(f"Paragraph {i}: Lorem ipsum dolor sit amet, consectetur adipiscing elit.")
+        if i % 7 == 0:
+            body.append("")
+    footer = ["", "Was this page helpful?", "Yes No", "[Next Install](/install)", "Community Forum"]
+    return "\n".join(header + ["# Large page"] + body + footer)
+
+
+def _time(func, text: str, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(text)
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=5000, help="큰 문서의 본문 줄 수")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--documents", type=int, default=2000, help="무작위로 생성할 코퍼스 문서 수")
+    parser.add_argument("--corpus", help="추가로 비교할 마크다운 파일 디렉토리 (예: 크롤링 출력)")
+    args = parser.parse_args()
+
+    corpus = golden_corpus(args.documents)
+    if args.corpus:
+        corpus += [path.read_text(encoding="utf-8") for path in sorted(Path(args.corpus).rglob("*.md"))]
+
+    mismatches = [i for i, text in enumerate(corpus) if clean_navigation_content(text) != legacy_clean_navigation_content(text)]
+
+    page = large_page(args.lines)
+    no_footer = page.rsplit("\nWas this page helpful?", 1)[0]
+    report = {"corpus_documents": len(corpus), "mismatches": len(mismatches)}
+    for name, text in (("large_page", page), ("large_page_no_footer", no_footer)):
+        legacy = _time(legacy_clean_navigation_content, text, args.repeat)
+        current = _time(clean_navigation_content, text, args.repeat)
+        report[name] = {
+            "bytes": len(text),
+            "legacy_ms": round(legacy * 1000, 3),
+            "current_ms": round(current * 1000, 3),
+            "speedup": round(legacy / current, 2),
+        }
+    report["corpus"] = {
+        "legacy_ms": round(sum(_time(legacy_clean_navigation_content, t, 1) for t in corpus) * 1000, 2),
+        "current_ms": round(sum(_time(clean_navigation_content, t, 1) for t in corpus) * 1000, 2),
+    }
+
+    print(json.dumps(report, indent=2))
+    if mismatches:
+        print(f"❌ {len(mismatches)} documents differ from the previous implementation (first: #{mismatches[0]})", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""Packed corpus vs. one markdown file per page: write throughput, bulk/random reads and disk usage.
+
+Pages are generated like the fixture site's cleaned markdown and written with the same code
+paths the crawler uses (``_save_markdown`` with a ``FilePathRegistry`` for per-page files,
+``CorpusWriter.append`` for the packed corpus) from ``--threads`` threads, like the crawler's
+writer stage. Reads are measured with a warm page cache unless ``--cold`` is given, which drops
+the OS page cache before each read pass (Linux, needs root). Use ``--dir`` to measure on a
+network filesystem.
+
+Run with:
+    uv run python benchmarks/bench_corpus.py --pages 20000
+    sudo uv run python benchmarks/bench_corpus.py --pages 20000 --cold
+    uv run python benchmarks/bench_corpus.py --pages 5000 --dir /mnt/nfs/tmp --output corpus.json
+"""
+
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from crawl4ai_mcp_server.core import _save_markdown
+from crawl4ai_mcp_server.corpus import CorpusReader, CorpusWriter, iter_corpus
+from crawl4ai_mcp_server.utils.path import FilePathRegistry
+
+_WORDS = (
+    "crawler browser markdown page config strategy depth filter cache request response "
+    "session context element selector render document section example install usage"
+).split()
+
+
+def _pages(count: int, page_size: int) -> list[tuple[str, str]]:
+    rng = random.Random(0)
+    pages = []
+    for i in range(count):
+        body = "\n\n".join(
+            f"## Section {n}" if n % 10 == 0 else " ".join(rng.choices(_WORDS, k=40)) + "."
+            for n in range(page_size)
+        )
+        pages.append((f"https://docs.example.com/docs/section{i // 50}/page{i}", f"# Page {i}\n\n{body}"))
+    return pages
+
+
+def _disk_usage(paths) -> int:
+    return sum(path.stat().st_blocks * 512 for path in paths)
+
+
+def _drop_caches(cold: bool) -> None:
+    if cold:
+        os.sync()
+        Path("/proc/sys/vm/drop_caches").write_text("3\n")
+
+
+def _write_all(write, pages, threads: int) -> float:
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(lambda page: write(*page), pages, chunksize=64))
+    return time.perf_counter() - start
+
+
+def _bench_markdown(pages, base: Path, lookups: list[str], args) -> dict:
+    output_path = base / "markdown"
+    paths = FilePathRegistry(output_path)
+    write = _write_all(lambda url, markdown: _save_markdown(url, markdown, output_path, paths), pages, args.threads)
+
+    _drop_caches(args.cold)
+    start = time.perf_counter()
+    read_bytes = sum(len(path.read_text(encoding="utf-8")) for path in output_path.rglob("*.md"))
+    bulk = time.perf_counter() - start
+
+    _drop_caches(args.cold)
+    start = time.perf_counter()
+    for url in lookups:
+        paths.path_for(url).read_text(encoding="utf-8")
+    lookup = time.perf_counter() - start
+
+    return {
+        "files": len(pages),
+        "disk_bytes": _disk_usage(output_path.rglob("*.md")),
+        "write_pages_per_s": round(len(pages) / write),
+        "bulk_read_pages_per_s": round(len(pages) / bulk),
+        "random_reads_per_s": round(len(lookups) / lookup),
+        "chars_read": read_bytes,
+    }
+
+
+def _bench_packed(pages, base: Path, lookups: list[str], args) -> dict:
+    output_path = base / "packed"
+    start = time.perf_counter()
+    with CorpusWriter(output_path) as corpus:
+        _write_all(corpus.append, pages, args.threads)
+        codec = corpus.codec
+    write = time.perf_counter() - start
+
+    _drop_caches(args.cold)
+    start = time.perf_counter()
+    read_bytes = sum(len(markdown) for _, markdown in iter_corpus(output_path))
+    bulk = time.perf_counter() - start
+
+    _drop_caches(args.cold)
+    start = time.perf_counter()
+    with CorpusReader(output_path) as corpus:
+        for url in lookups:
+            corpus.get(url)
+    lookup = time.perf_counter() - start
+
+    return {
+        "files": 2,
+        "codec": "zstd" if codec == 2 else "zlib",
+        "disk_bytes": _disk_usage(output_path.iterdir()),
+        "write_pages_per_s": round(len(pages) / write),
+        "bulk_read_pages_per_s": round(len(pages) / bulk),
+        "random_reads_per_s": round(len(lookups) / lookup),
+        "chars_read": read_bytes,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=20000, help="저장할 페이지 수")
+    parser.add_argument("--page-size", type=int, default=20, help="페이지당 문단 수")
+    parser.add_argument("--threads", type=int, default=4, help="쓰기 스레드 수 (크롤러 writer 단계와 같은 기본값)")
+    parser.add_argument("--lookups", type=int, default=2000, help="URL 임의 조회 횟수")
+    parser.add_argument("--cold", action="store_true", help="읽기 측정 전마다 OS 페이지 캐시 비우기 (Linux, root 필요)")
+    parser.add_argument("--dir", help="측정할 파일 시스템의 디렉토리 (기본: 임시 디렉토리)")
+    parser.add_argument("--output", help="JSON 결과를 저장할 파일")
+    args = parser.parse_args()
+
+    pages = _pages(args.pages, args.page_size)
+    lookups = [url for url, _ in random.Random(1).choices(pages, k=args.lookups)]
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        report = {
+            "pages": args.pages,
+            "markdown_chars": sum(len(markdown) for _, markdown in pages),
+            "threads": args.threads,
+            "cold_reads": args.cold,
+            "markdown": _bench_markdown(pages, Path(tmp), lookups, args),
+            "packed": _bench_packed(pages, Path(tmp), lookups, args),
+        }
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
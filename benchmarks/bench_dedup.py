@@ -0,0 +1,127 @@
+"""URL normalization and dedup: duplicate fetches on a site with URL variants, and index memory.
+
+The fixture site links child pages through variants of the same URL (trailing slash,
+index.html, tracking query parameters) while the navigation and "next" links use the plain
+path. The crawl is run with link dedup by canonical URL and without it (previous behaviour),
+and reports how many requests went to pages that were already fetched.
+
+Run with:
+    uv run python benchmarks/bench_dedup.py --pages 300
+    uv run python benchmarks/bench_dedup.py --urls 1000000 --output dedup.json
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest import mock
+
+from fixture_site import FixtureServer, FixtureSite
+
+from crawl4ai_mcp_server import core
+from crawl4ai_mcp_server.strategies.http import FETCH_MODES
+from crawl4ai_mcp_server.utils.url import VisitedIndex, normalize_url
+
+
+async def _crawl(site: FixtureSite, args, dedup: bool) -> dict:
+    with FixtureServer(site) as server, tempfile.TemporaryDirectory() as output_dir:
+        # dedup=False: 정규화 기준 중복 링크 필터 없이 crawl4ai의 문자열 비교만 사용
+        patch = contextlib.nullcontext() if dedup else mock.patch.object(core, "_visited_index", lambda *a: None)
+        with patch:
+            start = time.perf_counter()
+            results = await core.crawl_documentation(
+                server.url(site.path(0)),
+                output_dir=output_dir,
+                max_pages=args.budget or site.pages * 2,
+                max_depth=site.max_depth + 1,
+                mode=args.mode,
+            )
+            elapsed = time.perf_counter() - start
+        files = sum(1 for _ in Path(output_dir).rglob("*.md"))
+
+    pages = {site.page_index(path) for path in server.requests} - {None}
+    requests = sum(1 for path in server.requests if site.page_index(path) is not None)
+    return {
+        "requests": requests,
+        "unique_pages": len(pages),
+        "duplicate_fetches": requests - len(pages),
+        "results": len(results),
+        "files": files,
+        "elapsed_s": round(elapsed, 3),
+    }
+
+
+def _bench_index(count: int) -> dict:
+    urls = [f"https://docs.example.com/section{i // 50}/page{i}/?utm_source=nav" for i in range(count)]
+
+    normalize_url.cache_clear()
+    start = time.perf_counter()
+    for url in urls:
+        normalize_url(url)
+    cold = time.perf_counter() - start
+    # 캐시에 남아 있는 마지막 URL들을 다시 정규화 (같은 네비게이션 링크가 반복되는 경우)
+    recent = urls[-normalize_url.cache_info().maxsize :]
+    start = time.perf_counter()
+    for url in recent:
+        normalize_url(url)
+    warm = time.perf_counter() - start
+
+    report = {
+        "urls": count,
+        "normalize_per_s": {"cold": round(count / cold), "cached": round(len(recent) / warm)},
+    }
+    for name, index in (("hash_set", VisitedIndex()), ("bloom", VisitedIndex(capacity=count))):
+        start = time.perf_counter()
+        for url in urls:
+            index.add(url)
+        elapsed = time.perf_counter() - start
+        report[name] = {
+            "memory_mb": round(index.memory_bytes() / 1024 / 1024, 2),
+            "bytes_per_url": round(index.memory_bytes() / count, 1),
+            "adds_per_s": round(count / elapsed),
+            "stored": len(index),
+        }
+    return report
+
+
+async def run(args) -> dict:
+    site = FixtureSite(pages=args.pages, fanout=args.fanout, page_size=args.page_size, variants=True)
+    report = {
+        "site": {"pages": site.pages, "fanout": site.fanout, "max_depth": site.max_depth},
+        "budget": args.budget or site.pages * 2,
+        "mode": args.mode,
+    }
+    # 크롤러의 진행 출력이 JSON 결과와 섞이지 않도록 stderr로 보냄
+    with contextlib.redirect_stdout(sys.stderr):
+        report["crawl"] = {
+            "without_dedup": await _crawl(site, args, dedup=False),
+            "with_dedup": await _crawl(site, args, dedup=True),
+        }
+    report["index"] = _bench_index(args.urls)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=300, help="사이트 전체 페이지 수")
+    parser.add_argument("--fanout", type=int, default=5, help="페이지당 하위 페이지 링크 수")
+    parser.add_argument("--page-size", type=int, default=10, help="페이지당 본문 문단 수")
+    parser.add_argument("--budget", type=int, default=0, help="최대 크롤링 페이지 수 (0이면 전체 페이지 수의 2배)")
+    parser.add_argument("--urls", type=int, default=200_000, help="인덱스 메모리 측정에 쓸 URL 수")
+    parser.add_argument("--mode", choices=FETCH_MODES, default="http", help="가져오기 방식")
+    parser.add_argument("--output", help="JSON 결과를 저장할 파일")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
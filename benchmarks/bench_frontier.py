@@ -0,0 +1,109 @@
+"""Distributed deep crawl: pages/sec with 1, 2, 4 worker processes sharing one frontier.
+
+For each ``--workers`` value a deep crawl of a local fixture site runs through
+``crawl_documentation_distributed`` (SQLite frontier, ``crawl4ai-mcp-server --frontier`` worker
+processes, ``--concurrency`` pages per worker). The fixture server answers each page after
+``--delay`` seconds, standing in for a remote site. The report lists total time (worker start
+included), steady pages/s between the first and the last saved page and the speedup and
+efficiency relative to the first run.
+
+Run with:
+    uv run python benchmarks/bench_frontier.py
+    uv run python benchmarks/bench_frontier.py --workers 1 2 4 8 --pages 2000 --concurrency 4 --output frontier.json
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from fixture_site import FixtureServer, FixtureSite
+
+from crawl4ai_mcp_server.core import crawl_documentation_distributed
+from crawl4ai_mcp_server.strategies.http import FETCH_MODES
+
+
+async def _run(site: FixtureSite, server: FixtureServer, workers: int, args) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        output_path = Path(tmp) / "out"
+        worker_env = {
+            # 호스트별 제한 대신 워커 수에 따른 처리량을 보도록 풀어 둠
+            "CRAWL4AI_HOST_RATE": "0",
+            "CRAWL4AI_HOST_CONCURRENCY": "1000",
+            "CRAWL4AI_MCP_CACHE_DIR": tmp,
+        }
+        start = time.perf_counter()
+        results = await crawl_documentation_distributed(
+            server.url(site.path(0)),
+            str(Path(tmp) / "frontier.sqlite"),
+            str(output_path),
+            max_pages=args.max_pages,
+            max_depth=args.max_depth,
+            mode=args.mode,
+            workers=workers,
+            concurrency=args.concurrency,
+            worker_env=worker_env,
+            search_index=False,
+        )
+        elapsed = time.perf_counter() - start
+
+        saved = sorted(Path(record["file"]).stat().st_mtime for record in results)
+        steady = saved[-1] - saved[0]
+        return {
+            "pages": len(results),
+            "unique_urls": len({record["url"] for record in results}),
+            "elapsed_s": round(elapsed, 3),
+            "steady_pages_per_s": round((len(saved) - 1) / steady, 1) if steady > 0 else None,
+        }
+
+
+async def run(args) -> dict:
+    site = FixtureSite(pages=args.pages)
+    report = {
+        "cpu_count": os.cpu_count(),
+        "mode": args.mode,
+        "max_pages": args.max_pages,
+        "concurrency_per_worker": args.concurrency,
+        "delay_s": args.delay,
+        "runs": {},
+    }
+    # 크롤러의 진행 출력이 JSON 결과와 섞이지 않도록 stderr로 보냄
+    with contextlib.redirect_stdout(sys.stderr), FixtureServer(site, delay=args.delay) as server:
+        for workers in args.workers:
+            report["runs"][f"workers_{workers}"] = await _run(site, server, workers, args)
+
+    runs = list(report["runs"].values())
+    base = runs[0]["steady_pages_per_s"]
+    for workers, run_ in zip(args.workers, runs):
+        if base and run_["steady_pages_per_s"]:
+            speedup = run_["steady_pages_per_s"] / base
+            run_["speedup"] = round(speedup, 2)
+            run_["efficiency"] = round(speedup / (workers / args.workers[0]), 2)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="비교할 워커 프로세스 수")
+    parser.add_argument("--pages", type=int, default=500, help="테스트 사이트의 페이지 수")
+    parser.add_argument("--max-pages", type=int, default=200, help="크롤링할 최대 페이지 수")
+    parser.add_argument("--max-depth", type=int, default=10, help="최대 크롤링 깊이")
+    parser.add_argument("--concurrency", type=int, default=2, help="워커마다 동시에 가져오는 페이지 수")
+    parser.add_argument("--delay", type=float, default=0.5, help="테스트 서버의 응답 지연(초)")
+    parser.add_argument("--mode", choices=FETCH_MODES, default="http", help="가져오기 방식")
+    parser.add_argument("--output", help="JSON 결과를 저장할 파일")
+    args = parser.parse_args()
+
+    text = json.dumps(asyncio.run(run(args)), indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
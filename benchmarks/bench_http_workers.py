@@ -0,0 +1,160 @@
+"""Streamable HTTP server with one vs. several worker processes sharing crawl limits.
+
+For each ``--workers`` value the server is started with ``--transport streamable-http`` and
+``--clients`` MCP clients connect to the one port at the same time, each calling ``crawl_page``
+``--calls`` times on distinct pages of a local fixture site (so the hot cache does not merge
+them). The report lists calls/s, call latency, the highest number of page requests the fixture
+server saw at once (must stay within ``CRAWL4AI_MAX_PAGES`` for any worker count) and the RSS of
+the server process tree after the run.
+
+Run with:
+    uv run python benchmarks/bench_http_workers.py
+    uv run python benchmarks/bench_http_workers.py --workers 1 4 8 --clients 32 --max-pages 16 --mode browser
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import psutil
+from fixture_site import FixtureServer, FixtureSite
+from mcp import ClientSession
+from mcp.client.streamable_http import streamablehttp_client
+
+from crawl4ai_mcp_server.strategies.http import FETCH_MODES
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _tree_rss(pid: int) -> int:
+    process = psutil.Process(pid)
+    total = 0
+    for proc in [process, *process.children(recursive=True)]:
+        with contextlib.suppress(psutil.Error):
+            total += proc.memory_info().rss
+    return total
+
+
+async def _client(endpoint: str, urls: list[str], mode: str) -> list[float]:
+    latencies = []
+    async with streamablehttp_client(endpoint) as (read, write, _), ClientSession(read, write) as session:
+        await session.initialize()
+        for url in urls:
+            start = time.perf_counter()
+            result = await session.call_tool("crawl_page", {"url": url, "mode": mode})
+            latencies.append(time.perf_counter() - start)
+            if result.isError or result.content[0].text.startswith("Failed to crawl"):
+                raise RuntimeError(f"crawl_page failed: {result.content[0].text[:200]}")
+    return latencies
+
+
+async def _serve(site: FixtureSite, fixture: FixtureServer, workers: int, args) -> dict:
+    port = _free_port()
+    endpoint = f"http://127.0.0.1:{port}/mcp"
+    with tempfile.TemporaryDirectory() as cache_dir:
+        env = {
+            **os.environ,
+            "CRAWL4AI_MCP_CACHE_DIR": cache_dir,
+            "CRAWL4AI_MAX_PAGES": str(args.max_pages),
+            # 호스트별 제한 대신 전체 동시 페이지 제한이 걸리도록 풀어 둠
+            "CRAWL4AI_HOST_RATE": "0",
+            "CRAWL4AI_HOST_CONCURRENCY": "1000",
+            "CRAWL4AI_NO_CLOUD_NOTICE": "1",
+        }
+        command = [sys.executable, "-m", "crawl4ai_mcp_server.server", "--transport", "streamable-http"]
+        server = subprocess.Popen(
+            [*command, "--port", str(port), "--workers", str(workers)],
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            deadline = time.monotonic() + 60
+            while True:
+                with contextlib.suppress(OSError):
+                    socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+                    break
+                if time.monotonic() > deadline or server.poll() is not None:
+                    raise RuntimeError("server did not start")
+                await asyncio.sleep(0.1)
+            # 워커마다 crawl4ai를 불러오고 브라우저를 띄우는 비용이 측정에 섞이지 않도록 미리 호출
+            warmup = [[fixture.url(site.path(0)) + f"?warmup={i}"] for i in range(workers * 2)]
+            await asyncio.gather(*(_client(endpoint, urls, args.mode) for urls in warmup))
+            fixture.max_in_flight = 0
+
+            calls = [
+                [fixture.url(site.path(1 + client * args.calls + i)) for i in range(args.calls)]
+                for client in range(args.clients)
+            ]
+            start = time.perf_counter()
+            latencies = [
+                latency
+                for client in await asyncio.gather(*(_client(endpoint, urls, args.mode) for urls in calls))
+                for latency in client
+            ]
+            elapsed = time.perf_counter() - start
+            rss = _tree_rss(server.pid)
+        finally:
+            server.terminate()
+            server.wait(30)
+
+    ordered = sorted(latencies)
+    return {
+        "calls": len(latencies),
+        "elapsed_s": round(elapsed, 3),
+        "calls_per_s": round(len(latencies) / elapsed, 1),
+        "latency_p50_s": round(statistics.median(ordered), 3),
+        "latency_p95_s": round(ordered[int(len(ordered) * 0.95) - 1], 3),
+        "max_concurrent_fetches": fixture.max_in_flight,
+        "server_rss_mb": round(rss / 2**20, 1),
+    }
+
+
+async def run(args) -> dict:
+    site = FixtureSite(pages=args.clients * args.calls + 1)
+    report = {
+        "cpu_count": os.cpu_count(),
+        "mode": args.mode,
+        "clients": args.clients,
+        "calls_per_client": args.calls,
+        "max_pages": args.max_pages,
+        "runs": {},
+    }
+    with FixtureServer(site, delay=args.delay) as fixture:
+        for workers in args.workers:
+            report["runs"][f"workers_{workers}"] = await _serve(site, fixture, workers, args)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="비교할 서버 워커 프로세스 수")
+    parser.add_argument("--clients", type=int, default=16, help="동시에 접속하는 MCP 클라이언트 수")
+    parser.add_argument("--calls", type=int, default=4, help="클라이언트당 crawl_page 호출 수")
+    parser.add_argument("--max-pages", type=int, default=4, help="전체 동시 페이지 수 제한 (CRAWL4AI_MAX_PAGES)")
+    parser.add_argument("--delay", type=float, default=0.1, help="테스트 서버의 응답 지연(초)")
+    parser.add_argument("--mode", choices=FETCH_MODES, default="http", help="가져오기 방식")
+    parser.add_argument("--output", help="JSON 결과를 저장할 파일")
+    args = parser.parse_args()
+
+    text = json.dumps(asyncio.run(run(args)), indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Near-duplicate detection: pages fetched and written on a docs site with versioned mirrors.
+
+The fixture site serves the same page tree under /docs/ and under version paths (/docs/v1/,
+/docs/v2/, ...), linked from the root page; mirror pages differ only in a version line. The
+crawl is run with dedup="off" (previous behaviour), "alias" (near-duplicates are recorded as
+aliases instead of being written) and "prune" (their links are not followed either), and
+reports requests, files and bytes written, and the SimHash cost per page.
+
+Run with:
+    uv run python benchmarks/bench_near_dup.py --pages 200 --mirrors 2
+    uv run python benchmarks/bench_near_dup.py --mirrors 4 --output near-dup.json
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from fixture_site import FixtureServer, FixtureSite
+
+from crawl4ai_mcp_server.core import crawl_documentation
+from crawl4ai_mcp_server.dedup import DEDUP_MODES, simhash
+from crawl4ai_mcp_server.strategies.http import FETCH_MODES
+
+
+async def _crawl(site: FixtureSite, args, dedup: str) -> dict:
+    with FixtureServer(site) as server, tempfile.TemporaryDirectory() as output_dir:
+        start = time.perf_counter()
+        results = await crawl_documentation(
+            server.url(site.path(0)),
+            output_dir=output_dir,
+            max_pages=site.pages * (len(site.mirrors) + 1),
+            max_depth=site.max_depth + 1,
+            mode=args.mode,
+            dedup=dedup,
+        )
+        elapsed = time.perf_counter() - start
+        files = list(Path(output_dir).rglob("*.md"))
+        written = sum(path.stat().st_size for path in files)
+        counts = results.counts()
+
+    return {
+        "requests": sum(1 for path in server.requests if site.page_index(path) is not None),
+        "results": len(results),
+        "duplicates": counts["duplicate"],
+        "files": len(files),
+        "bytes_written": written,
+        "elapsed_s": round(elapsed, 3),
+    }
+
+
+def _bench_simhash(site: FixtureSite, samples: int = 200) -> dict:
+    # 본문 문단 수가 같은 페이지의 평문으로 지문 계산 속도 측정
+    texts = [site.render(i).decode() for i in range(min(samples, site.pages))]
+    start = time.perf_counter()
+    for text in texts:
+        simhash(text)
+    elapsed = time.perf_counter() - start
+    return {"pages": len(texts), "ms_per_page": round(elapsed / len(texts) * 1000, 3)}
+
+
+async def run(args) -> dict:
+    mirrors = tuple(f"v{n}" for n in range(1, args.mirrors + 1))
+    site = FixtureSite(pages=args.pages, fanout=args.fanout, page_size=args.page_size, mirrors=mirrors)
+    report = {
+        "site": {"pages": site.pages, "mirrors": list(mirrors), "fanout": site.fanout, "max_depth": site.max_depth},
+        "mode": args.mode,
+        "crawl": {},
+    }
+    # 크롤러의 진행 출력이 JSON 결과와 섞이지 않도록 stderr로 보냄
+    with contextlib.redirect_stdout(sys.stderr):
+        for dedup in DEDUP_MODES:
+            report["crawl"][dedup] = await _crawl(site, args, dedup)
+    report["simhash"] = _bench_simhash(site)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=200, help="버전 트리 하나의 페이지 수")
+    parser.add_argument("--mirrors", type=int, default=2, help="같은 내용을 제공할 버전 경로 수")
+    parser.add_argument("--fanout", type=int, default=5, help="페이지당 하위 페이지 링크 수")
+    parser.add_argument("--page-size", type=int, default=20, help="페이지당 본문 문단 수")
+    parser.add_argument("--mode", choices=FETCH_MODES, default="http", help="가져오기 방식")
+    parser.add_argument("--output", help="JSON 결과를 저장할 파일")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""End-to-end crawl pipeline benchmark against a generated local docs site.
+
+Each scenario runs in its own process so peak RSS is measured per scenario.
+
+Run with:
+    uv run python benchmarks/bench_pipeline.py --pages 100 --output bench.json
+    uv run python benchmarks/bench_pipeline.py --scenarios bfs,dfs --fanout 3 --page-size 200
+    uv run python benchmarks/bench_pipeline.py --mode http
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from importlib.metadata import version
+from pathlib import Path
+from urllib.parse import urlparse
+
+from fixture_site import FixtureServer, FixtureSite
+
+from crawl4ai_mcp_server.configs.browser import FAST_CONFIG
+from crawl4ai_mcp_server.core import crawl_documentation, crawl_single_page
+from crawl4ai_mcp_server.strategies.fetch import create_crawler
+from crawl4ai_mcp_server.strategies.http import FETCH_MODES
+
+SCENARIOS = ("startup", "single", "bfs", "dfs", "cli")
+
+
+def _percentiles(latencies: list[float]) -> dict:
+    if not latencies:
+        return {"p50_s": None, "p95_s": None, "max_s": None}
+    ordered = sorted(latencies)
+    return {
+        "p50_s": round(statistics.median(ordered), 4),
+        "p95_s": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 4),
+        "max_s": round(ordered[-1], 4),
+    }
+
+
+async def _bench_startup(server: FixtureServer, args) -> dict:
+    """브라우저 실행부터 크롤러 준비까지의 시간"""
+    startups = []
+    for _ in range(args.startup_runs):
+        start = time.perf_counter()
+        async with create_crawler(FAST_CONFIG, args.mode):
+            startups.append(time.perf_counter() - start)
+    return {"runs": len(startups), "browser_startup": _percentiles(startups)}
+
+
+async def _bench_single(server: FixtureServer, args) -> dict:
+    """crawl_single_page 호출당 지연 시간 (호출마다 브라우저 실행 포함)"""
+    site = server.site
+    latencies = []
+    start = time.perf_counter()
+    for n in range(args.single_requests):
+        url = server.url(site.path(n % site.pages))
+        page_start = time.perf_counter()
+        markdown = await crawl_single_page(url, mode=args.mode)
+        if not markdown:
+            raise RuntimeError(f"crawl_single_page returned nothing for {url}")
+        latencies.append(time.perf_counter() - page_start)
+    elapsed = time.perf_counter() - start
+    return {
+        "pages": len(latencies),
+        "elapsed_s": round(elapsed, 3),
+        "pages_per_second": round(len(latencies) / elapsed, 2),
+        "latency": _percentiles(latencies),
+    }
+
+
+async def _bench_deep(server: FixtureServer, args, strategy: str) -> dict:
+    """crawl_documentation 처리량과 페이지별 지연 시간 (서버 요청 도착 ~ 저장 완료)"""
+    site = server.site
+    finished: dict[str, float] = {}
+
+    async def on_progress(record, progress) -> None:
+        if record is not None:
+            finished[urlparse(record["url"]).path] = time.perf_counter()
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        start = time.perf_counter()
+        results = await crawl_documentation(
+            server.url(site.path(0)),
+            output_dir=output_dir,
+            max_pages=site.pages,
+            max_depth=site.max_depth,
+            strategy=strategy,
+            mode=args.mode,
+            on_progress=on_progress,
+        )
+        elapsed = time.perf_counter() - start
+
+    latencies = [done - server.requests[path] for path, done in finished.items() if path in server.requests]
+    return {
+        "pages": len(results),
+        "elapsed_s": round(elapsed, 3),
+        "pages_per_second": round(len(results) / elapsed, 2),
+        "latency": _percentiles(latencies),
+    }
+
+
+def _bench_cli(server: FixtureServer, args) -> dict:
+    """CLI 프로세스 전체 실행 시간 (인터프리터 시작, import, 브라우저 실행 포함)"""
+    site = server.site
+    with tempfile.TemporaryDirectory() as output_dir:
+        command = [
+            sys.executable, "-m", "crawl4ai_mcp_server.cli", "crawl", server.url(site.path(0)),
+            "--recursive", "--output-dir", output_dir,
+            "--max-pages", str(site.pages), "--max-depth", str(site.max_depth),
+            "--mode", args.mode,
+        ]
+        start = time.perf_counter()
+        subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+        elapsed = time.perf_counter() - start
+        pages = sum(1 for _ in Path(output_dir).rglob("*.md"))
+
+    return {
+        "pages": pages,
+        "elapsed_s": round(elapsed, 3),
+        "pages_per_second": round(pages / elapsed, 2),
+    }
+
+
+async def run_scenario(name: str, args) -> dict:
+    site = FixtureSite(pages=args.pages, fanout=args.fanout, page_size=args.page_size, noise=args.noise)
+    with FixtureServer(site, delay=args.delay) as server:
+        # 크롤러의 진행 출력이 JSON 결과와 섞이지 않도록 stderr로 보냄
+        with contextlib.redirect_stdout(sys.stderr):
+            if name == "startup":
+                return await _bench_startup(server, args)
+            if name == "single":
+                return await _bench_single(server, args)
+            if name in ("bfs", "dfs"):
+                return await _bench_deep(server, args, name)
+            return await asyncio.to_thread(_bench_cli, server, args)
+
+
+def _run_isolated(name: str, argv: list[str]) -> dict:
+    """시나리오를 별도 프로세스에서 실행하고 최대 RSS(브라우저 등 하위 프로세스 포함)를 함께 기록"""
+    proc = subprocess.Popen([sys.executable, __file__, *argv, "--scenario", name], stdout=subprocess.PIPE)
+    output = proc.stdout.read()
+    proc.stdout.close()
+    _, status, usage = os.wait4(proc.pid, 0)
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    if proc.returncode != 0:
+        return {"error": f"exit code {proc.returncode}"}
+
+    report = json.loads(output)
+    # ru_maxrss 단위: Linux는 KB, macOS는 byte
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    report["peak_rss_mb"] = round(usage.ru_maxrss / scale, 1)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help=f"실행할 시나리오 ({', '.join(SCENARIOS)})")
+    parser.add_argument("--pages", type=int, default=100, help="사이트 전체 페이지 수")
+    parser.add_argument("--fanout", type=int, default=5, help="페이지당 하위 페이지 링크 수")
+    parser.add_argument("--page-size", type=int, default=50, help="페이지당 본문 문단 수")
+    parser.add_argument("--noise", type=int, default=20, help="네비게이션/푸터 링크 수")
+    parser.add_argument("--delay", type=float, default=0.0, help="서버 응답 지연(초)")
+    parser.add_argument("--mode", choices=FETCH_MODES, default="browser", help="가져오기 방식")
+    parser.add_argument("--single-requests", type=int, default=5)
+    parser.add_argument("--startup-runs", type=int, default=3)
+    parser.add_argument("--output", help="JSON 결과를 저장할 파일")
+    parser.add_argument("--scenario", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.scenario:
+        report = asyncio.run(run_scenario(args.scenario, args))
+        print(json.dumps(report))
+        return
+
+    names = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = set(names) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    argv = sys.argv[1:]
+    report = {
+        "site": {
+            "pages": args.pages,
+            "fanout": args.fanout,
+            "page_size": args.page_size,
+            "noise": args.noise,
+            "delay_s": args.delay,
+        },
+        "mode": args.mode,
+        "environment": {
+            "python": platform.python_version(),
+            "crawl4ai": version("crawl4ai"),
+            "platform": platform.platform(),
+        },
+        "scenarios": {name: _run_isolated(name, argv) for name in names},
+    }
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    print(text)
+
+    failed = [name for name, result in report["scenarios"].items() if "error" in result]
+    if failed:
+        print(f"❌ Failed scenarios: {', '.join(failed)}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
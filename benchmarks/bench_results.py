@@ -0,0 +1,70 @@
+"""Deep crawl result memory: list of dicts + joined summary vs. compact records + on-disk log.
+
+Run with:
+    uv run python benchmarks/bench_results.py --pages 10000
+"""
+
+import argparse
+import json
+import tempfile
+import time
+import tracemalloc
+from itertools import islice
+from pathlib import Path
+
+from crawl4ai_mcp_server.results import RESULTS_FILENAME, CrawlResults, read_results
+
+
+def _records(pages: int):
+    for i in range(pages):
+        url = f"https://docs.example.com/section{i // 50}/page{i}"
+        yield {"url": url, "depth": 2, "file": f"docs_example_com/section{i // 50}/page{i}.md"}
+
+
+def _measure(func) -> dict:
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"peak_mb": round(peak / 1024 / 1024, 2), "elapsed_ms": round(elapsed * 1000, 1)}
+
+
+def legacy(pages: int) -> None:
+    """이전 방식: dict 리스트에 모으고 모든 페이지를 한 문자열로 요약"""
+    results = list(_records(pages))
+    lines = [f"Crawled {len(results)} pages:\n"]
+    lines.extend(f"- [{r['depth']}] {r['url']} -> {r['file']}" for r in results)
+    "\n".join(lines)
+
+
+def compact(pages: int, output_dir: Path, limit: int) -> None:
+    """현재 방식: 작은 레코드 + 결과 로그, 요약은 로그에서 limit개만"""
+    results = CrawlResults(output_dir / RESULTS_FILENAME)
+    for record in _records(pages):
+        results.append(record)
+    results.close()
+    lines = [f"Crawled {len(results)} pages:\n"]
+    lines.extend(f"- [{r['depth']}] {r['url']} -> {r['file']}" for r in islice(read_results(output_dir), limit))
+    "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=10000)
+    parser.add_argument("--limit", type=int, default=100, help="요약에 나열할 페이지 수")
+    args = parser.parse_args()
+
+    report = {"pages": args.pages}
+    for pages in (args.pages // 10, args.pages):
+        with tempfile.TemporaryDirectory() as output_dir:
+            report[str(pages)] = {
+                "legacy": _measure(lambda: legacy(pages)),
+                "compact": _measure(lambda: compact(pages, Path(output_dir), args.limit)),
+            }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Scraping + markdown generation in the event loop vs. in a process pool.
+
+A generated docs site with large pages (``--page-size`` paragraphs, so scraping dominates) is
+crawled in http mode once with processing in the crawler's event loop and once per
+``--workers`` value with ``ScrapeProcessPool``. The report lists pages/s, the scrape stage
+percentiles from the crawl metrics and whether the saved markdown is identical to the
+in-process crawl. Gains need more than one CPU core; ``cpu_count`` is part of the report.
+
+Run with:
+    uv run python benchmarks/bench_scrape_pool.py
+    uv run python benchmarks/bench_scrape_pool.py --pages 400 --page-size 300 --workers 2 4 8
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from fixture_site import FixtureServer, FixtureSite
+
+from crawl4ai_mcp_server.core import crawl_documentation
+from crawl4ai_mcp_server.metrics import get_metrics
+from crawl4ai_mcp_server.strategies.scrape import ScrapeProcessPool
+
+
+def _read_pages(output_dir: str) -> dict[str, str]:
+    return {
+        str(path.relative_to(output_dir)): path.read_text(encoding="utf-8")
+        for path in Path(output_dir).rglob("*.md")
+    }
+
+
+async def _crawl(server: FixtureServer, workers: int) -> tuple[dict, dict[str, str]]:
+    site = server.site
+    scrape_pool = ScrapeProcessPool(workers=workers) if workers else None
+    metrics = get_metrics()
+    metrics.reset()
+    try:
+        with tempfile.TemporaryDirectory() as output_dir:
+            start = time.perf_counter()
+            results = await crawl_documentation(
+                server.url(site.path(0)),
+                output_dir=output_dir,
+                max_pages=site.pages * 2,
+                max_depth=site.max_depth + 1,
+                mode="http",
+                scrape_pool=scrape_pool,
+                search_index=False,
+            )
+            elapsed = time.perf_counter() - start
+            pages = _read_pages(output_dir)
+    finally:
+        if scrape_pool is not None:
+            scrape_pool.close()
+
+    snapshot = metrics.snapshot()
+    scrape = snapshot["stages"].get("scrape", {})
+    return {
+        "pages": len(results),
+        "elapsed_s": round(elapsed, 3),
+        "pages_per_s": round(len(results) / elapsed, 1),
+        "scrape_p50_s": scrape.get("p50_s"),
+        "scrape_p95_s": scrape.get("p95_s"),
+        "scrape_share": scrape.get("share"),
+        "pool_pages": snapshot["counters"].get("scrape_pool_pages", 0),
+    }, pages
+
+
+async def run(args) -> dict:
+    site = FixtureSite(pages=args.pages, fanout=args.fanout, page_size=args.page_size)
+    report = {
+        "cpu_count": os.cpu_count(),
+        "site": {"pages": site.pages, "fanout": site.fanout, "page_size": site.page_size},
+        "runs": {},
+    }
+    # 크롤러의 진행 출력이 JSON 결과와 섞이지 않도록 stderr로 보냄
+    with contextlib.redirect_stdout(sys.stderr), FixtureServer(site) as server:
+        baseline, expected = await _crawl(server, 0)
+        report["runs"]["in_process"] = baseline
+        for workers in args.workers:
+            result, pages = await _crawl(server, workers)
+            result["same_markdown"] = pages == expected
+            result["speedup"] = round(result["pages_per_s"] / baseline["pages_per_s"], 2)
+            report["runs"][f"workers_{workers}"] = result
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=200, help="사이트 전체 페이지 수")
+    parser.add_argument("--fanout", type=int, default=10, help="페이지당 하위 페이지 링크 수")
+    parser.add_argument("--page-size", type=int, default=200, help="페이지당 본문 문단 수")
+    parser.add_argument(
+        "--workers", type=int, nargs="+", default=[1, 2, os.cpu_count() or 1], help="비교할 워커 프로세스 수"
+    )
+    parser.add_argument("--output", help="JSON 결과를 저장할 파일")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""Search index: indexing cost in the writer stage, incremental re-index and query latency.
+
+Pages are generated with headed sections and a Zipf-distributed vocabulary, saved as markdown
+files and indexed with ``SearchIndex.add`` from ``--threads`` threads like the crawler's writer
+stage. The crawl is then repeated with the same pages (nothing to re-index) and with
+``--changed`` of them edited. Queries of two or three words are answered from the index and,
+for comparison, by reading the saved markdown files back and counting matching words (what
+an agent without the index has to do).
+
+Run with:
+    uv run python benchmarks/bench_search.py --pages 5000
+    uv run python benchmarks/bench_search.py --pages 20000 --queries 500 --output search.json
+"""
+
+import argparse
+import itertools
+import json
+import random
+import re
+import statistics
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from crawl4ai_mcp_server.core import _save_markdown
+from crawl4ai_mcp_server.search import SEARCH_INDEX_FILENAME, SearchIndex, query_index
+from crawl4ai_mcp_server.utils.path import FilePathRegistry
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def _vocabulary(size: int) -> list[str]:
+    rng = random.Random(0)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    return ["".join(rng.choices(letters, k=rng.randint(4, 10))) for _ in range(size)]
+
+
+def _page(rng: random.Random, words: list[str], cum_weights: list[float], i: int, sections: int) -> str:
+    parts = [f"# Page {i}"]
+    for n in range(sections):
+        parts.append(f"## {' '.join(rng.choices(words, cum_weights=cum_weights, k=3))}")
+        parts.extend(" ".join(rng.choices(words, cum_weights=cum_weights, k=60)) + "." for _ in range(3))
+    return "\n\n".join(parts)
+
+
+def _pages(count: int, sections: int) -> tuple[list[tuple[str, str]], list[str]]:
+    rng = random.Random(1)
+    words = _vocabulary(20000)
+    cum_weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(words))))
+    pages = [
+        (f"https://docs.example.com/docs/section{i // 50}/page{i}", _page(rng, words, cum_weights, i, sections))
+        for i in range(count)
+    ]
+    return pages, words
+
+
+def _index_all(output_path: Path, pages, paths: FilePathRegistry, threads: int) -> tuple[float, int]:
+    start = time.perf_counter()
+    with SearchIndex(output_path) as index, ThreadPoolExecutor(max_workers=threads) as executor:
+        indexed = sum(
+            executor.map(lambda page: index.add(page[0], paths.path_for(page[0]), page[1]), pages, chunksize=32)
+        )
+    return time.perf_counter() - start, indexed
+
+
+def _scan_files(output_path: Path, query: str, k: int) -> list[str]:
+    terms = set(query.split())
+    scores = []
+    for path in output_path.rglob("*.md"):
+        words = _WORD_RE.findall(path.read_text(encoding="utf-8").lower())
+        score = sum(1 for word in words if word in terms)
+        if score:
+            scores.append((score, str(path)))
+    return [path for _, path in sorted(scores, reverse=True)[:k]]
+
+
+def _latency(run, queries: list[str]) -> dict:
+    timings = []
+    for query in queries:
+        start = time.perf_counter()
+        run(query)
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return {
+        "queries": len(queries),
+        "p50_ms": round(statistics.median(timings), 3),
+        "p95_ms": round(timings[int(len(timings) * 0.95) - 1], 3),
+        "max_ms": round(timings[-1], 3),
+    }
+
+
+def run(args) -> dict:
+    pages, words = _pages(args.pages, args.sections)
+    rng = random.Random(2)
+    # 너무 흔한 단어(상위 100개)는 빼고 검색어로 쓸 단어 선택
+    queries = [" ".join(rng.choices(words[100:2000], k=rng.randint(2, 3))) for _ in range(args.queries)]
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        output_path = Path(tmp)
+        paths = FilePathRegistry(output_path)
+        start = time.perf_counter()
+        for url, markdown in pages:
+            _save_markdown(url, markdown, output_path, paths)
+        write = time.perf_counter() - start
+
+        build, indexed = _index_all(output_path, pages, paths, args.threads)
+        unchanged, reindexed_unchanged = _index_all(output_path, pages, paths, args.threads)
+        changed_count = int(len(pages) * args.changed)
+        edited = [(url, markdown + "\n\nEdited paragraph.") for url, markdown in pages[:changed_count]]
+        edited += pages[changed_count:]
+        changed, reindexed_changed = _index_all(output_path, edited, paths, args.threads)
+        index_bytes = sum(
+            path.stat().st_size for path in output_path.glob(SEARCH_INDEX_FILENAME + "*") if path.is_file()
+        )
+
+        report = {
+            "pages": len(pages),
+            "markdown_bytes": sum(len(markdown.encode()) for _, markdown in pages),
+            "index_bytes": index_bytes,
+            "threads": args.threads,
+            "write_pages_per_s": round(len(pages) / write),
+            "index": {
+                "build_pages_per_s": round(indexed / build),
+                "unchanged": {"reindexed": reindexed_unchanged, "elapsed_s": round(unchanged, 3)},
+                "changed": {"reindexed": reindexed_changed, "elapsed_s": round(changed, 3)},
+            },
+            "query_index": _latency(lambda query: query_index(output_path, query, args.k), queries),
+            "scan_files": _latency(
+                lambda query: _scan_files(output_path, query, args.k), queries[: args.scan_queries]
+            ),
+        }
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=5000, help="저장할 페이지 수")
+    parser.add_argument("--sections", type=int, default=6, help="페이지당 제목 섹션 수")
+    parser.add_argument("--threads", type=int, default=4, help="색인 스레드 수 (크롤러 writer 단계와 같은 기본값)")
+    parser.add_argument("--changed", type=float, default=0.1, help="다시 크롤링할 때 내용이 바뀌는 페이지 비율")
+    parser.add_argument("--queries", type=int, default=200, help="인덱스 검색 횟수")
+    parser.add_argument("--scan-queries", type=int, default=5, help="파일을 다시 읽어 찾는 비교 검색 횟수")
+    parser.add_argument("-k", type=int, default=5, help="검색당 결과 수")
+    parser.add_argument("--dir", help="측정할 파일 시스템의 디렉토리 (기본: 임시 디렉토리)")
+    parser.add_argument("--output", help="JSON 결과를 저장할 파일")
+    args = parser.parse_args()
+
+    text = json.dumps(run(args), indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""MCP server cold start: import time, time to initialize/list_tools and to the first crawl.
+
+Each run spawns the stdio server (``python -m crawl4ai_mcp_server.server``) the way an agent
+session does and times ``initialize`` and ``list_tools`` from the spawn, then waits
+``--think`` seconds (the model's turn) and times a first ``crawl_page`` of a local fixture page
+in http mode. That call loads crawl4ai unless the background warm-up already did
+(``--no-warmup`` turns it off). ``python -X importtime`` gives the import time of the server
+module, its slowest imports and whether crawl4ai/Playwright/lxml were imported.
+
+The script exits with status 1 when a median exceeds its budget or a heavy module is imported
+at startup, so it doubles as a startup regression check.
+
+Run with:
+    uv run python benchmarks/bench_server_startup.py
+    uv run python benchmarks/bench_server_startup.py --runs 10 --no-warmup --output startup.json
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from fixture_site import FixtureServer, FixtureSite
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+SERVER_MODULE = "crawl4ai_mcp_server.server"
+# 서버 시작 시 import되면 안 되는 모듈 (첫 크롤에서 불러옴)
+HEAVY_MODULES = ("crawl4ai", "playwright", "lxml", "crawl4ai_mcp_server.core")
+
+# 서버 모듈은 print를 stderr로 돌리므로 stdout에 직접 씀
+_IMPORT_PROBE = (
+    f"import sys, {SERVER_MODULE}; "
+    f"sys.stdout.write(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+)
+
+
+def _importtime() -> dict:
+    """새 인터프리터에서 서버 모듈 import 시간, 가장 느린 모듈, import된 무거운 모듈"""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _IMPORT_PROBE],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = (part.strip() for part in line[len("import time:") :].split("|"))
+        if self_us.isdigit():
+            modules.append((name, int(self_us), int(cumulative_us)))
+    total_us = next(cumulative for name, _, cumulative in modules if name == SERVER_MODULE)
+    slowest = sorted(modules, key=lambda module: module[1], reverse=True)[:5]
+    return {
+        "import_ms": total_us / 1000,
+        "slowest_self_ms": {name: round(self_us / 1000, 1) for name, self_us, _ in slowest},
+        "heavy_modules": [name for name in proc.stdout.strip().split(",") if name],
+    }
+
+
+async def _session(url: str, args) -> dict:
+    """서버를 띄워 initialize, list_tools, (생각 시간 후) 첫 crawl_page까지의 시간 측정"""
+    env = {**os.environ, "CRAWL4AI_WARMUP": "0" if args.no_warmup else "1", "CRAWL4AI_NO_CLOUD_NOTICE": "1"}
+    params = StdioServerParameters(command=sys.executable, args=["-m", SERVER_MODULE], env=env)
+    start = time.perf_counter()
+    async with stdio_client(params) as (read, write), ClientSession(read, write) as session:
+        await session.initialize()
+        initialized = time.perf_counter()
+        tools = await session.list_tools()
+        listed = time.perf_counter()
+
+        await asyncio.sleep(args.think)
+        crawl_start = time.perf_counter()
+        result = await session.call_tool("crawl_page", {"url": url, "mode": "http"})
+        first_crawl = time.perf_counter() - crawl_start
+    if result.isError or result.content[0].text.startswith("Failed to crawl"):
+        raise RuntimeError(f"crawl_page failed: {result.content[0].text[:200]}")
+    return {
+        "tools": len(tools.tools),
+        "initialize_ms": (initialized - start) * 1000,
+        "list_tools_ms": (listed - start) * 1000,
+        "first_crawl_ms": first_crawl * 1000,
+    }
+
+
+def _median(runs: list[dict], key: str) -> float:
+    return round(statistics.median(run[key] for run in runs), 1)
+
+
+async def run(args) -> dict:
+    imports = [_importtime() for _ in range(args.runs)]
+    site = FixtureSite(pages=1)
+    # 서버의 진행 출력은 stderr로 가므로 stdout에는 JSON만 남음
+    with contextlib.redirect_stdout(sys.stderr), FixtureServer(site) as server:
+        sessions = [await _session(server.url(site.path(0)), args) for _ in range(args.runs)]
+
+    return {
+        "runs": args.runs,
+        "warmup": not args.no_warmup,
+        "think_s": args.think,
+        "import": {
+            "median_ms": _median(imports, "import_ms"),
+            "budget_ms": args.import_budget_ms,
+            "heavy_modules": sorted({name for result in imports for name in result["heavy_modules"]}),
+            "slowest_self_ms": imports[-1]["slowest_self_ms"],
+        },
+        "session": {
+            "tools": sessions[0]["tools"],
+            "initialize_median_ms": _median(sessions, "initialize_ms"),
+            "list_tools_median_ms": _median(sessions, "list_tools_ms"),
+            "list_tools_budget_ms": args.list_tools_budget_ms,
+            "first_crawl_median_ms": _median(sessions, "first_crawl_ms"),
+        },
+    }
+
+
+def _regressions(report: dict) -> list[str]:
+    failures = []
+    if report["import"]["median_ms"] > report["import"]["budget_ms"]:
+        failures.append(f"import {report['import']['median_ms']}ms > {report['import']['budget_ms']}ms")
+    if report["import"]["heavy_modules"]:
+        failures.append(f"imported at startup: {', '.join(report['import']['heavy_modules'])}")
+    session = report["session"]
+    if session["list_tools_median_ms"] > session["list_tools_budget_ms"]:
+        failures.append(f"list_tools {session['list_tools_median_ms']}ms > {session['list_tools_budget_ms']}ms")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="측정 반복 횟수 (중앙값 사용)")
+    parser.add_argument("--think", type=float, default=2.0, help="list_tools 후 첫 crawl_page까지 기다리는 시간(초)")
+    parser.add_argument("--no-warmup", action="store_true", help="핸드셰이크 후 백그라운드 워밍업 끄기")
+    parser.add_argument("--import-budget-ms", type=float, default=1500, help="서버 모듈 import 시간 예산(ms)")
+    parser.add_argument("--list-tools-budget-ms", type=float, default=2500, help="프로세스 시작부터 list_tools 응답까지 예산(ms)")
+    parser.add_argument("--output", help="JSON 결과를 저장할 파일")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    print(text)
+
+    failures = _regressions(report)
+    if failures:
+        print(f"❌ Startup regression: {'; '.join(failures)}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Bursty crawl_page traffic: duplicate fetches and latency with and without the hot cache.
+
+``--agents`` callers request each of ``--urls`` pages of a local fixture site at the same
+moment, ``--bursts`` times ``--gap`` seconds apart (within the hot cache TTL), the way several
+agents in one session read the same pages. ``crawl_single_page`` runs once without a
+``HotPageCache`` and once with one. The report lists how many fetches (renders) were done, the
+statuses recorded by the crawl metrics (``ok``, ``coalesced``, ``hot``) and per-call latency.
+
+Run with:
+    uv run python benchmarks/bench_single_flight.py
+    uv run python benchmarks/bench_single_flight.py --agents 16 --urls 10 --mode browser --output flight.json
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from fixture_site import FixtureServer, FixtureSite
+
+from crawl4ai_mcp_server.configs.browser import FAST_CONFIG
+from crawl4ai_mcp_server.core import crawl_single_page
+from crawl4ai_mcp_server.hotcache import HotPageCache
+from crawl4ai_mcp_server.metrics import get_metrics
+from crawl4ai_mcp_server.pool import BrowserPool
+from crawl4ai_mcp_server.strategies.http import FETCH_MODES
+
+
+async def _timed(url: str, args, pool: BrowserPool, hot_cache: HotPageCache | None) -> tuple[float, str]:
+    start = time.perf_counter()
+    markdown = await crawl_single_page(
+        url, browser_config=FAST_CONFIG, pool=pool, mode=args.mode, hot_cache=hot_cache
+    )
+    return time.perf_counter() - start, markdown
+
+
+async def _run(urls: list[str], args, hot_cache: HotPageCache | None) -> dict:
+    metrics = get_metrics()
+    pool = BrowserPool(size=args.pool_size)
+    try:
+        # 브라우저 실행 비용이 첫 burst에 섞이지 않도록 미리 한 번 가져옴
+        await crawl_single_page(urls[0] + "?warmup=1", browser_config=FAST_CONFIG, pool=pool, mode=args.mode)
+        metrics.reset()
+
+        latencies, pages = [], {}
+        start = time.perf_counter()
+        for burst in range(args.bursts):
+            if burst:
+                await asyncio.sleep(args.gap)
+            targets = [url for url in urls for _ in range(args.agents)]
+            results = await asyncio.gather(*(_timed(url, args, pool, hot_cache) for url in targets))
+            for url, (elapsed, markdown) in zip(targets, results):
+                latencies.append(elapsed)
+                pages.setdefault(url, set()).add(markdown)
+        total = time.perf_counter() - start
+    finally:
+        await pool.close()
+
+    statuses = metrics.snapshot()["pages"]
+    ordered = sorted(latencies)
+    return {
+        "calls": len(latencies),
+        "fetches": statuses.get("ok", 0) + statuses.get("cached", 0),
+        "statuses": statuses,
+        "elapsed_s": round(total, 3),
+        "latency_p50_ms": round(statistics.median(ordered) * 1000, 3),
+        "latency_p95_ms": round(ordered[int(len(ordered) * 0.95) - 1] * 1000, 3),
+        "consistent": all(len(results) == 1 and "" not in results for results in pages.values()),
+    }
+
+
+async def run(args) -> dict:
+    site = FixtureSite(pages=args.urls)
+    # 크롤러의 진행 출력이 JSON 결과와 섞이지 않도록 stderr로 보냄
+    with contextlib.redirect_stdout(sys.stderr), FixtureServer(site, delay=args.delay) as server:
+        urls = [server.url(site.path(i)) for i in range(args.urls)]
+        without = await _run(urls, args, None)
+        with_hot = await _run(urls, args, HotPageCache(ttl=args.ttl))
+
+    return {
+        "mode": args.mode,
+        "agents": args.agents,
+        "urls": args.urls,
+        "bursts": args.bursts,
+        "without_hot_cache": without,
+        "with_hot_cache": with_hot,
+        "fetches_saved": without["fetches"] - with_hot["fetches"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--agents", type=int, default=8, help="페이지마다 동시에 요청하는 호출 수")
+    parser.add_argument("--urls", type=int, default=5, help="요청하는 서로 다른 페이지 수")
+    parser.add_argument("--bursts", type=int, default=3, help="동시 요청 묶음 횟수")
+    parser.add_argument("--gap", type=float, default=1.0, help="묶음 사이 간격(초)")
+    parser.add_argument("--ttl", type=float, default=30.0, help="핫 캐시 TTL(초)")
+    parser.add_argument("--delay", type=float, default=0.05, help="테스트 서버의 응답 지연(초)")
+    parser.add_argument("--mode", choices=FETCH_MODES, default="http", help="가져오기 방식")
+    parser.add_argument("--pool-size", type=int, default=2, help="브라우저 풀 크기")
+    parser.add_argument("--output", help="JSON 결과를 저장할 파일")
+    args = parser.parse_args()
+
+    text = json.dumps(asyncio.run(run(args)), indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Inline vs. writer-stage throughput benchmark for deep crawl page saving.
+
+Run with:
+    uv run python benchmarks/bench_writer.py --pages 500
+"""
+
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+from functools import partial
+from pathlib import Path
+
+from crawl4ai_mcp_server.core import _PageToWrite, _write_page
+from crawl4ai_mcp_server.writer import PageWriter
+
+MARKDOWN = (
+    "[Skip to main content](#main)\n"
+    "* [Home](/)\n* [Docs](/docs)\n* [API](/api)\n\n"
+    "# Benchmark page\n\n" + "Lorem ipsum dolor sit amet, consectetur adipiscing elit.\n\n" * 300
+)
+
+
+def _page(i: int) -> _PageToWrite:
+    return _PageToWrite(
+        url=f"https://example.com/docs/section{i % 20}/page{i}",
+        depth=2,
+        score=0.0,
+        markdown=MARKDOWN,
+        headers={},
+        links=[],
+    )
+
+
+async def _produce(pages: int, fetch_delay: float):
+    """크롤러 대신 fetch_delay 간격으로 결과를 내보내는 생성기"""
+    for i in range(pages):
+        await asyncio.sleep(fetch_delay)
+        yield _page(i)
+
+
+async def _measure_lag(stop: asyncio.Event, lags: list[float], interval: float = 0.005):
+    """이벤트 루프가 예정보다 늦게 깨어난 시간 기록"""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - start - interval)
+
+
+async def _run_inline(pages: int, fetch_delay: float, output_path: Path) -> int:
+    written = 0
+    async for page in _produce(pages, fetch_delay):
+        _write_page(page, output_path, cache=None, manifest=None)
+        written += 1
+    return written
+
+
+async def _run_writer(pages: int, fetch_delay: float, output_path: Path, workers: int) -> int:
+    written = 0
+
+    async def on_done(page: _PageToWrite) -> None:
+        nonlocal written
+        written += 1
+
+    process = partial(_write_page, output_path=output_path, cache=None, manifest=None)
+    async with PageWriter(process=process, on_done=on_done, workers=workers) as writer:
+        async for page in _produce(pages, fetch_delay):
+            await writer.submit(page)
+    return written
+
+
+async def _measure(run, pages: int) -> dict:
+    stop = asyncio.Event()
+    lags: list[float] = []
+    monitor = asyncio.create_task(_measure_lag(stop, lags))
+
+    start = time.perf_counter()
+    written = await run()
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await monitor
+    lags.sort()
+    return {
+        "pages": written,
+        "elapsed_s": round(elapsed, 3),
+        "pages_per_second": round(pages / elapsed, 1),
+        "loop_lag_p50_ms": round(lags[len(lags) // 2] * 1000, 2) if lags else 0.0,
+        "loop_lag_max_ms": round(lags[-1] * 1000, 2) if lags else 0.0,
+    }
+
+
+async def run(pages: int, fetch_delay: float, workers: int) -> dict:
+    with tempfile.TemporaryDirectory() as inline_dir, tempfile.TemporaryDirectory() as writer_dir:
+        inline = await _measure(partial(_run_inline, pages, fetch_delay, Path(inline_dir)), pages)
+        staged = await _measure(partial(_run_writer, pages, fetch_delay, Path(writer_dir), workers), pages)
+
+    return {
+        "pages": pages,
+        "fetch_delay_s": fetch_delay,
+        "workers": workers,
+        "inline": inline,
+        "writer": staged,
+        "speedup": round(staged["pages_per_second"] / inline["pages_per_second"], 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=500)
+    parser.add_argument("--fetch-delay", type=float, default=0.002, help="페이지 하나를 가져오는 데 걸리는 시간(초)")
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args.pages, args.fetch_delay, args.workers))
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
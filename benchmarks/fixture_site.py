@@ -0,0 +1,233 @@
+"""Generated offline documentation site served from a local HTTP server.
+
+Used by the benchmarks to crawl a reproducible site without network access.
+"""
+
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 같은 페이지를 가리키는 URL 변형 (FixtureSite.variants)
+_VARIANTS = ("", "/", "/index.html", "?utm_content=sidebar", "?gclid=bench", "?utm_term=docs&fbclid=nav")
+
+_WORDS = (
+    "crawler browser markdown page config strategy depth filter cache request response "
+    "session context element selector render document section example install usage"
+).split()
+
+
+@dataclass
+class FixtureSite:
+    """트리 구조로 링크된 가상 문서 사이트
+
+    페이지 i는 i * fanout + 1 ~ i * fanout + fanout 페이지로 링크하고, 모든 페이지에
+    사이드바 네비게이션과 푸터(noise개의 링크/문구)가 붙는다. topics를 지정하면 최상위
+    페이지마다 주제를 돌아가며 붙이고, 그 하위 페이지는 모두 같은 주제 경로 아래에 둔다
+    (예: /docs/authentication/section7/page38). variants를 켜면 하위 페이지 링크를 끝의 ``/``,
+    ``index.html``, 추적용 쿼리가 붙은 변형으로 돌아가며 쓴다 (서버는 모두 같은 페이지로 응답).
+    mirrors를 지정하면 같은 트리를 버전 경로(예: /docs/v1/...) 아래에도 제공하고 루트 페이지에서
+    각 버전으로 링크한다. 버전 트리의 페이지는 버전 표시 한 줄만 다르다.
+
+    Attributes:
+        pages: 전체 페이지 수
+        fanout: 페이지당 하위 페이지 링크 수
+        page_size: 페이지당 본문 문단 수
+        noise: 네비게이션/푸터 링크 수
+        seed: 본문 생성용 난수 시드
+        topics: 최상위 페이지별 주제 (비어 있으면 주제 경로 없음)
+        variants: 하위 페이지 링크에 같은 페이지를 가리키는 URL 변형 사용
+        mirrors: 같은 내용을 제공할 버전 경로 이름
+    """
+
+    pages: int = 100
+    fanout: int = 5
+    page_size: int = 50
+    noise: int = 20
+    seed: int = 0
+    topics: tuple[str, ...] = ()
+    variants: bool = False
+    mirrors: tuple[str, ...] = ()
+    _rendered: dict[tuple[int, str | None], bytes] = field(default_factory=dict, repr=False)
+
+    def path(self, i: int, mirror: str | None = None) -> str:
+        root = f"/docs/{mirror}/" if mirror else "/docs/"
+        if i == 0:
+            return root
+        if self.topics:
+            return f"{root}{self.topic(i)}/section{(i - 1) // self.fanout}/page{i}"
+        return f"{root}section{(i - 1) // self.fanout}/page{i}"
+
+    def split_mirror(self, path: str) -> tuple[str | None, str]:
+        """버전 경로 이름과 버전 경로를 뺀 경로 (버전 트리가 아니면 None, path)"""
+        for mirror in self.mirrors:
+            root = f"/docs/{mirror}"
+            if path == root or path.startswith(root + "/") or path.startswith(root + "?"):
+                return mirror, "/docs" + path[len(root) :]
+        return None, path
+
+    def topic(self, i: int) -> str | None:
+        """페이지가 속한 최상위 페이지의 주제 (루트나 topics가 없으면 None)"""
+        if i == 0 or not self.topics:
+            return None
+        while i > self.fanout:
+            i = (i - 1) // self.fanout
+        return self.topics[(i - 1) % len(self.topics)]
+
+    def depth(self, i: int) -> int:
+        depth = 0
+        while i > 0:
+            i = (i - 1) // self.fanout
+            depth += 1
+        return depth
+
+    @property
+    def max_depth(self) -> int:
+        return self.depth(self.pages - 1)
+
+    def children(self, i: int) -> range:
+        return range(i * self.fanout + 1, min(i * self.fanout + self.fanout + 1, self.pages))
+
+    def render(self, i: int, mirror: str | None = None) -> bytes:
+        if (i, mirror) not in self._rendered:
+            self._rendered[i, mirror] = self._render(i, mirror).encode()
+        return self._rendered[i, mirror]
+
+    def _render(self, i: int, mirror: str | None = None) -> str:
+        rng = random.Random(self.seed * 1_000_003 + i)
+        nav = "".join(
+            f"<li><a href='{self.path(j, mirror)}'>Nav {j}</a></li>" for j in range(min(self.noise, self.pages))
+        )
+        body = "".join(
+            f"<h2>Section {n}</h2>" if n % 10 == 0 else f"<p>{' '.join(rng.choices(_WORDS, k=40))}.</p>"
+            for n in range(self.page_size)
+        )
+        links = "".join(
+            f"<li><a href='{self.link(j, i, mirror)}'>Child page {j}</a></li>" for j in self.children(i)
+        )
+        if i == 0 and mirror is None:
+            links += "".join(f"<li><a href='{self.path(0, m)}'>Version {m}</a></li>" for m in self.mirrors)
+        footer = "".join(f"<a href='/community/{n}'>Community Forum {n}</a> " for n in range(self.noise))
+        next_link = f"<a href='{self.path(i + 1, mirror)}'>Next Page {i + 1}</a>" if i + 1 < self.pages else ""
+        version = f"<p>Documentation version {mirror or 'latest'}</p>" if self.mirrors else ""
+        return (
+            f"<html><head><title>Page {i}</title></head><body>"
+            f"<nav><ul>{nav}</ul></nav>"
+            f"<main><h1>Page {i}</h1>{version}{body}<ul>{links}</ul></main>"
+            f"<footer><p>Was this page helpful?</p>{next_link} {footer}</footer>"
+            "</body></html>"
+        )
+
+    def link(self, i: int, source: int = 0, mirror: str | None = None) -> str:
+        """페이지 source에서 페이지 i로 거는 링크 (variants면 페이지마다 다른 변형)"""
+        if not self.variants:
+            return self.path(i, mirror)
+        suffix = _VARIANTS[(i + source) % len(_VARIANTS)]
+        return self.path(i, mirror).rstrip("/") + suffix if i else self.path(i, mirror)
+
+    def page_index(self, path: str) -> int | None:
+        """경로가 가리키는 페이지 번호 (버전 트리의 페이지도 같은 번호, 없는 페이지면 None)"""
+        path = self.split_mirror(path.split("?", 1)[0].split("#", 1)[0])[1]
+        if path.endswith("/index.html"):
+            path = path[: -len("index.html")]
+        if path in ("/docs", "/docs/"):
+            return 0
+        path = path.rstrip("/")
+        name = path.rsplit("/page", 1)
+        if len(name) == 2 and name[1].isdigit():
+            i = int(name[1])
+            if 0 < i < self.pages and self.path(i) == path:
+                return i
+        return None
+
+    def sitemap(self, origin: str) -> bytes:
+        urls = "".join(f"<url><loc>{origin}{self.path(i)}</loc></url>" for i in range(self.pages))
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            f'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{urls}</urlset>'
+        ).encode()
+
+
+class FixtureServer:
+    """FixtureSite를 제공하는 로컬 HTTP 서버 (페이지별 첫 요청 시각과 최대 동시 요청 수 기록)
+
+    Example:
+        with FixtureServer(FixtureSite(pages=50)) as server:
+            await crawl_documentation(server.url("/docs/"), ...)
+            server.requests  # {path: time.perf_counter() 시각}
+    """
+
+    def __init__(self, site: FixtureSite, delay: float = 0.0):
+        """
+        Args:
+            site: 제공할 사이트
+            delay: 응답마다 추가할 지연 시간(초)
+        """
+        self.site = site
+        self.delay = delay
+        self.requests: dict[str, float] = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self._server: ThreadingHTTPServer | None = None
+
+    @property
+    def origin(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    def url(self, path: str = "/docs/") -> str:
+        return self.origin + path
+
+    def __enter__(self) -> "FixtureServer":
+        fixture = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                fixture.requests.setdefault(self.path, time.perf_counter())
+                if self.path in ("/robots.txt", "/sitemap.xml"):
+                    self._respond()
+                    return
+                # 페이지 요청만 동시 요청 수에 포함
+                with fixture._lock:
+                    fixture.in_flight += 1
+                    fixture.max_in_flight = max(fixture.max_in_flight, fixture.in_flight)
+                try:
+                    self._respond()
+                finally:
+                    with fixture._lock:
+                        fixture.in_flight -= 1
+
+            def _respond(self):
+                if fixture.delay:
+                    time.sleep(fixture.delay)
+
+                if self.path == "/robots.txt":
+                    body, content_type = f"Sitemap: {fixture.origin}/sitemap.xml\n".encode(), "text/plain"
+                elif self.path == "/sitemap.xml":
+                    body, content_type = fixture.site.sitemap(fixture.origin), "application/xml"
+                else:
+                    i = fixture.site.page_index(self.path)
+                    if i is None:
+                        self.send_error(404)
+                        return
+                    mirror = fixture.site.split_mirror(self.path)[0]
+                    body, content_type = fixture.site.render(i, mirror), "text/html; charset=utf-8"
+
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,344 @@
+"""Content-addressed on-disk page cache."""
+
+import asyncio
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import httpx
+
+from .utils.url import normalize_url
+
+# 캐시 사용 방식
+#   bypass: 캐시를 사용하지 않음 (항상 새로 크롤링)
+#   prefer: TTL 이내면 네트워크 없이 캐시 사용, 만료됐으면 조건부 요청으로 재검증
+#   revalidate: 항상 조건부 요청(ETag/Last-Modified)으로 재검증 후 사용
+CACHE_MODES = ("bypass", "prefer", "revalidate")
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "crawl4ai-mcp-server"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    url_key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    html_hash TEXT,
+    markdown_hash TEXT,
+    etag TEXT,
+    last_modified TEXT,
+    fetched_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    html_size INTEGER NOT NULL DEFAULT 0,
+    markdown_size INTEGER NOT NULL DEFAULT 0,
+    fetch_mode TEXT
+);
+CREATE INDEX IF NOT EXISTS pages_accessed_at ON pages (accessed_at);
+CREATE INDEX IF NOT EXISTS pages_html_hash ON pages (html_hash);
+CREATE INDEX IF NOT EXISTS pages_markdown_hash ON pages (markdown_hash);
+
+-- 저장할 때마다 전체 크기를 다시 합산하지 않도록 본문 크기 합계를 한 행에 유지
+CREATE TABLE IF NOT EXISTS cache_stats (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    total_bytes INTEGER NOT NULL
+);
+INSERT INTO cache_stats (id, total_bytes)
+SELECT 0, (SELECT COALESCE(SUM(html_size + markdown_size), 0) FROM pages)
+WHERE NOT EXISTS (SELECT 1 FROM cache_stats);
+CREATE TRIGGER IF NOT EXISTS pages_size_insert AFTER INSERT ON pages BEGIN
+    UPDATE cache_stats SET total_bytes = total_bytes + NEW.html_size + NEW.markdown_size;
+END;
+CREATE TRIGGER IF NOT EXISTS pages_size_update AFTER UPDATE OF html_size, markdown_size ON pages BEGIN
+    UPDATE cache_stats SET total_bytes = total_bytes
+        + NEW.html_size + NEW.markdown_size - OLD.html_size - OLD.markdown_size;
+END;
+CREATE TRIGGER IF NOT EXISTS pages_size_delete AFTER DELETE ON pages BEGIN
+    UPDATE cache_stats SET total_bytes = total_bytes - OLD.html_size - OLD.markdown_size;
+END;
+"""
+
+# 가져오기 방식별로 재사용할 수 있는 캐시 항목의 가져오기 방식
+# http로 가져온 HTML은 JS 렌더링 전의 빈 껍데기일 수 있으므로 browser/auto 요청에는 쓰지 않음
+_USABLE_FETCH_MODES = {
+    "browser": frozenset({"browser"}),
+    "auto": frozenset({"browser", "auto"}),
+    "http": frozenset({"browser", "auto", "http"}),
+}
+
+# 조회할 때마다 쓰지 않도록 accessed_at은 이 시간(초)보다 오래됐을 때만 갱신 (LRU 순서에는 충분)
+_ACCESS_RESOLUTION = 60.0
+
+
+@dataclass
+class CacheEntry:
+    """캐시된 페이지 메타데이터"""
+
+    url: str
+    html_hash: str | None
+    markdown_hash: str | None
+    etag: str | None
+    last_modified: str | None
+    fetched_at: float
+    fetch_mode: str | None = None
+
+    def serves(self, mode: str) -> bool:
+        """``mode``("browser", "http", "auto")로 가져오는 요청에 이 항목을 쓸 수 있는지
+
+        가져온 방식이 기록되지 않은 이전 항목은 http로 가져온 것으로 본다.
+        """
+        return (self.fetch_mode or "http") in _USABLE_FETCH_MODES.get(mode, ())
+
+
+def cache_key(url: str) -> str:
+    """캐시 키로 사용할 정규화된 URL (``normalize_url``)
+
+    추적용 쿼리, 끝의 ``/``, ``index.html`` 등 같은 페이지의 변형은 같은 키가 된다.
+    """
+    return normalize_url(url)
+
+
+class PageCache:
+    """URL별 원본 HTML과 정리된 마크다운을 저장하는 디스크 캐시
+
+    본문은 SHA-256 해시 이름의 blob 파일로 저장하여 같은 내용은 한 번만 기록하고,
+    인덱스(SQLite)에는 URL별 blob 해시와 ETag/Last-Modified, 조회 시각을 기록한다.
+    전체 크기가 ``max_bytes``를 넘으면 가장 오래 조회되지 않은 항목부터 제거한다.
+
+    Example:
+        cache = PageCache(ttl=3600)
+        entry = cache.get(url)
+        if entry and cache.is_fresh(entry):
+            markdown = cache.read_markdown(entry)
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path = None,
+        ttl: float = 86400.0,
+        max_bytes: int = 512 * 1024 * 1024,
+    ):
+        """
+        Args:
+            cache_dir: 캐시 디렉토리 (None이면 CRAWL4AI_MCP_CACHE_DIR 또는 ~/.cache/crawl4ai-mcp-server)
+            ttl: 재검증 없이 캐시를 신뢰하는 시간(초)
+            max_bytes: 캐시 본문의 최대 전체 크기(바이트)
+        """
+        if cache_dir is None:
+            cache_dir = os.environ.get("CRAWL4AI_MCP_CACHE_DIR", DEFAULT_CACHE_DIR)
+
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._blob_dir = self.cache_dir / "blobs"
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._client: httpx.AsyncClient | None = None
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._blob_dir.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.cache_dir / "index.sqlite", check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            # 기존 캐시의 합계 초기화와 트리거 생성 사이에 다른 프로세스가 쓰지 않도록 한 트랜잭션으로 실행
+            conn.executescript(f"BEGIN IMMEDIATE; {_SCHEMA}")
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(pages)")}
+            if "fetch_mode" not in columns:
+                # 가져오기 방식을 기록하기 전에 만든 캐시
+                conn.execute("ALTER TABLE pages ADD COLUMN fetch_mode TEXT")
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    # ---- blob 저장소 ----
+
+    def _blob_path(self, digest: str) -> Path:
+        return self._blob_dir / digest[:2] / digest
+
+    def _write_blob(self, text: str) -> tuple[str, int]:
+        data = text.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._blob_path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # writer 스레드 여러 개가 같은 내용을 동시에 저장할 수 있으므로 임시 파일은 스레드마다 따로 씀
+            tmp_path = path.with_name(f"{digest}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(data)
+            try:
+                os.replace(tmp_path, path)
+            except OSError:
+                # 내용 주소 방식이라 다른 쪽이 먼저 저장한 같은 blob이 있으면 성공으로 봄
+                tmp_path.unlink(missing_ok=True)
+                if not path.exists():
+                    raise
+        return digest, len(data)
+
+    def _read_blob(self, digest: str | None) -> str | None:
+        if not digest:
+            return None
+        try:
+            return self._blob_path(digest).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+    # ---- 조회 ----
+
+    def get(self, url: str) -> CacheEntry | None:
+        """캐시 항목 조회 (LRU 순서 갱신)"""
+        key = cache_key(url)
+        with self._lock:
+            db = self._db()
+            row = db.execute(
+                "SELECT url, html_hash, markdown_hash, etag, last_modified, fetched_at, fetch_mode, accessed_at "
+                "FROM pages WHERE url_key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            now = time.time()
+            if now - row[-1] > _ACCESS_RESOLUTION:
+                db.execute("UPDATE pages SET accessed_at = ? WHERE url_key = ?", (now, key))
+                db.commit()
+        return CacheEntry(*row[:-1])
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        """TTL 이내에 가져온 항목인지 확인"""
+        return time.time() - entry.fetched_at < self.ttl
+
+    def read_html(self, entry: CacheEntry) -> str | None:
+        return self._read_blob(entry.html_hash)
+
+    def read_markdown(self, entry: CacheEntry) -> str | None:
+        return self._read_blob(entry.markdown_hash)
+
+    # ---- 저장 ----
+
+    def put_html(self, url: str, html: str, headers: dict = None, fetch_mode: str = None) -> None:
+        """원본 HTML과 검증자(ETag/Last-Modified), 가져온 방식 저장
+
+        HTML이 바뀌면 이전 마크다운은 더 이상 유효하지 않으므로 함께 비운다.
+
+        Args:
+            url: 페이지 URL
+            html: 원본 HTML
+            headers: 응답 헤더
+            fetch_mode: HTML을 가져온 방식 ("browser", "http", "auto")
+        """
+        headers = {k.lower(): v for k, v in (headers or {}).items()}
+        html_hash, size = self._write_blob(html)
+        now = time.time()
+        key = cache_key(url)
+
+        with self._lock:
+            db = self._db()
+            row = db.execute(
+                "SELECT html_hash, markdown_hash, markdown_size FROM pages WHERE url_key = ?", (key,)
+            ).fetchone()
+            markdown_hash, markdown_size = (row[1], row[2]) if row and row[0] == html_hash else (None, 0)
+            # INSERT OR REPLACE는 삭제 트리거를 실행하지 않아 크기 합계가 어긋나므로 upsert 사용
+            db.execute(
+                "INSERT INTO pages "
+                "(url_key, url, html_hash, markdown_hash, etag, last_modified, fetched_at, accessed_at, "
+                "html_size, markdown_size, fetch_mode) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (url_key) DO UPDATE SET url = excluded.url, html_hash = excluded.html_hash, "
+                "markdown_hash = excluded.markdown_hash, etag = excluded.etag, "
+                "last_modified = excluded.last_modified, fetched_at = excluded.fetched_at, "
+                "accessed_at = excluded.accessed_at, html_size = excluded.html_size, "
+                "markdown_size = excluded.markdown_size, fetch_mode = excluded.fetch_mode",
+                (key, url, html_hash, markdown_hash, headers.get("etag"),
+                 headers.get("last-modified"), now, now, size, markdown_size, fetch_mode),
+            )
+            db.commit()
+
+        self._evict()
+
+    def put_markdown(self, url: str, markdown: str) -> None:
+        """정리된 마크다운 저장 (put_html 이후 호출)"""
+        markdown_hash, size = self._write_blob(markdown)
+        with self._lock:
+            db = self._db()
+            db.execute(
+                "UPDATE pages SET markdown_hash = ?, markdown_size = ? WHERE url_key = ?",
+                (markdown_hash, size, cache_key(url)),
+            )
+            db.commit()
+
+        self._evict()
+
+    def touch(self, url: str) -> None:
+        """304 응답 등으로 재검증된 항목의 fetched_at 갱신"""
+        with self._lock:
+            db = self._db()
+            db.execute("UPDATE pages SET fetched_at = ? WHERE url_key = ?", (time.time(), cache_key(url)))
+            db.commit()
+
+    # ---- 재검증 ----
+
+    async def revalidate(self, entry: CacheEntry, timeout: float = 10.0) -> bool:
+        """조건부 요청으로 캐시 항목이 아직 유효한지 확인
+
+        Returns:
+            서버가 304 Not Modified를 응답하면 True (fetched_at 갱신)
+        """
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        if not headers:
+            return False
+
+        if self._client is None:
+            self._client = httpx.AsyncClient(follow_redirects=True, timeout=timeout)
+
+        try:
+            # 본문은 필요 없으므로 스트림으로 열고 상태 코드만 확인
+            async with self._client.stream("GET", entry.url, headers=headers) as response:
+                not_modified = response.status_code == 304
+        except httpx.HTTPError:
+            return False
+
+        if not_modified:
+            await asyncio.to_thread(self.touch, entry.url)
+        return not_modified
+
+    # ---- 정리 ----
+
+    def _evict(self) -> None:
+        """전체 크기가 max_bytes 이하가 될 때까지 LRU 순으로 제거"""
+        with self._lock:
+            db = self._db()
+            (total,) = db.execute("SELECT total_bytes FROM cache_stats").fetchone()
+            if total <= self.max_bytes:
+                return
+
+            removed_hashes = set()
+            for key, html_hash, markdown_hash, size in db.execute(
+                "SELECT url_key, html_hash, markdown_hash, html_size + markdown_size "
+                "FROM pages ORDER BY accessed_at"
+            ).fetchall():
+                if total <= self.max_bytes:
+                    break
+                db.execute("DELETE FROM pages WHERE url_key = ?", (key,))
+                removed_hashes.update(h for h in (html_hash, markdown_hash) if h)
+                total -= size
+            db.commit()
+
+            # 다른 URL이 참조하지 않는 blob만 삭제
+            for digest in removed_hashes:
+                (referenced,) = db.execute(
+                    "SELECT EXISTS (SELECT 1 FROM pages WHERE html_hash = ?) "
+                    "OR EXISTS (SELECT 1 FROM pages WHERE markdown_hash = ?)",
+                    (digest, digest),
+                ).fetchone()
+                if not referenced:
+                    self._blob_path(digest).unlink(missing_ok=True)
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
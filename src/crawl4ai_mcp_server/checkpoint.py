@@ -0,0 +1,309 @@
+"""Deep crawl checkpoints for resuming interrupted crawls."""
+
+import json
+import sqlite3
+from pathlib import Path
+
+CHECKPOINT_FILENAME = ".crawl_checkpoint.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS urls (
+    url TEXT PRIMARY KEY,
+    depth INTEGER,
+    visited INTEGER NOT NULL DEFAULT 0,
+    seen INTEGER NOT NULL DEFAULT 0,
+    done INTEGER NOT NULL DEFAULT 0,
+    file TEXT,
+    status TEXT,
+    score REAL,
+    duplicate_of TEXT
+);
+CREATE TABLE IF NOT EXISTS frontier (
+    position INTEGER PRIMARY KEY,
+    url TEXT NOT NULL,
+    parent_url TEXT,
+    depth INTEGER,
+    score REAL
+);
+"""
+# 이전 버전 체크포인트에 없는 열 (재개할 때 추가)
+_ADDED_COLUMNS = {"urls": ("score REAL", "duplicate_of TEXT"), "frontier": ("score REAL",)}
+
+
+class CrawlCheckpoint:
+    """Deep Crawl 진행 상태(frontier, 방문 집합, 깊이, 완료 페이지)를 저장하는 SQLite 체크포인트
+
+    crawl4ai 딥 크롤 전략의 ``on_state_change`` 콜백으로 받은 상태를 ``every`` 페이지마다
+    ``{output_dir}/.crawl_checkpoint.sqlite``에 기록한다. URL별 방문/완료 여부는 새로 바뀐
+    것만 추가로 기록하고, frontier만 매번 교체하므로 큰 크롤에서도 기록량이 작다.
+
+    Example:
+        checkpoint = CrawlCheckpoint.open(output_path, start_url, "bfs", resume=True)
+        strategy = create_bfs_strategy(..., resume_state=checkpoint.resume_state(),
+                                       on_state_change=checkpoint.on_state_change)
+    """
+
+    def __init__(self, path: Path, every: int = 10):
+        """
+        Args:
+            path: 체크포인트 파일 경로
+            every: 몇 페이지마다 기록할지
+        """
+        self.path = path
+        self.every = max(1, every)
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(_SCHEMA)
+        self._migrate()
+        self._state: dict | None = None
+        # 완료됐지만 아직 링크 탐색 결과가 상태에 반영되지 않은 페이지 / 반영된 페이지
+        self._pending_done: list[tuple] = []
+        self._ready_done: list[tuple] = []
+        self._changes = 0
+        # 이미 기록된 값 (변경분만 기록하기 위해)
+        self._written_depths: set[str] = set()
+        self._written_visited: set[str] = set()
+        self._written_seen: set[str] = set()
+
+    @classmethod
+    def open(
+        cls,
+        output_path: Path,
+        start_url: str,
+        strategy: str,
+        resume: bool = False,
+        every: int = 10,
+    ) -> "CrawlCheckpoint":
+        """체크포인트 열기
+
+        resume이 False이면 기존 체크포인트를 지우고 새로 시작한다.
+
+        Raises:
+            ValueError: 기존 체크포인트의 시작 URL이나 전략이 다를 때
+        """
+        path = output_path / CHECKPOINT_FILENAME
+        if not resume:
+            path.unlink(missing_ok=True)
+
+        checkpoint = cls(path, every=every)
+        meta = checkpoint._meta()
+        if not meta:
+            checkpoint._set_meta(start_url=start_url, strategy=strategy, pages_crawled=0)
+        elif meta["start_url"] != start_url or meta["strategy"] != strategy:
+            checkpoint.close()
+            raise ValueError(
+                f"Checkpoint in {output_path} belongs to {meta['start_url']} ({meta['strategy']}), "
+                f"not {start_url} ({strategy})"
+            )
+        else:
+            checkpoint._load_written()
+        return checkpoint
+
+    def _migrate(self) -> None:
+        for table, columns in _ADDED_COLUMNS.items():
+            existing = {row[1] for row in self._conn.execute(f"PRAGMA table_info({table})")}
+            for column in columns:
+                if column.split()[0] not in existing:
+                    self._conn.execute(f"ALTER TABLE {table} ADD COLUMN {column}")
+        self._conn.commit()
+
+    # ---- 메타데이터 ----
+
+    def _meta(self) -> dict:
+        return {key: json.loads(value) for key, value in self._conn.execute("SELECT key, value FROM meta")}
+
+    def _set_meta(self, **values) -> None:
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            [(key, json.dumps(value)) for key, value in values.items()],
+        )
+        self._conn.commit()
+
+    def _load_written(self) -> None:
+        for url, depth, visited, seen in self._conn.execute("SELECT url, depth, visited, seen FROM urls"):
+            if depth is not None:
+                self._written_depths.add(url)
+            if visited:
+                self._written_visited.add(url)
+            if seen:
+                self._written_seen.add(url)
+
+    # ---- 복원 ----
+
+    def resume_state(self) -> dict | None:
+        """crawl4ai 딥 크롤 전략의 ``resume_state``로 넘길 상태 (저장된 진행이 없으면 None)
+
+        BFS는 한 단계의 URL을 모두 visited에 넣은 뒤 가져오고, DFS와 Best-First는 꺼낸 URL을 바로
+        visited에 넣는다. 또 저장 단계에서 아직 기록 중인 페이지도 있으므로, 중단 시점에 방문했지만 완료되지
+        않은 URL은 frontier에 없다. 이런 URL은 먼저 처리되도록 frontier에 다시 넣는다.
+        """
+        meta = self._meta()
+        if not self._written_visited:
+            return None
+
+        depths, visited, seen, done = {}, [], [], set()
+        for url, depth, is_visited, is_seen, is_done in self._conn.execute(
+            "SELECT url, depth, visited, seen, done FROM urls"
+        ):
+            if depth is not None:
+                depths[url] = depth
+            if is_visited:
+                visited.append(url)
+            if is_seen:
+                seen.append(url)
+            if is_done:
+                done.add(url)
+
+        frontier = [
+            {"url": url, "parent_url": parent_url, "depth": depth, "score": score}
+            for url, parent_url, depth, score in self._conn.execute(
+                "SELECT url, parent_url, depth, score FROM frontier ORDER BY position"
+            )
+        ]
+
+        state = {
+            "strategy_type": meta["strategy"],
+            "visited": visited,
+            "depths": depths,
+            "pages_crawled": meta.get("pages_crawled", 0),
+        }
+        queued = {item["url"] for item in frontier}
+        unfinished = [
+            url for url in sorted(visited, key=lambda u: depths.get(u, 0)) if url not in done and url not in queued
+        ]
+
+        if meta["strategy"] == "dfs":
+            # DFS는 visited에 있는 URL을 건너뛰므로 visited에서 빼고 스택 맨 위에 다시 넣음
+            state["visited"] = [url for url in visited if url not in unfinished]
+            state["stack"] = frontier + [
+                {"url": url, "parent_url": None, "depth": depths.get(url, 0)} for url in reversed(unfinished)
+            ]
+            state["dfs_seen"] = seen
+        elif meta["strategy"] == "best_first":
+            # 우선순위 큐의 score는 음수로 저장됨 (작을수록 먼저). 미완료 URL은 남은 URL 중
+            # 가장 높은 우선순위로 다시 넣음
+            top = min((item["score"] for item in frontier if item["score"] is not None), default=0.0)
+            state["visited"] = [url for url in visited if url not in unfinished]
+            state["queue_items"] = [
+                {"score": top, "depth": depths.get(url, 0), "url": url, "parent_url": None} for url in unfinished
+            ] + [
+                {
+                    "score": item["score"] if item["score"] is not None else 0.0,
+                    "depth": item["depth"] if item["depth"] is not None else depths.get(item["url"], 0),
+                    "url": item["url"],
+                    "parent_url": item["parent_url"],
+                }
+                for item in frontier
+            ]
+        else:
+            state["pending"] = [{"url": url, "parent_url": None} for url in unfinished] + [
+                {"url": item["url"], "parent_url": item["parent_url"]} for item in frontier
+            ]
+        return state
+
+    def completed(self) -> list[dict]:
+        """이전 실행에서 완료된 페이지 (url, depth, file, status, score, duplicate_of)"""
+        return [
+            {"url": url, "depth": depth, "file": file, "status": status, "score": score, "duplicate_of": duplicate_of}
+            for url, depth, file, status, score, duplicate_of in self._conn.execute(
+                "SELECT url, depth, file, status, score, duplicate_of FROM urls WHERE done = 1 ORDER BY rowid"
+            )
+        ]
+
+    # ---- 기록 ----
+
+    async def on_state_change(self, state: dict) -> None:
+        """딥 크롤 전략의 상태 변경 콜백 (``every`` 번마다 기록)"""
+        self._state = state
+        self._ready_done.extend(self._pending_done)
+        self._pending_done = []
+        self._changes += 1
+        if self._changes >= self.every:
+            self.flush()
+
+    def mark_done(
+        self,
+        url: str,
+        depth: int,
+        file: str | None = None,
+        status: str | None = None,
+        score: float | None = None,
+        duplicate_of: str | None = None,
+    ) -> None:
+        """처리가 끝난 페이지 기록
+
+        페이지의 링크 탐색이 반영된 상태를 받은 뒤에야 저장되므로, 중단 시 하위 링크가
+        기록되지 않은 페이지는 재개할 때 다시 가져온다. 실패한 페이지도 file 없이 기록하여
+        재개 시 다시 가져오지 않는다.
+        """
+        self._pending_done.append((url, depth, file, status, score, duplicate_of))
+
+    def flush(self) -> None:
+        """마지막으로 받은 상태와 그 상태에 반영된 완료 페이지를 하나의 트랜잭션으로 기록"""
+        state = self._state
+        if state is None:
+            return
+
+        with self._conn:
+            self._write_state(state)
+            self._conn.executemany(
+                "INSERT INTO urls (url, depth, done, file, status, score, duplicate_of) "
+                "VALUES (?, ?, 1, ?, ?, ?, ?) "
+                "ON CONFLICT(url) DO UPDATE SET done = 1, file = excluded.file, status = excluded.status, "
+                "score = excluded.score, duplicate_of = excluded.duplicate_of",
+                self._ready_done,
+            )
+
+        self._state = None
+        self._ready_done = []
+        self._changes = 0
+
+    def _write_state(self, state: dict) -> None:
+        depths = state.get("depths", {})
+        new_depths = [(url, depth) for url, depth in depths.items() if url not in self._written_depths]
+        self._conn.executemany(
+            "INSERT INTO urls (url, depth) VALUES (?, ?) ON CONFLICT(url) DO UPDATE SET depth = excluded.depth",
+            new_depths,
+        )
+        self._written_depths.update(url for url, _ in new_depths)
+
+        for column, key, written in (
+            ("visited", "visited", self._written_visited),
+            ("seen", "dfs_seen", self._written_seen),
+        ):
+            new_urls = [url for url in state.get(key, []) if url not in written]
+            self._conn.executemany(
+                f"INSERT INTO urls (url, {column}) VALUES (?, 1) ON CONFLICT(url) DO UPDATE SET {column} = 1",
+                [(url,) for url in new_urls],
+            )
+            written.update(new_urls)
+
+        frontier = state.get("queue_items") or state.get("stack") or [
+            {"url": item["url"], "parent_url": item["parent_url"], "depth": depths.get(item["url"])}
+            for item in state.get("pending", [])
+        ]
+        self._conn.execute("DELETE FROM frontier")
+        self._conn.executemany(
+            "INSERT INTO frontier (position, url, parent_url, depth, score) VALUES (?, ?, ?, ?, ?)",
+            [
+                (i, item["url"], item["parent_url"], item.get("depth"), item.get("score"))
+                for i, item in enumerate(frontier)
+            ],
+        )
+        self._conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('pages_crawled', ?)",
+            (json.dumps(state.get("pages_crawled", 0)),),
+        )
+
+    # ---- 정리 ----
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def remove(self) -> None:
+        """크롤이 끝까지 완료되면 체크포인트 삭제"""
+        self.close()
+        self.path.unlink(missing_ok=True)
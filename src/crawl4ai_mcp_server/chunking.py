@@ -0,0 +1,150 @@
+"""Heading-aware markdown chunking and the chunk cache behind ``get_chunk``."""
+
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from .utils.url import normalize_url
+
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.+?)\s*#*\s*$")
+_FENCE_RE = re.compile(r"^\s*(```|~~~)")
+_SLUG_STRIP_RE = re.compile(r"[^\w\- ]")
+
+
+@dataclass(slots=True)
+class Chunk:
+    """제목 경계로 나눈 마크다운 조각
+
+    ``id``는 가장 가까운 제목의 슬러그(GitHub 앵커와 같은 규칙, 같은 슬러그가 다시 나오면 겹치지 않는
+    ``-1``, ``-2``를 붙임)이고, 첫 제목 앞의 내용은 ``intro``다. 페이지의 다른 섹션이 바뀌어도
+    그 앞의 조각 ID는 그대로다.
+    """
+
+    id: str
+    heading: str
+    text: str
+    tokens: int
+
+
+def _slug(title: str) -> str:
+    return _SLUG_STRIP_RE.sub("", title.lower()).strip().replace(" ", "-") or "section"
+
+
+def estimate_tokens(text: str) -> int:
+    """대략적인 토큰 수 (영문 기준 4자당 1토큰)"""
+    return (len(text) + 3) // 4
+
+
+def _split_section(lines: list[str], max_tokens: int) -> list[str]:
+    """한 섹션이 너무 길면 코드 블록 밖의 빈 줄(문단 경계)에서 나눔"""
+    pieces, current, size, in_fence = [], [], 0, False
+    for line in lines:
+        if _FENCE_RE.match(line):
+            in_fence = not in_fence
+        if not in_fence and not line.strip() and size >= max_tokens * 4:
+            pieces.append("\n".join(current))
+            current, size = [], 0
+            continue
+        current.append(line)
+        size += len(line) + 1
+    pieces.append("\n".join(current))
+    return [piece.strip() for piece in pieces if piece.strip()]
+
+
+def split_chunks(markdown: str, max_tokens: int = 400) -> list[Chunk]:
+    """마크다운을 제목(#~######) 경계에서 조각으로 나눔
+
+    각 조각의 ``heading``은 상위 제목까지 이어 붙인 경로("Guide > Install > pip")이고, 본문은
+    그 제목 줄부터 다음 제목 전까지다. 코드 블록 안의 ``#`` 줄은 제목으로 보지 않는다.
+    한 섹션이 ``max_tokens``를 넘으면 문단 경계에서 다시 나누므로 조각이 대략 이 크기를 넘지 않는다
+    (문단 하나가 더 길면 그대로 둠). 본문 없이 제목만 있는 섹션은 건너뛴다.
+
+    Args:
+        markdown: 정리된 마크다운
+        max_tokens: 조각의 대략적인 최대 토큰 수
+
+    Returns:
+        문서 순서대로 나열한 조각
+    """
+    chunks: list[Chunk] = []
+    headings: list[tuple[int, str]] = []
+    section: list[str] = []
+    has_body = False
+    slugs: dict[str, int] = {}
+
+    def flush() -> None:
+        if not has_body:
+            return
+        heading = " > ".join(title for _, title in headings)
+        base = _slug(headings[-1][1]) if headings else "intro"
+        for text in _split_section(section, max_tokens):
+            chunk_id = base
+            # "Foo", "Foo-1", "Foo"처럼 붙인 번호가 다른 제목과 겹치면 다음 번호로 넘어감
+            while chunk_id in slugs:
+                slugs[base] += 1
+                chunk_id = f"{base}-{slugs[base]}"
+            slugs[chunk_id] = 0
+            chunks.append(Chunk(id=chunk_id, heading=heading, text=text, tokens=estimate_tokens(text)))
+
+    in_fence = False
+    for line in markdown.splitlines():
+        if _FENCE_RE.match(line):
+            in_fence = not in_fence
+        match = None if in_fence else _HEADING_RE.match(line)
+        if match:
+            flush()
+            level = len(match.group(1))
+            while headings and headings[-1][0] >= level:
+                headings.pop()
+            headings.append((level, match.group(2)))
+            section, has_body = [line], False
+        else:
+            section.append(line)
+            has_body = has_body or bool(line.strip())
+    flush()
+    return chunks
+
+
+class ChunkCache:
+    """나눠서 보낸 페이지의 조각을 이어서 꺼낼 수 있도록 보관하는 메모리 LRU 캐시
+
+    ``crawl_page``가 토큰 예산을 넘는 페이지의 앞부분만 반환할 때 전체 조각을 URL(정규화)별로
+    넣어두고, ``get_chunk``가 나머지를 다시 크롤링하지 않고 꺼낸다. 조각 본문의 총 크기가
+    ``max_bytes``를 넘으면 가장 오래 쓰지 않은 페이지부터 버리고, ``ttl``초가 지난 페이지는 꺼내지 않는다.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, ttl: float = 3600):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._pages: OrderedDict[str, tuple[float, int, list[Chunk]]] = OrderedDict()
+        self._bytes = 0
+
+    def put(self, url: str, chunks: list[Chunk]) -> None:
+        key = normalize_url(url)
+        self._discard(key)
+        size = sum(len(chunk.text) for chunk in chunks)
+        self._pages[key] = (time.monotonic(), size, chunks)
+        self._bytes += size
+        while self._bytes > self.max_bytes and len(self._pages) > 1:
+            self._discard(next(iter(self._pages)))
+
+    def get(self, url: str) -> list[Chunk] | None:
+        """URL의 조각 (없거나 만료됐으면 None)"""
+        key = normalize_url(url)
+        entry = self._pages.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] > self.ttl:
+            self._discard(key)
+            return None
+        self._pages.move_to_end(key)
+        return entry[2]
+
+    def _discard(self, key: str) -> None:
+        entry = self._pages.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+
+    def __len__(self) -> int:
+        return len(self._pages)
@@ -1,10 +1,21 @@
 """CLI interface for the crawler."""
 
 import asyncio
+from pathlib import Path
 
 import typer
 
-from .core import crawl_documentation, crawl_single_page
+from .cache import CACHE_MODES
+from .configs.deep_crawl import DEEP_CRAWL_STRATEGIES
+from .core import crawl_documentation, crawl_documentation_distributed, crawl_single_page
+from .corpus import OUTPUT_FORMATS
+from .dedup import DEDUP_MODES
+from .metrics import get_metrics
+from .scheduler import HostScheduler, PolitenessPolicy
+from .search import query_index
+from .strategies.http import FETCH_MODES
+from .strategies.content import load_profiles
+from .strategies.scrape import ScrapeProcessPool
 
 app = typer.Typer(help="공식문서 크롤러 - 웹사이트를 크롤링하여 디렉토리 구조로 저장")
 
@@ -17,7 +28,29 @@ def crawl(
     max_pages: int = typer.Option(100, "--max-pages", "-p", help="최대 크롤링 페이지 수 (--recursive 사용 시)"),
     max_depth: int = typer.Option(2, "--max-depth", "-d", help="최대 크롤링 깊이 (--recursive 사용 시)"),
     prefix: str = typer.Option(None, "--prefix", "-px", help="URL 프리픽스 필터 (--recursive 사용 시, 지정 시 해당 프리픽스로 시작하는 URL만 크롤링)"),
-    strategy: str = typer.Option("bfs", "--strategy", "-s", help="크롤링 전략: bfs (너비 우선) 또는 dfs (깊이 우선)"),
+    strategy: str = typer.Option("bfs", "--strategy", "-s", help="크롤링 전략: bfs (너비 우선), dfs (깊이 우선), best_first (키워드 관련도 우선)"),
+    keywords: str = typer.Option(None, "--keywords", "-k", help="best_first 전략의 관련도 키워드 (쉼표로 구분, 예: auth,oauth)"),
+    score_threshold: float = typer.Option(None, "--score-threshold", help="best_first 전략에서 이 점수(0~0.8) 미만인 링크는 따라가지 않음 (관련 링크가 없으면 조기 종료)"),
+    cache: str = typer.Option("bypass", "--cache", "-c", help="캐시 모드: bypass (항상 새로 크롤링), prefer (캐시 우선), revalidate (조건부 요청으로 재검증)"),
+    mode: str = typer.Option("browser", "--mode", "-m", help="가져오기 방식: browser (Chromium 렌더링), http (브라우저 없이 HTTP), auto (HTTP 우선, JS 렌더링 페이지만 브라우저)"),
+    incremental: bool = typer.Option(False, "--incremental", "-i", help="증분 크롤링: 바뀐 페이지만 다시 저장 (--recursive 사용 시)"),
+    sitemap_lastmod: bool = typer.Option(False, "--sitemap-lastmod", help="sitemap.xml의 lastmod로 바뀌지 않은 페이지는 가져오지 않음 (--incremental 사용 시)"),
+    dedup: str = typer.Option("off", "--dedup", help="유사 중복 페이지 처리: off, alias (버전별 경로/미러처럼 내용이 거의 같은 페이지는 저장하지 않고 별칭으로 기록), prune (alias + 그 페이지의 링크도 따라가지 않음) (--recursive 사용 시)"),
+    output_format: str = typer.Option("markdown", "--output-format", "-f", help="저장 형식: markdown (페이지마다 .md 파일), packed (corpus.pack 한 파일에 압축 저장 + URL 색인) (--recursive 사용 시)"),
+    search_index: bool = typer.Option(True, "--search-index/--no-search-index", help="저장한 페이지를 제목 단위로 검색 인덱스에 추가 (search 명령으로 검색, --recursive 사용 시)"),
+    resume: bool = typer.Option(False, "--resume", help="중단된 크롤을 출력 디렉토리의 체크포인트에서 이어서 진행 (--recursive 사용 시)"),
+    sitemap: bool = typer.Option(False, "--sitemap", help="robots.txt/sitemap.xml의 URL을 링크 탐색 없이 병렬 크롤링 (--recursive 사용 시)"),
+    profiles: str = typer.Option(None, "--profiles", help="사이트별 헤더/푸터 마커를 정의한 클리닝 프로필 JSON 파일"),
+    metrics_jsonl: str = typer.Option(None, "--metrics-jsonl", help="페이지별 단계 소요 시간(span)을 JSON Lines로 기록할 파일"),
+    rate: float = typer.Option(10.0, "--rate", help="호스트별 초당 최대 요청 수 (0이면 제한 없음)"),
+    host_concurrency: int = typer.Option(8, "--host-concurrency", help="호스트별 최대 동시 요청 수 (응답 시간과 오류에 따라 이 안에서 자동 조절)"),
+    max_retries: int = typer.Option(3, "--max-retries", help="429/5xx 응답이나 연결 오류 시 최대 재시도 횟수"),
+    ignore_crawl_delay: bool = typer.Option(False, "--ignore-crawl-delay", help="robots.txt의 Crawl-delay를 무시"),
+    scrape_workers: int = typer.Option(0, "--scrape-workers", help="스크래핑/마크다운 생성을 실행할 워커 프로세스 수 (0이면 사용하지 않음)"),
+    frontier: str = typer.Option(None, "--frontier", help="공유 frontier 파일: 여러 워커 프로세스/호스트가 Deep Crawl을 나눠 진행 (--recursive 사용 시)"),
+    workers: int = typer.Option(2, "--workers", help="--frontier 사용 시 이 호스트에서 실행할 워커 프로세스 수 (0이면 다른 호스트의 워커만 기다림)"),
+    worker_concurrency: int = typer.Option(8, "--worker-concurrency", help="--frontier 워커마다 동시에 가져오는 최대 페이지 수"),
+    frontier_wal: bool = typer.Option(True, "--frontier-wal/--no-frontier-wal", help="frontier에 WAL 저널 사용 (다른 호스트의 워커가 네트워크 파일 시스템으로 접근하면 --no-frontier-wal)"),
 ):
     """웹사이트 크롤링 실행"""
     # 유효성 검사: --prefix는 --recursive와 함께만 사용 가능
@@ -30,19 +63,215 @@ def crawl(
         typer.echo("❌ Error: --strategy 옵션은 --recursive 옵션과 함께 사용해야 합니다.", err=True)
         raise typer.Exit(code=1)
 
-    if strategy not in ("bfs", "dfs"):
-        typer.echo(f"❌ Error: 지원하지 않는 전략입니다: {strategy} (bfs 또는 dfs)", err=True)
+    if strategy not in DEEP_CRAWL_STRATEGIES:
+        typer.echo(f"❌ Error: 지원하지 않는 전략입니다: {strategy} ({', '.join(DEEP_CRAWL_STRATEGIES)})", err=True)
         raise typer.Exit(code=1)
 
-    if recursive:
-        # Deep Crawl 모드
-        asyncio.run(crawl_documentation(url, output_dir, max_pages, max_depth, prefix, strategy))
-    else:
-        # 단일 페이지 모드
-        markdown = asyncio.run(crawl_single_page(url, output_dir))
-        if not output_dir:
-            # 출력 디렉토리가 없으면 마크다운 출력
-            typer.echo("\n" + markdown)
+    # 유효성 검사: --keywords, --score-threshold는 best_first 전략과 함께만 사용 가능
+    keyword_list = [keyword.strip() for keyword in (keywords or "").split(",") if keyword.strip()]
+    if strategy == "best_first" and not keyword_list:
+        typer.echo("❌ Error: best_first 전략은 --keywords 옵션이 필요합니다.", err=True)
+        raise typer.Exit(code=1)
+
+    if (keyword_list or score_threshold is not None) and strategy != "best_first":
+        typer.echo("❌ Error: --keywords, --score-threshold 옵션은 --strategy best_first와 함께 사용해야 합니다.", err=True)
+        raise typer.Exit(code=1)
+
+    # 유효성 검사: --incremental은 --recursive와, --sitemap-lastmod는 --incremental과 함께만 사용 가능
+    if incremental and not recursive:
+        typer.echo("❌ Error: --incremental 옵션은 --recursive 옵션과 함께 사용해야 합니다.", err=True)
+        raise typer.Exit(code=1)
+
+    if resume and not recursive:
+        typer.echo("❌ Error: --resume 옵션은 --recursive 옵션과 함께 사용해야 합니다.", err=True)
+        raise typer.Exit(code=1)
+
+    if dedup != "off" and not recursive:
+        typer.echo("❌ Error: --dedup 옵션은 --recursive 옵션과 함께 사용해야 합니다.", err=True)
+        raise typer.Exit(code=1)
+
+    if dedup not in DEDUP_MODES:
+        typer.echo(f"❌ Error: 지원하지 않는 중복 처리 방식입니다: {dedup} ({', '.join(DEDUP_MODES)})", err=True)
+        raise typer.Exit(code=1)
+
+    if output_format != "markdown" and not recursive:
+        typer.echo("❌ Error: --output-format 옵션은 --recursive 옵션과 함께 사용해야 합니다.", err=True)
+        raise typer.Exit(code=1)
+
+    if output_format not in OUTPUT_FORMATS:
+        typer.echo(f"❌ Error: 지원하지 않는 저장 형식입니다: {output_format} ({', '.join(OUTPUT_FORMATS)})", err=True)
+        raise typer.Exit(code=1)
+
+    if sitemap and not recursive:
+        typer.echo("❌ Error: --sitemap 옵션은 --recursive 옵션과 함께 사용해야 합니다.", err=True)
+        raise typer.Exit(code=1)
+
+    if sitemap_lastmod and not incremental:
+        typer.echo("❌ Error: --sitemap-lastmod 옵션은 --incremental 옵션과 함께 사용해야 합니다.", err=True)
+        raise typer.Exit(code=1)
+
+    if cache not in CACHE_MODES:
+        typer.echo(f"❌ Error: 지원하지 않는 캐시 모드입니다: {cache} ({', '.join(CACHE_MODES)})", err=True)
+        raise typer.Exit(code=1)
+
+    if mode not in FETCH_MODES:
+        typer.echo(f"❌ Error: 지원하지 않는 가져오기 방식입니다: {mode} ({', '.join(FETCH_MODES)})", err=True)
+        raise typer.Exit(code=1)
+
+    if rate < 0 or host_concurrency < 1 or max_retries < 0:
+        typer.echo("❌ Error: --rate와 --max-retries는 0 이상, --host-concurrency는 1 이상이어야 합니다.", err=True)
+        raise typer.Exit(code=1)
+
+    if scrape_workers < 0:
+        typer.echo("❌ Error: --scrape-workers는 0 이상이어야 합니다.", err=True)
+        raise typer.Exit(code=1)
+
+    if frontier and not recursive:
+        typer.echo("❌ Error: --frontier 옵션은 --recursive 옵션과 함께 사용해야 합니다.", err=True)
+        raise typer.Exit(code=1)
+
+    if frontier:
+        # frontier는 깊이 순서(BFS)로 링크를 나눠 주고, 페이지 간 상태가 필요한 기능은 지원하지 않음
+        unsupported = [
+            option
+            for option, used in (
+                ("--strategy", strategy != "bfs"),
+                ("--incremental", incremental),
+                ("--dedup", dedup != "off"),
+                ("--output-format", output_format != "markdown"),
+                ("--sitemap", sitemap),
+                ("--ignore-crawl-delay", ignore_crawl_delay),
+            )
+            if used
+        ]
+        if unsupported:
+            typer.echo(f"❌ Error: --frontier 옵션은 {', '.join(unsupported)} 옵션과 함께 사용할 수 없습니다.", err=True)
+            raise typer.Exit(code=1)
+
+    if workers < 0 or worker_concurrency < 1:
+        typer.echo("❌ Error: --workers는 0 이상, --worker-concurrency는 1 이상이어야 합니다.", err=True)
+        raise typer.Exit(code=1)
+
+    if profiles:
+        try:
+            load_profiles(profiles)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            typer.echo(f"❌ Error: 클리닝 프로필을 읽을 수 없습니다: {profiles} ({e})", err=True)
+            raise typer.Exit(code=1)
+
+    if metrics_jsonl:
+        get_metrics().set_jsonl_path(metrics_jsonl)
+
+    if frontier:
+        # 워커 프로세스(crawl4ai-mcp-server --frontier)는 환경 변수로 설정을 받음
+        worker_env = {
+            "CRAWL4AI_HOST_RATE": str(rate),
+            "CRAWL4AI_HOST_CONCURRENCY": str(host_concurrency),
+            "CRAWL4AI_MAX_RETRIES": str(max_retries),
+            "CRAWL4AI_SCRAPE_WORKERS": str(scrape_workers),
+        }
+        if profiles:
+            worker_env["CRAWL4AI_CLEANING_PROFILES"] = str(Path(profiles).resolve())
+        if metrics_jsonl:
+            worker_env["CRAWL4AI_METRICS_JSONL"] = str(Path(metrics_jsonl).resolve())
+        try:
+            asyncio.run(
+                crawl_documentation_distributed(
+                    url,
+                    frontier,
+                    output_dir,
+                    max_pages,
+                    max_depth,
+                    prefix,
+                    mode=mode,
+                    cache_mode=cache,
+                    workers=workers,
+                    concurrency=worker_concurrency,
+                    worker_env=worker_env,
+                    search_index=search_index,
+                    resume=resume,
+                    wal=frontier_wal,
+                )
+            )
+        except (ValueError, RuntimeError) as e:
+            typer.echo(f"❌ Error: {e}", err=True)
+            raise typer.Exit(code=1)
+        return
+
+    scheduler = HostScheduler(
+        PolitenessPolicy(
+            rate=rate,
+            max_concurrency=host_concurrency,
+            max_retries=max_retries,
+            respect_robots=not ignore_crawl_delay,
+        )
+    )
+
+    scrape_pool = ScrapeProcessPool(workers=scrape_workers) if scrape_workers else None
+
+    try:
+        if recursive:
+            # Deep Crawl 모드
+            try:
+                asyncio.run(
+                    crawl_documentation(
+                        url,
+                        output_dir,
+                        max_pages,
+                        max_depth,
+                        prefix,
+                        strategy,
+                        keywords=keyword_list or None,
+                        score_threshold=score_threshold,
+                        cache_mode=cache,
+                        mode=mode,
+                        scheduler=scheduler,
+                        scrape_pool=scrape_pool,
+                        incremental=incremental,
+                        sitemap_lastmod=sitemap_lastmod,
+                        dedup=dedup,
+                        output_format=output_format,
+                        search_index=search_index,
+                        resume=resume,
+                        use_sitemap=sitemap,
+                    )
+                )
+            except ValueError as e:
+                typer.echo(f"❌ Error: {e}", err=True)
+                raise typer.Exit(code=1)
+        else:
+            # 단일 페이지 모드
+            markdown = asyncio.run(
+                crawl_single_page(
+                    url, output_dir, cache_mode=cache, mode=mode, scheduler=scheduler, scrape_pool=scrape_pool
+                )
+            )
+            if not output_dir:
+                # 출력 디렉토리가 없으면 마크다운 출력
+                typer.echo("\n" + markdown)
+    finally:
+        if scrape_pool is not None:
+            scrape_pool.close()
+
+
+@app.command()
+def search(
+    query: str = typer.Argument(..., help="검색어"),
+    output_dir: str = typer.Option(..., "--output-dir", "-o", help="Deep Crawl로 저장한 출력 디렉토리"),
+    k: int = typer.Option(5, "--k", "-k", help="최대 결과 수"),
+):
+    """Deep Crawl로 저장한 페이지에서 검색 (제목 단위 조각, BM25 순위)"""
+    try:
+        hits = query_index(output_dir, query, k)
+    except FileNotFoundError:
+        typer.echo(f"❌ Error: 검색 인덱스가 없습니다: {output_dir} (--recursive로 먼저 크롤링하세요)", err=True)
+        raise typer.Exit(code=1)
+
+    if not hits:
+        typer.echo(f"검색 결과가 없습니다: {query}")
+        return
+    for i, hit in enumerate(hits, 1):
+        typer.echo(f"\n{i}. {hit.heading or hit.url} (score {hit.score:.2f})\n   {hit.url}\n   {hit.file}\n   {hit.snippet}")
 
 
 @app.command()
@@ -61,6 +290,7 @@ def config_list():
     print("\n=== Deep Crawl Strategies ===")
     print("- bfs: 너비 우선 탐색 (기본값)")
     print("- dfs: 깊이 우선 탐색")
+    print("- best_first: 키워드 관련도 우선 탐색 (--keywords, 결과는 점수순)")
 
 
 if __name__ == "__main__":
@@ -1,8 +1,23 @@
 """Configuration presets for Crawl4AI."""
 
-from .browser import FAST_CONFIG, DEBUG_CONFIG, STEALTH_CONFIG
-from .crawler import DOCS_CRAWL_CONFIG, TEXT_ONLY_CONFIG, COMPREHENSIVE_CONFIG
-from .deep_crawl import create_bfs_strategy, create_dfs_strategy, create_best_first_strategy
+from ..utils.lazy import lazy_exports
+
+# 프리셋과 전략 모듈(crawl4ai)은 처음 접근할 때 import
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "FAST_CONFIG": ".browser",
+        "DEBUG_CONFIG": ".browser",
+        "STEALTH_CONFIG": ".browser",
+        "DOCS_CRAWL_CONFIG": ".crawler",
+        "TEXT_ONLY_CONFIG": ".crawler",
+        "COMPREHENSIVE_CONFIG": ".crawler",
+        "DEEP_CRAWL_STRATEGIES": ".deep_crawl",
+        "create_bfs_strategy": ".deep_crawl",
+        "create_dfs_strategy": ".deep_crawl",
+        "create_best_first_strategy": ".deep_crawl",
+    },
+)
 
 __all__ = [
     # Browser configs
@@ -14,6 +29,7 @@ __all__ = [
     "TEXT_ONLY_CONFIG",
     "COMPREHENSIVE_CONFIG",
     # Deep crawl strategies
+    "DEEP_CRAWL_STRATEGIES",
     "create_bfs_strategy",
     "create_dfs_strategy",
     "create_best_first_strategy",
@@ -1,36 +1,66 @@
-"""Browser configuration presets."""
+"""Browser configuration presets.
+
+프리셋은 처음 사용할 때 만든다. crawl4ai import와 User-Agent 생성 비용이 MCP 서버의
+시작(initialize/list_tools 응답)에 들어가지 않도록 하기 위함이다. 만든 객체는 모듈 속성으로
+남으므로 ``from .browser import FAST_CONFIG``는 항상 같은 객체를 돌려준다(BrowserPool이 프리셋
+객체 단위로 브라우저를 재사용함).
+"""
+
+from typing import TYPE_CHECKING
+
+from ..utils.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from crawl4ai import BrowserConfig
 
-from crawl4ai import BrowserConfig
 
 # 빠른 크롤링용 - 텍스트 모드, 최소 리소스
-FAST_CONFIG = BrowserConfig(
-    headless=True,
-    text_mode=True,  # 이미지 비활성화
-    light_mode=True,  # 백그라운드 기능 최소화로 성능 향상
-    viewport_width=1280,
-    viewport_height=720,
-    verbose=False,
-)
+def _fast_config() -> "BrowserConfig":
+    from crawl4ai import BrowserConfig
+
+    return BrowserConfig(
+        headless=True,
+        text_mode=True,  # 이미지 비활성화
+        light_mode=True,  # 백그라운드 기능 최소화로 성능 향상
+        viewport_width=1280,
+        viewport_height=720,
+        verbose=False,
+    )
+
 
 # 디버깅용 - 브라우저 표시, 상세 로그
-DEBUG_CONFIG = BrowserConfig(
-    headless=False,
-    viewport_width=1920,
-    viewport_height=1080,
-    verbose=True,
-)
+def _debug_config() -> "BrowserConfig":
+    from crawl4ai import BrowserConfig
+
+    return BrowserConfig(
+        headless=False,
+        viewport_width=1920,
+        viewport_height=1080,
+        verbose=True,
+    )
+
 
 # 스텔스 크롤링용 - playwright-stealth 기반 봇 감지 회피
-STEALTH_CONFIG = BrowserConfig(
-    headless=True,
-    viewport_width=1920,
-    viewport_height=1080,
-    enable_stealth=True,  # playwright-stealth로 브라우저 핑거프린트 수정
-    user_agent_mode="random",  # 랜덤 User-Agent로 봇 감지 회피
+def _stealth_config() -> "BrowserConfig":
+    from crawl4ai import BrowserConfig
+
+    return BrowserConfig(
+        headless=True,
+        viewport_width=1920,
+        viewport_height=1080,
+        enable_stealth=True,  # playwright-stealth로 브라우저 핑거프린트 수정
+        user_agent_mode="random",  # 랜덤 User-Agent로 봇 감지 회피
+    )
+
+
+__getattr__ = lazy_attributes(
+    __name__,
+    {"FAST_CONFIG": _fast_config, "DEBUG_CONFIG": _debug_config, "STEALTH_CONFIG": _stealth_config},
 )
 
+
 # 프록시 사용 예시
-def create_proxy_config(proxy_url: str, username: str = None, password: str = None) -> BrowserConfig:
+def create_proxy_config(proxy_url: str, username: str = None, password: str = None) -> "BrowserConfig":
     """프록시를 사용하는 브라우저 설정 생성
 
     Args:
@@ -38,6 +68,8 @@ def create_proxy_config(proxy_url: str, username: str = None, password: str = No
         username: 프록시 인증 사용자명
         password: 프록시 인증 비밀번호
     """
+    from crawl4ai import BrowserConfig
+
     proxy_config = {"server": proxy_url}
     if username and password:
         proxy_config["username"] = username
@@ -1,51 +1,83 @@
-"""Crawler run configuration presets."""
+"""Crawler run configuration presets.
+
+브라우저 프리셋(``browser.py``)과 같이 처음 사용할 때 만든다.
+"""
+
+from typing import TYPE_CHECKING
+
+from ..utils.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from crawl4ai import CrawlerRunConfig
 
-from crawl4ai import CrawlerRunConfig, CacheMode
-from crawl4ai.content_scraping_strategy import LXMLWebScrapingStrategy
 
 # 문서 크롤링용 기본 설정
-DOCS_CRAWL_CONFIG = CrawlerRunConfig(
-    # LXML 기반 고속 HTML 파싱
-    scraping_strategy=LXMLWebScrapingStrategy(),
-    # 캐시 우회 (항상 최신 데이터)
-    cache_mode=CacheMode.BYPASS,
-    # 불필요한 태그 제거 (nav는 링크 추출을 위해 유지)
-    excluded_tags=["script", "style"],
-    # 외부 이미지 제외
-    exclude_external_images=True,
-    # 오버레이 요소 제거 (팝업, 모달 등)
-    remove_overlay_elements=True,
-    # 스트리밍 활성화
-    stream=True,
-    verbose=True,
-)
+def _docs_crawl_config() -> "CrawlerRunConfig":
+    from crawl4ai import CacheMode, CrawlerRunConfig
+    from crawl4ai.content_scraping_strategy import LXMLWebScrapingStrategy
+
+    return CrawlerRunConfig(
+        # LXML 기반 고속 HTML 파싱
+        scraping_strategy=LXMLWebScrapingStrategy(),
+        # 캐시 우회 (항상 최신 데이터)
+        cache_mode=CacheMode.BYPASS,
+        # 불필요한 태그 제거 (nav는 링크 추출을 위해 유지)
+        excluded_tags=["script", "style"],
+        # 외부 이미지 제외
+        exclude_external_images=True,
+        # 오버레이 요소 제거 (팝업, 모달 등)
+        remove_overlay_elements=True,
+        # 스트리밍 활성화
+        stream=True,
+        verbose=True,
+    )
+
 
 # 빠른 텍스트 추출용
-TEXT_ONLY_CONFIG = CrawlerRunConfig(
-    scraping_strategy=LXMLWebScrapingStrategy(),
-    # 캐시 활성화
-    cache_mode=CacheMode.ENABLED,
-    # 외부 링크 제외
-    exclude_external_links=True,
-    # 최소 단어 수
-    word_count_threshold=50,
-    # 텍스트만 추출
-    excluded_tags=["script", "style", "nav", "header", "footer", "aside"],
-    verbose=False,
-)
+def _text_only_config() -> "CrawlerRunConfig":
+    from crawl4ai import CacheMode, CrawlerRunConfig
+    from crawl4ai.content_scraping_strategy import LXMLWebScrapingStrategy
+
+    return CrawlerRunConfig(
+        scraping_strategy=LXMLWebScrapingStrategy(),
+        # 캐시 활성화
+        cache_mode=CacheMode.ENABLED,
+        # 외부 링크 제외
+        exclude_external_links=True,
+        # 최소 단어 수
+        word_count_threshold=50,
+        # 텍스트만 추출
+        excluded_tags=["script", "style", "nav", "header", "footer", "aside"],
+        verbose=False,
+    )
+
 
 # 전체 데이터 수집용
-COMPREHENSIVE_CONFIG = CrawlerRunConfig(
-    scraping_strategy=LXMLWebScrapingStrategy(),
-    # iframe 처리
-    process_iframes=True,
-    # 전체 페이지 스캔
-    scan_full_page=True,
-    # 스크린샷 캡처
-    screenshot=True,
-    # 캐시 우회
-    cache_mode=CacheMode.BYPASS,
-    verbose=True,
+def _comprehensive_config() -> "CrawlerRunConfig":
+    from crawl4ai import CacheMode, CrawlerRunConfig
+    from crawl4ai.content_scraping_strategy import LXMLWebScrapingStrategy
+
+    return CrawlerRunConfig(
+        scraping_strategy=LXMLWebScrapingStrategy(),
+        # iframe 처리
+        process_iframes=True,
+        # 전체 페이지 스캔
+        scan_full_page=True,
+        # 스크린샷 캡처
+        screenshot=True,
+        # 캐시 우회
+        cache_mode=CacheMode.BYPASS,
+        verbose=True,
+    )
+
+
+__getattr__ = lazy_attributes(
+    __name__,
+    {
+        "DOCS_CRAWL_CONFIG": _docs_crawl_config,
+        "TEXT_ONLY_CONFIG": _text_only_config,
+        "COMPREHENSIVE_CONFIG": _comprehensive_config,
+    },
 )
 
 
@@ -54,7 +86,7 @@ def create_custom_config(
     exclude_nav: bool = True,
     screenshot: bool = False,
     **kwargs,
-) -> CrawlerRunConfig:
+) -> "CrawlerRunConfig":
     """커스텀 크롤러 설정 생성
 
     Args:
@@ -63,6 +95,8 @@ def create_custom_config(
         screenshot: 스크린샷 캡처 여부
         **kwargs: 추가 CrawlerRunConfig 파라미터
     """
+    from crawl4ai import CacheMode, CrawlerRunConfig
+
     config = {
         "cache_mode": CacheMode.ENABLED if cache_enabled else CacheMode.BYPASS,
         "screenshot": screenshot,
@@ -1,5 +1,8 @@
 """Deep crawling strategy configurations."""
 
+from typing import Any, Awaitable, Callable
+from urllib.parse import urlsplit
+
 from crawl4ai.deep_crawling import (
     BFSDeepCrawlStrategy,
     BestFirstCrawlingStrategy,
@@ -9,29 +12,67 @@ from crawl4ai.deep_crawling.filters import (
     ContentTypeFilter,
     DomainFilter,
     FilterChain,
+    URLFilter,
     URLPatternFilter,
 )
 from crawl4ai.deep_crawling.scorers import KeywordRelevanceScorer
 
+from ..metrics import get_metrics
+from ..utils.url import VisitedIndex
+
+# 링크 탐색 전략 ("best_first"는 키워드가 필요)
+DEEP_CRAWL_STRATEGIES = ("bfs", "dfs", "best_first")
+
+
+class DuplicateURLFilter(URLFilter):
+    """정규화하면 이미 본 URL과 같은 링크를 거르는 필터
+
+    crawl4ai 전략은 링크를 문자열 그대로 비교하므로 끝의 ``/``, ``index.html``, 추적용
+    쿼리만 다른 변형을 다른 페이지로 보고 다시 가져온다. 이 필터는 정규 URL 기준으로
+    처음 보는 링크만 통과시킨다. 다른 필터를 통과한 링크만 기록되도록 체인의 마지막에 둔다.
+    같은 링크를 나중에 더 얕은 깊이에서 찾아도 거르므로, DFS에서는 처음 찾은 깊이로
+    max_depth가 적용된다.
+    """
+
+    __slots__ = ("visited",)
+
+    def __init__(self, visited: VisitedIndex):
+        super().__init__()
+        self.visited = visited
+
+    def apply(self, url: str) -> bool:
+        passed = self.visited.add(url)
+        if not passed:
+            get_metrics().incr("duplicate_urls")
+        self._update_stats(passed)
+        return passed
+
 
 def _build_filter_chain(
     domain: str,
     url_prefix: str = None,
+    visited: VisitedIndex = None,
 ) -> FilterChain:
     """공통 필터 체인 생성
 
     Args:
         domain: 허용할 도메인
         url_prefix: URL 프리픽스 필터
+        visited: 이미 방문했거나 큐에 넣은 URL 인덱스 (지정 시 정규화 기준 중복 링크 제외)
     """
+    # DomainFilter는 포트를 뺀 호스트명으로 비교하므로 허용 도메인에서도 포트 제거
+    host = urlsplit(f"//{domain}").hostname or domain
     filters = [
-        DomainFilter(allowed_domains=[domain]),
+        DomainFilter(allowed_domains=[host]),
         ContentTypeFilter(allowed_types=["text/html"]),
     ]
 
     if url_prefix:
         filters.append(URLPatternFilter(patterns=[f"{url_prefix}*"], use_glob=True))
 
+    if visited is not None:
+        filters.append(DuplicateURLFilter(visited))
+
     return FilterChain(filters)
 
 
@@ -41,6 +82,9 @@ def create_bfs_strategy(
     max_pages: int = 100,
     include_external: bool = False,
     url_prefix: str = None,
+    resume_state: dict[str, Any] = None,
+    on_state_change: Callable[[dict[str, Any]], Awaitable[None]] = None,
+    visited: VisitedIndex = None,
 ) -> BFSDeepCrawlStrategy:
     """BFS(너비 우선 탐색) 전략 생성
 
@@ -50,14 +94,19 @@ def create_bfs_strategy(
         max_pages: 최대 크롤링 페이지 수
         include_external: 외부 링크 포함 여부
         url_prefix: URL 프리픽스 필터 (지정 시 해당 프리픽스로 시작하는 URL만 크롤링)
+        resume_state: 이어서 크롤링할 저장된 상태 (frontier, visited, depths)
+        on_state_change: 페이지 처리 후 상태를 받는 비동기 콜백 (체크포인트 저장용)
+        visited: 정규 URL 기준 중복 링크를 거를 인덱스 (시작 URL을 미리 넣어둘 것)
     """
-    filter_chain = _build_filter_chain(domain, url_prefix)
+    filter_chain = _build_filter_chain(domain, url_prefix, visited)
 
     return BFSDeepCrawlStrategy(
         max_depth=max_depth,
         include_external=include_external,
         filter_chain=filter_chain,
         max_pages=max_pages,
+        resume_state=resume_state,
+        on_state_change=on_state_change,
     )
 
 
@@ -67,6 +116,9 @@ def create_dfs_strategy(
     max_pages: int = 100,
     include_external: bool = False,
     url_prefix: str = None,
+    resume_state: dict[str, Any] = None,
+    on_state_change: Callable[[dict[str, Any]], Awaitable[None]] = None,
+    visited: VisitedIndex = None,
 ) -> DFSDeepCrawlStrategy:
     """DFS(깊이 우선 탐색) 전략 생성
 
@@ -76,14 +128,19 @@ def create_dfs_strategy(
         max_pages: 최대 크롤링 페이지 수
         include_external: 외부 링크 포함 여부
         url_prefix: URL 프리픽스 필터 (지정 시 해당 프리픽스로 시작하는 URL만 크롤링)
+        resume_state: 이어서 크롤링할 저장된 상태 (frontier, visited, depths)
+        on_state_change: 페이지 처리 후 상태를 받는 비동기 콜백 (체크포인트 저장용)
+        visited: 정규 URL 기준 중복 링크를 거를 인덱스 (시작 URL을 미리 넣어둘 것)
     """
-    filter_chain = _build_filter_chain(domain, url_prefix)
+    filter_chain = _build_filter_chain(domain, url_prefix, visited)
 
     return DFSDeepCrawlStrategy(
         max_depth=max_depth,
         include_external=include_external,
         filter_chain=filter_chain,
         max_pages=max_pages,
+        resume_state=resume_state,
+        on_state_change=on_state_change,
     )
 
 
@@ -94,9 +151,17 @@ def create_best_first_strategy(
     max_pages: int = 100,
     keyword_weight: float = 0.8,
     url_prefix: str = None,
+    include_external: bool = False,
+    score_threshold: float = None,
+    resume_state: dict[str, Any] = None,
+    on_state_change: Callable[[dict[str, Any]], Awaitable[None]] = None,
+    visited: VisitedIndex = None,
 ) -> BestFirstCrawlingStrategy:
     """Best-First 전략 생성 (키워드 기반 우선순위)
 
+    URL에 키워드가 많이 포함된 링크부터 가져온다. 점수는 (포함된 키워드 수 / 키워드 수) ×
+    keyword_weight이며, 결과의 ``metadata["score"]``로 전달된다.
+
     Args:
         domain: 허용할 도메인
         keywords: 우선순위 결정 키워드 리스트
@@ -104,17 +169,26 @@ def create_best_first_strategy(
         max_pages: 최대 크롤링 페이지 수
         keyword_weight: 키워드 가중치
         url_prefix: URL 프리픽스 필터
+        include_external: 외부 링크 포함 여부
+        score_threshold: 이 점수 미만인 링크는 큐에 넣지 않음 (None이면 모두 넣음).
+            관련 링크가 더 없으면 max_pages 전에 크롤이 끝난다.
+        resume_state: 이어서 크롤링할 저장된 상태 (queue_items, visited, depths)
+        on_state_change: 페이지 처리 후 상태를 받는 비동기 콜백 (체크포인트 저장용)
+        visited: 정규 URL 기준 중복 링크를 거를 인덱스 (시작 URL을 미리 넣어둘 것)
     """
-    filter_chain = _build_filter_chain(domain, url_prefix)
+    filter_chain = _build_filter_chain(domain, url_prefix, visited)
 
     scorer = KeywordRelevanceScorer(keywords=keywords, weight=keyword_weight)
 
     return BestFirstCrawlingStrategy(
         max_depth=max_depth,
-        include_external=False,
+        include_external=include_external,
         filter_chain=filter_chain,
         url_scorer=scorer,
         max_pages=max_pages,
+        score_threshold=score_threshold if score_threshold is not None else float("-inf"),
+        resume_state=resume_state,
+        on_state_change=on_state_change,
     )
 
 
@@ -1,14 +1,46 @@
 """Core crawler module (refactored)."""
 
 import asyncio
+import os
+import sys
+from contextlib import aclosing, asynccontextmanager
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
+from typing import AsyncIterator
 
 from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig
 
-from .configs.deep_crawl import create_bfs_strategy, create_dfs_strategy
-from .strategies.content import clean_navigation_content
+from .cache import CACHE_MODES, DEFAULT_CACHE_DIR, PageCache, cache_key
+from .checkpoint import CrawlCheckpoint
+from .corpus import OUTPUT_FORMATS, CorpusWriter, read_page
+from .configs.deep_crawl import (
+    DEEP_CRAWL_STRATEGIES,
+    _build_filter_chain,
+    create_best_first_strategy,
+    create_bfs_strategy,
+    create_dfs_strategy,
+)
+from .dedup import DEDUP_MODES, NearDuplicateIndex
+from .frontier import FrontierURL, SharedFrontier
+from .hotcache import HotPageCache
+from .manifest import CrawlManifest
+from .metrics import get_metrics
+from .pool import BrowserPool
+from .progress import CrawlProgress, ProgressCallback
+from .results import RESULTS_FILENAME, CrawlResults
+from .scheduler import HostScheduler
+from .search import SearchIndex
+from .strategies.content import clean_navigation_content, profile_for_url
+from .strategies.dispatcher import DomainLimitedDispatcher
+from .strategies.fetch import UNCHANGED_HEADER, create_crawler, fetch_context
+from .strategies.http import FETCH_MODES
+from .strategies.scrape import ScrapeProcessPool
 from .utils.domain import extract_domain, extract_output_dir_name
-from .utils.path import url_to_filepath
+from .utils.path import FilePathRegistry, url_to_filepath
+from .utils.sitemap import fetch_sitemap_lastmods, iter_sitemap_urls
+from .utils.url import VisitedIndex, normalize_url
+from .writer import PageWriter, write_atomic
 
 # 기본 BrowserConfig: 빠른 텍스트 크롤링에 최적화
 DEFAULT_BROWSER_CONFIG = BrowserConfig(
@@ -18,12 +50,168 @@ DEFAULT_BROWSER_CONFIG = BrowserConfig(
     verbose=False,
 )
 
+# 증분 모드의 페이지 상태
+_INCREMENTAL_STATUSES = ("added", "changed", "unchanged", "removed")
+
+
+@asynccontextmanager
+async def _open_crawler(
+    browser_config: BrowserConfig,
+    pool: BrowserPool = None,
+    mode: str = "browser",
+) -> AsyncIterator[AsyncWebCrawler]:
+    """풀이 주어지면 풀에서 크롤러를 빌리고, 아니면 일회용 크롤러 생성"""
+    if pool is not None:
+        async with pool.acquire(browser_config, mode) as crawler:
+            yield crawler
+    else:
+        async with create_crawler(browser_config, mode) as crawler:
+            yield crawler
+
+
+def _validate_mode(mode: str) -> None:
+    if mode not in FETCH_MODES:
+        raise ValueError(f"Invalid fetch mode: {mode} (choose from {', '.join(FETCH_MODES)})")
+
+
+def _validate_strategy(strategy: str, keywords: list[str] | None) -> None:
+    if strategy not in DEEP_CRAWL_STRATEGIES:
+        raise ValueError(f"Invalid strategy: {strategy} (choose from {', '.join(DEEP_CRAWL_STRATEGIES)})")
+    if strategy == "best_first" and not keywords:
+        raise ValueError("best_first strategy requires keywords")
+    if keywords and strategy != "best_first":
+        raise ValueError("keywords are only used by the best_first strategy")
+
+
+def _validate_dedup(dedup: str) -> None:
+    if dedup not in DEDUP_MODES:
+        raise ValueError(f"Invalid dedup mode: {dedup} (choose from {', '.join(DEDUP_MODES)})")
+
+
+def _validate_output_format(output_format: str) -> None:
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Invalid output format: {output_format} (choose from {', '.join(OUTPUT_FORMATS)})")
+
+
+def _resolve_cache(cache: PageCache | None, cache_mode: str) -> PageCache | None:
+    """캐시 모드 검증 후 사용할 캐시 반환 (bypass면 None)
+
+    ``cache``가 None이면 기본 위치의 캐시를 새로 만들므로, 호출자가 작업을 마친 뒤 닫아야 한다
+    (연결은 처음 사용할 때 열림).
+    """
+    if cache_mode not in CACHE_MODES:
+        raise ValueError(f"Invalid cache mode: {cache_mode} (choose from {', '.join(CACHE_MODES)})")
+    if cache_mode == "bypass":
+        return None
+    return cache if cache is not None else PageCache()
+
+
+async def _cached_markdown(cache: PageCache | None, url: str, cache_mode: str, mode: str) -> str | None:
+    """캐시 모드에 따라 재사용 가능한 정리된 마크다운 반환 (없거나 ``mode``보다 덜 렌더링된 항목이면 None)"""
+    if cache is None:
+        return None
+
+    entry = cache.get(url)
+    if entry is None or not entry.markdown_hash or not entry.serves(mode):
+        return None
+
+    usable = cache_mode == "prefer" and cache.is_fresh(entry)
+    if not usable:
+        usable = await cache.revalidate(entry)
+
+    return cache.read_markdown(entry) if usable else None
+
+
+def _save_markdown(url: str, markdown: str, output_path: Path, paths: FilePathRegistry = None) -> Path:
+    """정리된 마크다운을 URL 기반 경로에 저장
+
+    Args:
+        url: 원본 URL (파일 상단 헤더로 기록)
+        markdown: 저장할 마크다운
+        output_path: 출력 디렉토리
+        paths: 여러 페이지를 저장할 때 파일 경로 충돌을 해소할 레지스트리
+
+    Returns:
+        저장된 파일 경로
+    """
+    file_path = paths.path_for(url) if paths is not None else url_to_filepath(url, output_path)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    write_atomic(file_path, f"# {url}\n\n{markdown}")
+    return file_path
+
+
+def _visited_index(start_url: str, max_pages: int, resume_state: dict | None) -> VisitedIndex:
+    """링크 탐색에서 정규화 기준 중복을 거를 인덱스 (시작 URL과 재개할 상태의 URL 포함)"""
+    visited = VisitedIndex.for_pages(max_pages)
+    visited.add(start_url)
+    if resume_state:
+        for url in resume_state.get("visited", []):
+            visited.add(url)
+        for key in ("pending", "stack", "queue_items"):
+            for item in resume_state.get(key, []):
+                visited.add(item["url"])
+    return visited
+
+
+def _unchanged_by_sitemap(lastmods: dict[str, float], manifest: CrawlManifest) -> dict[str, list[str]]:
+    """sitemap lastmod가 마지막 수집 시각 이전인 페이지와 그 내부 링크"""
+    unchanged = {}
+    for key, lastmod in lastmods.items():
+        entry = manifest.pages.get(key)
+        if entry is None or lastmod > entry["fetched_at"]:
+            continue
+        if (manifest.output_path / entry["file"]).exists():
+            unchanged[key] = entry["links"]
+
+    if lastmods:
+        print(f"✅ Sitemap: {len(unchanged)}/{len(lastmods)} pages unchanged since last crawl")
+    return unchanged
+
+
+async def _discover_sitemap_urls(
+    start_url: str,
+    domain: str,
+    url_prefix: str = None,
+    max_pages: int = 100,
+) -> tuple[list[str], dict[str, float]]:
+    """sitemap에서 Deep Crawl과 같은 필터(도메인, 프리픽스, 컨텐츠 타입)를 통과하는 URL 수집
+
+    시작 URL은 항상 첫 번째로 포함되며, max_pages개를 채우면 sitemap 읽기를 멈춘다.
+
+    Returns:
+        (크롤링할 URL 리스트, 정규화된 URL → lastmod)
+    """
+    visited = VisitedIndex.for_pages(max_pages)
+    visited.add(start_url)
+    filter_chain = _build_filter_chain(domain, url_prefix, visited)
+    urls = [start_url]
+    lastmods = {}
+
+    async with aclosing(iter_sitemap_urls(start_url)) as entries:
+        async for url, lastmod in entries:
+            if lastmod is not None:
+                lastmods[cache_key(url)] = lastmod
+            if not await filter_chain.apply(url):
+                continue
+            urls.append(url)
+            if len(urls) >= max_pages:
+                break
+
+    return (urls, lastmods) if len(urls) > 1 else ([], lastmods)
+
 
 async def crawl_single_page(
     url: str,
     output_dir: str = None,
     crawler_config: CrawlerRunConfig = None,
     browser_config: BrowserConfig = None,
+    pool: BrowserPool = None,
+    cache: PageCache = None,
+    cache_mode: str = "bypass",
+    mode: str = "browser",
+    scheduler: HostScheduler = None,
+    scrape_pool: ScrapeProcessPool = None,
+    hot_cache: HotPageCache = None,
 ) -> str:
     """단일 페이지 크롤링하여 마크다운 반환
 
@@ -32,10 +220,23 @@ async def crawl_single_page(
         output_dir: 출력 디렉토리 (None이면 파일 저장 안 함)
         crawler_config: 크롤러 실행 설정 (None이면 기본 설정 사용)
         browser_config: 브라우저 설정 (None이면 기본 설정 사용)
+        pool: 브라우저 풀 (None이면 호출마다 브라우저 실행)
+        cache: 페이지 캐시 (None이면 기본 위치의 캐시 사용)
+        cache_mode: 캐시 사용 방식 ("bypass", "prefer", "revalidate")
+        mode: 가져오기 방식 ("browser": Playwright, "http": 브라우저 없이 HTTP,
+            "auto": HTTP로 먼저 가져오고 JS 렌더링이 필요한 페이지만 브라우저 사용)
+        scheduler: 호스트별 속도/동시성 제한과 429/5xx 재시도 (None이면 제한 없음)
+        scrape_pool: 스크래핑과 마크다운 생성을 실행할 프로세스 풀 (None이면 현재 프로세스에서 실행)
+        hot_cache: 최근 결과를 메모리에서 재사용하고 같은 페이지의 동시 요청을 한 번의 가져오기로
+            묶는 캐시 (None이면 호출마다 가져옴)
 
     Returns:
         정리된 마크다운 텍스트
     """
+    owns_cache = cache is None
+    cache = _resolve_cache(cache, cache_mode)
+    _validate_mode(mode)
+
     if crawler_config is None:
         from .configs.crawler import DOCS_CRAWL_CONFIG
 
@@ -44,34 +245,278 @@ async def crawl_single_page(
     if browser_config is None:
         browser_config = DEFAULT_BROWSER_CONFIG
 
-    async with AsyncWebCrawler(config=browser_config) as crawler:
-        result = await crawler.arun(url, config=crawler_config)
+    metrics = get_metrics()
+    # 다른 호출이 진행 중인 가져오기의 결과를 받으면 fetch()가 실행되지 않으므로 그대로 남음
+    status = "coalesced"
+
+    async def fetch() -> str | None:
+        nonlocal status
+        markdown = await _cached_markdown(cache, url, cache_mode, mode)
+        if markdown is not None:
+            status = "cached"
+            return markdown
+
+        async with _open_crawler(browser_config, pool, mode) as crawler:
+            with fetch_context(cache=cache, cache_mode=cache_mode, scheduler=scheduler, scrape_pool=scrape_pool):
+                result = await crawler.arun(url, config=crawler_config)
 
         if not result.success:
-            print(f"❌ Failed: {url}")
-            return ""
+            status = "failed"
+            return None
 
         # 마크다운 정리
         markdown_content = result.markdown.raw_markdown if result.markdown else ""
-        cleaned_markdown = clean_navigation_content(markdown_content)
+        with metrics.stage(url, "clean"):
+            markdown = clean_navigation_content(markdown_content, profile_for_url(url))
+
+        if cache is not None:
+            await asyncio.to_thread(cache.put_markdown, url, markdown)
+        status = "ok"
+        return markdown
+
+    try:
+        if hot_cache is None:
+            cleaned_markdown = await fetch()
+        else:
+            # 결과에 영향을 주는 옵션까지 키에 포함 (설정 객체는 프리셋이라 동일성으로 비교)
+            # cache_mode도 넣어 "prefer" 호출이 가져온 결과를 "revalidate"/"bypass" 호출이 받지 않게 함
+            hot_key = (cache_key(url), mode, cache_mode, browser_config, crawler_config)
+            cleaned_markdown = hot_cache.get(hot_key)
+            if cleaned_markdown is not None:
+                status = "hot"
+            else:
+                cleaned_markdown = await hot_cache.run(hot_key, fetch)
+    finally:
+        if owns_cache and cache is not None:
+            await cache.close()
+
+    if cleaned_markdown is None:
+        print(f"❌ Failed: {url}")
+        metrics.finish(url, "failed")
+        return ""
+
+    # 파일 저장 (output_dir이 지정된 경우)
+    if output_dir:
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+
+        with metrics.stage(url, "write"):
+            file_path = _save_markdown(url, cleaned_markdown, output_path)
+        print(f"✅ Saved to {file_path}")
+
+    metrics.finish(url, status)
+    return cleaned_markdown
+
+
+async def crawl_multiple_pages(
+    urls: list[str],
+    output_dir: str = None,
+    concurrency: int = 5,
+    per_domain_limit: int = 2,
+    timeout: float = 60.0,
+    crawler_config: CrawlerRunConfig = None,
+    browser_config: BrowserConfig = None,
+    pool: BrowserPool = None,
+    cache: PageCache = None,
+    cache_mode: str = "bypass",
+    mode: str = "browser",
+    scheduler: HostScheduler = None,
+    scrape_pool: ScrapeProcessPool = None,
+) -> list[dict]:
+    """여러 페이지를 하나의 브라우저에서 병렬 크롤링
+
+    일부 URL이 실패해도 나머지 결과는 그대로 반환한다.
+
+    Args:
+        urls: 크롤링할 URL 리스트 (정규화하면 같은 URL은 처음 것만 크롤링)
+        output_dir: 출력 디렉토리 (None이면 파일 저장 안 함)
+        concurrency: 전체 최대 동시 크롤링 수
+        per_domain_limit: 도메인별 최대 동시 크롤링 수
+        timeout: URL별 타임아웃(초)
+        crawler_config: 크롤러 실행 설정 (None이면 기본 설정 사용)
+        browser_config: 브라우저 설정 (None이면 기본 설정 사용)
+        pool: 브라우저 풀 (None이면 호출마다 브라우저 실행)
+        cache: 페이지 캐시 (None이면 기본 위치의 캐시 사용)
+        cache_mode: 캐시 사용 방식 ("bypass", "prefer", "revalidate")
+        mode: 가져오기 방식 ("browser": Playwright, "http": 브라우저 없이 HTTP,
+            "auto": HTTP로 먼저 가져오고 JS 렌더링이 필요한 페이지만 브라우저 사용)
+        scheduler: 호스트별 속도/동시성 제한과 429/5xx 재시도 (None이면 제한 없음)
+        scrape_pool: 스크래핑과 마크다운 생성을 실행할 프로세스 풀 (None이면 현재 프로세스에서 실행)
+
+    Returns:
+        입력 순서대로 정렬된 결과 리스트
+        (url, success, markdown, file, error 키를 가진 dict)
+    """
+    unique: dict[str, str] = {}
+    for url in urls:
+        unique.setdefault(normalize_url(url), url)
+    urls = list(unique.values())
+    owns_cache = cache is None
+    cache = _resolve_cache(cache, cache_mode)
+    _validate_mode(mode)
 
-        # 파일 저장 (output_dir이 지정된 경우)
-        if output_dir:
-            domain = extract_domain(url)
-            output_dir = output_dir or extract_output_dir_name(domain)
-            output_path = Path(output_dir)
-            output_path.mkdir(parents=True, exist_ok=True)
+    if crawler_config is None:
+        from .configs.crawler import DOCS_CRAWL_CONFIG
+
+        crawler_config = DOCS_CRAWL_CONFIG
+    crawler_config = crawler_config.clone(stream=False, page_timeout=int(timeout * 1000))
+
+    if browser_config is None:
+        browser_config = DEFAULT_BROWSER_CONFIG
+
+    output_path, paths = None, None
+    if output_dir:
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+        paths = FilePathRegistry(output_path)
+
+    dispatcher = DomainLimitedDispatcher(
+        concurrency=concurrency,
+        per_domain_limit=per_domain_limit,
+        timeout=timeout,
+    )
 
-            file_path = url_to_filepath(url, output_path)
-            file_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        # 캐시에서 바로 쓸 수 있는 페이지는 브라우저로 보내지 않음
+        cached = {}
+        for url in urls:
+            markdown = await _cached_markdown(cache, url, cache_mode, mode)
+            if markdown is not None:
+                cached[url] = markdown
 
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(f"# {url}\n\n")
-                f.write(cleaned_markdown)
+        by_url = {}
+        pending = [url for url in urls if url not in cached]
+        if pending:
+            async with _open_crawler(browser_config, pool, mode) as crawler:
+                with fetch_context(cache=cache, cache_mode=cache_mode, scheduler=scheduler, scrape_pool=scrape_pool):
+                    crawl_results = await crawler.arun_many(pending, config=crawler_config, dispatcher=dispatcher)
 
-            print(f"✅ Saved to {file_path}")
+            for result in crawl_results:
+                if isinstance(result, BaseException):
+                    continue
+                by_url[result.url] = result
 
-        return cleaned_markdown
+        metrics = get_metrics()
+        results = []
+        for url in urls:
+            if url in cached:
+                cleaned_markdown = cached[url]
+            else:
+                result = by_url.get(url)
+                if result is None or not result.success:
+                    error = result.error_message if result is not None else "No result returned"
+                    print(f"❌ Failed: {url}")
+                    metrics.finish(url, "failed")
+                    results.append({"url": url, "success": False, "markdown": "", "file": None, "error": error})
+                    continue
+
+                markdown_content = result.markdown.raw_markdown if result.markdown else ""
+                with metrics.stage(url, "clean"):
+                    cleaned_markdown = clean_navigation_content(markdown_content, profile_for_url(url))
+                if cache is not None:
+                    await asyncio.to_thread(cache.put_markdown, url, cleaned_markdown)
+
+            file_path = None
+            if output_path is not None:
+                with metrics.stage(url, "write"):
+                    file_path = str(_save_markdown(url, cleaned_markdown, output_path, paths))
+                print(f"✅ Saved to {file_path}")
+            metrics.finish(url, "cached" if url in cached else "ok")
+
+            results.append(
+                {"url": url, "success": True, "markdown": cleaned_markdown, "file": file_path, "error": None}
+            )
+    finally:
+        if owns_cache and cache is not None:
+            await cache.close()
+
+    succeeded = sum(1 for r in results if r["success"])
+    print(f"\n✅ Crawled {succeeded}/{len(urls)} pages")
+
+    return results
+
+
+@dataclass(slots=True)
+class _PageToWrite:
+    """writer 단계로 넘기는 딥 크롤 결과 (정리 전 마크다운 포함)"""
+
+    url: str
+    depth: int
+    score: float
+    markdown: str
+    headers: dict
+    links: list[str]
+    file_path: Path | None = None
+    cleaned: bool = False
+    fingerprint: int | None = None
+    duplicate_of: str | None = None
+
+
+def _clean_page(page: _PageToWrite, near_duplicates: NearDuplicateIndex | None = None) -> _PageToWrite:
+    """마크다운 정리와 유사 중복 검사 (이미 처리한 페이지는 그대로 반환)
+
+    ``near_duplicates``가 있으면 정리된 마크다운의 지문으로 이미 처리한 페이지와 비교하여,
+    거의 같으면 ``page.duplicate_of``에 원본 URL을 기록하고 아니면 원본으로 등록한다.
+    """
+    if page.cleaned:
+        return page
+    with get_metrics().stage(page.url, "clean"):
+        page.markdown = clean_navigation_content(page.markdown, profile_for_url(page.url))
+        if near_duplicates is not None:
+            page.fingerprint = near_duplicates.fingerprint(page.markdown)
+            if page.fingerprint is not None:
+                page.duplicate_of = near_duplicates.add(page.url, page.fingerprint)
+    page.cleaned = True
+    return page
+
+
+def _write_page(
+    page: _PageToWrite,
+    output_path: Path,
+    cache: PageCache | None,
+    manifest: CrawlManifest | None,
+    paths: FilePathRegistry | None = None,
+    near_duplicates: NearDuplicateIndex | None = None,
+    corpus: CorpusWriter | None = None,
+    text_index: SearchIndex | None = None,
+) -> _PageToWrite:
+    """마크다운 정리 후 저장 (writer 스레드에서 실행)
+
+    증분 모드에서 내용이 같으면 파일을 다시 쓰지 않고, 유사 중복 페이지는 저장하지 않고
+    원본의 파일 경로를 기록한다. ``corpus``가 있으면 페이지별 파일 대신 corpus.pack에 추가한다.
+    ``text_index``가 있으면 저장한 페이지를 검색 인덱스에 반영한다(내용이 같으면 건너뜀).
+    ``page.markdown``은 정리된 마크다운으로 바뀌고 ``page.file_path``에 파일 경로가 기록된다.
+    """
+    metrics = get_metrics()
+    _clean_page(page, near_duplicates)
+    if cache is not None:
+        cache.put_markdown(page.url, page.markdown)
+
+    if page.duplicate_of is not None:
+        if corpus is not None:
+            page.file_path = corpus.path
+        else:
+            page.file_path = (
+                paths.path_for(page.duplicate_of)
+                if paths is not None
+                else url_to_filepath(page.duplicate_of, output_path)
+            )
+        if text_index is not None:
+            # 원본만 검색되도록 이전에 색인된 내용은 지움
+            text_index.remove(page.url)
+        return page
+
+    with metrics.stage(page.url, "write"):
+        if manifest is not None and manifest.is_unchanged(page.url, page.markdown):
+            page.file_path = output_path / manifest.get(page.url)["file"]
+        elif corpus is not None:
+            page.file_path = corpus.append(page.url, page.markdown)
+        else:
+            page.file_path = _save_markdown(page.url, page.markdown, output_path, paths)
+    if text_index is not None:
+        with metrics.stage(page.url, "index"):
+            text_index.add(page.url, page.file_path, page.markdown)
+    return page
 
 
 async def crawl_documentation(
@@ -81,9 +526,27 @@ async def crawl_documentation(
     max_depth: int = 2,
     url_prefix: str = None,
     strategy: str = "bfs",
+    keywords: list[str] = None,
+    score_threshold: float = None,
     crawler_config: CrawlerRunConfig = None,
     browser_config: BrowserConfig = None,
-) -> list[dict]:
+    pool: BrowserPool = None,
+    cache: PageCache = None,
+    cache_mode: str = "bypass",
+    mode: str = "browser",
+    scheduler: HostScheduler = None,
+    scrape_pool: ScrapeProcessPool = None,
+    incremental: bool = False,
+    sitemap_lastmod: bool = False,
+    dedup: str = "off",
+    output_format: str = "markdown",
+    search_index: bool = True,
+    resume: bool = False,
+    checkpoint_every: int = 10,
+    use_sitemap: bool = False,
+    concurrency: int = 5,
+    on_progress: ProgressCallback = None,
+) -> CrawlResults:
     """공식문서 크롤링
 
     Args:
@@ -92,13 +555,58 @@ async def crawl_documentation(
         max_pages: 최대 크롤링 페이지 수
         max_depth: 최대 크롤링 깊이
         url_prefix: URL 프리픽스 필터 (지정 시 해당 프리픽스로 시작하는 URL만 크롤링)
-        strategy: 크롤링 전략 ("bfs" 또는 "dfs")
+        strategy: 크롤링 전략 ("bfs", "dfs", "best_first")
+        keywords: best_first 전략에서 URL 관련도를 매길 키워드 (best_first에서만 사용, 필수)
+        score_threshold: best_first 전략에서 이 관련도 점수(0~0.8) 미만인 링크는 따라가지 않음.
+            관련 링크가 더 없으면 max_pages 전에 크롤이 끝난다. (None이면 모든 링크를 점수순으로)
         crawler_config: 크롤러 실행 설정 (None이면 기본 설정 사용)
         browser_config: 브라우저 설정 (None이면 기본 설정 사용)
+        pool: 브라우저 풀 (None이면 호출마다 브라우저 실행)
+        cache: 페이지 캐시 (None이면 기본 위치의 캐시 사용)
+        cache_mode: 캐시 사용 방식 ("bypass", "prefer", "revalidate").
+            캐시된 HTML은 다시 스크래핑되므로 링크 탐색은 그대로 동작한다.
+        mode: 가져오기 방식 ("browser": Playwright, "http": 브라우저 없이 HTTP,
+            "auto": HTTP로 먼저 가져오고 JS 렌더링이 필요한 페이지만 브라우저 사용)
+        scheduler: 호스트별 속도/동시성 제한과 429/5xx 재시도 (None이면 제한 없음)
+        scrape_pool: 스크래핑과 마크다운 생성을 실행할 프로세스 풀 (None이면 현재 프로세스에서 실행)
+        incremental: 증분 모드. 출력 디렉토리의 매니페스트와 비교하여 내용이 같은
+            페이지는 다시 쓰지 않고, 이번 크롤에서 보이지 않은 페이지는 removed로 보고한다.
+        sitemap_lastmod: 증분 모드에서 sitemap.xml의 lastmod가 마지막 수집 이후로
+            바뀌지 않은 페이지는 가져오지 않음 (기록된 링크로 탐색은 계속함)
+        dedup: 유사 중복 페이지 처리 ("off", "alias", "prune"). alias는 정리된 마크다운의
+            SimHash 지문이 이미 저장한 페이지와 거의 같으면(버전별 경로, 언어 미러 등) 파일을
+            쓰지 않고 원본의 별칭으로 기록한다. prune은 그런 페이지의 링크도 따라가지 않는다.
+            재개한 크롤에서는 재개 이후 가져온 페이지끼리만 비교한다.
+        output_format: 저장 형식 ("markdown": 페이지마다 .md 파일, "packed": 출력 디렉토리의
+            corpus.pack 한 파일에 압축 레코드로 추가하고 corpus.idx에 URL 색인을 기록.
+            ``CorpusReader``로 URL 조회, ``iter_corpus``로 전체를 순서대로 읽는다)
+        search_index: 저장한 페이지를 제목 단위 조각으로 나누어 출력 디렉토리의
+            ``.search_index.sqlite``(SQLite FTS5)에 색인. ``search.query_index``로 검색하며,
+            다시 크롤링하면 내용이 바뀐 페이지만 다시 색인하고 removed 페이지는 색인에서 지운다.
+        resume: 출력 디렉토리의 체크포인트에서 중단된 크롤을 이어서 진행.
+            이미 처리된 페이지는 다시 가져오지 않고 이전 결과를 그대로 포함한다.
+        checkpoint_every: 몇 페이지마다 진행 상태를 체크포인트에 기록할지
+        use_sitemap: robots.txt/sitemap.xml에서 URL을 찾아 링크 탐색 없이 병렬로 크롤링.
+            max_depth, strategy, keywords는 사용하지 않으며, sitemap이 없으면 링크 탐색으로 대체한다.
+        concurrency: sitemap 모드의 최대 동시 크롤링 수
+        on_progress: 페이지가 처리될 때마다 (결과 레코드 또는 실패 시 None, CrawlProgress)로
+            호출되는 비동기 콜백. 크롤이 끝나기 전에 결과를 사용하거나 진행 상황을 보고할 때 사용
 
     Returns:
-        크롤링 결과 리스트
+        크롤링 결과 (항목은 url, depth, file 키를 가진 dict,
+        증분 모드에서는 "added", "changed", "unchanged", "removed" 중 하나인 status 키 포함).
+        유사 중복 페이지는 status가 "duplicate"이고 duplicate_of에 원본 URL, file에 원본 파일이 들어간다.
+        best_first 전략에서는 항목에 관련도 score 키가 있고 점수가 높은 순으로 정렬된다.
+        페이지 내용은 저장 후 바로 버리고 결과는 작은 레코드로만 보관하며,
+        같은 내용이 ``{output_dir}/.crawl_results.jsonl``에 한 줄씩 기록된다.
     """
+    owns_cache = cache is None
+    cache = _resolve_cache(cache, cache_mode)
+    _validate_mode(mode)
+    _validate_strategy(strategy, keywords)
+    _validate_dedup(dedup)
+    _validate_output_format(output_format)
+
     # 도메인 추출
     domain = extract_domain(start_url)
 
@@ -109,54 +617,546 @@ async def crawl_documentation(
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
 
-    # Deep Crawl 전략 생성
-    strategy_factory = create_dfs_strategy if strategy == "dfs" else create_bfs_strategy
-    deep_crawl_strategy = strategy_factory(
-        domain=domain,
-        max_depth=max_depth,
-        max_pages=max_pages,
-        include_external=False,
-        url_prefix=url_prefix,
-    )
+    # sitemap 모드: 링크 탐색 없이 sitemap의 URL을 한 번에 병렬 크롤링
+    sitemap_urls, lastmods = [], {}
+    if use_sitemap:
+        sitemap_urls, lastmods = await _discover_sitemap_urls(start_url, domain, url_prefix, max_pages)
+        if sitemap_urls:
+            print(f"✅ Sitemap: {len(sitemap_urls)} pages")
+        else:
+            print("❌ No sitemap URLs found, falling back to link crawling")
+
+    # 진행 상태 체크포인트 (크롤이 끝까지 완료되면 삭제됨)
+    crawl_mode = "sitemap" if sitemap_urls else strategy
+    checkpoint = CrawlCheckpoint.open(output_path, start_url, crawl_mode, resume=resume, every=checkpoint_every)
+    resume_state = checkpoint.resume_state()
+    previous_results = checkpoint.completed() if resume_state else []
+    if resume_state:
+        print(f"✅ Resuming: {len(previous_results)} pages already processed")
+
+    progress = CrawlProgress()
+
+    async def on_state_change(state: dict) -> None:
+        # 대기 중인 페이지 수: BFS는 visited에 다음 단계 URL까지 포함, DFS는 스택, Best-First는 큐 크기
+        if "stack" in state:
+            progress.queued = len(state["stack"])
+        elif "queue_items" in state:
+            progress.queued = len(state["queue_items"])
+        else:
+            progress.queued = max(len(state.get("visited", [])) - progress.processed, 0)
+        await checkpoint.on_state_change(state)
 
-    # 크롤러 설정
     if crawler_config is None:
         from .configs.crawler import DOCS_CRAWL_CONFIG
 
-        crawler_config = DOCS_CRAWL_CONFIG.clone(deep_crawl_strategy=deep_crawl_strategy)
+        crawler_config = DOCS_CRAWL_CONFIG
+
+    # best_first의 관련도 점수 (재개 시 미완료 URL은 큐에서 우선순위를 올려 다시 넣으므로,
+    # 결과의 점수는 metadata 대신 URL로 다시 계산)
+    url_scorer = None
+    if sitemap_urls:
+        crawler_config = crawler_config.clone(deep_crawl_strategy=None, stream=True)
     else:
+        # Deep Crawl 전략 생성
+        if strategy == "best_first":
+            strategy_factory = partial(create_best_first_strategy, keywords=keywords, score_threshold=score_threshold)
+        else:
+            strategy_factory = create_dfs_strategy if strategy == "dfs" else create_bfs_strategy
+        deep_crawl_strategy = strategy_factory(
+            domain=domain,
+            max_depth=max_depth,
+            max_pages=max_pages,
+            include_external=False,
+            url_prefix=url_prefix,
+            resume_state=resume_state,
+            on_state_change=on_state_change,
+            visited=_visited_index(start_url, max_pages, resume_state),
+        )
         crawler_config = crawler_config.clone(deep_crawl_strategy=deep_crawl_strategy)
+        if strategy == "best_first":
+            url_scorer = deep_crawl_strategy.url_scorer
 
     if browser_config is None:
         browser_config = DEFAULT_BROWSER_CONFIG
 
-    results = []
+    manifest = CrawlManifest.load(output_path) if incremental else None
+    # 서로 다른 URL이 같은 파일을 덮어쓰지 않도록 경로 배정 (이전에 저장된 URL은 같은 경로 유지)
+    paths = FilePathRegistry(output_path)
+    if manifest is not None:
+        for entry in manifest.pages.values():
+            paths.claim(entry["url"], entry["file"])
+    unchanged = {}
+    if manifest is not None and sitemap_lastmod:
+        if not lastmods:
+            lastmods = await fetch_sitemap_lastmods(start_url)
+        unchanged = _unchanged_by_sitemap(lastmods, manifest)
 
-    async with AsyncWebCrawler(config=browser_config) as crawler:
-        async for result in await crawler.arun(start_url, config=crawler_config):
-            if result.success:
-                depth = result.metadata.get("depth", 0)
-                score = result.metadata.get("score", 0)
+    near_duplicates = NearDuplicateIndex() if dedup != "off" else None
+    # 증분 크롤과 재개한 크롤만 기존 코퍼스에 이어서 기록 (그 밖에는 새 코퍼스로 시작)
+    corpus = (
+        CorpusWriter(output_path, append=incremental or bool(resume_state))
+        if output_format == "packed"
+        else None
+    )
+    text_index = SearchIndex(output_path) if search_index else None
 
-                # URL을 파일 경로로 변환
-                file_path = url_to_filepath(result.url, output_path)
-                file_path.parent.mkdir(parents=True, exist_ok=True)
+    metrics = get_metrics()
+    # 재개한 경우에도 이전 결과부터 다시 기록하므로 로그는 항상 이번 결과와 같음
+    results = CrawlResults(output_path / RESULTS_FILENAME)
+    for previous in previous_results:
+        if previous["file"] is None:
+            progress.failed += 1
+            continue
+        if manifest is not None:
+            manifest.mark_seen(previous["url"])
+        if previous["duplicate_of"] is None:
+            paths.claim(previous["url"], str(Path(previous["file"]).relative_to(output_path)))
+        # 기록되지 않은 status(증분 모드가 아닐 때), score(best_first가 아닐 때), duplicate_of는 뺌
+        record = {
+            key: value for key, value in previous.items() if key in ("url", "depth", "file") or value is not None
+        }
+        results.append(record)
+        progress.done += 1
+        if on_progress is not None:
+            await on_progress(record, progress)
+    # sitemap 모드에서 다시 가져오지 않을 URL만 남기고 이전 결과는 버림
+    done = {previous["url"] for previous in previous_results} if sitemap_urls else set()
+    del previous_results
 
-                # 마크다운 정리
-                markdown_content = result.markdown.raw_markdown if result.markdown else ""
-                cleaned_markdown = clean_navigation_content(markdown_content)
+    async def finish(url: str, depth: int, record: dict | None) -> None:
+        """처리가 끝난 페이지를 결과, 체크포인트, 진행 상황, 메트릭에 반영"""
+        if record is None:
+            checkpoint.mark_done(url, depth, status="failed")
+            progress.failed += 1
+            metrics.finish(url, "failed")
+        else:
+            checkpoint.mark_done(
+                url, depth, record["file"], record.get("status"), record.get("score"), record.get("duplicate_of")
+            )
+            results.append(record)
+            progress.done += 1
+            metrics.finish(url, record.get("status", "ok"))
+        progress.queued = max(progress.queued - 1, 0)
+        if on_progress is not None:
+            # 백그라운드 작업은 다른 서버 프로세스도 결과 로그를 읽으므로 바로 기록
+            results.flush()
+            await on_progress(record, progress)
 
-                # 파일 저장
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(f"# {result.url}\n\n")
-                    f.write(cleaned_markdown)
+    async def on_written(page: _PageToWrite) -> None:
+        record = {"url": page.url, "depth": page.depth, "file": str(page.file_path)}
+        if crawl_mode == "best_first":
+            record["score"] = round(page.score, 4)
+        if page.duplicate_of is not None:
+            record["status"] = "duplicate"
+            record["duplicate_of"] = page.duplicate_of
+            if manifest is not None:
+                manifest.record(
+                    page.url, page.file_path, page.markdown, page.headers, links=page.links, alias_of=page.duplicate_of
+                )
+            print(f"✅ Depth {page.depth} | Duplicate of {page.duplicate_of}")
+        elif manifest is None:
+            print(f"✅ Depth {page.depth} | Score: {page.score:.2f} | {page.file_path}")
+        else:
+            record["status"] = manifest.record(
+                page.url, page.file_path, page.markdown, page.headers, links=page.links, fingerprint=page.fingerprint
+            )
+            print(f"✅ Depth {page.depth} | {record['status'].capitalize()} | {page.file_path}")
+        await finish(page.url, page.depth, record)
 
-                print(f"✅ Depth {depth} | Score: {score:.2f} | {file_path}")
-                results.append({"url": result.url, "depth": depth, "file": str(file_path)})
-            else:
-                print(f"❌ Failed: {result.url}")
+    # 정리/저장은 writer 스레드에서 처리하고, 큐가 가득 차면 크롤링이 대기함
+    writer = PageWriter(
+        process=partial(
+            _write_page,
+            output_path=output_path,
+            cache=cache,
+            manifest=manifest,
+            paths=paths,
+            near_duplicates=near_duplicates,
+            corpus=corpus,
+            text_index=text_index,
+        ),
+        on_done=on_written,
+    )
+
+    try:
+        async with _open_crawler(browser_config, pool, mode) as crawler, writer:
+            with fetch_context(
+                cache=cache, cache_mode=cache_mode, unchanged=unchanged, scheduler=scheduler, scrape_pool=scrape_pool
+            ):
+                if sitemap_urls:
+                    pending = [url for url in sitemap_urls if url not in done]
+                    progress.queued = len(pending)
+                    dispatcher = DomainLimitedDispatcher(concurrency=concurrency, per_domain_limit=concurrency)
+                    crawl_results = await crawler.arun_many(pending, config=crawler_config, dispatcher=dispatcher)
+                else:
+                    crawl_results = await crawler.arun(start_url, config=crawler_config)
+
+                async for result in crawl_results:
+                    result.metadata = result.metadata or {}
+                    if sitemap_urls:
+                        result.metadata["depth"] = 0 if result.url == start_url else 1
+                    depth = result.metadata.get("depth", 0)
+
+                    if not result.success:
+                        # 일시적인 실패는 삭제로 보지 않음
+                        if manifest is not None and result.status_code not in (404, 410):
+                            manifest.mark_seen(result.url)
+                        print(f"❌ Failed: {result.url}")
+                        await finish(result.url, depth, None)
+                    elif (result.response_headers or {}).get(UNCHANGED_HEADER):
+                        # sitemap 기준으로 가져오지 않은 페이지: 기존 파일 유지
+                        manifest.mark_seen(result.url)
+                        file_path = output_path / manifest.get(result.url)["file"]
+                        fingerprint = manifest.fingerprint(result.url)
+                        if near_duplicates is not None and fingerprint is not None:
+                            # 다시 가져오지 않은 페이지도 이후 페이지의 비교 대상으로 등록
+                            near_duplicates.insert(result.url, fingerprint)
+                        print(f"✅ Depth {depth} | Unchanged | {file_path}")
+                        record = {"url": result.url, "depth": depth, "file": str(file_path), "status": "unchanged"}
+                        await finish(result.url, depth, record)
+                    else:
+                        page = _PageToWrite(
+                            url=result.url,
+                            depth=depth,
+                            score=(
+                                url_scorer.score(result.url) if url_scorer is not None else result.metadata.get("score", 0)
+                            ),
+                            markdown=result.markdown.raw_markdown if result.markdown else "",
+                            headers=result.response_headers or {},
+                            links=[link["href"] for link in (result.links or {}).get("internal", []) if link.get("href")],
+                        )
+                        if dedup == "prune" and not sitemap_urls:
+                            # 전략은 다음 결과를 요청할 때 이 페이지의 링크를 탐색하므로 그 전에 중복 여부를 정함
+                            await asyncio.to_thread(_clean_page, page, near_duplicates)
+                            if page.duplicate_of is not None:
+                                result.links = {"internal": [], "external": []}
+                                metrics.incr("pruned_duplicates")
+                        await writer.submit(page)
+
+                    if sitemap_urls:
+                        # 링크 탐색이 없으므로 처리한 페이지를 바로 기록 대상으로 넘김
+                        await checkpoint.on_state_change({"strategy_type": "sitemap", "visited": [result.url]})
+    except BaseException:
+        # 중단된 지점까지 기록해두고 resume으로 이어서 진행
+        checkpoint.flush()
+        checkpoint.close()
+        results.close()
+        if corpus is not None:
+            corpus.close()
+        if text_index is not None:
+            text_index.close()
+        if manifest is not None:
+            manifest.save()
+        raise
+    finally:
+        if owns_cache and cache is not None:
+            await cache.close()
+
+    if corpus is not None:
+        corpus.close()
+    checkpoint.remove()
+
+    if crawl_mode == "best_first":
+        # 관련도가 높은 페이지부터 (같은 점수는 가져온 순서)
+        results.sort_by_score()
+
+    if manifest is not None:
+        for entry in manifest.removed():
+            results.append(
+                {"url": entry["url"], "depth": None, "file": str(output_path / entry["file"]), "status": "removed"}
+            )
+            if text_index is not None:
+                text_index.remove(entry["url"])
+        manifest.save()
+
+        counts = results.counts()
+        print("\n✅ " + ", ".join(f"{status.capitalize()}: {counts[status]}" for status in _INCREMENTAL_STATUSES))
+
+    results.close()
+    print(f"\n✅ Crawled {len(results) - results.counts()['removed']} pages")
+    if near_duplicates is not None:
+        print(f"✅ Near-duplicates: {results.counts()['duplicate']} pages (not saved)")
+    if text_index is not None:
+        print(f"✅ Search index: {len(text_index)} pages ({text_index.path})")
+        text_index.close()
+    print(f"✅ Saved to {output_path}/")
+
+    return results
+
+
+async def crawl_frontier(
+    frontier: SharedFrontier,
+    concurrency: int = 8,
+    crawler_config: CrawlerRunConfig = None,
+    browser_config: BrowserConfig = None,
+    pool: BrowserPool = None,
+    cache: PageCache = None,
+    scheduler: HostScheduler = None,
+    scrape_pool: ScrapeProcessPool = None,
+) -> int:
+    """공유 frontier의 Deep Crawl에 워커로 참여
+
+    frontier에서 URL을 리스해 최대 ``concurrency``개를 동시에 가져오고, 정리한 마크다운을
+    coordinator가 기록한 출력 디렉토리에 저장한 뒤 발견한 링크(도메인, 프리픽스 필터 통과)와
+    함께 완료를 보고한다. 큐가 비어도 다른 워커가 링크를 보고할 수 있으므로 frontier 전체가
+    끝날 때까지 기다린다. 중단되면 리스한 URL을 큐로 되돌린다.
+
+    Args:
+        frontier: coordinator가 만든 frontier
+        concurrency: 이 워커가 동시에 가져오는 최대 페이지 수
+        crawler_config: 크롤러 실행 설정 (None이면 기본 설정 사용)
+        browser_config: 브라우저 설정 (None이면 기본 설정 사용)
+        pool: 브라우저 풀 (None이면 이 호출 동안 브라우저 하나 실행)
+        cache: 페이지 캐시 (None이면 기본 위치의 캐시 사용)
+        scheduler: 호스트별 속도/동시성 제한과 429/5xx 재시도 (None이면 제한 없음)
+        scrape_pool: 스크래핑과 마크다운 생성을 실행할 프로세스 풀 (None이면 현재 프로세스에서 실행)
+
+    Returns:
+        이 워커가 저장한 페이지 수
+    """
+    options = frontier.options
+    mode = options["mode"]
+    cache_mode = options["cache_mode"]
+    owns_cache = cache is None
+    cache = _resolve_cache(cache, cache_mode)
+    _validate_mode(mode)
+
+    if crawler_config is None:
+        from .configs.crawler import DOCS_CRAWL_CONFIG
+
+        crawler_config = DOCS_CRAWL_CONFIG
+    crawler_config = crawler_config.clone(deep_crawl_strategy=None, stream=False)
+
+    if browser_config is None:
+        browser_config = DEFAULT_BROWSER_CONFIG
+
+    output_path = Path(options["output_dir"])
+    output_path.mkdir(parents=True, exist_ok=True)
+    filter_chain = _build_filter_chain(extract_domain(frontier.start_url), options["url_prefix"])
+    metrics = get_metrics()
+    saved = 0
+
+    async def on_written(page: _PageToWrite) -> None:
+        nonlocal saved
+        await frontier.complete(normalize_url(page.url), page.links)
+        metrics.finish(page.url, "ok")
+        saved += 1
+        print(f"✅ Depth {page.depth} | {page.file_path}")
+
+    async def on_write_error(page: _PageToWrite, error: Exception) -> None:
+        # 리스를 쥔 채로 두지 않도록 실패로 보고하고 다음 페이지를 계속 가져옴
+        await frontier.fail(normalize_url(page.url), f"Write failed: {error}")
+        metrics.finish(page.url, "failed")
+        print(f"❌ Failed to save: {page.url} ({error})")
+
+    # 파일 경로는 frontier가 리스할 때 배정하므로 (다른 워커와 겹치지 않음) 그 경로를 등록해 씀
+    paths = FilePathRegistry(output_path)
+    writer = PageWriter(
+        process=partial(_write_page, output_path=output_path, cache=cache, manifest=None, paths=paths),
+        on_done=on_written,
+        on_error=on_write_error,
+    )
+
+    async def crawl_one(crawler: AsyncWebCrawler, item: FrontierURL) -> None:
+        paths.claim(item.url, item.file)
+        result = await crawler.arun(item.url, config=crawler_config)
+        if not result.success:
+            await frontier.fail(item.key, result.error_message or f"HTTP {result.status_code}")
+            metrics.finish(item.url, "failed")
+            print(f"❌ Failed: {item.url}")
+            return
+        links = []
+        for link in (result.links or {}).get("internal", []):
+            href = link.get("href")
+            if href and await filter_chain.apply(href):
+                links.append(href)
+        await writer.submit(
+            _PageToWrite(
+                url=item.url,
+                depth=item.depth,
+                score=0,
+                markdown=result.markdown.raw_markdown if result.markdown else "",
+                headers=result.response_headers or {},
+                links=links,
+            )
+        )
+
+    async def heartbeat() -> None:
+        while True:
+            await frontier.renew()
+            await asyncio.sleep(frontier.lease_ttl / 3)
+
+    beat = asyncio.create_task(heartbeat())
+    in_flight: set[asyncio.Task] = set()
+    idle = 0.05
+    try:
+        async with _open_crawler(browser_config, pool, mode) as crawler, writer:
+            with fetch_context(cache=cache, cache_mode=cache_mode, scheduler=scheduler, scrape_pool=scrape_pool):
+                while True:
+                    if len(in_flight) < concurrency:
+                        for item in await frontier.lease(concurrency - len(in_flight)):
+                            in_flight.add(asyncio.create_task(crawl_one(crawler, item)))
+                    if not in_flight:
+                        if await frontier.finished():
+                            break
+                        # 다른 워커가 링크를 보고할 때까지 점점 길게 대기
+                        await asyncio.sleep(idle)
+                        idle = min(idle * 2, 1.0)
+                        continue
+                    idle = 0.05
+                    # 자리가 남아 있으면 다른 워커가 보고한 링크를 가져가도록 주기적으로 다시 리스
+                    done, in_flight = await asyncio.wait(
+                        in_flight,
+                        timeout=0.2 if len(in_flight) < concurrency else None,
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+                    for task in done:
+                        task.result()
+    finally:
+        beat.cancel()
+        for task in in_flight:
+            task.cancel()
+        await asyncio.gather(beat, *in_flight, return_exceptions=True)
+        # 끝내지 못한 URL은 리스 만료를 기다리지 않고 다른 워커가 바로 가져가도록 되돌림
+        # (취소된 경우에도 끝까지 실행)
+        await asyncio.shield(frontier.release())
+        if owns_cache and cache is not None:
+            await cache.close()
+
+    return saved
+
+
+async def crawl_documentation_distributed(
+    start_url: str,
+    frontier_path: str,
+    output_dir: str = None,
+    max_pages: int = 100,
+    max_depth: int = 2,
+    url_prefix: str = None,
+    mode: str = "browser",
+    cache_mode: str = "bypass",
+    workers: int = 2,
+    concurrency: int = 8,
+    worker_env: dict[str, str] = None,
+    search_index: bool = True,
+    resume: bool = False,
+    wal: bool = True,
+    lease_ttl: float = 30.0,
+    poll_interval: float = 1.0,
+) -> CrawlResults:
+    """공유 frontier로 여러 워커 프로세스가 나눠 하는 공식문서 Deep Crawl (coordinator)
+
+    ``frontier_path``에 frontier를 만들고 ``crawl4ai-mcp-server --frontier`` 워커를 ``workers``개
+    실행한 뒤 크롤이 끝날 때까지 진행 상황을 출력한다. 같은 파일을 여는 다른 호스트의 워커도
+    참여할 수 있다(출력 디렉토리도 같은 경로로 공유되어야 함). 링크 탐색은 BFS 순서이며,
+    끝나면 완료된 페이지로 결과 로그와 검색 인덱스를 만들고 frontier를 삭제한다.
+
+    Args:
+        start_url: 크롤링 시작 URL
+        frontier_path: frontier SQLite 파일 경로 (모든 워커가 접근할 수 있는 위치)
+        output_dir: 출력 디렉토리 (None이면 도메인명 사용)
+        max_pages: 최대 크롤링 페이지 수
+        max_depth: 최대 크롤링 깊이
+        url_prefix: URL 프리픽스 필터 (지정 시 해당 프리픽스로 시작하는 URL만 크롤링)
+        mode: 가져오기 방식 ("browser", "http", "auto")
+        cache_mode: 캐시 사용 방식 ("bypass", "prefer", "revalidate")
+        workers: 이 호스트에서 실행할 워커 프로세스 수 (0이면 다른 호스트의 워커만 기다림)
+        concurrency: 워커마다 동시에 가져오는 최대 페이지 수
+        worker_env: 워커 프로세스에 추가로 넘길 환경 변수 (호스트별 제한 등)
+        search_index: 저장한 페이지를 출력 디렉토리의 검색 인덱스에 추가
+        resume: 기존 frontier에서 남은 URL부터 이어서 진행
+        wal: frontier에 WAL 저널 사용 (다른 호스트의 워커가 네트워크 파일 시스템으로 접근하면 False)
+        lease_ttl: 워커가 갱신하지 않은 리스가 만료되어 다른 워커에게 넘어가기까지의 시간(초)
+        poll_interval: 진행 상황을 확인하는 간격(초)
+
+    Returns:
+        크롤링 결과 (항목은 url, depth, file 키를 가진 dict, 완료 순서)
+
+    Raises:
+        ValueError: 기존 frontier의 시작 URL이 다를 때
+        RuntimeError: 크롤이 끝나기 전에 모든 워커가 종료됐을 때
+    """
+    if cache_mode not in CACHE_MODES:
+        raise ValueError(f"Invalid cache mode: {cache_mode} (choose from {', '.join(CACHE_MODES)})")
+    _validate_mode(mode)
+
+    domain = extract_domain(start_url)
+    if output_dir is None:
+        output_dir = extract_output_dir_name(domain)
+    # 워커는 다른 작업 디렉토리(또는 호스트)에서 실행되므로 절대 경로로 기록
+    output_path = Path(output_dir).resolve()
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    frontier = SharedFrontier.create(
+        frontier_path,
+        start_url,
+        {
+            "output_dir": str(output_path),
+            "max_pages": max_pages,
+            "max_depth": max_depth,
+            "url_prefix": url_prefix,
+            "mode": mode,
+            "cache_mode": cache_mode,
+        },
+        resume=resume,
+        wal=wal,
+        lease_ttl=lease_ttl,
+    )
+
+    env = {**os.environ, **(worker_env or {})}
+    # 이 호스트의 워커들이 호스트별 속도 제한을 합계로 지키도록 공유 상태를 씀 (HTTP 서버 워커와 같은 기본 파일)
+    cache_dir = Path(env.get("CRAWL4AI_MCP_CACHE_DIR", DEFAULT_CACHE_DIR))
+    env.setdefault("CRAWL4AI_SHARED_STATE", str(cache_dir / "state.sqlite"))
+    env.setdefault("CRAWL4AI_MAX_PAGES", str(workers * concurrency))
+    # 워커마다 같은 포트를 열 수 없음
+    env.pop("CRAWL4AI_METRICS_PORT", None)
+    command = [sys.executable, "-m", "crawl4ai_mcp_server.server", "--frontier", str(frontier.path)]
+    processes = [
+        await asyncio.create_subprocess_exec(*command, "--concurrency", str(concurrency), env=env)
+        for _ in range(workers)
+    ]
+    if not workers:
+        print(f"✅ Waiting for workers: crawl4ai-mcp-server --frontier {frontier.path}")
+
+    progress = CrawlProgress()
+    try:
+        while not await frontier.finished():
+            await asyncio.sleep(poll_interval)
+            stats = await frontier.progress()
+            progress.done, progress.failed, progress.queued = stats["done"], stats["failed"], stats["queued"]
+            print(f"✅ {progress.message()} | {len(stats['workers'])} workers, {stats['leased']} in flight")
+            if processes and all(process.returncode is not None for process in processes) and not stats["workers"]:
+                if await frontier.finished():
+                    break
+                raise RuntimeError(f"All frontier workers exited before the crawl finished (see {frontier.path})")
+        # 워커는 frontier가 끝난 것을 보고 스스로 종료함
+        await asyncio.wait_for(asyncio.gather(*(process.wait() for process in processes)), timeout=60)
+    except BaseException:
+        # frontier는 남겨두고 resume으로 이어서 진행
+        for process in processes:
+            if process.returncode is None:
+                process.terminate()
+        await asyncio.gather(*(process.wait() for process in processes), return_exceptions=True)
+        frontier.close()
+        raise
+
+    metrics = get_metrics()
+    results = CrawlResults(output_path / RESULTS_FILENAME)
+    text_index = SearchIndex(output_path) if search_index else None
+    for record in await frontier.completed():
+        results.append(record)
+        if text_index is not None:
+            with metrics.stage(record["url"], "index"):
+                markdown = read_page(record["file"], record["url"]).removeprefix(f"# {record['url']}\n\n")
+                text_index.add(record["url"], record["file"], markdown)
+    failed = (await frontier.progress())["failed"]
+    frontier.remove()
+    results.close()
 
-    print(f"\n✅ Crawled {len(results)} pages")
+    print(f"\n✅ Crawled {len(results)} pages ({failed} failed)")
+    if text_index is not None:
+        print(f"✅ Search index: {len(text_index)} pages ({text_index.path})")
+        text_index.close()
     print(f"✅ Saved to {output_path}/")
 
     return results
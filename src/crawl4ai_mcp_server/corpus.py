@@ -0,0 +1,365 @@
+"""Packed single-file corpus of crawled pages with an offset index."""
+
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import zlib
+from collections.abc import Iterator
+from functools import partial
+from pathlib import Path
+
+from .utils.url import normalize_url
+
+try:
+    import zstandard
+except ImportError:  # 선택 의존성: 없으면 zlib으로 압축
+    zstandard = None
+
+# 출력 형식
+#   markdown: 페이지마다 URL 경로를 딴 .md 파일
+#   packed: 출력 디렉토리의 corpus.pack 한 파일에 압축 레코드로 추가 (corpus.idx로 URL 조회)
+OUTPUT_FORMATS = ("markdown", "packed")
+
+CORPUS_FILENAME = "corpus.pack"
+INDEX_FILENAME = "corpus.idx"
+
+# 파일 헤더: 매직(8) + 버전(1) + 코덱(1) + 예약(6)
+_PACK_MAGIC = b"C4PACK\x00\x01"
+_PACK_HEADER = struct.Struct("<8sBB6x")
+# 레코드: 압축된 본문 길이(4) + 본문 ("{url}\n{markdown}"을 UTF-8로 인코딩하여 압축)
+_RECORD_HEADER = struct.Struct("<I")
+# 색인 헤더: 매직(8) + 색인에 반영된 팩 크기(8) + 항목 수(8), 항목: URL 해시(8) + 위치(8) + 길이(4)
+_INDEX_MAGIC = b"C4INDEX1"
+_INDEX_HEADER = struct.Struct("<8sQQ")
+_INDEX_ENTRY = struct.Struct("<QQI")
+
+_CODEC_ZLIB = 1
+_CODEC_ZSTD = 2
+_PACK_VERSION = 1
+
+
+def _url_hash(url: str) -> int:
+    return int.from_bytes(hashlib.blake2b(normalize_url(url).encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def _default_codec() -> int:
+    return _CODEC_ZSTD if zstandard is not None else _CODEC_ZLIB
+
+
+def _compressor(codec: int):
+    if codec == _CODEC_ZLIB:
+        # 레벨 1: 기본 레벨(6)보다 두 배 가까이 빠르고 크기는 15% 정도만 큼
+        return partial(zlib.compress, level=1)
+    if zstandard is None:
+        raise RuntimeError("corpus.pack is zstd-compressed; install the zstd extra (zstandard) to use it")
+    # ZstdCompressor는 스레드 간에 공유할 수 없으므로 호출마다 만든다 (생성 비용은 작음)
+    return lambda data: zstandard.ZstdCompressor(level=3).compress(data)
+
+
+def _decompressor(codec: int):
+    if codec == _CODEC_ZLIB:
+        return zlib.decompress
+    if zstandard is None:
+        raise RuntimeError("corpus.pack is zstd-compressed; install the zstd extra (zstandard) to read it")
+    return lambda data: zstandard.ZstdDecompressor().decompress(data)
+
+
+def _encode(url: str, markdown: str) -> bytes:
+    # 정규화 전 URL에도 줄바꿈은 없으므로 첫 줄바꿈으로 구분 (JSON보다 인코딩/디코딩이 빠름)
+    return f"{url}\n{markdown}".encode("utf-8")
+
+
+def _decode(data: bytes) -> tuple[str, str]:
+    url, _, markdown = data.decode("utf-8").partition("\n")
+    return url, markdown
+
+
+def _read_header(f) -> int:
+    """팩 파일 헤더를 읽고 코덱 반환"""
+    magic, version, codec = _PACK_HEADER.unpack(f.read(_PACK_HEADER.size))
+    if magic != _PACK_MAGIC or version != _PACK_VERSION:
+        raise ValueError(f"Not a corpus pack: {getattr(f, 'name', f)}")
+    return codec
+
+
+def _scan(f, start: int) -> Iterator[tuple[int, int]]:
+    """``start``부터 온전한 레코드의 (위치, 본문 길이)를 차례로 반환 (쓰다 만 마지막 레코드에서 멈춤)"""
+    f.seek(0, os.SEEK_END)
+    end = f.tell()
+    offset = start
+    while offset + _RECORD_HEADER.size <= end:
+        f.seek(offset)
+        (length,) = _RECORD_HEADER.unpack(f.read(_RECORD_HEADER.size))
+        if offset + _RECORD_HEADER.size + length > end:
+            break
+        yield offset, length
+        offset += _RECORD_HEADER.size + length
+
+
+class _Index:
+    """URL 해시 → 최신 레코드 (위치, 길이)"""
+
+    def __init__(self):
+        self.entries: dict[int, tuple[int, int]] = {}
+        # 색인에 반영된 팩 파일 크기 (이후에 추가된 레코드는 팩을 읽어 반영)
+        self.size = _PACK_HEADER.size
+
+    @classmethod
+    def load(cls, pack_path: Path, codec: int) -> "_Index":
+        """색인 파일을 읽고, 없거나 팩보다 오래됐으면 팩을 읽어 나머지를 채움"""
+        index = cls()
+        try:
+            data = (pack_path.parent / INDEX_FILENAME).read_bytes()
+            magic, size, count = _INDEX_HEADER.unpack_from(data)
+            if magic == _INDEX_MAGIC and size <= pack_path.stat().st_size:
+                for url_hash, offset, length in _INDEX_ENTRY.iter_unpack(data[_INDEX_HEADER.size :]):
+                    index.entries[url_hash] = (offset, length)
+                index.size = size
+        except (FileNotFoundError, struct.error):
+            pass
+
+        if index.size < pack_path.stat().st_size:
+            decompress = _decompressor(codec)
+            with open(pack_path, "rb") as f:
+                for offset, length in _scan(f, index.size):
+                    f.seek(offset + _RECORD_HEADER.size)
+                    url = _decode(decompress(f.read(length)))[0]
+                    index.entries[_url_hash(url)] = (offset, length)
+                    index.size = offset + _RECORD_HEADER.size + length
+        return index
+
+    def save(self, pack_path: Path) -> None:
+        """URL 해시 순으로 정렬하여 임시 파일에 쓴 뒤 교체 (읽을 때 mmap 이진 탐색)"""
+        path = pack_path.parent / INDEX_FILENAME
+        tmp_path = path.with_name(f"{INDEX_FILENAME}.{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(_INDEX_HEADER.pack(_INDEX_MAGIC, self.size, len(self.entries)))
+            for url_hash in sorted(self.entries):
+                f.write(_INDEX_ENTRY.pack(url_hash, *self.entries[url_hash]))
+        os.replace(tmp_path, path)
+
+
+class CorpusWriter:
+    """크롤링한 페이지를 ``corpus.pack`` 한 파일에 추가하는 writer
+
+    페이지마다 URL과 마크다운을 압축하여(zstandard가 있으면 zstd, 없으면 zlib)
+    길이와 함께 파일 끝에 붙이고, ``close()``에서 URL → 위치 색인(``corpus.idx``)을 쓴다.
+    같은 URL을 다시 쓰면 새 레코드가 추가되고 색인은 최신 레코드를 가리킨다. 색인을 쓰기 전에
+    중단되어도 레코드는 남아 있으므로, 다음에 열 때 팩을 읽어 색인을 다시 만든다.
+    ``append=False``면 기존 팩을 버리고 새 팩으로 시작하므로 다시 크롤해도 팩이 계속 커지지 않는다.
+    writer 스레드에서 함께 쓰므로 압축은 각 스레드에서 하고 파일 추가만 잠금으로 보호한다.
+
+    Example:
+        with CorpusWriter(output_path) as corpus:
+            corpus.append("https://docs.example.com/intro", markdown)
+    """
+
+    # 색인을 저장할 최소 추가 페이지 수
+    INDEX_EVERY = 1000
+
+    def __init__(self, output_path: Path, append: bool = True):
+        """
+        Args:
+            output_path: 출력 디렉토리
+            append: 기존 corpus.pack이 있으면 이어서 추가 (False면 기존 팩과 색인을 지우고 새로 시작)
+        """
+        self.path = Path(output_path) / CORPUS_FILENAME
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if not append:
+            # 이미 열린 reader는 지운 파일을 계속 읽을 수 있도록 잘라내지 않고 지움
+            (self.path.parent / INDEX_FILENAME).unlink(missing_ok=True)
+            self.path.unlink(missing_ok=True)
+        if self.path.exists() and self.path.stat().st_size >= _PACK_HEADER.size:
+            with open(self.path, "rb") as f:
+                self.codec = _read_header(f)
+            self._index = _Index.load(self.path, self.codec)
+            # 쓰다 만 마지막 레코드는 버림
+            if self._index.size < self.path.stat().st_size:
+                os.truncate(self.path, self._index.size)
+            self._file = open(self.path, "ab")
+        else:
+            self.codec = _default_codec()
+            self._index = _Index()
+            self._file = open(self.path, "wb")
+            self._file.write(_PACK_HEADER.pack(_PACK_MAGIC, _PACK_VERSION, self.codec))
+        self._compress = _compressor(self.codec)
+        self._unsaved = 0
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "CorpusWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def append(self, url: str, markdown: str) -> Path:
+        """페이지 추가 후 팩 파일 경로 반환"""
+        payload = self._compress(_encode(url, markdown))
+        with self._lock:
+            offset = self._index.size
+            self._file.write(_RECORD_HEADER.pack(len(payload)))
+            self._file.write(payload)
+            self._index.entries[_url_hash(url)] = (offset, len(payload))
+            self._index.size = offset + _RECORD_HEADER.size + len(payload)
+            self._unsaved += 1
+            # 크롤 중에 여는 reader가 색인 이후의 레코드만 읽도록 색인을 가끔 저장
+            # (페이지 수의 10%마다 저장하므로 크롤 전체의 정렬 비용은 페이지 수에 거의 비례)
+            if self._unsaved >= max(self.INDEX_EVERY, len(self._index.entries) // 10):
+                self._file.flush()
+                self._index.save(self.path)
+                self._unsaved = 0
+        return self.path
+
+    def __len__(self) -> int:
+        return len(self._index.entries)
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def close(self) -> None:
+        """남은 레코드를 쓰고 색인 저장"""
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.close()
+            self._file = None
+            self._index.save(self.path)
+
+
+class CorpusReader:
+    """``corpus.pack``을 mmap으로 열어 URL로 조회하거나 처음부터 차례로 읽는 reader
+
+    색인(``corpus.idx``)도 mmap으로 열어 URL 해시로 이진 탐색하므로 페이지 수와 상관없이
+    필요한 레코드만 읽는다. 크롤 중이라 색인이 팩보다 오래됐으면 색인 이후에 추가된 레코드만
+    읽어 메모리에 색인을 만든다. 연 시점 이후에 추가된 레코드는 보이지 않으므로 필요하면 다시 연다.
+
+    Example:
+        with CorpusReader(output_path) as corpus:
+            corpus.get("https://docs.example.com/intro")  # 마크다운 또는 None
+            for url, markdown in corpus:
+                ...
+    """
+
+    def __init__(self, output_path: Path):
+        """
+        Args:
+            output_path: corpus.pack이 있는 출력 디렉토리
+
+        Raises:
+            FileNotFoundError: corpus.pack이 없을 때
+            ValueError: corpus.pack 형식이 아닐 때
+        """
+        self.path = Path(output_path) / CORPUS_FILENAME
+        self._index: mmap.mmap | None = None
+        self._entries: dict[int, tuple[int, int]] | None = None
+        self._count = 0
+        with open(self.path, "rb") as f:
+            self.codec = _read_header(f)
+            self._decompress = _decompressor(self.codec)
+            index_path = self.path.parent / INDEX_FILENAME
+            if self._index_is_current(index_path):
+                with open(index_path, "rb") as index_file:
+                    self._index = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+                self._count = _INDEX_HEADER.unpack_from(self._index)[2]
+            else:
+                self._entries = _Index.load(self.path, self.codec).entries
+                self._count = len(self._entries)
+            # 색인을 먼저 읽으므로 mmap은 색인에 있는 레코드를 모두 포함
+            self._pack = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _index_is_current(self, index_path: Path) -> bool:
+        try:
+            with open(index_path, "rb") as f:
+                magic, size, _ = _INDEX_HEADER.unpack(f.read(_INDEX_HEADER.size))
+        except (FileNotFoundError, struct.error):
+            return False
+        return magic == _INDEX_MAGIC and size == self.path.stat().st_size
+
+    def __enter__(self) -> "CorpusReader":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _entry(self, i: int) -> tuple[int, int, int]:
+        return _INDEX_ENTRY.unpack_from(self._index, _INDEX_HEADER.size + i * _INDEX_ENTRY.size)
+
+    def _locations(self) -> Iterator[tuple[int, int]]:
+        if self._entries is not None:
+            return iter(self._entries.values())
+        return ((offset, length) for _, offset, length in map(self._entry, range(self._count)))
+
+    def _record(self, offset: int, length: int) -> tuple[str, str]:
+        start = offset + _RECORD_HEADER.size
+        return _decode(self._decompress(self._pack[start : start + length]))
+
+    def _locate(self, url: str) -> tuple[int, int] | None:
+        target = _url_hash(url)
+        if self._entries is not None:
+            return self._entries.get(target)
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._entry(mid)[0] < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._count:
+            url_hash, offset, length = self._entry(lo)
+            if url_hash == target:
+                return offset, length
+        return None
+
+    def get(self, url: str) -> str | None:
+        """URL의 마크다운 (정규화한 URL로 찾고, 없으면 None)"""
+        location = self._locate(url)
+        if location is None:
+            return None
+        record_url, markdown = self._record(*location)
+        # 64비트 해시 충돌 확인
+        return markdown if normalize_url(record_url) == normalize_url(url) else None
+
+    def __contains__(self, url: str) -> bool:
+        return self.get(url) is not None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[tuple[str, str]]:
+        """파일 순서대로 (url, markdown) 반환 (같은 URL을 다시 쓴 경우 최신 레코드만)"""
+        for offset, length in sorted(self._locations()):
+            yield self._record(offset, length)
+
+    def close(self) -> None:
+        if self._pack is not None:
+            self._pack.close()
+            self._pack = None
+        if self._index is not None:
+            self._index.close()
+            self._index = None
+
+
+def iter_corpus(output_path: str | Path) -> Iterator[tuple[str, str]]:
+    """출력 디렉토리의 corpus.pack을 처음부터 스트리밍으로 읽기 (url, markdown)"""
+    with CorpusReader(Path(output_path)) as corpus:
+        yield from corpus
+
+
+def read_page(file: str | Path, url: str) -> str:
+    """결과 레코드의 file/url로 저장된 마크다운 읽기 (.md 파일과 corpus.pack 모두)
+
+    Raises:
+        OSError: 파일을 읽을 수 없거나 corpus.pack에 URL이 없을 때
+    """
+    file = Path(file)
+    if file.name != CORPUS_FILENAME:
+        return file.read_text(encoding="utf-8")
+    with CorpusReader(file.parent) as corpus:
+        markdown = corpus.get(url)
+    if markdown is None:
+        raise FileNotFoundError(f"{url} not found in {file}")
+    return f"# {url}\n\n{markdown}"
@@ -0,0 +1,134 @@
+"""Near-duplicate page detection with SimHash fingerprints."""
+
+import hashlib
+import re
+import threading
+
+from .utils.url import normalize_url
+
+# off: 검사 안 함, alias: 유사 중복 페이지는 저장하지 않고 원본의 별칭으로 기록,
+# prune: alias에 더해 유사 중복 페이지의 링크도 따라가지 않음
+DEDUP_MODES = ("off", "alias", "prune")
+
+_WORD_RE = re.compile(r"\w+")
+# 마크다운 링크/이미지의 대상 URL (버전 경로만 다른 미러 페이지는 링크 대상이 모두 다름)
+_LINK_TARGET_RE = re.compile(r"\]\([^)]*\)")
+_BITS = 128
+# 바이트 값 → 해당 비트 값(0/1) 변환표
+_BIT_TABLES = tuple(bytes((value >> bit) & 1 for value in range(256)) for bit in range(8))
+
+
+def simhash(text: str, shingle_size: int = 3) -> int:
+    """단어 shingle 기반 128비트 SimHash
+
+    내용이 조금만 다른 두 문서는 해밍 거리가 작은 지문을 갖는다. 64비트보다 거리의 편차가
+    상대적으로 작아 조금 다른 페이지와 꽤 비슷한 페이지를 더 잘 가른다. 프로세스가 바뀌어도
+    같은 값이 나오도록(매니페스트에 저장) 파이썬 ``hash()`` 대신 blake2b를 쓴다.
+
+    Args:
+        text: 정리된 마크다운
+        shingle_size: 한 특징으로 묶을 연속 단어 수
+
+    Returns:
+        128비트 지문 (단어가 없으면 0)
+    """
+    words = _WORD_RE.findall(text.lower())
+    if len(words) > shingle_size:
+        features = {" ".join(words[i : i + shingle_size]) for i in range(len(words) - shingle_size + 1)}
+    else:
+        features = set(words)
+    if not features:
+        return 0
+
+    digests = b"".join(hashlib.blake2b(f.encode("utf-8"), digest_size=_BITS // 8).digest() for f in features)
+    # 바이트 위치별로 각 비트가 1인 특징 수를 센다 (translate/count는 C에서 한 번에 처리)
+    half = len(features) / 2
+    fingerprint = 0
+    for position in range(_BITS // 8):
+        column = digests[position :: _BITS // 8]
+        for bit, table in enumerate(_BIT_TABLES):
+            if column.translate(table).count(1) > half:
+                fingerprint |= 1 << (position * 8 + bit)
+    return fingerprint
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+class NearDuplicateIndex:
+    """SimHash 지문으로 이미 본 페이지와 거의 같은 페이지를 찾는 인덱스
+
+    지문을 ``max_distance + 1``개의 구간으로 나누어 구간 값별로 색인한다. 해밍 거리가
+    ``max_distance`` 이하인 두 지문은 적어도 한 구간이 같으므로, 같은 구간 값을 가진 후보만
+    비교하면 된다. writer 스레드에서 함께 쓰므로 조회와 추가는 잠금으로 보호한다.
+
+    Example:
+        index = NearDuplicateIndex()
+        index.add("https://docs.example.com/latest/intro", index.fingerprint(markdown))  # None (처음 봄)
+        index.add("https://docs.example.com/v1/intro", index.fingerprint(same_markdown))  # ".../latest/intro"
+    """
+
+    def __init__(self, max_distance: int = 12, min_words: int = 30):
+        """
+        Args:
+            max_distance: 같은 내용으로 볼 최대 해밍 거리 (128비트 중). 기본값은 단어가 1% 안팎으로
+                다른 페이지(버전 표기만 다른 미러 등)를 잡고 3% 이상 다르면 거의 잡지 않는 정도
+            min_words: 이보다 단어가 적은 페이지는 비교하지 않음 (빈 페이지, 리다이렉트 안내 등)
+        """
+        self.max_distance = max_distance
+        self.min_words = min_words
+        bands = max_distance + 1
+        self._band_bits = -(-_BITS // bands)
+        self._bands: list[dict[int, list[tuple[int, str]]]] = [{} for _ in range(bands)]
+        self._urls: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _band_keys(self, fingerprint: int) -> list[int]:
+        mask = (1 << self._band_bits) - 1
+        return [(fingerprint >> (i * self._band_bits)) & mask for i in range(len(self._bands))]
+
+    def fingerprint(self, text: str) -> int | None:
+        """비교할 지문 (링크 대상 URL은 빼고 계산, 단어가 ``min_words``보다 적으면 None)"""
+        text = _LINK_TARGET_RE.sub("]", text)
+        if len(text.split()) < self.min_words:
+            return None
+        return simhash(text)
+
+    def find(self, fingerprint: int) -> str | None:
+        """지문과 거의 같은 페이지의 URL (없으면 None)"""
+        with self._lock:
+            return self._find(fingerprint)
+
+    def _find(self, fingerprint: int) -> str | None:
+        for band, key in zip(self._bands, self._band_keys(fingerprint)):
+            for candidate, url in band.get(key, ()):
+                if hamming_distance(candidate, fingerprint) <= self.max_distance:
+                    return url
+        return None
+
+    def insert(self, url: str, fingerprint: int) -> None:
+        """원본 페이지로 등록 (이전 크롤에서 저장해 둔 지문 복원용)"""
+        with self._lock:
+            self._insert(normalize_url(url), url, fingerprint)
+
+    def _insert(self, key: str, url: str, fingerprint: int) -> None:
+        if key in self._urls:
+            return
+        self._urls[key] = fingerprint
+        for band, key in zip(self._bands, self._band_keys(fingerprint)):
+            band.setdefault(key, []).append((fingerprint, url))
+
+    def add(self, url: str, fingerprint: int) -> str | None:
+        """거의 같은 페이지가 있으면 그 URL을 반환하고, 없으면 원본으로 등록 후 None 반환"""
+        key = normalize_url(url)
+        with self._lock:
+            if key in self._urls:
+                return None
+            original = self._find(fingerprint)
+            if original is None:
+                self._insert(key, url, fingerprint)
+            return original
+
+    def __len__(self) -> int:
+        return len(self._urls)
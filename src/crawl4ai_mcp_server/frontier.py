@@ -0,0 +1,404 @@
+"""Shared frontier store for deep crawls split across worker processes and hosts."""
+
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from .utils.path import url_to_filepath
+from .utils.sqlite import BUSY_TIMEOUT, LOCK_TIMEOUT, run_with_busy_retry
+from .utils.url import normalize_url, url_hash
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS urls (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    parent_url TEXT,
+    depth INTEGER NOT NULL,
+    state INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    lease_until REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    file TEXT,
+    file_key TEXT,
+    error TEXT,
+    done_at REAL
+);
+CREATE INDEX IF NOT EXISTS urls_state ON urls (state, depth);
+-- 대소문자를 구분하지 않는 파일 시스템에서도 두 URL이 같은 파일에 쓰지 않도록 casefold한 경로로 구분
+CREATE UNIQUE INDEX IF NOT EXISTS urls_file_key ON urls (file_key);
+CREATE TABLE IF NOT EXISTS workers (
+    id TEXT PRIMARY KEY,
+    pages INTEGER NOT NULL DEFAULT 0,
+    started_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+# URL 상태
+QUEUED, LEASED, DONE, FAILED = range(4)
+_STATE_NAMES = {QUEUED: "queued", LEASED: "leased", DONE: "done", FAILED: "failed"}
+
+
+@dataclass(frozen=True, slots=True)
+class FrontierURL:
+    """워커가 리스한 URL과 저장할 파일 경로 (출력 디렉토리 기준 상대 경로)"""
+
+    key: str
+    url: str
+    depth: int
+    file: str
+
+
+class SharedFrontier:
+    """여러 워커 프로세스(또는 호스트)가 하나의 Deep Crawl을 나눠 하는 SQLite frontier
+
+    coordinator가 ``create()``로 시작 URL과 크롤 옵션(출력 디렉토리, 깊이, 페이지 수 등)을
+    기록하면, 워커는 ``open()``으로 같은 파일을 열어 URL을 리스하고(``lease``) 가져온 뒤 발견한
+    링크와 함께 완료를 보고한다(``complete``). 방문 집합은 정규화된 URL을 키로 하는 ``urls``
+    테이블이라 여러 워커가 같은 링크를 찾아도 한 번만 큐에 들어가고, 큐는 깊이 순서로 꺼내므로
+    전체적으로 BFS에 가깝게 진행된다. 저장할 파일 경로는 처음 리스할 때 frontier에서 배정하므로,
+    대소문자만 다른 경로처럼 겹치는 URL을 다른 워커가 가져가도 서로의 파일을 덮어쓰지 않는다.
+
+    리스는 ``lease_ttl``초 동안 유효하고 워커가 ``renew()``로 연장한다. 워커가 비정상 종료되면
+    리스가 만료된 URL을 다음 ``lease()``에서 다시 큐에 넣고, ``max_attempts``번 리스되고도
+    끝나지 않은 URL은 실패로 처리한다. ``max_pages``는 리스 시점에 남은 예산으로 지킨다
+    (실패한 페이지는 예산을 돌려받음).
+
+    여러 호스트가 네트워크 파일 시스템의 파일을 공유할 때는 WAL을 쓸 수 없으므로
+    ``create(wal=False)``로 만든다(저널 모드는 파일에 기록되어 워커도 따름).
+
+    워커가 쓰는 메서드는 이 객체가 가진 스레드 하나에서 SQLite를 사용하므로, 다른 워커가 잠금을
+    잡고 있어도 이벤트 루프(리스를 갱신하는 heartbeat 포함)는 멈추지 않는다.
+
+    Example:
+        frontier = SharedFrontier.create("frontier.sqlite", start_url, {"max_pages": 1000, ...})
+        # 워커 (다른 프로세스/호스트)
+        frontier = SharedFrontier.open("frontier.sqlite")
+        for item in await frontier.lease(8):
+            await frontier.complete(item.key, links)
+    """
+
+    def __init__(self, path: str | Path):
+        """
+        Args:
+            path: frontier SQLite 파일 경로 (coordinator와 워커가 같은 파일을 지정)
+        """
+        self.path = Path(path)
+        self.worker = f"{socket.gethostname()}:{os.getpid()}"
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="frontier")
+        # 만들고 여는 동안에는 잠금을 기다리고, 크롤 중에는 짧게 기다린 뒤 이벤트 루프에서 다시 시도
+        self._conn = sqlite3.connect(self.path, timeout=LOCK_TIMEOUT, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self.meta = self._meta()
+
+    @classmethod
+    def create(
+        cls,
+        path: str | Path,
+        start_url: str,
+        options: dict,
+        resume: bool = False,
+        wal: bool = True,
+        lease_ttl: float = 30.0,
+        max_attempts: int = 3,
+    ) -> "SharedFrontier":
+        """coordinator: frontier를 만들고 시작 URL을 큐에 넣음
+
+        resume이 False이면 기존 frontier를 지우고 새로 시작한다.
+
+        Args:
+            path: frontier 파일 경로
+            start_url: 크롤링 시작 URL
+            options: 워커가 사용할 크롤 옵션 (``max_pages``, ``max_depth`` 필수)
+            resume: 기존 frontier가 있으면 남은 URL부터 이어서 진행
+            wal: WAL 저널 사용 (모든 워커가 같은 호스트일 때만)
+            lease_ttl: 갱신되지 않은 리스가 만료되기까지의 시간(초)
+            max_attempts: URL을 다시 리스할 최대 횟수
+
+        Raises:
+            ValueError: 기존 frontier의 시작 URL이 다를 때
+        """
+        path = Path(path)
+        if not resume:
+            for suffix in ("", "-wal", "-shm", "-journal"):
+                Path(f"{path}{suffix}").unlink(missing_ok=True)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        frontier = cls(path)
+        if not frontier.meta:
+            frontier._conn.execute(f"PRAGMA journal_mode={'WAL' if wal else 'DELETE'}")
+
+            def init(db: sqlite3.Connection, now: float) -> None:
+                values = {
+                    "start_url": start_url,
+                    "options": options,
+                    "lease_ttl": lease_ttl,
+                    "max_attempts": max_attempts,
+                    "budget": options["max_pages"],
+                }
+                db.executemany(
+                    "INSERT INTO meta (key, value) VALUES (?, ?)",
+                    [(key, json.dumps(value)) for key, value in values.items()],
+                )
+                db.execute("INSERT INTO urls (key, url, depth) VALUES (?, ?, 0)", (normalize_url(start_url), start_url))
+
+            frontier._run_transaction(init)
+            frontier.meta = frontier._meta()
+        elif frontier.meta["start_url"] != start_url:
+            frontier.close()
+            raise ValueError(f"Frontier {path} belongs to {frontier.meta['start_url']}, not {start_url}")
+        return frontier._ready()
+
+    @classmethod
+    def open(cls, path: str | Path) -> "SharedFrontier":
+        """워커: coordinator가 만든 frontier 열기
+
+        Raises:
+            FileNotFoundError: frontier가 없거나 아직 초기화되지 않았을 때
+        """
+        if not Path(path).exists():
+            raise FileNotFoundError(f"Frontier not found: {path}")
+        frontier = cls(path)
+        if not frontier.meta:
+            frontier.close()
+            raise FileNotFoundError(f"Frontier not initialized: {path}")
+        return frontier._ready()
+
+    def _ready(self) -> "SharedFrontier":
+        self._conn.execute(f"PRAGMA busy_timeout = {int(BUSY_TIMEOUT * 1000)}")
+        return self
+
+    def _meta(self) -> dict:
+        with self._lock:
+            rows = self._conn.execute("SELECT key, value FROM meta").fetchall()
+        return {key: json.loads(value) for key, value in rows}
+
+    def _run_transaction(self, fn, *args):
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                result = fn(self._conn, time.time(), *args)
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+        return result
+
+    async def _transaction(self, fn, *args):
+        """쓰기 잠금을 잡은 트랜잭션에서 ``fn(db, now, *args)`` 실행 (전용 스레드에서)"""
+        return await run_with_busy_retry(self._executor, self._run_transaction, fn, *args)
+
+    def _run_query(self, fn):
+        with self._lock:
+            return fn(self._conn)
+
+    async def _query(self, fn):
+        """``fn(db)``로 조회 (WAL이 아니면 읽기도 잠금을 기다리므로 전용 스레드에서)"""
+        return await run_with_busy_retry(self._executor, self._run_query, fn)
+
+    @property
+    def start_url(self) -> str:
+        return self.meta["start_url"]
+
+    @property
+    def options(self) -> dict:
+        return self.meta["options"]
+
+    @property
+    def lease_ttl(self) -> float:
+        return self.meta["lease_ttl"]
+
+    # ---- 워커 ----
+
+    async def lease(self, limit: int) -> list[FrontierURL]:
+        """큐에서 최대 ``limit``개의 URL을 깊이 순서로 리스 (만료된 리스는 먼저 되돌림)"""
+
+        def take(db: sqlite3.Connection, now: float) -> list[FrontierURL]:
+            self._expire(db, now)
+            (budget,) = db.execute("SELECT value FROM meta WHERE key = 'budget'").fetchone()
+            count = min(limit, json.loads(budget))
+            if count <= 0:
+                return []
+            rows = db.execute(
+                "SELECT key, url, depth, file FROM urls WHERE state = ? ORDER BY depth, rowid LIMIT ?",
+                (QUEUED, count),
+            ).fetchall()
+            db.executemany(
+                "UPDATE urls SET state = ?, worker = ?, lease_until = ?, attempts = attempts + 1 WHERE key = ?",
+                [(LEASED, self.worker, now + self.lease_ttl, key) for key, _, _, _ in rows],
+            )
+            self._add_budget(db, -len(rows))
+            return [
+                FrontierURL(key, url, depth, file or self._assign_file(db, key)) for key, url, depth, file in rows
+            ]
+
+        return await self._transaction(take)
+
+    def _assign_file(self, db: sqlite3.Connection, key: str) -> str:
+        """URL의 파일 경로를 배정 (다른 URL이 같은 경로를 가졌으면 ``FilePathRegistry``처럼 해시를 붙임)"""
+        file = url_to_filepath(key, Path()).as_posix()
+        if db.execute("SELECT 1 FROM urls WHERE file_key = ?", (file.casefold(),)).fetchone() is not None:
+            file = f"{file[:-3]}-{url_hash(key)}.md"
+        db.execute("UPDATE urls SET file = ?, file_key = ? WHERE key = ?", (file, file.casefold(), key))
+        return file
+
+    def _expire(self, db: sqlite3.Connection, now: float) -> None:
+        expired = db.execute(
+            "SELECT key, attempts FROM urls WHERE state = ? AND lease_until < ?", (LEASED, now)
+        ).fetchall()
+        if not expired:
+            return
+        max_attempts = self.meta["max_attempts"]
+        db.executemany(
+            "UPDATE urls SET state = ?, worker = NULL, lease_until = NULL, error = ? WHERE key = ?",
+            [
+                (FAILED, "Lease expired too many times", key) if attempts >= max_attempts else (QUEUED, None, key)
+                for key, attempts in expired
+            ],
+        )
+        self._add_budget(db, len(expired))
+
+    def _add_budget(self, db: sqlite3.Connection, amount: int) -> None:
+        if amount:
+            db.execute("UPDATE meta SET value = value + ? WHERE key = 'budget'", (amount,))
+
+    async def complete(self, key: str, links: list[str]) -> None:
+        """리스한 URL의 완료와 발견한 링크를 하나의 트랜잭션으로 기록
+
+        리스가 만료되어 다른 워커가 다시 가져가고 있어도 먼저 끝낸 쪽의 결과를 기록한다
+        (파일 경로는 리스할 때 배정되어 어느 워커가 저장해도 같음).
+        링크는 ``max_depth``를 넘지 않을 때만 큐에 넣는다.
+
+        Args:
+            key: ``lease()``가 반환한 URL 키
+            links: 필터(도메인, 프리픽스)를 통과한 내부 링크
+        """
+
+        def done(db: sqlite3.Connection, now: float) -> None:
+            row = db.execute("SELECT url, depth, state, worker FROM urls WHERE key = ?", (key,)).fetchone()
+            if row is None or row[2] == DONE:
+                return
+            url, depth, state, _ = row
+            if state in (QUEUED, FAILED):
+                # 리스가 만료되어 되돌려진 URL: 되돌릴 때 돌려받은 예산을 다시 씀
+                # (다른 워커가 다시 리스했으면 그 리스의 예산이 이 페이지 몫이 됨)
+                self._add_budget(db, -1)
+            db.execute(
+                "UPDATE urls SET state = ?, worker = ?, lease_until = NULL, error = NULL, done_at = ? WHERE key = ?",
+                (DONE, self.worker, now, key),
+            )
+            if depth < self.options["max_depth"]:
+                db.executemany(
+                    "INSERT OR IGNORE INTO urls (key, url, parent_url, depth) VALUES (?, ?, ?, ?)",
+                    [(normalize_url(link), link, url, depth + 1) for link in links],
+                )
+            db.execute("UPDATE workers SET pages = pages + 1 WHERE id = ?", (self.worker,))
+
+        await self._transaction(done)
+
+    async def fail(self, key: str, error: str) -> None:
+        """가져오지 못한 URL을 실패로 기록 (예산은 돌려받음)"""
+
+        def failed(db: sqlite3.Connection, now: float) -> None:
+            cursor = db.execute(
+                "UPDATE urls SET state = ?, lease_until = NULL, error = ? WHERE key = ? AND state = ? AND worker = ?",
+                (FAILED, error, key, LEASED, self.worker),
+            )
+            self._add_budget(db, cursor.rowcount)
+
+        await self._transaction(failed)
+
+    async def release(self) -> None:
+        """이 워커가 리스한 URL을 모두 큐로 되돌림 (종료할 때)"""
+
+        def back(db: sqlite3.Connection, now: float) -> None:
+            cursor = db.execute(
+                "UPDATE urls SET state = ?, worker = NULL, lease_until = NULL, attempts = attempts - 1 "
+                "WHERE state = ? AND worker = ?",
+                (QUEUED, LEASED, self.worker),
+            )
+            self._add_budget(db, cursor.rowcount)
+            db.execute("DELETE FROM workers WHERE id = ?", (self.worker,))
+
+        await self._transaction(back)
+
+    async def renew(self) -> None:
+        """이 워커의 리스를 연장하고 살아 있음을 기록 (``lease_ttl``보다 짧은 간격으로 호출)"""
+
+        def beat(db: sqlite3.Connection, now: float) -> None:
+            db.execute(
+                "UPDATE urls SET lease_until = ? WHERE state = ? AND worker = ?",
+                (now + self.lease_ttl, LEASED, self.worker),
+            )
+            db.execute(
+                "INSERT INTO workers (id, started_at, updated_at) VALUES (?, ?, ?) "
+                "ON CONFLICT (id) DO UPDATE SET updated_at = excluded.updated_at",
+                (self.worker, now, now),
+            )
+
+        await self._transaction(beat)
+
+    # ---- 조회 ----
+
+    async def finished(self) -> bool:
+        """리스 중인 URL이 없고, 큐가 비었거나 페이지 예산을 다 썼으면 True"""
+
+        def check(db: sqlite3.Connection) -> bool:
+            leased = db.execute("SELECT 1 FROM urls WHERE state = ? LIMIT 1", (LEASED,)).fetchone()
+            if leased is not None:
+                # 만료된 리스는 다음 lease()에서 되돌려지므로 아직 끝나지 않음
+                return False
+            (budget,) = db.execute("SELECT value FROM meta WHERE key = 'budget'").fetchone()
+            queued = db.execute("SELECT 1 FROM urls WHERE state = ? LIMIT 1", (QUEUED,)).fetchone()
+            return queued is None or json.loads(budget) <= 0
+
+        return await self._query(check)
+
+    async def progress(self) -> dict:
+        """상태별 URL 수와 ``lease_ttl`` 안에 갱신한 워커별 완료 페이지 수"""
+
+        def count(db: sqlite3.Connection) -> dict:
+            counts = dict(db.execute("SELECT state, COUNT(*) FROM urls GROUP BY state").fetchall())
+            workers = db.execute(
+                "SELECT id, pages FROM workers WHERE updated_at >= ? ORDER BY id", (time.time() - self.lease_ttl,)
+            ).fetchall()
+            stats = {name: counts.get(state, 0) for state, name in _STATE_NAMES.items()}
+            stats["workers"] = dict(workers)
+            return stats
+
+        return await self._query(count)
+
+    async def completed(self) -> list[dict]:
+        """완료된 페이지 (url, depth, file)를 완료 순서대로 (file은 출력 디렉토리를 포함한 경로)"""
+        rows = await self._query(
+            lambda db: db.execute(
+                "SELECT url, depth, file FROM urls WHERE state = ? ORDER BY done_at, rowid", (DONE,)
+            ).fetchall()
+        )
+        output_path = Path(self.options["output_dir"])
+        return [{"url": url, "depth": depth, "file": str(output_path / file)} for url, depth, file in rows]
+
+    # ---- 정리 ----
+
+    def close(self) -> None:
+        # 실행 중인 조회가 끝난 뒤에 연결을 닫음
+        self._executor.shutdown(wait=True)
+        self._conn.close()
+
+    def remove(self) -> None:
+        """크롤이 끝까지 완료되면 frontier 삭제"""
+        self.close()
+        for suffix in ("", "-wal", "-shm", "-journal"):
+            Path(f"{self.path}{suffix}").unlink(missing_ok=True)
@@ -0,0 +1,97 @@
+"""In-memory hot cache and single-flight fetches for ``crawl_page``."""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Hashable
+
+
+class HotPageCache:
+    """최근 정리된 마크다운을 잠깐 보관하고, 같은 페이지의 동시 요청을 한 번의 가져오기로 묶는 캐시
+
+    에이전트 여러 개가 같은 URL을 거의 동시에 ``crawl_page``하면 호출마다 브라우저 렌더링을 따로
+    하게 된다. 같은 키의 가져오기가 진행 중이면 새 호출은 그 결과를 기다리고(single-flight),
+    끝난 결과는 ``ttl``초 동안 메모리에서 바로 돌려준다. 마크다운 총 크기가 ``max_bytes``를 넘으면
+    가장 오래 쓰지 않은 페이지부터 버린다. 실패(None)는 보관하지 않는다.
+
+    한 이벤트 루프 안에서만 사용한다(스레드 간 공유하지 않음).
+
+    Example:
+        hot = HotPageCache(ttl=30)
+        markdown = hot.get(key)
+        if markdown is None:
+            markdown = await hot.run(key, fetch)
+    """
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024, ttl: float = 30):
+        """
+        Args:
+            max_bytes: 보관할 마크다운의 최대 총 크기(문자 수 기준)
+            ttl: 결과를 재사용할 시간(초, 0이면 보관하지 않고 동시 요청만 묶음)
+        """
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._pages: OrderedDict[Hashable, tuple[float, str]] = OrderedDict()
+        self._bytes = 0
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+
+    def get(self, key: Hashable) -> str | None:
+        """보관 중인 마크다운 (없거나 만료됐으면 None)"""
+        entry = self._pages.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] > self.ttl:
+            self._discard(key)
+            return None
+        self._pages.move_to_end(key)
+        return entry[1]
+
+    def put(self, key: Hashable, markdown: str) -> None:
+        if self.ttl <= 0:
+            return
+        self._discard(key)
+        self._pages[key] = (time.monotonic(), markdown)
+        self._bytes += len(markdown)
+        while self._bytes > self.max_bytes and self._pages:
+            self._discard(next(iter(self._pages)))
+
+    async def run(self, key: Hashable, fetch: Callable[[], Awaitable[str | None]]) -> str | None:
+        """같은 키의 가져오기가 진행 중이면 그 결과를, 아니면 ``fetch()``를 실행해 결과를 반환
+
+        가져오기는 별도 태스크로 실행하므로 먼저 호출한 쪽이 취소돼도 기다리는 다른 호출은
+        결과를 받는다. ``fetch``의 예외는 기다리던 모든 호출에 그대로 전달된다.
+
+        Args:
+            key: 페이지와 결과에 영향을 주는 옵션을 묶은 키
+            fetch: 마크다운을 가져오는 함수 (실패하면 None)
+
+        Returns:
+            정리된 마크다운 (실패하면 None)
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fill(key, fetch))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(task)
+
+    async def _fill(self, key: Hashable, fetch: Callable[[], Awaitable[str | None]]) -> str | None:
+        markdown = await fetch()
+        if markdown is not None:
+            self.put(key, markdown)
+        return markdown
+
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # 기다리던 호출이 모두 취소돼도 "exception was never retrieved" 경고가 남지 않도록 확인
+        if not task.cancelled():
+            task.exception()
+
+    def _discard(self, key: Hashable) -> None:
+        entry = self._pages.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry[1])
+
+    def __len__(self) -> int:
+        return len(self._pages)
@@ -0,0 +1,177 @@
+"""Background crawl jobs for long-running MCP tool calls."""
+
+import asyncio
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Awaitable, Callable
+
+from .progress import CrawlProgress
+from .results import RESULTS_FILENAME, CrawlResults
+
+if TYPE_CHECKING:
+    from .shared import SharedState
+
+
+@dataclass
+class CrawlJob:
+    """백그라운드에서 실행되는 크롤링 작업
+
+    결과는 페이지가 처리될 때마다 ``results``에 작은 레코드로 추가되므로, 작업이 끝나기 전에도
+    완료된 페이지를 조회할 수 있다.
+    """
+
+    id: str
+    params: dict
+    # running, completed, failed(error에 메시지), cancelled(서버 종료 등)
+    status: str = "running"
+    progress: CrawlProgress = field(default_factory=CrawlProgress)
+    results: CrawlResults = field(default_factory=CrawlResults)
+    error: str | None = None
+    created_at: float = field(default_factory=time.time)
+    finished_at: float | None = None
+    _task: asyncio.Task | None = field(default=None, repr=False)
+
+    async def on_progress(self, record: dict | None, progress: CrawlProgress) -> None:
+        """crawl_documentation의 on_progress 콜백"""
+        self.progress = progress
+        if record is not None:
+            self.results.append(record)
+
+
+class JobManager:
+    """백그라운드 크롤링 작업 관리
+
+    끝난 작업은 ``ttl``초 동안 결과를 조회할 수 있도록 유지하고,
+    보관 중인 작업이 ``max_jobs``개를 넘으면 오래된 완료 작업부터 삭제한다.
+
+    ``shared``가 주어지면 작업 상태를 ``publish_interval``초마다 공유 상태에 기록하여, 다른 서버
+    프로세스에서도 ``get()``으로 조회할 수 있다. 이때 결과는 ``output_dir`` 파라미터의 결과 로그에서
+    읽고, 작업을 실행하던 프로세스가 종료됐으면 상태를 ``cancelled``로 보여준다.
+
+    Example:
+        job = jobs.start(lambda job: crawl_documentation(url, on_progress=job.on_progress), url=url)
+        ...
+        job = jobs.get(job.id)
+    """
+
+    def __init__(
+        self,
+        max_jobs: int = 50,
+        ttl: float = 3600.0,
+        shared: "SharedState | None" = None,
+        publish_interval: float = 1.0,
+    ):
+        """
+        Args:
+            max_jobs: 보관할 최대 작업 수
+            ttl: 끝난 작업을 보관하는 시간(초)
+            shared: 작업 상태를 다른 프로세스와 공유할 저장소 (None이면 이 프로세스에서만 조회)
+            publish_interval: 실행 중인 작업 상태를 공유 저장소에 기록하는 간격(초)
+        """
+        self.max_jobs = max_jobs
+        self.ttl = ttl
+        self.shared = shared
+        self.publish_interval = publish_interval
+        self._jobs: dict[str, CrawlJob] = {}
+
+    def start(self, run: Callable[[CrawlJob], Awaitable[CrawlResults]], **params) -> CrawlJob:
+        """작업을 만들고 백그라운드에서 실행
+
+        Args:
+            run: 작업을 받아 크롤링을 실행하고 최종 결과 리스트를 반환하는 함수
+            **params: 상태 조회 시 보여줄 작업 파라미터
+        """
+        self._prune()
+        job = CrawlJob(id=uuid.uuid4().hex[:12], params=params)
+        job._task = asyncio.create_task(self._run(job, run))
+        self._jobs[job.id] = job
+        return job
+
+    async def _run(self, job: CrawlJob, run: Callable[[CrawlJob], Awaitable[CrawlResults]]) -> None:
+        publisher = None
+        if self.shared is not None:
+            await self.shared.prune_jobs(self.ttl)
+            publisher = asyncio.create_task(self._publish_while_running(job))
+        try:
+            # 최종 결과에는 삭제된 페이지 등 진행 중에 보고되지 않은 항목도 포함됨
+            job.results = await run(job)
+            job.status = "completed"
+        except asyncio.CancelledError:
+            job.status = "cancelled"
+        except Exception as e:
+            job.status = "failed"
+            job.error = str(e) or type(e).__name__
+        finally:
+            job.finished_at = time.time()
+            if publisher is not None:
+                publisher.cancel()
+            await self._publish(job)
+
+    async def _publish_while_running(self, job: CrawlJob) -> None:
+        while True:
+            await self._publish(job)
+            await asyncio.sleep(self.publish_interval)
+
+    async def _publish(self, job: CrawlJob) -> None:
+        if self.shared is None:
+            return
+        await self.shared.put_job(
+            job.id,
+            {
+                "params": job.params,
+                "status": job.status,
+                "progress": {"done": job.progress.done, "failed": job.progress.failed, "queued": job.progress.queued},
+                "error": job.error,
+                "created_at": job.created_at,
+                "finished_at": job.finished_at,
+            },
+        )
+
+    def get(self, job_id: str) -> CrawlJob | None:
+        job = self._jobs.get(job_id)
+        if job is None and self.shared is not None:
+            job = self._load(job_id)
+        return job
+
+    def _load(self, job_id: str) -> CrawlJob | None:
+        """다른 프로세스에서 실행 중이거나 끝난 작업을 공유 상태와 결과 로그로 복원"""
+        found = self.shared.get_job(job_id)
+        if found is None:
+            return None
+        snapshot, alive = found
+        status = snapshot["status"]
+        if status == "running" and not alive:
+            status = "cancelled"
+        output_dir = snapshot["params"].get("output_dir")
+        return CrawlJob(
+            id=job_id,
+            params=snapshot["params"],
+            status=status,
+            progress=CrawlProgress(**snapshot["progress"]),
+            results=CrawlResults.load(Path(output_dir) / RESULTS_FILENAME) if output_dir else CrawlResults(),
+            error=snapshot["error"],
+            created_at=snapshot["created_at"],
+            finished_at=snapshot["finished_at"],
+        )
+
+    def _prune(self) -> None:
+        """보관 기간이 지났거나 개수 제한을 넘은 끝난 작업 삭제"""
+        now = time.time()
+        finished = sorted(
+            (job for job in self._jobs.values() if job.finished_at is not None),
+            key=lambda job: job.finished_at,
+        )
+        overflow = len(self._jobs) - self.max_jobs + 1
+        for job in finished:
+            if now - job.finished_at > self.ttl or overflow > 0:
+                del self._jobs[job.id]
+                overflow -= 1
+
+    async def close(self) -> None:
+        """실행 중인 작업 취소 (체크포인트가 남으므로 resume으로 이어서 진행 가능)"""
+        tasks = [job._task for job in self._jobs.values() if job._task is not None and not job._task.done()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,129 @@
+"""Crawl manifest tracking what was written to an output directory."""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+from .cache import cache_key
+
+MANIFEST_FILENAME = ".crawl_manifest.json"
+
+
+def content_hash(text: str) -> str:
+    """마크다운 내용의 SHA-256 해시"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class CrawlManifest:
+    """출력 디렉토리에 저장된 페이지의 URL별 기록
+
+    ``{output_dir}/.crawl_manifest.json``에 URL → 파일 경로, 내용 해시, 수집 시각,
+    검증자(ETag/Last-Modified), 페이지의 내부 링크, 유사 중복 검사용 SimHash 지문을 기록한다.
+    다른 페이지와 내용이 거의 같아 따로 저장하지 않은 페이지는 ``alias_of``에 원본 URL을,
+    ``file``에 원본 파일을 기록한다.
+    증분 크롤링 시 내용 해시가 같으면 파일을 다시 쓰지 않고, 이번 실행에서
+    보이지 않은 페이지는 삭제된 것으로 보고한다.
+    """
+
+    def __init__(self, output_path: Path, pages: dict[str, dict] = None):
+        self.output_path = output_path
+        self.pages: dict[str, dict] = pages or {}
+        self._seen: set[str] = set()
+
+    @classmethod
+    def load(cls, output_path: Path) -> "CrawlManifest":
+        path = output_path / MANIFEST_FILENAME
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return cls(output_path)
+        # 이전 버전에서 다른 정규화로 기록된 키도 현재 키로 맞춤
+        pages = {cache_key(entry["url"]): entry for entry in data.get("pages", {}).values()}
+        return cls(output_path, pages)
+
+    def get(self, url: str) -> dict | None:
+        return self.pages.get(cache_key(url))
+
+    def is_unchanged(self, url: str, markdown: str) -> bool:
+        """기록된 해시와 같고 파일도 남아 있으면 True"""
+        entry = self.get(url)
+        if entry is None or entry["hash"] != content_hash(markdown):
+            return False
+        return (self.output_path / entry["file"]).exists()
+
+    def record(
+        self,
+        url: str,
+        file_path: Path,
+        markdown: str,
+        headers: dict = None,
+        links: list[str] = None,
+        fingerprint: int | None = None,
+        alias_of: str | None = None,
+    ) -> str:
+        """페이지 기록 후 상태 반환
+
+        Args:
+            url: 페이지 URL
+            file_path: 저장된 파일 (별칭이면 원본 파일)
+            markdown: 정리된 마크다운
+            headers: 응답 헤더 (ETag/Last-Modified 기록)
+            links: 페이지의 내부 링크 (None이면 이전 기록 유지)
+            fingerprint: 유사 중복 검사용 SimHash 지문
+            alias_of: 내용이 거의 같은 원본 페이지 URL (별칭으로 기록할 때)
+
+        Returns:
+            "added", "changed", "unchanged" 중 하나
+        """
+        key = cache_key(url)
+        headers = {k.lower(): v for k, v in (headers or {}).items()}
+        digest = content_hash(markdown)
+        previous = self.pages.get(key)
+
+        if previous is None:
+            status = "added"
+        elif previous["hash"] == digest:
+            status = "unchanged"
+        else:
+            status = "changed"
+
+        self.pages[key] = {
+            "url": url,
+            "file": str(file_path.relative_to(self.output_path)),
+            "hash": digest,
+            "fetched_at": time.time(),
+            "etag": headers.get("etag"),
+            "last_modified": headers.get("last-modified"),
+            "links": links if links is not None else (previous or {}).get("links", []),
+            "simhash": f"{fingerprint:016x}" if fingerprint is not None else None,
+            "alias_of": alias_of,
+        }
+        self._seen.add(key)
+        return status
+
+    def fingerprint(self, url: str) -> int | None:
+        """기록된 SimHash 지문 (없으면 None)"""
+        entry = self.get(url)
+        if entry is None or not entry.get("simhash"):
+            return None
+        return int(entry["simhash"], 16)
+
+    def mark_seen(self, url: str) -> None:
+        """다시 가져오지 않았지만 이번 실행에 포함된 페이지 표시"""
+        self._seen.add(cache_key(url))
+
+    def removed(self) -> list[dict]:
+        """이번 실행에서 보이지 않은 기존 페이지"""
+        return [entry for key, entry in self.pages.items() if key not in self._seen]
+
+    def save(self) -> None:
+        """임시 파일에 쓴 뒤 교체하여 원자적으로 저장"""
+        path = self.output_path / MANIFEST_FILENAME
+        tmp_path = path.with_name(f"{MANIFEST_FILENAME}.{os.getpid()}.tmp")
+        tmp_path.write_text(
+            json.dumps({"version": 1, "pages": self.pages}, ensure_ascii=False, indent=1),
+            encoding="utf-8",
+        )
+        os.replace(tmp_path, path)
@@ -0,0 +1,293 @@
+"""Per-page stage timings and counters for crawls.
+
+크롤링 파이프라인의 단계별 소요 시간을 페이지 단위 span으로 모으고, 단계별 히스토그램과
+카운터로 집계한다. 페이지 처리가 끝나면 span을 JSON 한 줄로 기록할 수 있고, 집계는
+``crawl_stats`` MCP 도구나 Prometheus 텍스트 형식(``/metrics``)으로 조회한다.
+
+단계:
+- browser_launch: 브라우저 실행 (페이지와 무관)
+- wait: 호스트별 속도/동시성 제한으로 기다린 시간 (fetch에 포함, 기다린 경우에만 기록)
+- fetch: 페이지 가져오기 전체 (navigate + render, 캐시 히트 시 캐시 읽기)
+- navigate: 페이지 이동 (브라우저 전략에서만)
+- render: 이동 후 렌더링 대기, JS 실행, HTML 추출 (브라우저 전략에서만)
+- scrape: crawl4ai의 HTML 스크래핑과 마크다운 생성
+- clean: 네비게이션/푸터 정리
+- write: 파일 저장
+"""
+
+import json
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter, deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Iterator
+
+STAGES = ("browser_launch", "wait", "fetch", "navigate", "render", "scrape", "clean", "write", "index")
+_PIPELINE_STAGES = ("fetch", "scrape", "clean", "write", "index")
+
+# 히스토그램 버킷 상한(초)
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class Histogram:
+    """고정 버킷 히스토그램 (분위수는 버킷 안에서 선형 보간으로 추정)"""
+
+    __slots__ = ("counts", "count", "sum", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(BUCKETS, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        if self.count == 0:
+            return 0.0
+        target = q * self.count
+        cumulative = 0
+        lower = 0.0
+        for bound, count in zip(BUCKETS, self.counts):
+            if count and cumulative + count >= target:
+                # 버킷 안에서는 고르게 분포한다고 보고 선형 보간
+                upper = min(bound, self.max)
+                return lower + (upper - lower) * (target - cumulative) / count
+            cumulative += count
+            lower = bound
+        return self.max
+
+    def as_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "mean_s": round(self.sum / self.count, 4) if self.count else 0.0,
+            "p50_s": round(self.quantile(0.5), 4),
+            "p95_s": round(self.quantile(0.95), 4),
+            "max_s": round(self.max, 4),
+        }
+
+
+@dataclass(slots=True)
+class PageSpan:
+    """한 페이지의 단계별 소요 시간"""
+
+    url: str
+    started_at: float = field(default_factory=time.time)
+    started: float = field(default_factory=time.perf_counter)
+    stages: dict[str, float] = field(default_factory=dict)
+    bytes: int = 0
+
+    def as_dict(self, status: str, total: float) -> dict:
+        return {
+            "url": self.url,
+            "status": status,
+            "started_at": round(self.started_at, 3),
+            "total_s": round(total, 4),
+            "bytes": self.bytes,
+            "stages": {stage: round(seconds, 4) for stage, seconds in self.stages.items()},
+        }
+
+
+class CrawlMetrics:
+    """크롤링 단계별 span, 히스토그램, 카운터 수집기
+
+    정리/저장은 writer 스레드에서 기록되므로 모든 갱신은 잠금 안에서 처리한다.
+
+    Example:
+        metrics = get_metrics()
+        with metrics.stage(url, "clean"):
+            markdown = clean_navigation_content(markdown)
+        metrics.finish(url, "ok")
+    """
+
+    def __init__(self, jsonl_path: str | Path | None = None, recent: int = 200, max_open: int = 10000):
+        """
+        Args:
+            jsonl_path: 끝난 페이지의 span을 JSON 한 줄씩 추가할 파일 (None이면 기록 안 함)
+            recent: 최근 span을 보관할 개수 (crawl_stats의 느린 페이지 목록용)
+            max_open: 끝나지 않은 span의 최대 개수 (넘으면 오래된 것부터 버림)
+        """
+        self.max_open = max_open
+        self._lock = threading.Lock()
+        self._open: dict[str, PageSpan] = {}
+        self._recent: deque[dict] = deque(maxlen=recent)
+        self._jsonl_path = Path(jsonl_path) if jsonl_path else None
+        self._jsonl = None
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.started_at = time.time()
+            self.stages = {stage: Histogram() for stage in STAGES}
+            self.pages = Histogram()
+            self.statuses: Counter[str] = Counter()
+            self.counters: Counter[str] = Counter()
+            self._open.clear()
+            self._recent.clear()
+
+    def set_jsonl_path(self, path: str | Path | None) -> None:
+        with self._lock:
+            if self._jsonl is not None:
+                self._jsonl.close()
+                self._jsonl = None
+            self._jsonl_path = Path(path) if path else None
+
+    # ---- 기록 ----
+
+    def _span(self, url: str) -> PageSpan:
+        span = self._open.get(url)
+        if span is None:
+            if len(self._open) >= self.max_open:
+                self._open.pop(next(iter(self._open)))
+            span = self._open[url] = PageSpan(url)
+        return span
+
+    def observe(self, url: str | None, stage: str, seconds: float) -> None:
+        """단계 소요 시간 기록 (url이 None이면 집계에만 반영)"""
+        with self._lock:
+            self.stages[stage].observe(seconds)
+            if url is not None:
+                span = self._span(url)
+                span.stages[stage] = span.stages.get(stage, 0.0) + seconds
+
+    @contextmanager
+    def stage(self, url: str | None, stage: str) -> Iterator[None]:
+        """블록 실행 시간을 단계 소요 시간으로 기록"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(url, stage, time.perf_counter() - start)
+
+    def add_bytes(self, url: str, size: int) -> None:
+        with self._lock:
+            self._span(url).bytes += size
+            self.counters["bytes_fetched"] += size
+
+    def incr(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self.counters[name] += value
+
+    def finish(self, url: str, status: str = "ok") -> dict | None:
+        """페이지 처리 완료 (span을 닫고 JSON 줄로 기록)
+
+        Returns:
+            닫힌 span (기록된 단계가 없으면 None)
+        """
+        with self._lock:
+            self.statuses[status] += 1
+            span = self._open.pop(url, None)
+            if span is None:
+                return None
+
+            record = span.as_dict(status, time.perf_counter() - span.started)
+            self.pages.observe(record["total_s"])
+            self._recent.append(record)
+            if self._jsonl_path is not None:
+                if self._jsonl is None:
+                    self._jsonl = open(self._jsonl_path, "a", encoding="utf-8")
+                self._jsonl.write(json.dumps(record, ensure_ascii=False) + "\n")
+                self._jsonl.flush()
+        return record
+
+    # ---- 조회 ----
+
+    def snapshot(self, slowest: int = 10) -> dict:
+        """집계 결과 (단계별 히스토그램 요약, 카운터, 최근 느린 페이지)"""
+        with self._lock:
+            stages = {stage: histogram.as_dict() for stage, histogram in self.stages.items() if histogram.count}
+            # 페이지 처리 시간 중 각 단계가 차지하는 비율 (wait/navigate/render는 fetch에 포함되므로 제외)
+            total = sum(self.stages[stage].sum for stage in _PIPELINE_STAGES)
+            for stage in _PIPELINE_STAGES:
+                if stage in stages and total:
+                    stages[stage]["share"] = round(self.stages[stage].sum / total, 3)
+            return {
+                "since": round(self.started_at, 3),
+                "pages": dict(self.statuses),
+                "page_total": self.pages.as_dict(),
+                "stages": stages,
+                "counters": dict(self.counters),
+                "slowest": sorted(self._recent, key=lambda r: r["total_s"], reverse=True)[:slowest],
+            }
+
+    def prometheus(self) -> str:
+        """Prometheus 텍스트 형식 (version 0.0.4)"""
+        lines = []
+        with self._lock:
+            histograms = [("crawl4ai_stage_seconds", {"stage": s}, h) for s, h in self.stages.items()]
+            histograms.append(("crawl4ai_page_seconds", {}, self.pages))
+            for name in ("crawl4ai_stage_seconds", "crawl4ai_page_seconds"):
+                lines.append(f"# TYPE {name} histogram")
+                for metric, labels, histogram in histograms:
+                    if metric == name:
+                        lines.extend(_histogram_lines(name, labels, histogram))
+
+            lines.append("# TYPE crawl4ai_pages_total counter")
+            lines.extend(f'crawl4ai_pages_total{{status="{status}"}} {count}' for status, count in self.statuses.items())
+            for name, value in sorted(self.counters.items()):
+                lines.append(f"# TYPE crawl4ai_{name}_total counter")
+                lines.append(f"crawl4ai_{name}_total {value}")
+        return "\n".join(lines) + "\n"
+
+
+def _histogram_lines(name: str, labels: dict, histogram: Histogram) -> list[str]:
+    def label_text(extra: dict | None = None) -> str:
+        items = {**labels, **(extra or {})}
+        if not items:
+            return ""
+        return "{" + ",".join(f'{key}="{value}"' for key, value in items.items()) + "}"
+
+    lines = []
+    cumulative = 0
+    for bound, count in zip(BUCKETS, histogram.counts):
+        cumulative += count
+        lines.append(f"{name}_bucket{label_text({'le': bound})} {cumulative}")
+    lines.append(f"{name}_bucket{label_text({'le': '+Inf'})} {histogram.count}")
+    lines.append(f"{name}_sum{label_text()} {histogram.sum:.6f}")
+    lines.append(f"{name}_count{label_text()} {histogram.count}")
+    return lines
+
+
+_metrics = CrawlMetrics()
+
+
+def get_metrics() -> CrawlMetrics:
+    """프로세스 전역 수집기"""
+    return _metrics
+
+
+def serve_metrics(port: int, host: str = "127.0.0.1", metrics: CrawlMetrics | None = None) -> ThreadingHTTPServer:
+    """``/metrics``에서 Prometheus 텍스트 형식을 제공하는 HTTP 서버를 백그라운드 스레드로 실행
+
+    Returns:
+        실행 중인 서버 (종료 시 ``shutdown()`` 호출)
+    """
+    metrics = metrics or _metrics
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = metrics.prometheus().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    return server
@@ -0,0 +1,240 @@
+"""Persistent browser pool shared across crawl calls."""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, AsyncIterator
+
+from .shared import BROWSERS
+
+if TYPE_CHECKING:
+    from crawl4ai import AsyncWebCrawler, BrowserConfig
+
+    from .shared import SharedState
+
+
+class _PooledCrawler:
+    """풀에서 관리되는 크롤러 인스턴스와 사용 이력"""
+
+    __slots__ = ("crawler", "created_at", "last_used", "uses", "lease")
+
+    def __init__(self, crawler: "AsyncWebCrawler", lease: int | None = None):
+        self.crawler = crawler
+        # 공유 상태의 브라우저 리스 (브라우저를 닫을 때 반납)
+        self.lease = lease
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+        self.uses = 0
+
+
+class _PoolSlot:
+    """BrowserConfig 프리셋과 가져오기 모드 하나에 대응하는 풀 슬롯"""
+
+    def __init__(self, browser_config: "BrowserConfig", size: int, mode: str = "browser"):
+        self.browser_config = browser_config
+        self.mode = mode
+        self.semaphore = asyncio.Semaphore(size)
+        self.idle: list[_PooledCrawler] = []
+        self.in_use = 0
+        self.launched = 0
+
+
+class BrowserPool:
+    """BrowserConfig 프리셋별로 브라우저를 재사용하는 풀
+
+    첫 요청 시 브라우저를 지연 실행하고, 이후 호출에서는 이미 떠 있는
+    AsyncWebCrawler를 빌려준다. crawl4ai의 BrowserManager가 설정별 컨텍스트를
+    캐시하므로 크롤러를 재사용하면 브라우저 컨텍스트도 함께 재사용된다.
+
+    - 프리셋(FAST_CONFIG, STEALTH_CONFIG 등) 객체와 가져오기 모드 단위로 슬롯을 분리
+    - 슬롯마다 최대 ``size``개의 브라우저를 동시에 유지
+    - 반환 시 연결이 끊긴 브라우저, ``max_uses``회 이상 사용된 브라우저는 폐기
+    - ``idle_timeout``초 이상 쉬고 있는 브라우저는 백그라운드에서 정리
+    - ``shared``가 주어지면 브라우저를 띄울 때마다 전체 브라우저 리스를 잡고, 다른 프로세스가
+      리스를 기다리는 동안에는 유휴 브라우저를 바로 닫아 자리를 내줌
+
+    Example:
+        pool = BrowserPool(size=2)
+        async with pool.acquire(FAST_CONFIG) as crawler:
+            result = await crawler.arun(url, config=DOCS_CRAWL_CONFIG)
+        await pool.close()
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        idle_timeout: float = 300.0,
+        max_uses: int = 200,
+        shared: "SharedState | None" = None,
+    ):
+        """
+        Args:
+            size: 프리셋별 최대 브라우저 수
+            idle_timeout: 유휴 브라우저를 종료하기까지의 시간(초)
+            max_uses: 브라우저를 재시작하기 전까지 허용할 최대 사용 횟수
+            shared: 여러 프로세스가 공유하는 브라우저 수 제한 (None이면 이 풀 안에서만 제한)
+        """
+        if size < 1:
+            raise ValueError("size must be >= 1")
+
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self.max_uses = max_uses
+        self.shared = shared
+        self._slots: dict[tuple[int, str], _PoolSlot] = {}
+        self._reaper: asyncio.Task | None = None
+        self._closed = False
+
+    def _get_slot(self, browser_config: "BrowserConfig", mode: str = "browser") -> _PoolSlot:
+        key = (id(browser_config), mode)
+        slot = self._slots.get(key)
+        if slot is None:
+            slot = _PoolSlot(browser_config, self.size, mode)
+            self._slots[key] = slot
+        return slot
+
+    @asynccontextmanager
+    async def acquire(self, browser_config: "BrowserConfig", mode: str = "browser") -> AsyncIterator["AsyncWebCrawler"]:
+        """프리셋에 해당하는 크롤러를 빌려오고 블록이 끝나면 반환
+
+        Args:
+            browser_config: 브라우저 설정 프리셋
+            mode: 가져오기 모드 ("browser", "http", "auto")
+
+        Yields:
+            시작된 AsyncWebCrawler
+        """
+        if self._closed:
+            raise RuntimeError("BrowserPool is closed")
+
+        self._ensure_reaper()
+        slot = self._get_slot(browser_config, mode)
+
+        async with slot.semaphore:
+            entry = await self._checkout(slot)
+            slot.in_use += 1
+            try:
+                yield entry.crawler
+            finally:
+                slot.in_use -= 1
+                await self._checkin(slot, entry)
+
+    async def _checkout(self, slot: _PoolSlot) -> _PooledCrawler:
+        """유휴 크롤러 중 건강한 것을 꺼내고, 없으면 새로 실행"""
+        now = time.monotonic()
+        while slot.idle:
+            entry = slot.idle.pop()
+            if now - entry.last_used > self.idle_timeout or not _is_healthy(entry.crawler):
+                await self._discard(entry)
+                continue
+            return entry
+
+        # crawl4ai는 첫 브라우저를 띄울 때 import (서버 시작 시 풀 생성 비용 최소화)
+        from .strategies.fetch import create_crawler
+
+        # http 모드는 브라우저를 띄우지 않으므로 리스가 필요 없음
+        lease = await self.shared.acquire(BROWSERS) if self.shared is not None and slot.mode != "http" else None
+        try:
+            crawler = create_crawler(slot.browser_config, slot.mode)
+            await crawler.start()
+        except BaseException:
+            if lease is not None:
+                await self.shared.release(lease)
+            raise
+        slot.launched += 1
+        return _PooledCrawler(crawler, lease)
+
+    async def _checkin(self, slot: _PoolSlot, entry: _PooledCrawler) -> None:
+        """사용이 끝난 크롤러를 풀에 돌려놓거나 폐기"""
+        entry.uses += 1
+        entry.last_used = time.monotonic()
+
+        if self._closed or entry.uses >= self.max_uses or not _is_healthy(entry.crawler):
+            await self._discard(entry)
+            return
+
+        slot.idle.append(entry)
+
+    async def _discard(self, entry: _PooledCrawler) -> None:
+        """브라우저를 닫고 공유 리스 반납"""
+        await _close_quietly(entry.crawler)
+        if entry.lease is not None:
+            await self.shared.release(entry.lease)
+            entry.lease = None
+
+    def _ensure_reaper(self) -> None:
+        if self._reaper is None or self._reaper.done():
+            self._reaper = asyncio.create_task(self._reap_idle())
+
+    async def _reap_idle(self) -> None:
+        """유휴 시간이 초과된 브라우저를 주기적으로 종료
+
+        공유 상태가 있으면 1초마다 확인하여 다른 프로세스가 브라우저 리스를 기다리는 동안에는
+        유휴 브라우저를 모두 닫는다.
+        """
+        interval = max(self.idle_timeout / 2, 1.0)
+        if self.shared is not None:
+            interval = 1.0
+        while not self._closed:
+            await asyncio.sleep(interval)
+            now = time.monotonic()
+            pressure = self.shared is not None and self.shared.waiting(BROWSERS)
+            for slot in self._slots.values():
+                expired = [
+                    e for e in slot.idle
+                    if (pressure and e.lease is not None) or now - e.last_used > self.idle_timeout
+                ]
+                for entry in expired:
+                    slot.idle.remove(entry)
+                    await self._discard(entry)
+
+    def stats(self) -> list[dict]:
+        """슬롯별 브라우저 상태 요약"""
+        return [
+            {
+                "browser_type": slot.browser_config.browser_type,
+                "stealth": bool(getattr(slot.browser_config, "enable_stealth", False)),
+                "mode": slot.mode,
+                "idle": len(slot.idle),
+                "in_use": slot.in_use,
+                "launched": slot.launched,
+            }
+            for slot in self._slots.values()
+        ]
+
+    async def close(self) -> None:
+        """모든 유휴 브라우저 종료. 사용 중인 브라우저는 반환 시점에 종료된다."""
+        self._closed = True
+
+        if self._reaper is not None:
+            self._reaper.cancel()
+            try:
+                await self._reaper
+            except asyncio.CancelledError:
+                pass
+            self._reaper = None
+
+        for slot in self._slots.values():
+            while slot.idle:
+                await self._discard(slot.idle.pop())
+
+
+def _is_healthy(crawler: "AsyncWebCrawler") -> bool:
+    """크롤러가 시작된 상태이고 브라우저 연결이 살아있는지 확인"""
+    if not crawler.ready:
+        return False
+
+    browser_manager = getattr(crawler.crawler_strategy, "browser_manager", None)
+    browser = getattr(browser_manager, "browser", None)
+    if browser is not None and not browser.is_connected():
+        return False
+
+    return True
+
+
+async def _close_quietly(crawler: "AsyncWebCrawler") -> None:
+    """이미 죽은 브라우저 종료 시 발생하는 예외는 무시"""
+    try:
+        await crawler.close()
+    except Exception as e:
+        print(f"⚠️ Failed to close browser: {e}")
@@ -0,0 +1,48 @@
+"""Progress tracking for long-running crawls."""
+
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable
+
+
+@dataclass
+class CrawlProgress:
+    """크롤링 진행 상황 (완료/대기/실패 페이지 수와 처리량)"""
+
+    done: int = 0
+    failed: int = 0
+    # 발견했지만 아직 크롤링하지 않은 페이지 수 (딥 크롤에서는 추정치)
+    queued: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def processed(self) -> int:
+        return self.done + self.failed
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    @property
+    def pages_per_second(self) -> float:
+        elapsed = self.elapsed
+        return self.processed / elapsed if elapsed > 0 else 0.0
+
+    def message(self) -> str:
+        return (
+            f"{self.done} done, {self.queued} queued, {self.failed} failed "
+            f"({self.pages_per_second:.1f} pages/s)"
+        )
+
+    def as_dict(self) -> dict:
+        return {
+            "done": self.done,
+            "failed": self.failed,
+            "queued": self.queued,
+            "elapsed": round(self.elapsed, 1),
+            "pages_per_second": round(self.pages_per_second, 2),
+        }
+
+
+# 페이지 하나가 처리될 때마다 호출되는 콜백: (결과 레코드 또는 실패 시 None, 진행 상황)
+ProgressCallback = Callable[[dict | None, CrawlProgress], Awaitable[None]]
@@ -0,0 +1,214 @@
+"""Compact per-page crawl results backed by an on-disk log."""
+
+import json
+import os
+from array import array
+from collections import Counter
+from collections.abc import Iterator, Sequence
+from itertools import islice
+from pathlib import Path
+
+RESULTS_FILENAME = ".crawl_results.jsonl"
+
+
+class PageRecord:
+    """크롤링된 페이지 하나의 결과 (url, depth, file, status, score, duplicate_of)
+
+    로그 없이 메모리에만 보관할 때 쓰므로 dict 대신 ``__slots__``로 필요한 필드만 둔다.
+    """
+
+    __slots__ = ("url", "depth", "file", "status", "score", "duplicate_of")
+
+    def __init__(
+        self,
+        url: str,
+        depth: int | None,
+        file: str | None,
+        status: str | None = None,
+        score: float | None = None,
+        duplicate_of: str | None = None,
+    ):
+        self.url = url
+        self.depth = depth
+        self.file = file
+        self.status = status
+        self.score = score
+        self.duplicate_of = duplicate_of
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "PageRecord":
+        return cls(
+            data["url"],
+            data.get("depth"),
+            data.get("file"),
+            data.get("status"),
+            data.get("score"),
+            data.get("duplicate_of"),
+        )
+
+    def as_dict(self) -> dict:
+        record = {"url": self.url, "depth": self.depth, "file": self.file}
+        if self.status is not None:
+            record["status"] = self.status
+        if self.score is not None:
+            record["score"] = self.score
+        if self.duplicate_of is not None:
+            record["duplicate_of"] = self.duplicate_of
+        return record
+
+
+class CrawlResults(Sequence):
+    """크롤링 결과 목록
+
+    ``log_path``가 있으면 결과를 JSON 한 줄씩 파일에 쓰고 메모리에는 각 줄의 위치(8바이트)와
+    status별 개수만 남긴다. 항목은 꺼낼 때 파일에서 읽으므로 페이지 수가 늘어도 메모리 사용량이
+    거의 늘지 않는다. ``log_path``가 없으면 ``PageRecord``로 메모리에 보관한다.
+    어느 쪽이든 항목은 기존과 같은 dict로 돌려주므로 ``list[dict]``처럼 사용할 수 있다.
+
+    Example:
+        results = CrawlResults(output_path / RESULTS_FILENAME)
+        results.append({"url": url, "depth": 0, "file": "index.md"})
+        results[0]  # {"url": ..., "depth": 0, "file": "index.md"}
+        results.close()
+    """
+
+    def __init__(self, log_path: str | Path | None = None):
+        """
+        Args:
+            log_path: 결과를 기록할 JSON Lines 파일 (있으면 새로 씀, None이면 메모리에 보관)
+        """
+        self.log_path = Path(log_path) if log_path else None
+        self._counts: Counter[str] = Counter()
+        self._records: list[PageRecord] = []
+        self._offsets = array("q")
+        # 점수순 정렬용 (점수가 없으면 -inf)
+        self._scores = array("d")
+        self._size = 0
+        self._log = open(self.log_path, "wb") if self.log_path else None
+
+    @classmethod
+    def load(cls, log_path: str | Path) -> "CrawlResults":
+        """다른 프로세스가 쓰고 있는 결과 로그를 읽기 전용으로 열기 (지금까지 기록된 줄까지)"""
+        results = cls()
+        results.log_path = Path(log_path)
+        try:
+            f = open(results.log_path, "rb")
+        except FileNotFoundError:
+            return results
+        with f:
+            for line in f:
+                # 아직 다 쓰이지 않은 마지막 줄은 제외
+                if not line.endswith(b"\n"):
+                    break
+                record = json.loads(line)
+                results._counts[record.get("status") or "ok"] += 1
+                results._offsets.append(results._size)
+                results._scores.append(record["score"] if record.get("score") is not None else float("-inf"))
+                results._size += len(line)
+        return results
+
+    def append(self, record: dict | PageRecord) -> None:
+        if isinstance(record, dict):
+            record = PageRecord.from_dict(record)
+        self._counts[record.status or "ok"] += 1
+        if self.log_path is None:
+            self._records.append(record)
+            return
+
+        line = (json.dumps(record.as_dict(), ensure_ascii=False) + "\n").encode("utf-8")
+        self._log.write(line)
+        self._offsets.append(self._size)
+        self._scores.append(record.score if record.score is not None else float("-inf"))
+        self._size += len(line)
+
+    def __len__(self) -> int:
+        return len(self._offsets) if self.log_path is not None else len(self._records)
+
+    def __getitem__(self, index):
+        if self.log_path is None:
+            if isinstance(index, slice):
+                return [record.as_dict() for record in self._records[index]]
+            return self._records[index].as_dict()
+
+        if isinstance(index, slice):
+            return self._read(self._offsets[index])
+        return self._read([self._offsets[index]])[0]
+
+    def __iter__(self) -> Iterator[dict]:
+        if self.log_path is None:
+            return (record.as_dict() for record in self._records)
+        self.flush()
+        return islice(_iter_log(self.log_path), len(self))
+
+    def _read(self, offsets) -> list[dict]:
+        self.flush()
+        records = []
+        with open(self.log_path, "rb") as f:
+            for offset in offsets:
+                f.seek(offset)
+                records.append(json.loads(f.readline()))
+        return records
+
+    def sort_by_score(self) -> None:
+        """점수가 높은 순으로 정렬 (같은 점수는 추가된 순서 유지, 점수 없는 항목은 맨 뒤)
+
+        로그가 있으면 정렬된 순서로 로그 파일을 다시 쓴다.
+        """
+        if self.log_path is None:
+            self._records.sort(key=lambda record: -record.score if record.score is not None else float("inf"))
+            return
+
+        order = sorted(range(len(self._offsets)), key=lambda i: -self._scores[i])
+        self.flush()
+        tmp_path = self.log_path.with_name(f"{self.log_path.name}.{os.getpid()}.tmp")
+        offsets, scores, size = array("q"), array("d"), 0
+        with open(self.log_path, "rb") as src, open(tmp_path, "wb") as dst:
+            for i in order:
+                src.seek(self._offsets[i])
+                line = src.readline()
+                dst.write(line)
+                offsets.append(size)
+                scores.append(self._scores[i])
+                size += len(line)
+
+        reopen = self._log is not None
+        self.close()
+        os.replace(tmp_path, self.log_path)
+        self._offsets, self._scores, self._size = offsets, scores, size
+        if reopen:
+            self._log = open(self.log_path, "ab")
+
+    def counts(self) -> Counter[str]:
+        """status별 페이지 수 (status가 없으면 "ok")"""
+        return Counter(self._counts)
+
+    def flush(self) -> None:
+        if self._log is not None:
+            self._log.flush()
+
+    def close(self) -> None:
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+
+def read_results(output_path: str | Path, offset: int = 0, limit: int | None = None) -> Iterator[dict]:
+    """출력 디렉토리의 결과 로그를 한 줄씩 읽기
+
+    Args:
+        output_path: 크롤링 출력 디렉토리
+        offset: 건너뛸 결과 수
+        limit: 최대 결과 수 (None이면 끝까지)
+    """
+    stop = None if limit is None else offset + limit
+    return islice(_iter_log(Path(output_path) / RESULTS_FILENAME), offset, stop)
+
+
+def _iter_log(path: Path) -> Iterator[dict]:
+    try:
+        f = open(path, encoding="utf-8")
+    except FileNotFoundError:
+        return
+    with f:
+        for line in f:
+            yield json.loads(line)
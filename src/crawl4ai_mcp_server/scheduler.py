@@ -0,0 +1,337 @@
+"""Per-host politeness scheduling for page fetches."""
+
+import asyncio
+import random
+import time
+from contextlib import nullcontext
+from dataclasses import dataclass
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Awaitable, Callable, TypeVar
+from urllib.parse import urlsplit
+
+import httpx
+
+from .metrics import get_metrics
+from .utils.robots import fetch_crawl_delay
+
+if TYPE_CHECKING:
+    from .shared import SharedState
+
+T = TypeVar("T")
+
+# 서버 과부하/차단으로 보고 다시 시도할 HTTP 상태
+RETRY_STATUSES = (429, 502, 503, 504)
+# 다시 시도할 예외 (연결 실패, 타임아웃)
+RETRY_EXCEPTIONS = (httpx.TransportError, TimeoutError, ConnectionError)
+
+
+@dataclass(frozen=True)
+class PolitenessPolicy:
+    """호스트별 요청 속도, 동시성, 재시도 정책
+
+    Attributes:
+        rate: 호스트별 초당 최대 요청 수 (token bucket 충전 속도, 0이면 제한 없음)
+        burst: 쉬고 있던 호스트에 연달아 보낼 수 있는 최대 요청 수 (token bucket 크기)
+        initial_concurrency: 호스트별 시작 동시 요청 수
+        max_concurrency: 호스트별 최대 동시 요청 수
+        latency_factor: 응답 시간이 기준 응답 시간의 몇 배를 넘으면 동시성을 줄일지
+        max_retries: 429/5xx 응답이나 연결 오류 시 최대 재시도 횟수
+        backoff_base: 재시도 대기 시간의 기준(초). 시도마다 두 배로 늘리고 0부터 그 값 사이에서 무작위로 기다림
+        backoff_max: 재시도 대기 시간 상한(초)
+        max_retry_after: 따를 Retry-After의 상한(초)
+        respect_robots: robots.txt의 Crawl-delay 적용 여부
+        user_agent: robots.txt에서 Crawl-delay를 찾을 User-agent 이름
+    """
+
+    rate: float = 10.0
+    burst: int = 10
+    initial_concurrency: int = 2
+    max_concurrency: int = 8
+    latency_factor: float = 3.0
+    max_retries: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    max_retry_after: float = 120.0
+    respect_robots: bool = True
+    user_agent: str = "crawl4ai"
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Retry-After 헤더(초 또는 HTTP-date)를 기다릴 시간(초)으로 변환"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max(0.0, date.timestamp() - time.time())
+
+
+def _retry_after(response) -> float | None:
+    headers = getattr(response, "response_headers", None) or {}
+    for key, value in headers.items():
+        if key.lower() == "retry-after":
+            return parse_retry_after(value)
+    return None
+
+
+class _HostState:
+    """호스트 하나의 token bucket, 동시성 창, 응답 시간 통계"""
+
+    __slots__ = (
+        "origin", "rate", "burst", "tokens", "refilled_at", "window", "max_window", "in_flight",
+        "blocked_until", "latency", "baseline", "last_decrease", "crawl_delay", "robots_checked",
+        "robots_lock", "changed", "requests", "errors",
+    )
+
+    def __init__(self, origin: str, policy: PolitenessPolicy):
+        self.origin = origin
+        self.rate = policy.rate
+        self.burst = max(1, policy.burst)
+        self.tokens = float(self.burst)
+        self.refilled_at = time.monotonic()
+        self.window = float(max(1, min(policy.initial_concurrency, policy.max_concurrency)))
+        self.max_window = max(1, policy.max_concurrency)
+        self.in_flight = 0
+        self.blocked_until = 0.0
+        # 응답 시간 지수 이동 평균과 그 최솟값(기준)
+        self.latency: float | None = None
+        self.baseline: float | None = None
+        self.last_decrease = 0.0
+        self.crawl_delay: float | None = None
+        self.robots_checked = False
+        self.robots_lock = asyncio.Lock()
+        # 요청이 끝나거나 상태가 바뀌면 set되어 대기 중인 요청을 깨움
+        self.changed = asyncio.Event()
+        self.requests = 0
+        self.errors = 0
+
+    def delay(self, now: float, tokens: bool = True) -> float | None:
+        """지금 보낼 수 있으면 0, 아니면 기다릴 시간 (None이면 진행 중인 요청이 끝날 때까지)
+
+        ``tokens``가 False면 token bucket은 확인하지 않음 (공유 상태의 bucket을 쓸 때)
+        """
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        if self.in_flight >= int(self.window):
+            return None
+        if self.rate <= 0 or not tokens:
+            return 0.0
+        self.tokens = min(self.burst, self.tokens + (now - self.refilled_at) * self.rate)
+        self.refilled_at = now
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def notify(self) -> None:
+        self.changed.set()
+        self.changed = asyncio.Event()
+
+
+class HostScheduler:
+    """크롤러와 호스트 사이에서 요청 시점을 정하는 politeness 스케줄러
+
+    - 호스트별 token bucket으로 초당 요청 수 제한 (robots.txt Crawl-delay가 있으면 그 간격으로)
+    - 호스트별 동시 요청 수를 AIMD로 조절: 응답이 정상이면 창을 조금씩 늘리고,
+      429/5xx, 연결 오류, 응답 시간 급증 시 절반으로 줄임
+    - Retry-After를 받으면 해당 호스트의 모든 요청을 그 시간까지 멈춤
+    - 429/5xx, 연결 오류는 jitter를 넣은 지수 백오프로 재시도
+
+    호스트 상태는 스케줄러에 남으므로 여러 크롤에 같은 스케줄러를 쓰면 학습한 동시성과
+    차단 시간이 이어진다. ``shared``가 주어지면 token bucket과 Retry-After 차단은 다른 프로세스와
+    공유하고, 요청마다 전체 동시 페이지 리스를 잡는다 (동시성 창은 프로세스별로 유지).
+
+    Example:
+        scheduler = HostScheduler(PolitenessPolicy(rate=5))
+        with fetch_context(scheduler=scheduler):
+            result = await crawler.arun(url, config=config)
+    """
+
+    def __init__(self, policy: PolitenessPolicy | None = None, shared: "SharedState | None" = None):
+        """
+        Args:
+            policy: 속도/동시성/재시도 정책 (None이면 기본값)
+            shared: 여러 프로세스가 공유하는 제한과 호스트 상태 (None이면 이 프로세스 안에서만 적용)
+        """
+        self.policy = policy or PolitenessPolicy()
+        self.shared = shared
+        self._hosts: dict[str, _HostState] = {}
+
+    def _host(self, url: str) -> _HostState:
+        parts = urlsplit(url)
+        origin = f"{parts.scheme}://{parts.netloc.lower()}"
+        host = self._hosts.get(origin)
+        if host is None:
+            host = self._hosts[origin] = _HostState(origin, self.policy)
+        return host
+
+    async def _check_robots(self, host: _HostState) -> None:
+        """호스트의 첫 요청 전에 robots.txt의 Crawl-delay 적용"""
+        if host.robots_checked or not self.policy.respect_robots:
+            return
+        async with host.robots_lock:
+            if host.robots_checked:
+                return
+            delay = await fetch_crawl_delay(host.origin, self.policy.user_agent)
+            host.robots_checked = True
+            if delay:
+                host.crawl_delay = delay
+                host.rate = min(host.rate, 1 / delay) if host.rate > 0 else 1 / delay
+                host.burst = 1
+                host.tokens = min(host.tokens, 1.0)
+                host.window = host.max_window = 1
+                get_metrics().incr("crawl_delay_hosts")
+
+    async def _acquire(self, host: _HostState) -> float:
+        """보낼 차례가 될 때까지 대기하고 기다린 시간(초) 반환"""
+        start = time.perf_counter()
+        while (delay := await self._delay(host)) != 0:
+            try:
+                await asyncio.wait_for(host.changed.wait(), delay)
+            except TimeoutError:
+                pass
+        return time.perf_counter() - start
+
+    async def _delay(self, host: _HostState) -> float | None:
+        """보낼 수 있으면 토큰을 꺼내고 동시성 창의 자리를 잡은 뒤 0, 아니면 기다릴 시간"""
+        if self.shared is None:
+            delay = host.delay(time.monotonic())
+            if delay == 0:
+                host.tokens -= 1
+                host.in_flight += 1
+            return delay
+
+        delay = host.delay(time.monotonic(), tokens=False)
+        if delay != 0:
+            return delay
+        # 공유 token bucket을 기다리는 동안 다른 요청이 같은 자리를 가져가지 않도록 먼저 잡아 둠
+        host.in_flight += 1
+        delay = None
+        try:
+            delay = await self.shared.take_token(host.origin, host.rate, host.burst)
+        finally:
+            if delay != 0:
+                host.in_flight -= 1
+                host.notify()
+        return delay
+
+    def _release(
+        self,
+        host: _HostState,
+        latency: float | None = None,
+        overloaded: bool = False,
+        retry_after: float | None = None,
+    ) -> None:
+        """요청 결과를 반영하여 동시성 창 조절 (AIMD)"""
+        now = time.monotonic()
+        host.in_flight -= 1
+        if retry_after is not None:
+            host.blocked_until = max(host.blocked_until, now + retry_after)
+
+        if overloaded:
+            host.requests += 1
+            host.errors += 1
+            self._decrease(host, now)
+        elif latency is not None:
+            host.requests += 1
+            host.latency = latency if host.latency is None else 0.8 * host.latency + 0.2 * latency
+            # 사이트가 전반적으로 느려진 경우에도 회복하도록 기준은 조금씩 올라감
+            host.baseline = host.latency if host.baseline is None else min(host.latency, host.baseline * 1.02)
+            if host.latency > self.policy.latency_factor * host.baseline:
+                self._decrease(host, now)
+            elif host.in_flight + 1 >= int(host.window):
+                # 창을 다 쓰고 있을 때만 늘림 (창 크기만큼 성공하면 1 증가)
+                host.window = min(host.max_window, host.window + 1 / host.window)
+        host.notify()
+
+    def _decrease(self, host: _HostState, now: float) -> None:
+        # 같은 혼잡으로 여러 요청이 한꺼번에 실패해도 응답 시간 한 번에 한 번만 줄임
+        if now - host.last_decrease < (host.latency or 0.0):
+            return
+        host.window = max(1.0, host.window / 2)
+        host.last_decrease = now
+        get_metrics().incr("host_backoffs")
+
+    async def fetch(self, url: str, fetch: Callable[[], Awaitable[T]]) -> T:
+        """호스트 제한을 지키며 ``fetch()`` 실행, 429/5xx와 연결 오류는 재시도
+
+        Args:
+            url: 가져올 URL (호스트 구분용)
+            fetch: 요청을 보내는 함수. ``status_code``/``response_headers`` 속성이 있는 응답을 반환
+
+        Returns:
+            마지막 시도의 응답 (재시도를 모두 써도 실패하면 실패한 응답 그대로)
+        """
+        host = self._host(url)
+        await self._check_robots(host)
+        metrics = get_metrics()
+
+        attempt = 0
+        while True:
+            waited = await self._acquire(host)
+            if waited > 0.001:
+                metrics.observe(url, "wait", waited)
+
+            start = time.perf_counter()
+            response, error = None, None
+            try:
+                # 다른 프로세스의 요청까지 포함한 동시 페이지 수 제한 (리스를 기다린 시간도 wait로 기록)
+                async with self.shared.page() if self.shared is not None else nullcontext():
+                    if (waited := time.perf_counter() - start) > 0.001:
+                        metrics.observe(url, "wait", waited)
+                    start = time.perf_counter()
+                    response = await fetch()
+            except RETRY_EXCEPTIONS as e:
+                error = e
+            except asyncio.CancelledError:
+                self._release(host)
+                raise
+            except Exception:
+                self._release(host, overloaded=True)
+                raise
+
+            status = getattr(response, "status_code", None)
+            retryable = error is not None or status in RETRY_STATUSES
+            retry_after = _retry_after(response) if status in (429, 503) else None
+            if retry_after is not None:
+                retry_after = min(retry_after, self.policy.max_retry_after)
+            self._release(host, time.perf_counter() - start, overloaded=retryable, retry_after=retry_after)
+            if retry_after is not None and self.shared is not None:
+                await self.shared.block_host(host.origin, retry_after)
+
+            if not retryable or attempt >= self.policy.max_retries:
+                if error is not None:
+                    raise error
+                return response
+
+            attempt += 1
+            metrics.incr("retries")
+            if retry_after is None:
+                # full jitter: 같은 시점에 실패한 요청들이 한꺼번에 다시 몰리지 않도록 분산
+                backoff = min(self.policy.backoff_max, self.policy.backoff_base * 2**attempt)
+                await asyncio.sleep(random.uniform(0, backoff))
+            # Retry-After는 호스트 전체를 막으므로 _acquire에서 그 시간까지 기다림
+
+    def stats(self) -> list[dict]:
+        """호스트별 현재 상태 (동시성 창, 속도, 응답 시간, 오류 수)"""
+        now = time.monotonic()
+        return [
+            {
+                "host": host.origin,
+                "window": round(host.window, 2),
+                "in_flight": host.in_flight,
+                "rate": round(host.rate, 3),
+                "latency_s": round(host.latency, 3) if host.latency is not None else None,
+                "requests": host.requests,
+                "errors": host.errors,
+                "crawl_delay": host.crawl_delay,
+                "blocked_for_s": round(max(0.0, host.blocked_until - now), 1),
+            }
+            for host in self._hosts.values()
+        ]
@@ -0,0 +1,203 @@
+"""Full-text search index over crawled pages (SQLite FTS5, BM25 ranking)."""
+
+import re
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+from .chunking import split_chunks
+from .manifest import content_hash
+from .utils.url import normalize_url
+
+SEARCH_INDEX_FILENAME = ".search_index.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    url TEXT NOT NULL,
+    file TEXT NOT NULL,
+    hash TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS chunks (
+    id INTEGER PRIMARY KEY,
+    page_id INTEGER NOT NULL,
+    heading TEXT NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS chunks_page ON chunks (page_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS chunks_fts USING fts5(
+    heading, text, content='chunks', content_rowid='id', tokenize='porter unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS chunks_insert AFTER INSERT ON chunks BEGIN
+    INSERT INTO chunks_fts (rowid, heading, text) VALUES (new.id, new.heading, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS chunks_delete AFTER DELETE ON chunks BEGIN
+    INSERT INTO chunks_fts (chunks_fts, rowid, heading, text) VALUES ('delete', old.id, old.heading, old.text);
+END;
+"""
+# 제목 열이 본문보다 BM25 점수에 더 크게 반영되도록 하는 가중치
+_HEADING_WEIGHT = 4.0
+_TERM_RE = re.compile(r"\w+")
+
+
+@dataclass(slots=True)
+class SearchHit:
+    """검색 결과 한 건 (BM25 점수는 클수록 관련도가 높음)"""
+
+    url: str
+    file: str
+    heading: str
+    snippet: str
+    score: float
+
+
+def _match_query(query: str) -> str | None:
+    """자유 입력을 FTS5 MATCH 식으로 변환 (단어마다 인용하여 OR로 연결, 단어가 없으면 None)
+
+    FTS5 문법 문자(``"``, ``*``, ``-``, ``:`` 등)가 그대로 들어가 오류가 나지 않도록 단어만 뽑는다.
+    BM25는 더 많은 단어가 맞는 조각에 높은 점수를 주므로 OR로도 모든 단어가 맞는 조각이 먼저 온다.
+    """
+    terms = dict.fromkeys(term.lower() for term in _TERM_RE.findall(query))
+    if not terms:
+        return None
+    return " OR ".join(f'"{term}"' for term in terms)
+
+
+class SearchIndex:
+    """출력 디렉토리의 정리된 마크다운을 제목 단위 조각으로 색인하는 SQLite FTS5 인덱스
+
+    ``{output_dir}/.search_index.sqlite``에 페이지(URL, 파일, 내용 해시)와 조각을 기록한다.
+    다시 크롤링할 때 내용 해시가 같은 페이지는 건너뛰고, 바뀐 페이지는 그 페이지의 조각만
+    교체하므로 전체를 다시 만들지 않는다. writer 스레드에서 함께 쓰므로 기록은 잠금으로 보호하고
+    ``commit_every`` 페이지마다 커밋한다. WAL 모드라 크롤 중에도 다른 연결에서 검색할 수 있다.
+
+    Example:
+        with SearchIndex(output_path) as index:
+            index.add(url, file_path, markdown)
+        hits = query_index(output_path, "deep crawl strategy", k=5)
+    """
+
+    def __init__(self, output_path: Path, commit_every: int = 100):
+        """
+        Args:
+            output_path: 출력 디렉토리
+            commit_every: 몇 페이지마다 커밋할지
+        """
+        self.path = Path(output_path) / SEARCH_INDEX_FILENAME
+        self.commit_every = max(1, commit_every)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        self._changes = 0
+
+    def add(self, url: str, file: Path | str, markdown: str) -> bool:
+        """페이지 색인 (내용과 파일이 그대로면 건너뛰고 False 반환)"""
+        key = normalize_url(url)
+        digest = content_hash(markdown)
+        with self._lock:
+            row = self._conn.execute("SELECT id, file, hash FROM pages WHERE key = ?", (key,)).fetchone()
+        if row is not None and row[1] == str(file) and row[2] == digest:
+            return False
+
+        # 조각 나누기는 잠금 밖에서 (다른 writer 스레드와 겹쳐서 처리)
+        chunks = [(chunk.heading, chunk.text) for chunk in split_chunks(markdown)]
+        with self._lock:
+            if row is not None:
+                self._conn.execute("DELETE FROM chunks WHERE page_id = ?", (row[0],))
+            page_id = self._conn.execute(
+                "INSERT INTO pages (key, url, file, hash) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET url = excluded.url, file = excluded.file, hash = excluded.hash "
+                "RETURNING id",
+                (key, url, str(file), digest),
+            ).fetchone()[0]
+            self._conn.executemany(
+                "INSERT INTO chunks (page_id, heading, text) VALUES (?, ?, ?)",
+                [(page_id, heading, text) for heading, text in chunks],
+            )
+            self._changed()
+        return True
+
+    def remove(self, url: str) -> None:
+        """페이지와 그 조각을 색인에서 삭제 (삭제된 페이지, 유사 중복으로 바뀐 페이지)"""
+        with self._lock:
+            row = self._conn.execute("SELECT id FROM pages WHERE key = ?", (normalize_url(url),)).fetchone()
+            if row is None:
+                return
+            self._conn.execute("DELETE FROM chunks WHERE page_id = ?", (row[0],))
+            self._conn.execute("DELETE FROM pages WHERE id = ?", (row[0],))
+            self._changed()
+
+    def _changed(self) -> None:
+        self._changes += 1
+        if self._changes >= self.commit_every:
+            self._conn.commit()
+            self._changes = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.commit()
+            self._conn.close()
+
+    def __enter__(self) -> "SearchIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def query_index(output_path: Path | str, query: str, k: int = 5, per_page: int = 2) -> list[SearchHit]:
+    """출력 디렉토리의 검색 인덱스에서 query와 관련도가 높은 조각 검색
+
+    Args:
+        output_path: crawl_documentation의 출력 디렉토리
+        query: 검색어 (단어 단위로 비교, 영어는 어간 기준)
+        k: 반환할 최대 결과 수
+        per_page: 한 페이지에서 반환할 최대 조각 수
+
+    Returns:
+        BM25 점수가 높은 순서의 결과 (맞는 조각이 없으면 빈 리스트)
+
+    Raises:
+        FileNotFoundError: 출력 디렉토리에 검색 인덱스가 없을 때
+    """
+    path = Path(output_path) / SEARCH_INDEX_FILENAME
+    if not path.exists():
+        raise FileNotFoundError(f"No search index in {output_path} (crawl it with crawl_docs first)")
+    match = _match_query(query)
+    if match is None or k < 1:
+        return []
+
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        rows = conn.execute(
+            "SELECT pages.url, pages.file, chunks.heading, "
+            "snippet(chunks_fts, 1, '**', '**', '…', 32), "
+            f"bm25(chunks_fts, {_HEADING_WEIGHT}, 1.0) AS rank "
+            "FROM chunks_fts "
+            "JOIN chunks ON chunks.id = chunks_fts.rowid "
+            "JOIN pages ON pages.id = chunks.page_id "
+            "WHERE chunks_fts MATCH ? ORDER BY rank LIMIT ?",
+            (match, k * max(per_page, 1) * 2),
+        ).fetchall()
+    finally:
+        conn.close()
+
+    hits, per_url = [], {}
+    for url, file, heading, snippet, rank in rows:
+        if per_url.get(url, 0) >= per_page:
+            continue
+        per_url[url] = per_url.get(url, 0) + 1
+        # SQLite의 bm25()는 관련도가 높을수록 작은 음수, 스니펫은 한 줄로
+        snippet = " ".join(snippet.split())
+        hits.append(SearchHit(url=url, file=file, heading=heading, snippet=snippet, score=round(-rank, 3)))
+        if len(hits) == k:
+            break
+    return hits
@@ -6,12 +6,34 @@ Run with:
     uv run mcp run mcp_server.py
 """
 
+import argparse
+import asyncio
+import os
 import sys
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
+from typing import AsyncIterator
 
-from .core import crawl_documentation, crawl_single_page
-from .configs.browser import FAST_CONFIG, STEALTH_CONFIG
-from mcp.server.fastmcp import FastMCP
+from .cache import CACHE_MODES, DEFAULT_CACHE_DIR, PageCache
+from .chunking import Chunk, ChunkCache, estimate_tokens, split_chunks
+from .corpus import OUTPUT_FORMATS, read_page
+from .dedup import DEDUP_MODES
+from .hotcache import HotPageCache
+from .jobs import JobManager
+from .metrics import get_metrics, serve_metrics
+from .pool import BrowserPool
+from .progress import CrawlProgress, ProgressCallback
+from .results import CrawlResults, read_results
+from .scheduler import HostScheduler, PolitenessPolicy
+from .search import query_index
+from .shared import SharedState
+from .strategies.content import load_profiles
+from .strategies.scrape import ScrapeProcessPool
+from .utils.domain import extract_domain, extract_output_dir_name
+from mcp.server.fastmcp import Context, FastMCP
 
 # Redirect print to stderr (STDIO transport uses stdout for JSON-RPC)
 _original_print = print
@@ -30,24 +52,284 @@ builtins.print = _stderr_print
 
 def _get_browser_config(stealth: bool):
     """stealth 옵션에 따라 BrowserConfig 반환"""
-    return STEALTH_CONFIG if stealth else FAST_CONFIG
+    from .configs import browser
 
+    # 쓰는 프리셋만 만들도록 속성으로 접근 (STEALTH_CONFIG는 User-Agent 생성 비용이 있음)
+    return browser.STEALTH_CONFIG if stealth else browser.FAST_CONFIG
+
+
+def _import_crawler():
+    """크롤러 코어(crawl4ai, Playwright, lxml)를 import하고 기본 프리셋 생성
+
+    서버가 crawl4ai 없이 initialize/list_tools에 응답하도록 모듈 import 시점에는 부르지 않고,
+    크롤링 도구가 처음 쓸 때 불러온다.
+    """
+    from . import core
+    from .configs import browser, crawler
+
+    # 첫 요청에서 만들지 않도록 기본 프리셋을 미리 생성
+    browser.FAST_CONFIG
+    crawler.DOCS_CRAWL_CONFIG
+    return core
+
+
+async def _load_crawler():
+    """크롤러 코어 모듈 반환 (처음에는 이벤트 루프를 막지 않도록 스레드에서 import)"""
+    return await asyncio.to_thread(_import_crawler)
+
+
+async def _warm_up() -> None:
+    """서버 시작 시 백그라운드에서 크롤러 코어를 미리 불러옴
+
+    import는 스레드에서 실행되므로 그동안에도 initialize/list_tools에 응답하고, 첫 크롤링은
+    import 비용을 치르지 않는다. CRAWL4AI_WARMUP=0이면 하지 않음.
+    """
+    if os.environ.get("CRAWL4AI_WARMUP", "1") == "0":
+        return
+    start = time.perf_counter()
+    await _load_crawler()
+    print(f"✅ Crawler loaded in {time.perf_counter() - start:.2f}s")
+
+
+@dataclass
+class AppContext:
+    """서버가 실행되는 동안 모든 도구 호출이 공유하는 자원"""
+
+    pool: BrowserPool
+    cache: PageCache
+    jobs: JobManager
+    scheduler: HostScheduler
+    chunks: ChunkCache
+    hot: HotPageCache
+    scrape_pool: ScrapeProcessPool | None
+    shared: SharedState | None
+
+
+# HTTP 워커 프로세스의 자원 (모든 세션이 공유, http_app 참고)
+_http_context: AppContext | None = None
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
+    """서버가 실행되는 동안 브라우저 풀과 페이지 캐시 등을 소유
+
+    HTTP에서는 MCP lifespan이 세션마다(stateless면 요청마다) 실행되므로, 새로 만들지 않고
+    워커 프로세스가 시작할 때 연 자원을 그대로 사용한다.
+    """
+    if _http_context is not None:
+        yield _http_context
+        return
+    async with _open_app_context() as app_context:
+        yield app_context
+
+
+@asynccontextmanager
+async def _open_app_context() -> AsyncIterator[AppContext]:
+    """환경 변수 설정으로 서버 자원을 만들고 끝날 때 정리"""
+    profiles_path = os.environ.get("CRAWL4AI_CLEANING_PROFILES")
+    if profiles_path:
+        load_profiles(profiles_path)
+
+    # 다른 서버 프로세스(HTTP 워커 등)와 나눠 쓰는 전체 제한 (같은 파일을 지정한 프로세스끼리 공유)
+    shared_path = os.environ.get("CRAWL4AI_SHARED_STATE")
+    shared = None
+    if shared_path:
+        shared = SharedState(
+            shared_path,
+            max_pages=int(os.environ.get("CRAWL4AI_MAX_PAGES", "16")),
+            max_browsers=int(os.environ.get("CRAWL4AI_MAX_BROWSERS", "4")),
+            max_memory=int(os.environ.get("CRAWL4AI_MAX_MEMORY_MB", "0")) * 1024 * 1024,
+        )
+        await shared.start()
+
+    pool = BrowserPool(
+        size=int(os.environ.get("CRAWL4AI_POOL_SIZE", "2")),
+        idle_timeout=float(os.environ.get("CRAWL4AI_POOL_IDLE_TIMEOUT", "300")),
+        shared=shared,
+    )
+    cache = PageCache(
+        ttl=float(os.environ.get("CRAWL4AI_CACHE_TTL", "86400")),
+        max_bytes=int(os.environ.get("CRAWL4AI_CACHE_MAX_MB", "512")) * 1024 * 1024,
+    )
+    jobs = JobManager(shared=shared)
+    chunks = ChunkCache(
+        max_bytes=int(os.environ.get("CRAWL4AI_CHUNK_CACHE_MB", "64")) * 1024 * 1024,
+        ttl=float(os.environ.get("CRAWL4AI_CHUNK_CACHE_TTL", "3600")),
+    )
+    # 같은 페이지를 거의 동시에 요청하는 crawl_page 호출이 한 번만 가져오도록 공유
+    hot = HotPageCache(
+        max_bytes=int(os.environ.get("CRAWL4AI_HOT_CACHE_MB", "32")) * 1024 * 1024,
+        ttl=float(os.environ.get("CRAWL4AI_HOT_CACHE_TTL", "30")),
+    )
+    # 호스트별 제한은 서버 전체에서 공유하여 호출이 달라도 같은 호스트에 몰리지 않도록 함
+    scheduler = HostScheduler(
+        PolitenessPolicy(
+            rate=float(os.environ.get("CRAWL4AI_HOST_RATE", "10")),
+            max_concurrency=int(os.environ.get("CRAWL4AI_HOST_CONCURRENCY", "8")),
+            max_retries=int(os.environ.get("CRAWL4AI_MAX_RETRIES", "3")),
+        ),
+        shared=shared,
+    )
+
+    # 스크래핑/마크다운 생성용 프로세스 풀 (0이면 사용하지 않음)
+    scrape_workers = int(os.environ.get("CRAWL4AI_SCRAPE_WORKERS", "0"))
+    scrape_pool = ScrapeProcessPool(workers=scrape_workers) if scrape_workers > 0 else None
+
+    metrics = get_metrics()
+    metrics.set_jsonl_path(os.environ.get("CRAWL4AI_METRICS_JSONL"))
+    metrics_port = os.environ.get("CRAWL4AI_METRICS_PORT")
+    metrics_server = serve_metrics(int(metrics_port)) if metrics_port else None
+
+    # 첫 도구 호출 전에 crawl4ai를 불러 둠 (서버가 끝나면 기다리지 않고 취소)
+    warm_up = asyncio.create_task(_warm_up())
+    try:
+        yield AppContext(
+            pool=pool,
+            cache=cache,
+            jobs=jobs,
+            scheduler=scheduler,
+            chunks=chunks,
+            hot=hot,
+            scrape_pool=scrape_pool,
+            shared=shared,
+        )
+    finally:
+        warm_up.cancel()
+        if metrics_server is not None:
+            metrics_server.shutdown()
+        metrics.set_jsonl_path(None)
+        await jobs.close()
+        await pool.close()
+        await cache.close()
+        if scrape_pool is not None:
+            scrape_pool.close()
+        if shared is not None:
+            await shared.close()
+
+
+def _get_pool(ctx: Context) -> BrowserPool:
+    return ctx.request_context.lifespan_context.pool
+
+
+def _get_cache(ctx: Context) -> PageCache:
+    return ctx.request_context.lifespan_context.cache
+
+
+def _get_jobs(ctx: Context) -> JobManager:
+    return ctx.request_context.lifespan_context.jobs
+
+
+def _get_scheduler(ctx: Context) -> HostScheduler:
+    return ctx.request_context.lifespan_context.scheduler
+
+
+def _get_chunks(ctx: Context) -> ChunkCache:
+    return ctx.request_context.lifespan_context.chunks
+
+
+def _get_shared(ctx: Context) -> SharedState | None:
+    return ctx.request_context.lifespan_context.shared
+
+
+def _get_hot_cache(ctx: Context) -> HotPageCache:
+    return ctx.request_context.lifespan_context.hot
+
+
+def _get_scrape_pool(ctx: Context) -> ScrapeProcessPool | None:
+    return ctx.request_context.lifespan_context.scrape_pool
+
+
+def _progress_reporter(ctx: Context, interval: float = 0.5) -> ProgressCallback:
+    """크롤링 진행 상황을 MCP progress 알림으로 전달 (``interval``초에 한 번 이하)"""
+    last_sent = 0.0
+
+    async def report(record: dict | None, progress: CrawlProgress) -> None:
+        nonlocal last_sent
+        now = time.monotonic()
+        if now - last_sent < interval:
+            return
+        last_sent = now
+        await ctx.report_progress(
+            progress=progress.processed,
+            total=progress.processed + progress.queued,
+            message=progress.message(),
+        )
+
+    return report
+
+
+def _validate_cache_mode(cache: str) -> str | None:
+    """알 수 없는 캐시 모드면 오류 메시지 반환"""
+    if cache not in CACHE_MODES:
+        return f"Invalid cache mode: {cache}. Use {', '.join(repr(m) for m in CACHE_MODES)}."
+    return None
+
+
+def _validate_fetch_mode(mode: str) -> str | None:
+    """알 수 없는 가져오기 방식이면 오류 메시지 반환"""
+    from .strategies.http import FETCH_MODES
+
+    if mode not in FETCH_MODES:
+        return f"Invalid mode: {mode}. Use {', '.join(repr(m) for m in FETCH_MODES)}."
+    return None
+
+
+def _validate_output_format(output_format: str) -> str | None:
+    """알 수 없는 출력 형식이면 오류 메시지 반환"""
+    if output_format not in OUTPUT_FORMATS:
+        return f"Invalid output_format: {output_format}. Use {', '.join(repr(f) for f in OUTPUT_FORMATS)}."
+    return None
+
+
+def _validate_dedup_mode(dedup: str) -> str | None:
+    """알 수 없는 유사 중복 처리 방식이면 오류 메시지 반환"""
+    if dedup not in DEDUP_MODES:
+        return f"Invalid dedup: {dedup}. Use {', '.join(repr(m) for m in DEDUP_MODES)}."
+    return None
+
+
+# main()이 지원하는 MCP 전송 방식
+TRANSPORTS = ("stdio", "streamable-http", "sse")
 
 # Create MCP server instance
 mcp = FastMCP(
     name="crawl4ai-mcp-server",
+    lifespan=_lifespan,
     instructions="""Crawl4AI MCP Server - Web document crawling tools.
 
 Available tools:
 - crawl_page: Crawl a single page and return markdown content
+  (large pages: table of contents plus the first max_tokens, the rest via get_chunk)
+- get_chunk: Read more of a large page returned by crawl_page, by chunk id
+- crawl_pages: Crawl many pages in parallel and return their markdown content
 - crawl_docs: Recursively crawl documentation sites (Deep Crawl)
+- crawl_status / crawl_results: Follow a crawl_docs job started with background=True
+- search_docs: Full-text search over the pages crawl_docs saved, returning ranked snippets with URLs
+- crawl_stats: Per-stage timings (browser launch, fetch, scrape, clean, write) and per-host limits across crawls
 
 Use crawl_page for single page content extraction.
+Use crawl_pages instead of repeated crawl_page calls when you already know the URLs.
 Use crawl_docs for crawling entire documentation sites with link following.
+For large sites, start crawl_docs with background=True and read pages with crawl_results
+while the crawl is still running.
+After crawl_docs, use search_docs with the same output_dir to find relevant sections
+instead of reading the saved files one by one.
 
 Options:
 - stealth: Enable stealth mode (playwright-stealth) for sites with bot detection
-- strategy: Choose crawl strategy - "bfs" (breadth-first, default) or "dfs" (depth-first)""",
+- mode: "browser" (default), "http" (no browser, fastest for static docs) or "auto"
+  (HTTP first, browser only for JavaScript-rendered pages)
+- cache: "bypass" (default, always fetch), "prefer" (reuse recent pages without network),
+  or "revalidate" (reuse pages after an ETag/Last-Modified check)
+- strategy: Choose crawl strategy - "bfs" (breadth-first, default), "dfs" (depth-first)
+  or "best_first" (follow links whose URL matches keywords first, results ordered by score)
+- incremental: Re-crawl into an existing output_dir and only rewrite changed pages
+- dedup: "alias" records near-duplicate pages (versioned paths, language mirrors) as aliases
+  of the first copy instead of writing them again; "prune" also stops following their links
+- output_format: "packed" appends pages to a single compressed corpus.pack with a URL index
+  instead of one .md file per page (much faster for large crawls and easy to ship)
+- resume: Continue an interrupted crawl_docs run with the same url and output_dir
+- use_sitemap: Crawl the pages listed in the site's sitemap in parallel (much faster for large docs sites)""",
 )
 
 
@@ -56,9 +338,22 @@ async def crawl_page(
     url: str,
     output_dir: str | None = None,
     stealth: bool = False,
+    cache: str = "bypass",
+    mode: str = "browser",
+    max_tokens: int = 4000,
+    ctx: Context = None,
 ) -> str:
     """Crawl a single web page and return cleaned markdown content.
 
+    Pages larger than max_tokens are split on heading boundaries into chunks with
+    stable ids. The response then holds a table of contents (chunk id, heading,
+    estimated tokens) and the first chunks that fit in max_tokens; read the rest
+    with get_chunk(url, chunk_id) without crawling the page again.
+
+    Concurrent calls for the same URL and options share one fetch, and the result
+    is reused for a short time (CRAWL4AI_HOT_CACHE_TTL, default 30 seconds) even
+    with cache="bypass".
+
     Args:
         url: The URL to crawl
         output_dir: Optional directory to save the markdown file.
@@ -66,15 +361,163 @@ async def crawl_page(
         stealth: Enable stealth mode to bypass bot detection.
                 Uses playwright-stealth with random user-agent.
                 Slower but needed for sites that block automated crawlers.
+        cache: Page cache mode - "bypass" (default) always fetches,
+              "prefer" reuses a recently cached page without any request,
+              "revalidate" reuses the cached page if the server reports it unchanged.
+        mode: Fetch mode - "browser" (default) renders with Chromium,
+             "http" fetches HTML without a browser (much faster for static docs),
+             "auto" tries HTTP first and uses the browser only for JavaScript-rendered pages.
+        max_tokens: Approximate token budget of the response (default: 4000, about 4
+                   characters per token). 0 returns the whole page however large.
 
     Returns:
-        Cleaned markdown content of the page
+        Cleaned markdown content of the page, or its table of contents and first
+        chunks when the page exceeds max_tokens
     """
+    core = await _load_crawler()
+    if error := _validate_cache_mode(cache) or _validate_fetch_mode(mode):
+        return error
+
     browser_config = _get_browser_config(stealth)
-    markdown = await crawl_single_page(url, output_dir, browser_config=browser_config)
+    markdown = await core.crawl_single_page(
+        url,
+        output_dir,
+        browser_config=browser_config,
+        pool=_get_pool(ctx),
+        cache=_get_cache(ctx),
+        cache_mode=cache,
+        mode=mode,
+        scheduler=_get_scheduler(ctx),
+        scrape_pool=_get_scrape_pool(ctx),
+        hot_cache=_get_hot_cache(ctx),
+    )
     if not markdown:
         return f"Failed to crawl: {url}"
-    return markdown
+    if max_tokens <= 0 or estimate_tokens(markdown) <= max_tokens:
+        return markdown
+
+    chunks = split_chunks(markdown)
+    chunk_cache = _get_chunks(ctx)
+    chunk_cache.put(url, chunks)
+    if (shared := _get_shared(ctx)) is not None:
+        # 다음 get_chunk 요청은 다른 워커가 받을 수 있으므로 조각의 원본을 공유 상태에 남김
+        await shared.put_chunked_page(url, markdown, chunk_cache.ttl)
+    toc, toc_tokens = _format_toc(chunks, max_tokens // 4)
+    header = f"Page: {url} (~{sum(c.tokens for c in chunks)} tokens in {len(chunks)} chunks, "
+    body, shown = _format_chunks(url, chunks, 0, max_tokens - toc_tokens - estimate_tokens(header) - 16)
+    return f"{header}showing {shown})\n\n## Contents\n\n{toc}\n\n---\n\n{body}"
+
+
+@mcp.tool()
+async def get_chunk(url: str, chunk_id: str | None = None, max_tokens: int = 4000, ctx: Context = None) -> str:
+    """Read chunks of a large page that crawl_page returned only in part.
+
+    Returns the chunk with chunk_id and the chunks after it, in page order, until
+    max_tokens is reached. Chunks are kept on the server after crawl_page, so
+    nothing is fetched again.
+
+    Args:
+        url: The URL passed to crawl_page
+        chunk_id: Chunk id from the table of contents or a "Continue" line
+                 (default: the first chunk)
+        max_tokens: Approximate token budget of the response (default: 4000).
+                   At least one chunk is always returned.
+
+    Returns:
+        Markdown of the chunks, followed by a get_chunk call for the next chunk if any
+    """
+    chunk_cache = _get_chunks(ctx)
+    chunks = chunk_cache.get(url)
+    if chunks is None and (shared := _get_shared(ctx)) is not None:
+        # crawl_page를 다른 워커가 처리한 경우 공유 상태의 마크다운으로 같은 조각을 다시 만듦
+        markdown = await shared.get_chunked_page(url, chunk_cache.ttl)
+        if markdown is not None:
+            chunks = split_chunks(markdown)
+            chunk_cache.put(url, chunks)
+    if chunks is None:
+        return f"No chunks cached for {url}. Call crawl_page first (chunks expire after a while)."
+
+    ids = [chunk.id for chunk in chunks]
+    if chunk_id is None:
+        start = 0
+    elif chunk_id in ids:
+        start = ids.index(chunk_id)
+    else:
+        return f"Unknown chunk_id: {chunk_id}. Chunk ids of {url}: {', '.join(ids[:50])}"
+
+    body, shown = _format_chunks(url, chunks, start, max_tokens)
+    return f"Page: {url} (chunks {start + 1}-{start + shown} of {len(chunks)})\n\n{body}"
+
+
+@mcp.tool()
+async def crawl_pages(
+    urls: list[str],
+    concurrency: int = 5,
+    per_domain_limit: int = 2,
+    timeout: float = 60.0,
+    output_dir: str | None = None,
+    stealth: bool = False,
+    cache: str = "bypass",
+    mode: str = "browser",
+    ctx: Context = None,
+) -> str:
+    """Crawl many web pages in parallel and return their cleaned markdown content.
+
+    All URLs share one browser. Failed URLs are reported at the end
+    while the successfully crawled pages are still returned.
+
+    Args:
+        urls: The URLs to crawl
+        concurrency: Maximum number of pages crawled at the same time (default: 5)
+        per_domain_limit: Maximum number of concurrent pages per domain (default: 2)
+        timeout: Per-URL timeout in seconds (default: 60)
+        output_dir: Optional directory to save the markdown files.
+                   If not provided, returns markdown without saving.
+        stealth: Enable stealth mode to bypass bot detection.
+                Uses playwright-stealth with random user-agent.
+        cache: Page cache mode - "bypass" (default), "prefer" or "revalidate"
+        mode: Fetch mode - "browser" (default), "http" (no browser) or "auto"
+             (HTTP first, browser only for JavaScript-rendered pages)
+
+    Returns:
+        Markdown content of each page under a "## <url>" heading,
+        followed by the list of failed URLs
+    """
+    if not urls:
+        return "No URLs given."
+    core = await _load_crawler()
+    if error := _validate_cache_mode(cache) or _validate_fetch_mode(mode):
+        return error
+
+    browser_config = _get_browser_config(stealth)
+    results = await core.crawl_multiple_pages(
+        urls,
+        output_dir=output_dir,
+        concurrency=concurrency,
+        per_domain_limit=per_domain_limit,
+        timeout=timeout,
+        browser_config=browser_config,
+        pool=_get_pool(ctx),
+        cache=_get_cache(ctx),
+        cache_mode=cache,
+        mode=mode,
+        scheduler=_get_scheduler(ctx),
+        scrape_pool=_get_scrape_pool(ctx),
+    )
+
+    succeeded = [r for r in results if r["success"]]
+    failed = [r for r in results if not r["success"]]
+
+    sections = [f"Crawled {len(succeeded)}/{len(results)} pages"]
+    for r in succeeded:
+        saved = f"\n\nSaved to: {r['file']}" if r["file"] else ""
+        sections.append(f"## {r['url']}{saved}\n\n{r['markdown']}")
+
+    if failed:
+        failed_lines = "\n".join(f"- {r['url']}: {r['error']}" for r in failed)
+        sections.append(f"## Failed\n\n{failed_lines}")
+
+    return "\n\n".join(sections)
 
 
 @mcp.tool()
@@ -85,7 +528,21 @@ async def crawl_docs(
     max_depth: int = 2,
     url_prefix: str | None = None,
     strategy: str = "bfs",
+    keywords: list[str] | None = None,
+    score_threshold: float | None = None,
     stealth: bool = False,
+    cache: str = "bypass",
+    mode: str = "browser",
+    incremental: bool = False,
+    sitemap_lastmod: bool = False,
+    dedup: str = "off",
+    output_format: str = "markdown",
+    search_index: bool = True,
+    resume: bool = False,
+    use_sitemap: bool = False,
+    background: bool = False,
+    limit: int = 100,
+    ctx: Context = None,
 ) -> str:
     """Recursively crawl a documentation site (Deep Crawl).
 
@@ -103,49 +560,497 @@ async def crawl_docs(
         strategy: Crawl strategy - "bfs" (breadth-first, default) or "dfs" (depth-first).
                  BFS explores all links at one depth before going deeper.
                  DFS explores as deep as possible before backtracking.
+                 "best_first" fetches links whose URL matches the most keywords first
+                 and returns pages ordered by relevance score.
+        keywords: Keywords for the best_first strategy (required for it),
+                 e.g. ["authentication", "oauth"]
+        score_threshold: With best_first, do not follow links scoring below this
+                        (scores range 0-0.8). The crawl stops early once no relevant
+                        links remain. Default: follow every link in score order.
         stealth: Enable stealth mode to bypass bot detection.
                 Uses playwright-stealth with random user-agent.
+        cache: Page cache mode - "bypass" (default), "prefer" or "revalidate".
+              Cached pages skip the network and rendering; links are still followed.
+        mode: Fetch mode - "browser" (default), "http" (no browser, much faster for
+             static docs) or "auto" (HTTP first, browser only for JavaScript-rendered pages)
+        incremental: Compare against the manifest (.crawl_manifest.json) in output_dir.
+                    Unchanged pages are not rewritten, and the summary reports
+                    added, changed, unchanged and removed pages.
+        sitemap_lastmod: With incremental, skip fetching pages whose sitemap.xml
+                        lastmod is older than the previous crawl.
+        dedup: Near-duplicate handling - "off" (default), "alias" or "prune".
+              "alias" compares a SimHash fingerprint of each cleaned page and records
+              pages almost identical to an earlier one (versioned paths such as /v1/ and
+              /latest/, language mirrors) as aliases in the results and manifest instead of
+              writing them again. "prune" also does not follow links found on those pages.
+        output_format: "markdown" (default, one .md file per page) or "packed" (append every
+                      page to output_dir/corpus.pack as compressed records, with a URL index in
+                      corpus.idx). Result entries then point at corpus.pack; crawl_results with
+                      include_content reads pages from it.
+        search_index: Index saved pages by heading section for search_docs (default: True).
+                     The index lives in output_dir/.search_index.sqlite; re-crawls only
+                     re-index pages whose content changed.
+        resume: Continue an interrupted crawl from the checkpoint in output_dir
+               (.crawl_checkpoint.sqlite). Pages already processed are not fetched again.
+        use_sitemap: Discover pages from robots.txt / sitemap.xml (including sitemap
+                    indexes and .xml.gz) and crawl them in parallel without following
+                    links. max_depth, strategy and keywords are ignored. Falls back to link
+                    crawling when the site has no sitemap.
+        background: Return a job id immediately and crawl in the background.
+                   Use crawl_status to follow progress and crawl_results to read
+                   pages as soon as they are saved.
+        limit: Maximum number of pages listed in the summary (default: 100).
+              The full list is kept in output_dir/.crawl_results.jsonl.
 
     Returns:
-        Summary of crawled pages with URLs and file paths
+        Summary of crawled pages with URLs and file paths, or the job id in background mode
     """
-    if strategy not in ("bfs", "dfs"):
-        return f"Invalid strategy: {strategy}. Use 'bfs' or 'dfs'."
+    core = await _load_crawler()
+    if strategy not in core.DEEP_CRAWL_STRATEGIES:
+        return f"Invalid strategy: {strategy}. Use 'bfs', 'dfs' or 'best_first'."
+    if strategy == "best_first" and not keywords:
+        return "The best_first strategy requires keywords."
+    if keywords and strategy != "best_first":
+        return "keywords are only used with strategy='best_first'."
+    if error := (
+        _validate_cache_mode(cache)
+        or _validate_fetch_mode(mode)
+        or _validate_dedup_mode(dedup)
+        or _validate_output_format(output_format)
+    ):
+        return error
 
-    browser_config = _get_browser_config(stealth)
-    results = await crawl_documentation(
+    options = dict(
         start_url=url,
         output_dir=output_dir,
         max_pages=max_pages,
         max_depth=max_depth,
         url_prefix=url_prefix,
         strategy=strategy,
-        browser_config=browser_config,
+        keywords=keywords,
+        score_threshold=score_threshold,
+        browser_config=_get_browser_config(stealth),
+        pool=_get_pool(ctx),
+        cache=_get_cache(ctx),
+        cache_mode=cache,
+        mode=mode,
+        scheduler=_get_scheduler(ctx),
+        scrape_pool=_get_scrape_pool(ctx),
+        incremental=incremental,
+        sitemap_lastmod=sitemap_lastmod,
+        dedup=dedup,
+        output_format=output_format,
+        search_index=search_index,
+        resume=resume,
+        use_sitemap=use_sitemap,
     )
 
+    if background:
+        # 다른 서버 프로세스는 작업의 출력 디렉토리에서 결과를 읽음
+        options["output_dir"] = output_dir or extract_output_dir_name(extract_domain(url))
+        job = _get_jobs(ctx).start(
+            lambda job: core.crawl_documentation(**options, on_progress=job.on_progress),
+            url=url,
+            output_dir=options["output_dir"],
+        )
+        return (
+            f"Started crawl job {job.id} for {url}\n"
+            f'Use crawl_status(job_id="{job.id}") to follow progress and '
+            f'crawl_results(job_id="{job.id}") to read pages as they are saved.'
+        )
+
+    try:
+        results = await core.crawl_documentation(**options, on_progress=_progress_reporter(ctx))
+    except ValueError as e:
+        # output_dir의 체크포인트가 다른 크롤링의 것
+        return str(e)
+
     if not results:
         return f"No pages crawled from: {url}"
 
-    # Format results as summary
-    summary_lines = [f"Crawled {len(results)} pages:\n"]
-    for r in results:
-        summary_lines.append(f"- [{r['depth']}] {r['url']} -> {r['file']}")
-
-    # Add output directory info
-    if results:
-        output_path = Path(results[0]["file"]).parent
-        while output_path.parent != output_path and output_path.name != output_dir:
-            if output_path.parent.name == "":
-                break
-            output_path = output_path.parent
-        summary_lines.append(f"\nSaved to: {output_path}/")
+    # 모든 줄을 메모리에 두지 않고 디스크의 결과 로그에서 요약 생성
+    limit = max(limit, 1)
+    if incremental:
+        summary_lines = _format_incremental_summary(results, limit)
+    else:
+        duplicates = results.counts()["duplicate"]
+        summary_lines = [
+            f"Crawled {len(results)} pages ({duplicates} near-duplicates not saved):\n"
+            if duplicates
+            else f"Crawled {len(results)} pages:\n"
+        ]
+        summary_lines.extend(_format_page_line(r) for r in read_results(results.log_path.parent, limit=limit))
+        if len(results) > limit:
+            summary_lines.append(f"... and {len(results) - limit} more (see {results.log_path})")
 
+    summary_lines.append(f"\nSaved to: {results.log_path.parent}/")
     return "\n".join(summary_lines)
 
 
+@mcp.tool()
+async def crawl_status(job_id: str, ctx: Context = None) -> str:
+    """Check the progress of a crawl_docs job started with background=True.
+
+    Args:
+        job_id: The job id returned by crawl_docs
+
+    Returns:
+        Job status, page counts, throughput and any error
+    """
+    job = _get_jobs(ctx).get(job_id)
+    if job is None:
+        return f"Unknown job: {job_id}"
+
+    progress = job.progress
+    elapsed = (job.finished_at or time.time()) - job.created_at
+    rate = progress.processed / elapsed if elapsed > 0 else 0.0
+
+    lines = [
+        f"Job {job.id}: {job.status}",
+        f"URL: {job.params['url']}",
+        f"Pages: {progress.done} done, {progress.queued} queued, {progress.failed} failed",
+        f"Elapsed: {elapsed:.0f}s ({rate:.1f} pages/s)",
+        f"Results available: {len(job.results)}",
+    ]
+    if job.error:
+        lines.append(f"Error: {job.error}")
+    return "\n".join(lines)
+
+
+@mcp.tool()
+async def crawl_results(
+    job_id: str,
+    offset: int = 0,
+    limit: int = 20,
+    include_content: bool = False,
+    ctx: Context = None,
+) -> str:
+    """Read the pages saved so far by a background crawl_docs job.
+
+    Results are available while the job is still running, in the order the
+    pages finished.
+
+    Args:
+        job_id: The job id returned by crawl_docs
+        offset: Index of the first result to return (default: 0)
+        limit: Maximum number of results to return (default: 20)
+        include_content: Include the saved markdown of each page (default: False)
+
+    Returns:
+        One line per page (depth, URL, file), followed by the markdown when
+        include_content is set, and the offset of the next page of results
+    """
+    job = _get_jobs(ctx).get(job_id)
+    if job is None:
+        return f"Unknown job: {job_id}"
+
+    offset = max(offset, 0)
+    page = job.results[offset : offset + max(limit, 1)]
+    if not page:
+        return f"Job {job.id} ({job.status}): no results after offset {offset} (total {len(job.results)})"
+
+    lines = [f"Job {job.id} ({job.status}): results {offset + 1}-{offset + len(page)} of {len(job.results)}\n"]
+    lines.extend(_format_page_line(r) for r in page)
+
+    if include_content:
+        for r in page:
+            if r.get("status") == "removed":
+                continue
+            try:
+                content = read_page(r["file"], r["url"])
+            except OSError as e:
+                content = f"(could not read {r['file']}: {e})"
+            lines.append(f"\n## {r['url']}\n\n{content}")
+
+    next_offset = offset + len(page)
+    if next_offset < len(job.results) or job.status == "running":
+        lines.append(f'\nNext: crawl_results(job_id="{job.id}", offset={next_offset})')
+
+    return "\n".join(lines)
+
+
+@mcp.tool()
+async def search_docs(query: str, output_dir: str, k: int = 5) -> str:
+    """Search the pages crawl_docs saved in output_dir and return the best matching sections.
+
+    Pages are indexed by heading section while they are saved (BM25 ranking, headings
+    weigh more than body text, English words match by stem). Works on finished crawls
+    and on background crawls that are still running.
+
+    Args:
+        query: Words to search for, e.g. "deep crawl max pages"
+        output_dir: The output_dir used with crawl_docs (e.g. docs_example_com)
+        k: Maximum number of sections to return (default: 5)
+
+    Returns:
+        Ranked sections with source URL, heading path, saved file and a snippet
+        with the matching words in bold
+    """
+    try:
+        hits = query_index(output_dir, query, k)
+    except FileNotFoundError as e:
+        return str(e)
+
+    if not hits:
+        return f'No results for "{query}" in {output_dir}'
+
+    lines = [f'Top {len(hits)} results for "{query}" in {output_dir}:']
+    for i, hit in enumerate(hits, 1):
+        lines.append(
+            f"\n{i}. {hit.heading or hit.url} (score {hit.score:.2f})\n"
+            f"   URL: {hit.url}\n   File: {hit.file}\n   {hit.snippet}"
+        )
+    return "\n".join(lines)
+
+
+@mcp.tool()
+async def crawl_stats(reset: bool = False, slowest: int = 5, ctx: Context = None) -> str:
+    """Show where crawl time goes, aggregated over all crawls since the server started.
+
+    Stages: browser_launch, wait (per-host rate limiting), fetch (navigate + render
+    for browser fetches), scrape (HTML scraping and markdown generation), clean, write
+    and index (search index update).
+
+    Args:
+        reset: Clear the collected stats after reading them (default: False)
+        slowest: Number of slowest recent pages to list (default: 5)
+
+    Returns:
+        Page counts, per-stage count/mean/p50/p95/max and share of page time,
+        counters, per-host concurrency and latency, and the slowest recent pages
+        with their stage breakdown
+    """
+    metrics = get_metrics()
+    stats = metrics.snapshot(slowest=slowest)
+    if reset:
+        metrics.reset()
+
+    pages = ", ".join(f"{count} {status}" for status, count in stats["pages"].items()) or "none"
+    lines = [f"Pages: {pages}"]
+    if stats["page_total"]["count"]:
+        total = stats["page_total"]
+        lines.append(f"Page time: mean {total['mean_s']:.3f}s, p50 {total['p50_s']:.3f}s, p95 {total['p95_s']:.3f}s")
+
+    if stats["stages"]:
+        lines.append("\n| Stage | Count | Mean (s) | p50 (s) | p95 (s) | Max (s) | Share |")
+        lines.append("|-------|-------|----------|---------|---------|---------|-------|")
+        for stage, summary in stats["stages"].items():
+            share = f"{summary['share']:.0%}" if "share" in summary else ""
+            lines.append(
+                f"| {stage} | {summary['count']} | {summary['mean_s']:.3f} | {summary['p50_s']:.3f} "
+                f"| {summary['p95_s']:.3f} | {summary['max_s']:.3f} | {share} |"
+            )
+
+    if stats["counters"]:
+        lines.append("\nCounters: " + ", ".join(f"{name}={value}" for name, value in stats["counters"].items()))
+
+    shared = _get_shared(ctx) if ctx is not None else None
+    if shared is not None:
+        limits = shared.stats()
+        memory = f"{limits['memory'] / 2**20:.0f}"
+        if limits["max_memory"]:
+            memory += f"/{limits['max_memory'] / 2**20:.0f}"
+        lines.append(
+            f"\nShared limits ({len(limits['workers'])} processes): "
+            f"pages {limits['pages']}/{limits['max_pages'] or 'unlimited'}, "
+            f"browsers {limits['browsers']}/{limits['max_browsers'] or 'unlimited'}, memory {memory} MB"
+        )
+
+    hosts = _get_scheduler(ctx).stats() if ctx is not None else []
+    if hosts:
+        lines.append("\n| Host | Concurrency | Rate (/s) | Latency (s) | Requests | Errors | Crawl-delay | Blocked (s) |")
+        lines.append("|------|-------------|-----------|-------------|----------|--------|-------------|-------------|")
+        for host in hosts:
+            latency = f"{host['latency_s']:.3f}" if host["latency_s"] is not None else ""
+            lines.append(
+                f"| {host['host']} | {host['window']:g} | {host['rate']:g} | {latency} | {host['requests']} "
+                f"| {host['errors']} | {host['crawl_delay'] or ''} | {host['blocked_for_s']:g} |"
+            )
+
+    if stats["slowest"]:
+        lines.append("\n## Slowest pages")
+        for record in stats["slowest"]:
+            stages = ", ".join(f"{stage} {seconds:.3f}s" for stage, seconds in record["stages"].items())
+            lines.append(f"- {record['url']} ({record['total_s']:.3f}s, {record['status']}): {stages}")
+
+    return "\n".join(lines)
+
+
+def _format_toc(chunks: list[Chunk], max_tokens: int) -> tuple[str, int]:
+    """제목 깊이만큼 들여쓴 목차(ID, 제목, 토큰 수)를 max_tokens까지 생성
+
+    Returns:
+        목차 텍스트와 그 예상 토큰 수
+    """
+    lines, used = [], 0
+    for i, chunk in enumerate(chunks):
+        title = chunk.heading.rsplit(" > ", 1)[-1] if chunk.heading else "(intro)"
+        line = f"{'  ' * chunk.heading.count(' > ')}- `{chunk.id}` {title} (~{chunk.tokens} tokens)"
+        if lines and used + estimate_tokens(line) > max_tokens:
+            lines.append(f"- ... {len(chunks) - i} more chunks (continue with get_chunk)")
+            break
+        lines.append(line)
+        used += estimate_tokens(line) + 1
+    text = "\n".join(lines)
+    return text, estimate_tokens(text)
+
+
+def _format_chunks(url: str, chunks: list[Chunk], start: int, max_tokens: int) -> tuple[str, int]:
+    """``start``부터 페이지 순서대로 max_tokens까지의 청크(최소 한 개)와 다음 청크 안내
+
+    Returns:
+        텍스트와 포함된 청크 수
+    """
+    parts, used = [], 0
+    for chunk in chunks[start:]:
+        if parts and used + chunk.tokens > max_tokens:
+            break
+        parts.append(chunk.text)
+        used += chunk.tokens
+    shown = len(parts)
+    if start + shown < len(chunks):
+        parts.append(f'[Continue: get_chunk(url="{url}", chunk_id="{chunks[start + shown].id}")]')
+    return "\n\n".join(parts), shown
+
+
+def _format_page_line(record: dict) -> str:
+    """페이지 한 줄 요약: 깊이, URL, 파일 (증분 상태와 best_first 점수가 있으면 함께)"""
+    line = f"- [{record['depth']}] {record['url']} -> {record['file']}"
+    if "duplicate_of" in record:
+        line += f" (duplicate of {record['duplicate_of']})"
+    elif "status" in record:
+        line += f" ({record['status']})"
+    if "score" in record:
+        line += f" (score {record['score']:.2f})"
+    return line
+
+
+def _format_incremental_summary(results: CrawlResults, limit: int) -> list[str]:
+    """증분 크롤링 결과를 상태별로 묶어 요약 (unchanged 페이지는 개수만)
+
+    페이지 목록은 결과 로그에서 다시 읽으며 상태마다 최대 ``limit``개까지 보여준다.
+    """
+    counts = results.counts()
+    crawled = len(results) - counts["removed"]
+    summary = ", ".join(f"{counts[status]} {status}" for status in ("added", "changed", "unchanged", "removed"))
+    if counts["duplicate"]:
+        summary += f", {counts['duplicate']} duplicate"
+    summary_lines = [f"Crawled {crawled} pages ({summary})"]
+
+    for status in ("added", "changed", "removed"):
+        if not counts[status]:
+            continue
+        summary_lines.append(f"\n## {status.capitalize()}")
+        matching = (r for r in read_results(results.log_path.parent) if r["status"] == status)
+        summary_lines.extend(f"- {r['url']} -> {r['file']}" for r in islice(matching, limit))
+        if counts[status] > limit:
+            summary_lines.append(f"... and {counts[status] - limit} more (see {results.log_path})")
+
+    return summary_lines
+
+
+def http_app(transport: str = "streamable-http"):
+    """MCP 서버를 HTTP로 제공하는 Starlette 앱 (--workers 사용 시 uvicorn factory)
+
+    Streamable HTTP는 stateless로 실행하므로 어느 워커 프로세스든 모든 요청에 응답할 수 있다.
+    프로세스마다 시작할 때 자원(브라우저 풀, 캐시, 스케줄러)을 한 번 열어 모든 세션이 공유하고,
+    프로세스 사이의 제한은 CRAWL4AI_SHARED_STATE로 나눈다.
+    """
+    mcp.settings.stateless_http = True
+    app = mcp.streamable_http_app() if transport == "streamable-http" else mcp.sse_app()
+    session_lifespan = app.router.lifespan_context
+
+    @asynccontextmanager
+    async def lifespan(app):
+        global _http_context
+        async with _open_app_context() as app_context:
+            _http_context = app_context
+            try:
+                async with session_lifespan(app):
+                    yield
+            finally:
+                _http_context = None
+
+    app.router.lifespan_context = lifespan
+    return app
+
+
+async def _run_frontier_worker(path: str, concurrency: int) -> None:
+    """분산 딥 크롤링에 참여하여 전체 크롤링이 끝날 때까지 frontier에서 URL을 받아 처리
+
+    워커는 서버와 같은 자원(브라우저 풀, 페이지 캐시, 호스트별 제한, CRAWL4AI_SHARED_STATE)을
+    환경 변수 설정으로 만들어 사용한다.
+    """
+    from .frontier import SharedFrontier
+
+    core = await _load_crawler()
+    frontier = SharedFrontier.open(path)
+    try:
+        async with _open_app_context() as app:
+            pages = await core.crawl_frontier(
+                frontier,
+                concurrency=concurrency,
+                browser_config=_get_browser_config(False),
+                pool=app.pool,
+                cache=app.cache,
+                scheduler=app.scheduler,
+                scrape_pool=app.scrape_pool,
+            )
+    finally:
+        frontier.close()
+    print(f"✅ Frontier worker {frontier.worker} saved {pages} pages")
+
+
 def main():
-    """Entry point for the MCP server."""
-    mcp.run()
+    """MCP 서버 진입점 (기본은 stdio, --transport로 HTTP)
+
+    --frontier를 지정하면 MCP 서버 대신 딥 크롤링 워커로 실행한다.
+    """
+    parser = argparse.ArgumentParser(description="Crawl4AI MCP server")
+    parser.add_argument("--transport", choices=TRANSPORTS, default="stdio", help="MCP 전송 방식 (기본: stdio)")
+    parser.add_argument("--host", default="127.0.0.1", help="HTTP 전송 방식에서 listen할 주소")
+    parser.add_argument("--port", type=int, default=8000, help="HTTP 전송 방식에서 listen할 포트")
+    parser.add_argument(
+        "--workers", type=int, default=1, help="포트를 나눠 쓰는 서버 프로세스 수 (streamable-http만)"
+    )
+    parser.add_argument("--frontier", help="서버 대신 이 frontier 파일의 분산 딥 크롤링에 워커로 참여")
+    parser.add_argument("--concurrency", type=int, default=8, help="--frontier 워커가 동시에 가져오는 페이지 수")
+    args = parser.parse_args()
+
+    if args.frontier:
+        if args.concurrency < 1:
+            parser.error("--concurrency must be >= 1")
+        if not Path(args.frontier).exists():
+            parser.error(f"frontier not found: {args.frontier}")
+        asyncio.run(_run_frontier_worker(args.frontier, args.concurrency))
+        return
+    if args.transport == "stdio":
+        mcp.run()
+        return
+    if args.workers < 1:
+        parser.error("--workers must be >= 1")
+    if args.workers > 1 and args.transport != "streamable-http":
+        parser.error("--workers > 1 requires --transport streamable-http (SSE sessions live in one process)")
+    if args.workers > 1 and os.environ.get("CRAWL4AI_METRICS_PORT"):
+        parser.error("CRAWL4AI_METRICS_PORT cannot be used with --workers > 1 (every worker would bind it)")
+
+    # 워커 프로세스는 환경 변수를 물려받으므로 모두 같은 공유 상태 파일을 씀
+    cache_dir = Path(os.environ.get("CRAWL4AI_MCP_CACHE_DIR", DEFAULT_CACHE_DIR))
+    os.environ.setdefault("CRAWL4AI_SHARED_STATE", str(cache_dir / "state.sqlite"))
+
+    import uvicorn
+
+    if args.workers == 1:
+        uvicorn.run(http_app(args.transport), host=args.host, port=args.port, log_level="warning")
+    else:
+        uvicorn.run(
+            "crawl4ai_mcp_server.server:http_app",
+            factory=True,
+            host=args.host,
+            port=args.port,
+            workers=args.workers,
+            log_level="warning",
+        )
 
 
 if __name__ == "__main__":
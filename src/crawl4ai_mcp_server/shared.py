@@ -0,0 +1,414 @@
+"""Crawl limits and state shared by server processes through a local SQLite store."""
+
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator
+
+from .utils.sqlite import BUSY_TIMEOUT, run_with_busy_retry
+from .utils.url import normalize_url
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS leases (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    pid INTEGER NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS leases_name ON leases (name, expires_at);
+CREATE TABLE IF NOT EXISTS waiters (
+    name TEXT NOT NULL,
+    pid INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    PRIMARY KEY (name, pid)
+);
+CREATE TABLE IF NOT EXISTS hosts (
+    origin TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    refilled_at REAL NOT NULL,
+    blocked_until REAL NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS workers (
+    pid INTEGER PRIMARY KEY,
+    rss INTEGER NOT NULL,
+    started_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    pid INTEGER NOT NULL,
+    snapshot TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS chunked_pages (
+    url_key TEXT PRIMARY KEY,
+    markdown TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+# 리스 이름
+PAGES = "pages"
+BROWSERS = "browsers"
+
+
+def _rss() -> int:
+    """현재 프로세스와 자식 프로세스(Chromium 등)의 RSS 합계(바이트)"""
+    import psutil
+
+    process = psutil.Process()
+    total = process.memory_info().rss
+    for child in process.children(recursive=True):
+        try:
+            total += child.memory_info().rss
+        except psutil.Error:
+            pass
+    return total
+
+
+class SharedState:
+    """여러 서버 프로세스가 같은 SQLite 파일로 공유하는 크롤 제한과 상태
+
+    HTTP 모드의 워커 프로세스들이(또는 같은 파일을 지정한 stdio 서버들이) 한 호스트의 자원을
+    나눠 쓰도록 다음을 조정한다.
+
+    - 동시에 가져오는 페이지 수와 실행 중인 브라우저 수의 전체 상한 (프로세스별 리스)
+    - 메모리 상한: 워커들이 주기적으로 보고한 RSS(자식 프로세스 포함) 합계가 넘으면
+      진행 중인 페이지가 끝날 때까지 새 페이지를 시작하지 않음 (진행 중인 페이지가 없으면 허용)
+    - 호스트별 token bucket과 Retry-After 차단 시각 (``HostScheduler``가 사용)
+    - 백그라운드 작업 상태 (다른 워커가 시작한 작업도 조회할 수 있도록)
+    - 나눠서 보낸 페이지의 마크다운 (다른 워커가 받은 ``get_chunk``도 나머지 조각을 꺼낼 수 있도록)
+
+    리스와 워커 기록은 ``heartbeat``초마다 갱신하고 그 세 배가 지나면 만료되므로, 비정상 종료된
+    프로세스가 잡고 있던 자리는 잠시 후 다시 쓸 수 있다.
+
+    쓰기 트랜잭션은 이 객체가 가진 스레드 하나에서 실행하므로 다른 프로세스가 잠금을 잡고 있어도
+    이벤트 루프는 멈추지 않는다. 잠금이 풀리기를 기다리는 동안에는 스레드도 놓아 둔다.
+
+    Example:
+        shared = SharedState("state.sqlite", max_pages=16, max_browsers=4)
+        await shared.start()
+        async with shared.page():
+            response = await fetch()
+        await shared.close()
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_pages: int = 16,
+        max_browsers: int = 4,
+        max_memory: int = 0,
+        heartbeat: float = 2.0,
+    ):
+        """
+        Args:
+            path: SQLite 파일 경로 (공유할 프로세스들이 같은 경로를 지정)
+            max_pages: 모든 프로세스에서 동시에 가져오는 최대 페이지 수 (0이면 제한 없음)
+            max_browsers: 모든 프로세스에서 실행 중인 최대 브라우저 수 (0이면 제한 없음)
+            max_memory: 모든 프로세스의 RSS 합계 상한(바이트, 0이면 제한 없음)
+            heartbeat: 리스와 메모리 사용량을 갱신하는 간격(초)
+        """
+        self.path = Path(path)
+        self.limits = {PAGES: max_pages, BROWSERS: max_browsers}
+        self.max_memory = max_memory
+        self.heartbeat = heartbeat
+        self.pid = os.getpid()
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="shared-state")
+        self._waiting: dict[str, int] = {}
+        self._task: asyncio.Task | None = None
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _run_transaction(self, fn, *args):
+        with self._lock:
+            db = self._db()
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                result = fn(db, time.time(), *args)
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+            db.execute("COMMIT")
+        return result
+
+    async def _transaction(self, fn, *args):
+        """쓰기 잠금을 잡은 트랜잭션에서 ``fn(db, now, *args)`` 실행
+
+        트랜잭션은 전용 스레드에서 실행하고, 다른 프로세스가 잠금을 잡고 있으면 이벤트 루프에서
+        기다렸다가 다시 시도한다.
+
+        Raises:
+            sqlite3.OperationalError: ``LOCK_TIMEOUT``초 동안 잠금을 얻지 못한 경우
+        """
+        return await run_with_busy_retry(self._executor, self._run_transaction, fn, *args)
+
+    def _run_query(self, fn):
+        with self._lock:
+            return fn(self._db())
+
+    async def _query(self, fn):
+        """``fn(db)``로 조회 (전용 스레드에서)"""
+        return await run_with_busy_retry(self._executor, self._run_query, fn)
+
+    @property
+    def _expiry(self) -> float:
+        return self.heartbeat * 3
+
+    # ---- 수명 ----
+
+    async def start(self) -> None:
+        """워커 등록 후 리스와 메모리 사용량을 주기적으로 갱신"""
+        await self._transaction(self._report, await asyncio.to_thread(_rss))
+        if self._task is None:
+            self._task = asyncio.create_task(self._beat())
+
+    async def _beat(self) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat)
+            rss = await asyncio.to_thread(_rss)
+            await self._transaction(self._report, rss)
+
+    def _report(self, db: sqlite3.Connection, now: float, rss: int) -> None:
+        db.execute(
+            "INSERT INTO workers (pid, rss, started_at, updated_at) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (pid) DO UPDATE SET rss = excluded.rss, updated_at = excluded.updated_at",
+            (self.pid, rss, now, now),
+        )
+        db.execute("UPDATE leases SET expires_at = ? WHERE pid = ?", (now + self._expiry, self.pid))
+        # 비정상 종료된 프로세스의 기록 정리
+        db.execute("DELETE FROM leases WHERE expires_at < ?", (now,))
+        db.execute("DELETE FROM waiters WHERE expires_at < ?", (now,))
+        db.execute("DELETE FROM workers WHERE updated_at < ?", (now - self._expiry,))
+
+    async def close(self) -> None:
+        """이 프로세스의 리스, 대기, 워커 기록을 지우고 연결 종료"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._conn is not None:
+
+            def forget(db: sqlite3.Connection, now: float) -> None:
+                for table in ("leases", "waiters", "workers"):
+                    db.execute(f"DELETE FROM {table} WHERE pid = ?", (self.pid,))
+
+            await self._transaction(forget)
+            self._conn.close()
+            self._conn = None
+        self._executor.shutdown(wait=False)
+
+    # ---- 리스 ----
+
+    def _try_acquire(self, db: sqlite3.Connection, now: float, name: str) -> int | None:
+        limit = self.limits[name]
+        (held,) = db.execute(
+            "SELECT COUNT(*) FROM leases WHERE name = ? AND expires_at >= ?", (name, now)
+        ).fetchone()
+        if limit and held >= limit:
+            return None
+        if name == PAGES and self.max_memory and held:
+            (rss,) = db.execute(
+                "SELECT COALESCE(SUM(rss), 0) FROM workers WHERE updated_at >= ?", (now - self._expiry,)
+            ).fetchone()
+            if rss > self.max_memory:
+                return None
+        cursor = db.execute(
+            "INSERT INTO leases (name, pid, expires_at) VALUES (?, ?, ?)", (name, self.pid, now + self._expiry)
+        )
+        return cursor.lastrowid
+
+    def _set_waiting(self, db: sqlite3.Connection, now: float, name: str, waiting: bool) -> None:
+        if waiting:
+            db.execute(
+                "INSERT OR REPLACE INTO waiters (name, pid, expires_at) VALUES (?, ?, ?)",
+                (name, self.pid, now + self._expiry),
+            )
+        else:
+            db.execute("DELETE FROM waiters WHERE name = ? AND pid = ?", (name, self.pid))
+
+    async def acquire(self, name: str) -> int:
+        """리스 하나를 얻을 때까지 기다려 리스 ID 반환 (``release()``로 반납)
+
+        Args:
+            name: ``"pages"`` 또는 ``"browsers"``
+        """
+        lease = await self._transaction(self._try_acquire, name)
+        if lease is not None:
+            return lease
+
+        self._waiting[name] = self._waiting.get(name, 0) + 1
+        delay = 0.02
+        try:
+            while True:
+                await self._transaction(self._set_waiting, name, True)
+                await asyncio.sleep(delay)
+                lease = await self._transaction(self._try_acquire, name)
+                if lease is not None:
+                    return lease
+                delay = min(delay * 2, 0.5)
+        finally:
+            self._waiting[name] -= 1
+            if not self._waiting[name]:
+                # 취소된 경우에도 대기 표시를 지우도록 끝까지 실행
+                await asyncio.shield(self._transaction(self._set_waiting, name, False))
+
+    async def release(self, lease: int) -> None:
+        # 취소되더라도 리스가 만료될 때까지 자리를 잡고 있지 않도록 끝까지 실행
+        await asyncio.shield(
+            self._transaction(lambda db, now: db.execute("DELETE FROM leases WHERE id = ?", (lease,)))
+        )
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[None]:
+        """페이지 하나를 가져오는 동안 전체 동시 페이지 리스를 잡음"""
+        lease = await self.acquire(PAGES)
+        try:
+            yield
+        finally:
+            await self.release(lease)
+
+    def waiting(self, name: str) -> bool:
+        """어느 프로세스든 이 리스를 기다리고 있으면 True (유휴 브라우저를 먼저 닫는 데 사용)"""
+        with self._lock:
+            row = self._db().execute(
+                "SELECT 1 FROM waiters WHERE name = ? AND expires_at >= ? LIMIT 1", (name, time.time())
+            ).fetchone()
+        return row is not None
+
+    # ---- 호스트별 속도 제한 ----
+
+    async def take_token(self, origin: str, rate: float, burst: int) -> float:
+        """호스트의 공유 token bucket에서 토큰 하나를 꺼냄
+
+        Returns:
+            꺼냈으면 0, 아니면 다시 시도하기까지 기다릴 시간(초)
+        """
+
+        def take(db: sqlite3.Connection, now: float) -> float:
+            row = db.execute(
+                "SELECT tokens, refilled_at, blocked_until FROM hosts WHERE origin = ?", (origin,)
+            ).fetchone()
+            tokens, refilled_at, blocked_until = row if row is not None else (float(burst), now, 0.0)
+            if now < blocked_until:
+                return blocked_until - now
+            if rate <= 0:
+                return 0.0
+            tokens = min(burst, tokens + (now - refilled_at) * rate)
+            wait = 0.0 if tokens >= 1 else (1 - tokens) / rate
+            if not wait:
+                tokens -= 1
+            db.execute(
+                "INSERT OR REPLACE INTO hosts (origin, tokens, refilled_at, blocked_until) VALUES (?, ?, ?, ?)",
+                (origin, tokens, now, blocked_until),
+            )
+            return wait
+
+        return await self._transaction(take)
+
+    async def block_host(self, origin: str, seconds: float) -> None:
+        """Retry-After를 받은 호스트를 모든 프로세스에서 ``seconds``초 동안 멈춤"""
+
+        def block(db: sqlite3.Connection, now: float) -> None:
+            db.execute(
+                "INSERT INTO hosts (origin, tokens, refilled_at, blocked_until) VALUES (?, 0, ?, ?) "
+                "ON CONFLICT (origin) DO UPDATE SET blocked_until = MAX(blocked_until, excluded.blocked_until)",
+                (origin, now, now + seconds),
+            )
+
+        await self._transaction(block)
+
+    # ---- 백그라운드 작업 ----
+
+    async def put_job(self, job_id: str, snapshot: dict) -> None:
+        await self._transaction(
+            lambda db, now: db.execute(
+                "INSERT OR REPLACE INTO jobs (id, pid, snapshot, updated_at) VALUES (?, ?, ?, ?)",
+                (job_id, self.pid, json.dumps(snapshot, ensure_ascii=False), now),
+            )
+        )
+
+    def get_job(self, job_id: str) -> tuple[dict, bool] | None:
+        """다른 프로세스가 기록한 작업 상태와 그 프로세스가 살아 있는지 여부"""
+        with self._lock:
+            db = self._db()
+            row = db.execute("SELECT pid, snapshot FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if row is None:
+                return None
+            alive = db.execute(
+                "SELECT 1 FROM workers WHERE pid = ? AND updated_at >= ?", (row[0], time.time() - self._expiry)
+            ).fetchone()
+        return json.loads(row[1]), alive is not None
+
+    async def prune_jobs(self, ttl: float) -> None:
+        """``ttl``초 넘게 갱신되지 않은 작업 기록 삭제"""
+        await self._transaction(lambda db, now: db.execute("DELETE FROM jobs WHERE updated_at < ?", (now - ttl,)))
+
+    # ---- 나눠서 보낸 페이지 ----
+
+    async def put_chunked_page(self, url: str, markdown: str, ttl: float) -> None:
+        """``get_chunk``가 다른 프로세스에서도 조각을 다시 만들 수 있도록 페이지 마크다운 저장
+
+        ``ttl``초 넘게 갱신되지 않은 페이지는 함께 지운다.
+        """
+
+        def put(db: sqlite3.Connection, now: float) -> None:
+            db.execute(
+                "INSERT OR REPLACE INTO chunked_pages (url_key, markdown, updated_at) VALUES (?, ?, ?)",
+                (normalize_url(url), markdown, now),
+            )
+            db.execute("DELETE FROM chunked_pages WHERE updated_at < ?", (now - ttl,))
+
+        await self._transaction(put)
+
+    async def get_chunked_page(self, url: str, ttl: float) -> str | None:
+        """``ttl``초 안에 저장된 페이지 마크다운 (없으면 None)"""
+        row = await self._query(
+            lambda db: db.execute(
+                "SELECT markdown FROM chunked_pages WHERE url_key = ? AND updated_at >= ?",
+                (normalize_url(url), time.time() - ttl),
+            ).fetchone()
+        )
+        return row[0] if row is not None else None
+
+    # ---- 조회 ----
+
+    def stats(self) -> dict:
+        """전체 리스 사용량과 워커별 메모리"""
+        now = time.time()
+        with self._lock:
+            db = self._db()
+            held = dict(
+                db.execute("SELECT name, COUNT(*) FROM leases WHERE expires_at >= ? GROUP BY name", (now,)).fetchall()
+            )
+            workers = db.execute(
+                "SELECT pid, rss FROM workers WHERE updated_at >= ? ORDER BY pid", (now - self._expiry,)
+            ).fetchall()
+        return {
+            "pages": held.get(PAGES, 0),
+            "max_pages": self.limits[PAGES],
+            "browsers": held.get(BROWSERS, 0),
+            "max_browsers": self.limits[BROWSERS],
+            "memory": sum(rss for _, rss in workers),
+            "max_memory": self.max_memory,
+            "workers": {pid: rss for pid, rss in workers},
+        }
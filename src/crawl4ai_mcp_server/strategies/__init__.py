@@ -1,5 +1,47 @@
 """Crawling strategies for extraction and content processing."""
 
-from .content import clean_navigation_content
+from ..utils.lazy import lazy_exports
 
-__all__ = ["clean_navigation_content"]
+# 가져오기/디스패처 전략은 crawl4ai를 import하므로 처음 접근할 때 불러옴
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "clean_navigation_content": ".content",
+        "CleaningProfile": ".content",
+        "DEFAULT_PROFILE": ".content",
+        "register_profile": ".content",
+        "load_profiles": ".content",
+        "profile_for_url": ".content",
+        "DomainLimitedDispatcher": ".dispatcher",
+        "CachingCrawlerStrategy": ".fetch",
+        "UnchangedPageStrategy": ".fetch",
+        "PolitenessCrawlerStrategy": ".fetch",
+        "create_crawler": ".fetch",
+        "fetch_context": ".fetch",
+        "FETCH_MODES": ".http",
+        "HttpCrawlerStrategy": ".http",
+        "AutoCrawlerStrategy": ".http",
+        "looks_like_js_shell": ".http",
+        "ScrapeProcessPool": ".scrape",
+    },
+)
+
+__all__ = [
+    "clean_navigation_content",
+    "CleaningProfile",
+    "DEFAULT_PROFILE",
+    "register_profile",
+    "load_profiles",
+    "profile_for_url",
+    "DomainLimitedDispatcher",
+    "CachingCrawlerStrategy",
+    "UnchangedPageStrategy",
+    "PolitenessCrawlerStrategy",
+    "create_crawler",
+    "fetch_context",
+    "FETCH_MODES",
+    "HttpCrawlerStrategy",
+    "AutoCrawlerStrategy",
+    "looks_like_js_shell",
+    "ScrapeProcessPool",
+]
@@ -1,9 +1,126 @@
 """Content processing strategies."""
 
+import json
 import re
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+from urllib.parse import urlparse
+
+
+# 하단 네비게이션/푸터 시작을 나타내는 기본 패턴
+DEFAULT_FOOTER_PATTERNS = (
+    r"Was this page helpful\?",
+    r"ON THIS PAGE",
+    r"\[Next\s+.*\]",
+    r"\[Previous\s+.*\]",
+    r"Community Forum",
+    r"Discord Server",
+    r"GitHub Samples",
+    r"FigJam.*Enterprise.*Learn",
+)
+
+_HEADING_RE = re.compile(r"^[^\S\n]*#", re.MULTILINE)
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+# 구간 전체 검사로 넘어가기 전에 아래에서부터 한 줄씩 검사할 줄 수
+_FOOTER_SCAN_LINES = 64
+
+
+@dataclass(frozen=True)
+class CleaningProfile:
+    """사이트별 헤더/푸터 마커
+
+    패턴은 정규식이며 한 줄 단위로 검사한다.
+
+    Attributes:
+        name: 프로필 이름
+        domains: 적용할 도메인 (하위 도메인 포함, 비어 있으면 이름으로만 사용)
+        header_markers: 헤더의 마지막 줄 패턴. 처음 일치하는 줄 다음부터 본문으로 보고,
+            일치하는 줄이 없으면 첫 heading부터 본문으로 본다.
+        footer_markers: 푸터 시작 줄 패턴 (기본 패턴에 추가됨)
+        include_defaults: 기본 푸터 패턴도 함께 사용할지 여부
+    """
+
+    name: str
+    domains: tuple[str, ...] = ()
+    header_markers: tuple[str, ...] = ()
+    footer_markers: tuple[str, ...] = ()
+    include_defaults: bool = True
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CleaningProfile":
+        return cls(
+            name=data["name"],
+            domains=tuple(data.get("domains", ())),
+            header_markers=tuple(data.get("header_markers", ())),
+            footer_markers=tuple(data.get("footer_markers", ())),
+            include_defaults=data.get("include_defaults", True),
+        )
+
+    def matches(self, domain: str) -> bool:
+        domain = domain.lower().split(":")[0]
+        return any(domain == d or domain.endswith("." + d) for d in self.domains)
+
+
+DEFAULT_PROFILE = CleaningProfile(name="default")
+
+_profiles: dict[str, CleaningProfile] = {}
+
+
+def register_profile(profile: CleaningProfile) -> None:
+    """클리닝 프로필 등록 (같은 이름이 있으면 교체)"""
+    _profiles[profile.name] = profile
+
+
+def get_profile(name: str) -> CleaningProfile:
+    """이름으로 프로필 조회
+
+    Raises:
+        KeyError: 등록되지 않은 이름일 때
+    """
+    if name == DEFAULT_PROFILE.name:
+        return DEFAULT_PROFILE
+    return _profiles[name]
+
 
+def profile_for_url(url: str) -> CleaningProfile:
+    """URL의 도메인에 등록된 프로필 (없으면 기본 프로필)"""
+    domain = urlparse(url).netloc
+    for profile in _profiles.values():
+        if profile.matches(domain):
+            return profile
+    return DEFAULT_PROFILE
 
-def clean_navigation_content(markdown: str) -> str:
+
+def load_profiles(path: str | Path) -> list[CleaningProfile]:
+    """JSON 파일의 프로필 목록을 읽어 등록
+
+    파일 형식: ``[{"name": "...", "domains": [...], "header_markers": [...], "footer_markers": [...]}]``
+
+    Returns:
+        등록된 프로필 목록
+    """
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    profiles = [CleaningProfile.from_dict(item) for item in data]
+    for profile in profiles:
+        register_profile(profile)
+    return profiles
+
+
+def _alternation(patterns: tuple[str, ...]) -> re.Pattern | None:
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns), re.MULTILINE)
+
+
+@cache
+def _compile(profile: CleaningProfile) -> tuple[re.Pattern | None, re.Pattern | None]:
+    """프로필의 헤더/푸터 패턴을 각각 하나의 정규식으로 컴파일"""
+    footer_patterns = (DEFAULT_FOOTER_PATTERNS if profile.include_defaults else ()) + profile.footer_markers
+    return _alternation(profile.header_markers), _alternation(footer_patterns)
+
+
+def clean_navigation_content(markdown: str, profile: CleaningProfile | str | None = None) -> str:
     """마크다운에서 네비게이션 컨텐츠 제거
 
     제거 대상:
@@ -13,56 +130,57 @@ def clean_navigation_content(markdown: str) -> str:
     - 푸터 링크 (FigJam, Enterprise 등)
     - "Next/Previous" 네비게이션
 
+    줄로 나누지 않고 원본 문자열에서 줄 경계만 찾아가며, 푸터 패턴은 하나의 정규식으로
+    아래 줄부터 검사한다.
+
     Args:
         markdown: 원본 마크다운 텍스트
+        profile: 사이트 프로필 또는 등록된 프로필 이름 (기본: 기본 프로필)
 
     Returns:
         정리된 마크다운 텍스트
     """
-    lines = markdown.split("\n")
-    content_start = 0
-    content_end = len(lines)
-
-    # 첫 번째 heading 찾기
-    for i, line in enumerate(lines):
-        stripped = line.strip()
-
-        # 빈 줄이거나 리스트/링크인 경우 계속
-        if not stripped or stripped.startswith("*") or stripped.startswith("["):
-            continue
-
-        # 첫 번째 heading을 찾으면 시작점으로 설정
-        if stripped.startswith("#") and i > 0:
-            content_start = i
-            break
-
-    # 하단 네비게이션/푸터 제거를 위한 패턴
-    footer_patterns = [
-        r"Was this page helpful\?",
-        r"ON THIS PAGE",
-        r"\[Next\s+.*\]",
-        r"\[Previous\s+.*\]",
-        r"Community Forum",
-        r"Discord Server",
-        r"GitHub Samples",
-        r"FigJam.*Enterprise.*Learn",
-    ]
-
-    # 하단에서 푸터 시작점 찾기
-    for i in range(len(lines) - 1, content_start, -1):
-        line = lines[i]
-        for pattern in footer_patterns:
-            if re.search(pattern, line):
-                content_end = i
+    if isinstance(profile, str):
+        profile = get_profile(profile)
+    header_re, footer_re = _compile(profile or DEFAULT_PROFILE)
+
+    # 본문 시작: 헤더 마커 다음 줄, 없으면 두 번째 줄 이후의 첫 heading
+    start = 0
+    marker = header_re.search(markdown) if header_re is not None else None
+    if marker is not None:
+        line_end = markdown.find("\n", marker.start())
+        start = len(markdown) if line_end == -1 else line_end + 1
+    else:
+        first_line_end = markdown.find("\n")
+        if first_line_end != -1:
+            heading = _HEADING_RE.search(markdown, first_line_end + 1)
+            if heading is not None:
+                start = heading.start()
+
+    # 하단에서 푸터 시작 줄 찾기 (본문 첫 줄은 제외)
+    end = len(markdown)
+    limit = markdown.find("\n", start)
+    if footer_re is not None and limit != -1:
+        search = footer_re.search
+        line_end = len(markdown)
+        checked = 0
+        while line_end > limit:
+            # 푸터는 보통 문서 끝에 있으므로, 아래쪽 줄을 충분히 본 뒤에도 없으면
+            # 남은 구간 전체를 한 번 검사하여 일치하는 곳이 없을 때 줄 단위 검사를 끝냄
+            checked += 1
+            if checked == _FOOTER_SCAN_LINES and search(markdown, limit, line_end) is None:
+                break
+            line_start = markdown.rfind("\n", limit, line_end) + 1
+            if search(markdown, line_start, line_end) is not None:
+                end = line_start - 1
                 break
-        if content_end < len(lines):
-            break
+            line_end = line_start - 1
 
-    result = "\n".join(lines[content_start:content_end]).strip()
+    result = markdown[start:end].strip()
 
     # 추가 정리: 연속된 빈 줄을 하나로
-    result = re.sub(r"\n{3,}", "\n\n", result)
-
+    if "\n\n\n" in result:
+        result = _BLANK_LINES_RE.sub("\n\n", result)
     return result
 
 
@@ -0,0 +1,115 @@
+"""Dispatching strategies for batch crawls."""
+
+import asyncio
+import time
+import uuid
+from typing import AsyncGenerator
+from urllib.parse import urlparse
+
+from crawl4ai import AsyncWebCrawler, CrawlerRunConfig, CrawlResult, SemaphoreDispatcher
+from crawl4ai.models import CrawlerTaskResult
+
+
+class DomainLimitedDispatcher(SemaphoreDispatcher):
+    """전체 동시성과 도메인별 동시성을 함께 제한하는 디스패처
+
+    crawl4ai의 SemaphoreDispatcher는 전체 동시 실행 수만 제한한다.
+    여러 도메인이 섞인 배치에서 한 도메인에 요청이 몰리지 않도록
+    도메인별 세마포어를 추가하고, URL마다 타임아웃을 적용한다.
+    실패하거나 타임아웃된 URL은 예외 대신 실패한 CrawlResult로 반환되어
+    나머지 URL의 결과는 그대로 유지된다.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = 5,
+        per_domain_limit: int = 2,
+        timeout: float = None,
+        **kwargs,
+    ):
+        """
+        Args:
+            concurrency: 전체 최대 동시 크롤링 수
+            per_domain_limit: 도메인별 최대 동시 크롤링 수
+            timeout: URL별 타임아웃(초). None이면 제한 없음
+            **kwargs: 추가 SemaphoreDispatcher 파라미터 (rate_limiter, monitor 등)
+        """
+        super().__init__(semaphore_count=concurrency, **kwargs)
+        self.per_domain_limit = per_domain_limit
+        self.timeout = timeout
+        self._domain_semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def _domain_semaphore(self, url: str) -> asyncio.Semaphore:
+        domain = urlparse(url).netloc
+        semaphore = self._domain_semaphores.get(domain)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.per_domain_limit)
+            self._domain_semaphores[domain] = semaphore
+        return semaphore
+
+    async def crawl_url(
+        self,
+        url: str,
+        config: CrawlerRunConfig | list[CrawlerRunConfig],
+        task_id: str,
+        semaphore: asyncio.Semaphore = None,
+    ) -> CrawlerTaskResult:
+        start_time = time.time()
+        selected_config = self.select_config(url, config)
+
+        if selected_config is None:
+            result = CrawlResult(
+                url=url, html="", success=False, error_message="No matching configuration"
+            )
+        else:
+            # 도메인 슬롯을 먼저 잡아 한 도메인이 전체 슬롯을 점유하지 않도록 함
+            async with self._domain_semaphore(url), semaphore:
+                if self.rate_limiter:
+                    await self.rate_limiter.wait_if_needed(url)
+
+                try:
+                    result = await asyncio.wait_for(
+                        self.crawler.arun(url, config=selected_config), self.timeout
+                    )
+                except TimeoutError:
+                    result = CrawlResult(
+                        url=url, html="", success=False, error_message=f"Timed out after {self.timeout}s"
+                    )
+                except Exception as e:
+                    result = CrawlResult(url=url, html="", success=False, error_message=str(e))
+
+                if self.rate_limiter and result.status_code:
+                    self.rate_limiter.update_delay(url, result.status_code)
+
+        return CrawlerTaskResult(
+            task_id=task_id,
+            url=url,
+            result=result,
+            memory_usage=0.0,
+            peak_memory=0.0,
+            start_time=start_time,
+            end_time=time.time(),
+            error_message=result.error_message or "",
+        )
+
+    async def run_urls_stream(
+        self,
+        crawler: AsyncWebCrawler,
+        urls: list[str],
+        config: CrawlerRunConfig | list[CrawlerRunConfig],
+    ) -> AsyncGenerator[CrawlerTaskResult, None]:
+        """완료되는 순서대로 결과를 반환 (``stream=True`` 설정의 arun_many용)"""
+        self.crawler = crawler
+        semaphore = asyncio.Semaphore(self.semaphore_count)
+        tasks = [
+            asyncio.create_task(self.crawl_url(url, config, str(uuid.uuid4()), semaphore))
+            for url in urls
+        ]
+
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            # 소비자가 중간에 멈추면 남은 크롤링 취소
+            for task in tasks:
+                task.cancel()
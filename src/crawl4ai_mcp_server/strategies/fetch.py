@@ -0,0 +1,283 @@
+"""Fetching strategies layered around crawl4ai's crawler strategy.
+
+crawl4ai의 AsyncWebCrawler는 페이지를 가져올 때 ``crawler_strategy.crawl()``만
+호출하고, 스크래핑/마크다운 생성/딥 크롤 링크 탐색은 그 결과 HTML로 수행한다.
+이 모듈의 래퍼는 그 지점에 끼어들어 캐시된 HTML을 돌려주는 등 "가져오기" 단계만
+바꾸므로, 단일 페이지/배치/딥 크롤이 모두 같은 방식으로 동작한다.
+
+호출별 옵션(캐시 모드 등)은 ``fetch_context()``로 지정한다. contextvar를 사용하므로
+풀에서 공유되는 크롤러라도 동시에 실행되는 호출끼리 옵션이 섞이지 않는다.
+"""
+
+import asyncio
+import time
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, replace
+from html import escape
+from typing import Iterator
+
+from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig
+from crawl4ai.async_crawler_strategy import AsyncCrawlerStrategy
+from crawl4ai.models import AsyncCrawlResponse
+
+from ..cache import PageCache, cache_key
+from ..metrics import get_metrics
+from ..scheduler import HostScheduler
+from .http import FETCH_MODES, AutoCrawlerStrategy, HttpCrawlerStrategy
+from .scrape import ScrapeProcessPool
+
+# 이전 크롤 이후 바뀌지 않아 가져오기를 건너뛴 응답에 붙는 헤더
+UNCHANGED_HEADER = "x-crawl4ai-mcp-unchanged"
+
+
+@dataclass(frozen=True)
+class FetchContext:
+    """현재 호출에 적용되는 가져오기 옵션"""
+
+    cache: PageCache | None = None
+    cache_mode: str = "bypass"
+    # 가져오지 않을 페이지: 정규화된 URL(cache_key) → 이전 크롤에서 기록된 내부 링크
+    unchanged: dict[str, list[str]] = field(default_factory=dict)
+    # 호스트별 속도/동시성 제한과 재시도 (None이면 제한 없음)
+    scheduler: HostScheduler | None = None
+    # 스크래핑/마크다운 생성을 실행할 프로세스 풀 (None이면 이벤트 루프 스레드에서 실행)
+    scrape_pool: ScrapeProcessPool | None = None
+
+
+_current = ContextVar("fetch_context", default=FetchContext())
+# 현재 가져오는 페이지의 페이지 이동 완료 시각 (after_goto 훅에서 기록)
+_navigated: ContextVar[list[float] | None] = ContextVar("navigated", default=None)
+
+
+@contextmanager
+def fetch_context(**options) -> Iterator[FetchContext]:
+    """블록 안에서 실행되는 크롤링에 가져오기 옵션 적용
+
+    Example:
+        with fetch_context(cache=cache, cache_mode="prefer"):
+            result = await crawler.arun(url, config=config)
+    """
+    context = replace(_current.get(), **options)
+    token = _current.set(context)
+    try:
+        yield context
+    finally:
+        _current.reset(token)
+
+
+def current_fetch_context() -> FetchContext:
+    return _current.get()
+
+
+class DelegatingCrawlerStrategy(AsyncCrawlerStrategy):
+    """내부 crawler strategy로 모든 동작을 위임하는 기본 래퍼"""
+
+    def __init__(self, inner: AsyncCrawlerStrategy):
+        self.inner = inner
+
+    def __getattr__(self, name):
+        # browser_manager, set_hook 등 crawl4ai가 직접 접근하는 속성은 내부 전략으로 위임
+        if name == "inner":
+            raise AttributeError(name)
+        return getattr(self.inner, name)
+
+    async def __aenter__(self):
+        await self.inner.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.inner.__aexit__(exc_type, exc_val, exc_tb)
+
+    async def crawl(self, url: str, config: CrawlerRunConfig = None, **kwargs) -> AsyncCrawlResponse:
+        return await self.inner.crawl(url, config=config, **kwargs)
+
+
+class CachingCrawlerStrategy(DelegatingCrawlerStrategy):
+    """PageCache에 저장된 HTML로 네트워크 요청과 렌더링을 건너뛰는 래퍼
+
+    캐시 히트 시에도 crawl4ai가 HTML을 다시 스크래핑하므로 딥 크롤의 링크 탐색은
+    그대로 동작한다. 새로 가져온 HTML은 응답 헤더의 검증자, 가져온 방식과 함께 캐시에 저장되고,
+    렌더링이 덜 된 방식으로 가져온 항목(browser 요청에 대한 http 항목 등)은 캐시 미스로 본다.
+    """
+
+    def __init__(self, inner: AsyncCrawlerStrategy, mode: str = "browser"):
+        """
+        Args:
+            inner: 내부 전략
+            mode: 내부 전략의 가져오기 방식 ("browser", "http", "auto")
+        """
+        super().__init__(inner)
+        self.mode = mode
+
+    async def crawl(self, url: str, config: CrawlerRunConfig = None, **kwargs) -> AsyncCrawlResponse:
+        context = _current.get()
+        cache = context.cache
+        if cache is None or context.cache_mode == "bypass" or not url.startswith(("http://", "https://")):
+            return await self.inner.crawl(url, config=config, **kwargs)
+
+        entry = cache.get(url)
+        if entry is not None and entry.html_hash and entry.serves(self.mode):
+            usable = context.cache_mode == "prefer" and cache.is_fresh(entry)
+            if not usable:
+                usable = await cache.revalidate(entry)
+            if usable:
+                html = cache.read_html(entry)
+                if html:
+                    get_metrics().incr("cache_hits")
+                    return AsyncCrawlResponse(
+                        html=html,
+                        response_headers=_validator_headers(entry.etag, entry.last_modified),
+                        status_code=200,
+                        redirected_url=url,
+                    )
+
+        response = await self.inner.crawl(url, config=config, **kwargs)
+        if response.status_code == 200 and response.html:
+            # blob 쓰기와 커밋, LRU 제거가 이벤트 루프를 막지 않도록 스레드에서 실행
+            await asyncio.to_thread(cache.put_html, url, response.html, response.response_headers, fetch_mode=self.mode)
+        return response
+
+
+class PolitenessCrawlerStrategy(DelegatingCrawlerStrategy):
+    """호스트별 속도/동시성 제한과 재시도를 적용하는 래퍼
+
+    ``fetch_context(scheduler=...)``로 스케줄러가 지정된 호출에만 적용된다.
+    캐시 래퍼 안쪽에 있으므로 캐시 히트나 가져오지 않은 페이지는 제한받지 않는다.
+    """
+
+    async def crawl(self, url: str, config: CrawlerRunConfig = None, **kwargs) -> AsyncCrawlResponse:
+        scheduler = _current.get().scheduler
+        if scheduler is None or not url.startswith(("http://", "https://")):
+            return await self.inner.crawl(url, config=config, **kwargs)
+        return await scheduler.fetch(url, lambda: self.inner.crawl(url, config=config, **kwargs))
+
+
+class UnchangedPageStrategy(DelegatingCrawlerStrategy):
+    """바뀌지 않은 것으로 확인된 페이지를 가져오지 않는 래퍼
+
+    sitemap lastmod 등으로 이전 크롤 이후 바뀌지 않은 페이지는 네트워크 요청 없이
+    이전에 기록된 링크만 담은 HTML을 돌려준다. 딥 크롤은 이 링크로 하위 페이지를
+    계속 탐색하고, 호출자는 ``UNCHANGED_HEADER`` 헤더로 결과를 구분해 저장을 건너뛴다.
+    """
+
+    async def crawl(self, url: str, config: CrawlerRunConfig = None, **kwargs) -> AsyncCrawlResponse:
+        links = _current.get().unchanged.get(cache_key(url))
+        if links is None:
+            return await self.inner.crawl(url, config=config, **kwargs)
+
+        anchors = "".join(f'<a href="{escape(link)}">{escape(link)}</a>\n' for link in links)
+        return AsyncCrawlResponse(
+            html=f"<html><body>\n{anchors}</body></html>",
+            response_headers={UNCHANGED_HEADER: "1"},
+            status_code=200,
+            redirected_url=url,
+            placeholder_html=True,
+        )
+
+
+class MetricsCrawlerStrategy(DelegatingCrawlerStrategy):
+    """브라우저 실행과 페이지 가져오기 시간을 ``metrics``에 기록하는 래퍼
+
+    브라우저 전략에서는 after_goto 훅으로 페이지 이동(navigate)과 이후 렌더링 대기/HTML
+    추출(render)을 나누어 기록한다.
+    """
+
+    def __init__(self, inner: AsyncCrawlerStrategy):
+        super().__init__(inner)
+        hooks = getattr(inner, "hooks", None)
+        if isinstance(hooks, dict) and "after_goto" in hooks and hooks["after_goto"] is None:
+            inner.set_hook("after_goto", _mark_navigated)
+
+    async def __aenter__(self):
+        if not getattr(self.inner, "launches_browser", True):
+            # HTTP/auto 모드는 시작 시 브라우저를 띄우지 않음
+            await self.inner.__aenter__()
+            return self
+
+        metrics = get_metrics()
+        with metrics.stage(None, "browser_launch"):
+            await self.inner.__aenter__()
+        metrics.incr("browser_launches")
+        return self
+
+    async def crawl(self, url: str, config: CrawlerRunConfig = None, **kwargs) -> AsyncCrawlResponse:
+        metrics = get_metrics()
+        navigated = []
+        token = _navigated.set(navigated)
+        start = time.perf_counter()
+        try:
+            response = await self.inner.crawl(url, config=config, **kwargs)
+        finally:
+            end = time.perf_counter()
+            _navigated.reset(token)
+            metrics.observe(url, "fetch", end - start)
+            if navigated:
+                metrics.observe(url, "navigate", navigated[0] - start)
+                metrics.observe(url, "render", end - navigated[0])
+        if response.html and UNCHANGED_HEADER not in (response.response_headers or {}):
+            metrics.add_bytes(url, len(response.html))
+        return response
+
+
+async def _mark_navigated(page, **kwargs):
+    navigated = _navigated.get()
+    if navigated is not None and not navigated:
+        navigated.append(time.perf_counter())
+    return page
+
+
+def _instrument_processing(crawler: AsyncWebCrawler) -> None:
+    """crawl4ai의 스크래핑 + 마크다운 생성(aprocess_html) 시간을 scrape 단계로 기록
+
+    ``fetch_context(scrape_pool=...)``가 지정된 호출은 이 단계를 프로세스 풀에서 실행한다.
+    """
+    process_html = crawler.aprocess_html
+
+    async def timed_process_html(url: str, html: str, extracted_content: str, config: CrawlerRunConfig, **kwargs):
+        scrape_pool = _current.get().scrape_pool
+        with get_metrics().stage(url, "scrape"):
+            if scrape_pool is not None and not extracted_content and scrape_pool.supports(config):
+                try:
+                    return await scrape_pool.process(url, html, config, **kwargs)
+                except BrokenProcessPool:
+                    # 워커가 비정상 종료됨: 풀을 다시 만들고 이 페이지는 여기서 처리
+                    scrape_pool.reset()
+            return await process_html(url, html, extracted_content, config, **kwargs)
+
+    crawler.aprocess_html = timed_process_html
+
+
+def _validator_headers(etag: str | None, last_modified: str | None) -> dict:
+    headers = {}
+    if etag:
+        headers["etag"] = etag
+    if last_modified:
+        headers["last-modified"] = last_modified
+    return headers
+
+
+def create_crawler(browser_config: BrowserConfig, mode: str = "browser") -> AsyncWebCrawler:
+    """가져오기 래퍼가 적용된 AsyncWebCrawler 생성
+
+    Args:
+        browser_config: 브라우저 설정 (http 모드에서는 User-Agent와 헤더만 사용)
+        mode: "browser" (Playwright), "http" (브라우저 없이 HTTP),
+            "auto" (HTTP로 먼저 가져오고 JS 렌더링이 필요한 페이지만 브라우저 사용)
+    """
+    if mode not in FETCH_MODES:
+        raise ValueError(f"Invalid fetch mode: {mode} (choose from {', '.join(FETCH_MODES)})")
+
+    crawler = AsyncWebCrawler(config=browser_config)
+    strategy = crawler.crawler_strategy
+    if mode == "http":
+        strategy = HttpCrawlerStrategy(browser_config)
+    elif mode == "auto":
+        strategy = AutoCrawlerStrategy(HttpCrawlerStrategy(browser_config), browser=strategy)
+
+    crawler.crawler_strategy = MetricsCrawlerStrategy(
+        UnchangedPageStrategy(CachingCrawlerStrategy(PolitenessCrawlerStrategy(strategy), mode=mode))
+    )
+    _instrument_processing(crawler)
+    return crawler
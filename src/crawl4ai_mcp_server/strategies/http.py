@@ -0,0 +1,209 @@
+"""HTTP-only and auto (HTTP first, browser fallback) crawler strategies.
+
+정적인 문서 페이지는 브라우저 없이 HTTP로 HTML만 가져와도 같은 마크다운을 얻을 수 있다.
+여기의 전략은 crawl4ai의 ``crawler_strategy`` 자리에 들어가므로, 가져온 HTML은 기존과
+같은 LXML 스크래핑/마크다운 생성을 거친다.
+
+- http: 연결을 재사용하는 httpx 클라이언트로 가져옴 (keep-alive, 압축, h2 설치 시 HTTP/2)
+- auto: HTTP로 먼저 가져오고, JS로 렌더링되는 빈 껍데기 페이지나 봇 차단 응답일 때만
+  브라우저로 다시 가져옴. 브라우저는 처음 필요할 때 실행한다.
+"""
+
+import asyncio
+import importlib.util
+import re
+
+import httpx
+from crawl4ai import BrowserConfig, CrawlerRunConfig
+from crawl4ai.async_crawler_strategy import AsyncCrawlerStrategy
+from crawl4ai.models import AsyncCrawlResponse
+
+from ..metrics import get_metrics
+
+FETCH_MODES = ("browser", "http", "auto")
+
+# h2 패키지가 있을 때만 HTTP/2 사용 (httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+_ACCEPT = "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"
+
+# 본문이 비어 있는 SPA 마운트 지점 / JavaScript 필요 안내
+_SPA_ROOT_RE = re.compile(
+    r"<div[^>]+id=[\"'](?:root|app|__next|__nuxt|svelte|q-app)[\"'][^>]*>\s*</div>", re.IGNORECASE
+)
+_NOSCRIPT_JS_RE = re.compile(r"<noscript[^>]*>[^<]*(?:enable|requires?|need)[^<]*javascript", re.IGNORECASE)
+_INVISIBLE_RE = re.compile(r"<(script|style|noscript|template|svg)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r"<[^>]+>")
+
+# 브라우저로 다시 시도할 HTTP 상태 (봇 차단, 일시적 차단)
+_BROWSER_RETRY_STATUSES = (403, 429, 503)
+
+
+def visible_text_length(html: str) -> int:
+    """스크립트/스타일과 태그를 뺀 텍스트 길이 (공백 제외)"""
+    text = _TAG_RE.sub(" ", _INVISIBLE_RE.sub(" ", html))
+    return len("".join(text.split()))
+
+
+def looks_like_js_shell(html: str, min_text: int = 200) -> bool:
+    """JavaScript로 렌더링해야 내용이 채워지는 HTML인지 추정
+
+    보이는 텍스트가 ``min_text``자 미만이거나, 빈 SPA 마운트 지점(``<div id="root"></div>`` 등)
+    또는 "JavaScript를 켜라"는 noscript 안내가 있으면서 텍스트가 적으면 껍데기로 본다.
+    """
+    text_length = visible_text_length(html)
+    if text_length < min_text:
+        return True
+    if text_length < min_text * 5 and (_SPA_ROOT_RE.search(html) or _NOSCRIPT_JS_RE.search(html)):
+        return True
+    return False
+
+
+class HttpCrawlerStrategy(AsyncCrawlerStrategy):
+    """브라우저 없이 httpx로 HTML을 가져오는 crawler strategy
+
+    크롤러가 시작될 때 클라이언트를 만들고 종료될 때 닫으므로, 같은 크롤러의 요청은
+    호스트별 연결을 재사용한다.
+    """
+
+    launches_browser = False
+
+    def __init__(
+        self,
+        browser_config: BrowserConfig | None = None,
+        timeout: float = 30.0,
+        max_connections: int = 20,
+    ):
+        """
+        Args:
+            browser_config: User-Agent, 추가 헤더를 가져올 브라우저 설정
+            timeout: 요청 타임아웃(초)
+            max_connections: 최대 동시 연결 수
+        """
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.headers = {"Accept": _ACCEPT}
+        if browser_config is not None:
+            self.headers.update(browser_config.headers or {})
+            if browser_config.user_agent:
+                self.headers["User-Agent"] = browser_config.user_agent
+        self.hooks: dict = {}
+        self._client: httpx.AsyncClient | None = None
+
+    async def __aenter__(self):
+        self._client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            follow_redirects=True,
+            timeout=self.timeout,
+            headers=self.headers,
+            limits=httpx.Limits(max_connections=self.max_connections, max_keepalive_connections=self.max_connections),
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def update_user_agent(self, user_agent: str) -> None:
+        self.headers["User-Agent"] = user_agent
+        if self._client is not None:
+            self._client.headers["User-Agent"] = user_agent
+
+    def set_hook(self, hook_type: str, hook) -> None:
+        self.hooks[hook_type] = hook
+
+    async def crawl(self, url: str, config: CrawlerRunConfig = None, **kwargs) -> AsyncCrawlResponse:
+        if not url.startswith(("http://", "https://")):
+            raise ValueError(f"HTTP mode only supports http(s) URLs: {url}")
+        if self._client is None:
+            raise RuntimeError("HttpCrawlerStrategy is not started")
+
+        response = await self._client.get(url)
+        return AsyncCrawlResponse(
+            html=response.text,
+            response_headers=dict(response.headers),
+            status_code=response.status_code,
+            redirected_url=str(response.url),
+        )
+
+
+class AutoCrawlerStrategy(AsyncCrawlerStrategy):
+    """HTTP로 먼저 가져오고 필요할 때만 브라우저로 다시 가져오는 crawler strategy
+
+    브라우저는 처음 필요할 때 실행하므로, 정적인 사이트에서는 Chromium을 띄우지 않는다.
+    """
+
+    launches_browser = False
+
+    def __init__(self, http: HttpCrawlerStrategy, browser: AsyncCrawlerStrategy, min_text: int = 200):
+        """
+        Args:
+            http: HTTP 전략
+            browser: 대체할 브라우저 전략 (시작되지 않은 상태)
+            min_text: 이보다 보이는 텍스트가 적으면 브라우저로 다시 가져옴
+        """
+        self.http = http
+        self.browser = browser
+        self.min_text = min_text
+        self._browser_started = False
+        self._browser_lock = asyncio.Lock()
+
+    @property
+    def hooks(self) -> dict:
+        return self.browser.hooks
+
+    @property
+    def browser_manager(self):
+        return getattr(self.browser, "browser_manager", None)
+
+    def set_hook(self, hook_type: str, hook) -> None:
+        self.browser.set_hook(hook_type, hook)
+
+    def update_user_agent(self, user_agent: str) -> None:
+        self.http.update_user_agent(user_agent)
+        self.browser.update_user_agent(user_agent)
+
+    async def __aenter__(self):
+        await self.http.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.http.__aexit__(exc_type, exc_val, exc_tb)
+        if self._browser_started:
+            self._browser_started = False
+            await self.browser.__aexit__(exc_type, exc_val, exc_tb)
+
+    async def _ensure_browser(self) -> None:
+        async with self._browser_lock:
+            if self._browser_started:
+                return
+            metrics = get_metrics()
+            with metrics.stage(None, "browser_launch"):
+                await self.browser.__aenter__()
+            metrics.incr("browser_launches")
+            self._browser_started = True
+
+    def _needs_browser(self, response: AsyncCrawlResponse) -> bool:
+        if response.status_code in _BROWSER_RETRY_STATUSES:
+            return True
+        content_type = (response.response_headers or {}).get("content-type", "")
+        if content_type and "html" not in content_type:
+            return False
+        return looks_like_js_shell(response.html or "", self.min_text)
+
+    async def crawl(self, url: str, config: CrawlerRunConfig = None, **kwargs) -> AsyncCrawlResponse:
+        metrics = get_metrics()
+        try:
+            response = await self.http.crawl(url, config=config, **kwargs)
+        except (httpx.HTTPError, ValueError):
+            # 네트워크 오류나 http(s)가 아닌 URL은 브라우저로 처리
+            response = None
+
+        if response is not None and not self._needs_browser(response):
+            metrics.incr("http_fetches")
+            return response
+
+        metrics.incr("browser_fallbacks")
+        await self._ensure_browser()
+        return await self.browser.crawl(url, config=config, **kwargs)
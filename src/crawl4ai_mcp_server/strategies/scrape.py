@@ -0,0 +1,188 @@
+"""Process pool for HTML scraping and markdown generation.
+
+crawl4ai은 가져온 HTML을 ``AsyncWebCrawler.aprocess_html()``에서 이벤트 루프와 같은 스레드로
+스크래핑하고 마크다운으로 바꾼다. 순수 파이썬/lxml 작업이라 GIL에 묶여 동시성을 올려도 한 코어를
+넘지 못하므로, 이 단계만 프로세스 풀에서 실행한다. 워커에는 URL, HTML과 설정에서 뽑은 스크래핑
+옵션만 보내고 마크다운, 링크, 미디어, 메타데이터만 돌려받는다. 브라우저/HTTP 가져오기는 그대로
+이벤트 루프에서 비동기로 진행된다.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import pickle
+import re
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING
+
+from ..metrics import get_metrics
+
+if TYPE_CHECKING:
+    from crawl4ai import CrawlerRunConfig
+    from crawl4ai.models import CrawlResult
+
+# 워커로 보내지 않는 설정 (워커에서 새로 만들거나 프로세스 밖에서만 의미가 있는 객체)
+_LOCAL_ONLY = {"url", "deep_crawl_strategy", "scraping_strategy", "extraction_strategy", "markdown_generator"}
+# aprocess_html에 넘어오는 인자 중 스크래핑에 쓰이는 것
+_FORWARDED_KWARGS = ("is_raw_html", "redirected_url", "original_scheme")
+_BASE_TAG_RE = re.compile(r'<base\s[^>]*href\s*=\s*["\']([^"\']+)["\']', re.IGNORECASE)
+
+# 워커 프로세스의 설정별 (스크래핑 전략, 마크다운 생성기, 옵션)
+_worker_configs: dict[bytes, tuple] = {}
+
+
+def _load_config(payload: bytes) -> tuple:
+    config = _worker_configs.get(payload)
+    if config is None:
+        scraper_class, generator, params = pickle.loads(payload)
+        if len(_worker_configs) >= 16:
+            _worker_configs.clear()
+        config = _worker_configs[payload] = (scraper_class(), generator, params)
+    return config
+
+
+def _scrape(url: str, html: str, payload: bytes, kwargs: dict) -> tuple:
+    """워커 프로세스에서 crawl4ai ``aprocess_html``의 스크래핑 + 마크다운 생성 부분을 실행
+
+    추출 전략(LLM 등)을 쓰는 설정은 ``ScrapeProcessPool.supports()``에서 걸러지므로 다루지 않고,
+    fit_html은 마크다운 생성기의 입력으로 쓰일 때만 만든다.
+    """
+    from crawl4ai.utils import preprocess_html_for_schema, sanitize_input_encode
+
+    scraper, generator, params = _load_config(payload)
+    params = {**params, **{key: value for key, value in kwargs.items() if key not in params}}
+    try:
+        result = scraper.scrap(url, html, **params)
+    except Exception as e:
+        raise ValueError(f"Process HTML, Failed to extract content from the website: {url}, error: {e}") from None
+    if result is None:
+        raise ValueError(f"Process HTML, Failed to extract content from the website: {url}")
+
+    cleaned_html = sanitize_input_encode(result.cleaned_html)
+    media = result.media.model_dump()
+    tables = media.pop("tables", [])
+    links = result.links.model_dump()
+
+    source = getattr(generator, "content_source", "cleaned_html")
+    if source == "raw_html":
+        markdown_input = html
+    elif source == "fit_html":
+        markdown_input = preprocess_html_for_schema(html_content=html, text_threshold=500, max_size=300_000)
+    else:
+        markdown_input = cleaned_html
+    base_url = params.get("base_url") or params.get("redirected_url") or url
+    if match := _BASE_TAG_RE.search(html):
+        base_url = match.group(1)
+    markdown = generator.generate_markdown(input_html=markdown_input, base_url=base_url)
+    return markdown, links, media, tables, result.metadata
+
+
+class ScrapeProcessPool:
+    """HTML 스크래핑과 마크다운 생성을 워커 프로세스에서 실행하는 풀
+
+    ``fetch_context(scrape_pool=...)``로 지정된 호출에서 crawl4ai의 ``aprocess_html`` 대신 사용된다.
+    워커는 처음 쓸 때 ``spawn``으로 띄우고 닫을 때까지 재사용한다(이벤트 루프와 스레드가 있는
+    프로세스에서 fork하지 않음). 워커가 비정상 종료되면 풀을 다시 만들고 그 페이지는 현재
+    프로세스에서 처리한다.
+
+    결과의 ``cleaned_html``과 ``fit_html``은 돌려받지 않으므로 비어 있다(마크다운, 링크, 미디어,
+    메타데이터만 사용). 추출 전략, prefetch, link preview를 쓰는 설정은 현재 프로세스에서 처리한다.
+
+    Example:
+        scrape_pool = ScrapeProcessPool(workers=4)
+        with fetch_context(scrape_pool=scrape_pool):
+            result = await crawler.arun(url, config=config)
+        scrape_pool.close()
+    """
+
+    def __init__(self, workers: int | None = None):
+        """
+        Args:
+            workers: 워커 프로세스 수 (None이면 CPU 코어 수)
+        """
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self._executor: ProcessPoolExecutor | None = None
+        # 설정 객체별로 워커에 보낼 옵션을 한 번만 직렬화 (지원하지 않는 설정은 None)
+        self._payloads: weakref.WeakKeyDictionary["CrawlerRunConfig", bytes | None] = weakref.WeakKeyDictionary()
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    def _payload(self, config: "CrawlerRunConfig") -> bytes | None:
+        if config in self._payloads:
+            return self._payloads[config]
+
+        from crawl4ai.extraction_strategy import NoExtractionStrategy
+        from crawl4ai.markdown_generation_strategy import DefaultMarkdownGenerator
+
+        payload = None
+        extraction = config.extraction_strategy
+        if (
+            (extraction is None or isinstance(extraction, NoExtractionStrategy))
+            and not getattr(config, "prefetch", False)
+            and getattr(config, "link_preview_config", None) is None
+        ):
+            params = {}
+            for key, value in config.__dict__.items():
+                if key in _LOCAL_ONLY:
+                    continue
+                try:
+                    pickle.dumps(value)
+                except Exception:
+                    continue
+                params[key] = value
+            generator = config.markdown_generator or DefaultMarkdownGenerator()
+            try:
+                payload = pickle.dumps((type(config.scraping_strategy), generator, params))
+            except Exception:
+                payload = None
+        self._payloads[config] = payload
+        return payload
+
+    def supports(self, config: "CrawlerRunConfig") -> bool:
+        """이 설정의 처리를 워커로 보낼 수 있으면 True"""
+        return self._payload(config) is not None
+
+    async def process(self, url: str, html: str, config: "CrawlerRunConfig", **kwargs) -> "CrawlResult":
+        """워커에서 스크래핑과 마크다운 생성 후 ``aprocess_html``과 같은 형태의 결과 반환"""
+        from crawl4ai.models import CrawlResult
+
+        payload = self._payload(config)
+        screenshot = kwargs.pop("screenshot_data", None)
+        pdf = kwargs.pop("pdf_data", None)
+        kwargs = {key: value for key, value in kwargs.items() if key in _FORWARDED_KWARGS}
+        loop = asyncio.get_running_loop()
+        markdown, links, media, tables, metadata = await loop.run_in_executor(
+            self._pool(), _scrape, url, html, payload, kwargs
+        )
+        get_metrics().incr("scrape_pool_pages")
+        return CrawlResult(
+            url=url,
+            html=html,
+            markdown=markdown,
+            media=media,
+            tables=tables,
+            links=links,
+            metadata=metadata,
+            screenshot=screenshot,
+            pdf=pdf,
+            success=True,
+            error_message="",
+        )
+
+    def reset(self) -> None:
+        """비정상 종료된 워커가 있는 풀을 버리고 다음 호출에서 새로 띄움"""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def close(self) -> None:
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
@@ -1,6 +1,14 @@
 """Utility functions for crawling."""
 
 from .domain import extract_domain, extract_output_dir_name
-from .path import url_to_filepath
+from .path import FilePathRegistry, url_to_filepath
+from .url import VisitedIndex, normalize_url
 
-__all__ = ["extract_domain", "extract_output_dir_name", "url_to_filepath"]
+__all__ = [
+    "extract_domain",
+    "extract_output_dir_name",
+    "url_to_filepath",
+    "FilePathRegistry",
+    "normalize_url",
+    "VisitedIndex",
+]
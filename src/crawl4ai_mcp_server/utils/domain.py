@@ -1,10 +1,12 @@
 """Domain processing utilities."""
 
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
+
+from .url import normalize_url
 
 
 def extract_domain(url: str) -> str:
-    """URL에서 도메인 추출
+    """URL에서 도메인 추출 (소문자, 기본 포트 제외)
 
     Args:
         url: 전체 URL
@@ -12,8 +14,7 @@ def extract_domain(url: str) -> str:
     Returns:
         도메인 (예: docs.crawl4ai.com)
     """
-    parsed = urlparse(url)
-    return parsed.netloc
+    return urlsplit(normalize_url(url)).netloc
 
 
 def extract_output_dir_name(domain: str) -> str:
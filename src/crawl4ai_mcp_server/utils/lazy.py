@@ -0,0 +1,54 @@
+"""Module attributes built on first access (PEP 562 ``__getattr__``)."""
+
+import sys
+import threading
+from importlib import import_module
+from typing import Any, Callable
+
+
+def lazy_attributes(module_name: str, loaders: dict[str, Callable[[], Any]]) -> Callable[[str], Any]:
+    """모듈의 ``__getattr__``로 쓸, 속성을 처음 접근할 때 만드는 함수 반환
+
+    만든 값은 모듈 전역에 넣어 두므로 이후 접근은 일반 속성 조회다. 백그라운드 워밍업과
+    도구 호출처럼 여러 스레드에서 동시에 접근해도 속성마다 한 번만 만든다.
+
+    Args:
+        module_name: 속성을 둘 모듈 이름 (보통 ``__name__``)
+        loaders: 속성 이름별로 값을 만드는 함수
+
+    Returns:
+        모듈 전역에 ``__getattr__``로 둘 함수
+
+    Example:
+        __getattr__ = lazy_attributes(__name__, {"FAST_CONFIG": _fast_config})
+    """
+    lock = threading.RLock()
+
+    def __getattr__(name: str) -> Any:
+        loader = loaders.get(name)
+        if loader is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        namespace = sys.modules[module_name].__dict__
+        with lock:
+            if name not in namespace:
+                namespace[name] = loader()
+            return namespace[name]
+
+    return __getattr__
+
+
+def lazy_exports(package: str, exports: dict[str, str]) -> Callable[[str], Any]:
+    """패키지 ``__init__``의 re-export를 처음 접근할 때 하위 모듈에서 import하는 ``__getattr__`` 반환
+
+    Args:
+        package: 패키지 이름 (보통 ``__name__``)
+        exports: 이름별로 그 이름을 정의한 하위 모듈 (예: ``{"FAST_CONFIG": ".browser"}``)
+    """
+    return lazy_attributes(
+        package,
+        {name: _export_loader(package, module, name) for name, module in exports.items()},
+    )
+
+
+def _export_loader(package: str, module: str, name: str) -> Callable[[], Any]:
+    return lambda: getattr(import_module(module, package), name)
@@ -1,7 +1,11 @@
 """Path conversion utilities."""
 
+import threading
 from pathlib import Path
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
+
+from ..metrics import get_metrics
+from .url import normalize_url, url_hash
 
 
 def url_to_filepath(url: str, base_dir: Path) -> Path:
@@ -9,6 +13,11 @@ def url_to_filepath(url: str, base_dir: Path) -> Path:
 
     https://docs.crawl4ai.com/core/deep-crawling/ -> base_dir/core/deep-crawling.md
     https://docs.crawl4ai.com/ -> base_dir/index.md
+    https://docs.crawl4ai.com/api/index.html -> base_dir/api.md
+    https://docs.crawl4ai.com/search?q=a -> base_dir/search-<쿼리 해시>.md
+
+    정규화된 URL(``normalize_url``)을 쓰므로 같은 페이지의 변형은 같은 파일이 되고,
+    ``..`` 경로로 base_dir 밖을 가리킬 수 없다.
 
     Args:
         url: 변환할 URL
@@ -17,10 +26,61 @@ def url_to_filepath(url: str, base_dir: Path) -> Path:
     Returns:
         파일 경로 (Path 객체)
     """
-    url_path = urlparse(url).path.strip("/")
+    parts = urlsplit(normalize_url(url))
+    url_path = parts.path.strip("/")
 
     if not url_path:
         url_path = "index"
+    if parts.query:
+        # 쿼리만 다른 페이지는 다른 파일로 저장
+        url_path = f"{url_path}-{url_hash(parts.query)}"
 
     file_path = base_dir / f"{url_path}.md"
     return file_path
+
+
+class FilePathRegistry:
+    """출력 디렉토리 안에서 URL별 파일 경로를 배정하고 충돌을 해소
+
+    서로 다른 URL이 같은 파일 경로가 되면(대소문자만 다른 경로 등) 나중 URL의 파일 이름에
+    URL 해시를 붙여 구분한다. 같은 URL은 항상 같은 경로를 받는다. writer 스레드에서 함께
+    쓰므로 배정은 잠금으로 보호한다.
+
+    Example:
+        paths = FilePathRegistry(output_path)
+        paths.path_for("https://docs.example.com/API")  # output_path/API.md
+        paths.path_for("https://docs.example.com/api")  # output_path/api-1a2b3c4d.md
+    """
+
+    def __init__(self, base_dir: Path):
+        """
+        Args:
+            base_dir: 출력 디렉토리
+        """
+        self.base_dir = base_dir
+        self._by_url: dict[str, str] = {}
+        # 대소문자를 구분하지 않는 파일 시스템에서도 겹치지 않도록 casefold한 경로 → URL
+        self._owners: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def claim(self, url: str, relative_path: str) -> None:
+        """이전 크롤에서 저장된 URL의 파일 경로를 그대로 사용하도록 등록 (매니페스트 복원용)"""
+        key = normalize_url(url)
+        relative_path = Path(relative_path).as_posix()
+        with self._lock:
+            self._by_url[key] = relative_path
+            self._owners.setdefault(relative_path.casefold(), key)
+
+    def path_for(self, url: str) -> Path:
+        """URL을 저장할 파일 경로 (다른 URL과 겹치면 해시를 붙인 경로)"""
+        key = normalize_url(url)
+        with self._lock:
+            relative_path = self._by_url.get(key)
+            if relative_path is None:
+                relative_path = url_to_filepath(key, Path()).as_posix()
+                if self._owners.setdefault(relative_path.casefold(), key) != key:
+                    relative_path = f"{relative_path[:-3]}-{url_hash(key)}.md"
+                    self._owners[relative_path.casefold()] = key
+                    get_metrics().incr("path_collisions")
+                self._by_url[key] = relative_path
+        return self.base_dir / relative_path
@@ -0,0 +1,62 @@
+"""robots.txt utilities."""
+
+import httpx
+
+
+def parse_crawl_delay(text: str, user_agent: str = "*") -> float | None:
+    """robots.txt에서 user_agent에 적용되는 Crawl-delay(초)
+
+    user_agent를 포함하는 User-agent 그룹의 값을 우선하고, 없으면 ``*`` 그룹의 값을 사용한다.
+
+    Args:
+        text: robots.txt 내용
+        user_agent: 크롤러 User-Agent (그룹 이름과 부분 일치로 비교)
+
+    Returns:
+        Crawl-delay 초 (지정되지 않았으면 None)
+    """
+    delays: dict[str, float] = {}
+    agents: list[str] = []
+    in_rules = False
+    for raw_line in text.splitlines():
+        line = raw_line.split("#", 1)[0].strip()
+        key, _, value = line.partition(":")
+        key, value = key.strip().lower(), value.strip()
+        if key == "user-agent":
+            # 규칙 뒤에 나온 User-agent는 새 그룹의 시작
+            if in_rules:
+                agents, in_rules = [], False
+            agents.append(value.lower())
+        elif key:
+            in_rules = True
+            if key == "crawl-delay":
+                try:
+                    delay = float(value)
+                except ValueError:
+                    continue
+                for agent in agents:
+                    delays.setdefault(agent, delay)
+
+    user_agent = user_agent.lower()
+    for agent, delay in delays.items():
+        if agent != "*" and agent in user_agent:
+            return delay
+    return delays.get("*")
+
+
+async def fetch_crawl_delay(origin: str, user_agent: str = "*", timeout: float = 10.0) -> float | None:
+    """사이트 robots.txt의 Crawl-delay (가져오지 못하면 None)
+
+    Args:
+        origin: 스킴과 호스트 (예: https://docs.example.com)
+        user_agent: 크롤러 User-Agent
+        timeout: 요청 타임아웃(초)
+    """
+    try:
+        async with httpx.AsyncClient(follow_redirects=True, timeout=timeout) as client:
+            response = await client.get(f"{origin}/robots.txt")
+    except httpx.HTTPError:
+        return None
+    if response.status_code != 200:
+        return None
+    return parse_crawl_delay(response.text, user_agent)
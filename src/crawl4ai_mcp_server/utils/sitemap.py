@@ -0,0 +1,154 @@
+"""Sitemap discovery utilities."""
+
+import xml.etree.ElementTree as ET
+import zlib
+from datetime import datetime, timezone
+from typing import AsyncIterator
+from urllib.parse import urlparse
+
+import httpx
+
+from ..cache import cache_key
+
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+def parse_lastmod(value: str) -> float | None:
+    """W3C Datetime 형식의 lastmod를 epoch 초로 변환
+
+    2024-01-31, 2024-01-31T12:00:00Z, 2024-01-31T12:00:00+09:00 형식 지원
+    """
+    try:
+        parsed = datetime.fromisoformat(value.strip())
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def _local_name(tag: str) -> str:
+    """네임스페이스를 제외한 태그 이름 ({ns}url -> url)"""
+    return tag.rsplit("}", 1)[-1]
+
+
+async def _robots_sitemaps(client: httpx.AsyncClient, origin: str) -> list[str]:
+    """robots.txt의 Sitemap: 항목"""
+    try:
+        response = await client.get(f"{origin}/robots.txt")
+    except httpx.HTTPError:
+        return []
+    if response.status_code != 200:
+        return []
+
+    sitemaps = []
+    for line in response.text.splitlines():
+        key, _, value = line.partition(":")
+        if key.strip().lower() == "sitemap" and value.strip():
+            sitemaps.append(value.strip())
+    return sitemaps
+
+
+async def _iter_sitemap(
+    client: httpx.AsyncClient,
+    sitemap_url: str,
+) -> AsyncIterator[tuple[str, str, str | None]]:
+    """sitemap 하나를 스트리밍으로 파싱하여 ("url" | "sitemap", loc, lastmod) 반환
+
+    전체 문서를 메모리에 올리지 않고 받은 청크를 바로 파서에 넣으며,
+    gzip 압축 sitemap(.xml.gz)은 받으면서 압축을 푼다.
+    """
+    parser = ET.XMLPullParser(events=("end",))
+    decompressor = None
+    first_chunk = True
+
+    async with client.stream("GET", sitemap_url) as response:
+        if response.status_code != 200:
+            return
+
+        async for chunk in response.aiter_bytes():
+            if first_chunk:
+                # Content-Encoding 없이 gzip 파일 자체를 응답하는 경우
+                if chunk.startswith(_GZIP_MAGIC):
+                    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+                first_chunk = False
+            if decompressor is not None:
+                chunk = decompressor.decompress(chunk)
+
+            parser.feed(chunk)
+            for _, element in parser.read_events():
+                name = _local_name(element.tag)
+                if name not in ("url", "sitemap"):
+                    continue
+
+                loc, lastmod = None, None
+                for child in element:
+                    child_name = _local_name(child.tag)
+                    if child_name == "loc" and child.text:
+                        loc = child.text.strip()
+                    elif child_name == "lastmod" and child.text:
+                        lastmod = child.text.strip()
+                # 처리한 항목은 비워서 메모리 사용량을 일정하게 유지
+                element.clear()
+
+                if loc:
+                    yield name, loc, lastmod
+
+
+async def iter_sitemap_urls(
+    start_url: str,
+    timeout: float = 10.0,
+    max_sitemaps: int = 100,
+) -> AsyncIterator[tuple[str, float | None]]:
+    """사이트 sitemap의 URL을 발견하는 순서대로 반환
+
+    robots.txt의 Sitemap: 항목을 사용하고, 없으면 /sitemap.xml을 시도한다.
+    sitemap index는 하위 sitemap을 따라가며 gzip 압축 sitemap도 지원한다.
+    가져오거나 파싱하지 못한 sitemap은 건너뛴다.
+
+    Args:
+        start_url: 사이트 URL (스킴과 도메인만 사용)
+        timeout: 요청 타임아웃(초)
+        max_sitemaps: 읽을 최대 sitemap 파일 수
+
+    Yields:
+        (URL, lastmod epoch 초 또는 None)
+    """
+    parsed = urlparse(start_url)
+    origin = f"{parsed.scheme}://{parsed.netloc}"
+
+    async with httpx.AsyncClient(follow_redirects=True, timeout=timeout) as client:
+        queue = await _robots_sitemaps(client, origin) or [f"{origin}/sitemap.xml"]
+        seen = set()
+
+        while queue and len(seen) < max_sitemaps:
+            sitemap_url = queue.pop(0)
+            if sitemap_url in seen:
+                continue
+            seen.add(sitemap_url)
+
+            try:
+                async for kind, loc, lastmod in _iter_sitemap(client, sitemap_url):
+                    if kind == "sitemap":
+                        queue.append(loc)
+                    else:
+                        yield loc, parse_lastmod(lastmod) if lastmod else None
+            except (httpx.HTTPError, ET.ParseError, zlib.error):
+                continue
+
+
+async def fetch_sitemap_lastmods(start_url: str, timeout: float = 10.0) -> dict[str, float]:
+    """사이트 sitemap에서 URL별 lastmod 수집
+
+    Args:
+        start_url: 사이트 URL (스킴과 도메인만 사용)
+        timeout: 요청 타임아웃(초)
+
+    Returns:
+        정규화된 URL(cache_key) → lastmod(epoch 초)
+    """
+    lastmods = {}
+    async for url, lastmod in iter_sitemap_urls(start_url, timeout=timeout):
+        if lastmod is not None:
+            lastmods[cache_key(url)] = lastmod
+    return lastmods
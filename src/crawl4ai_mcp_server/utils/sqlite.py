@@ -0,0 +1,31 @@
+"""SQLite helpers for stores shared between processes."""
+
+import asyncio
+import sqlite3
+import time
+from concurrent.futures import Executor
+
+# 잠금을 기다리는 동안 스레드를 오래 막지 않도록 SQLite busy timeout은 짧게 두고 그 밖에서 다시 시도
+BUSY_TIMEOUT = 0.05
+# 잠금을 얻지 못해 포기하기까지의 전체 시간(초)
+LOCK_TIMEOUT = 30.0
+
+
+async def run_with_busy_retry(executor: Executor, fn, *args):
+    """``executor``에서 ``fn(*args)`` 실행 (다른 프로세스가 잠금을 잡고 있으면 이벤트 루프에서 기다렸다가 다시 시도)
+
+    Raises:
+        sqlite3.OperationalError: ``LOCK_TIMEOUT``초 동안 잠금을 얻지 못한 경우
+    """
+    loop = asyncio.get_running_loop()
+    deadline = time.monotonic() + LOCK_TIMEOUT
+    delay = 0.01
+    while True:
+        try:
+            return await loop.run_in_executor(executor, fn, *args)
+        except sqlite3.OperationalError as e:
+            # 확장 오류 코드(SQLITE_BUSY_SNAPSHOT 등)도 잠금 대기로 봄
+            if (e.sqlite_errorcode or 0) & 0xFF != sqlite3.SQLITE_BUSY or time.monotonic() >= deadline:
+                raise
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 0.2)
@@ -0,0 +1,180 @@
+"""Canonical URL normalization and a compact visited-URL index."""
+
+import hashlib
+import math
+import re
+from functools import lru_cache
+from urllib.parse import urlsplit, urlunsplit
+
+# 같은 페이지를 가리키면서 값만 바뀌는 추적용 쿼리 파라미터 (utm_*는 접두사로 처리)
+# ref처럼 흔한 이름은 문서 사이트에서 브랜치/버전 선택 등 실제 내용을 바꾸는 데도 쓰이므로 넣지 않음
+TRACKING_PARAMS = frozenset(
+    {"gclid", "dclid", "fbclid", "msclkid", "yclid", "igshid", "mc_cid", "mc_eid", "_ga", "_gl"}
+)
+# 디렉토리와 같은 페이지로 보는 인덱스 파일
+INDEX_FILES = frozenset({"index.html", "index.htm", "index.php"})
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+_PERCENT_RE = re.compile(r"%[0-9a-fA-F]{2}")
+_UNRESERVED = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-._~")
+
+
+def _normalize_percent(match: re.Match) -> str:
+    # 인코딩할 필요 없는 문자는 풀고, 나머지는 대문자 16진수로 통일
+    char = chr(int(match.group(0)[1:], 16))
+    return char if char in _UNRESERVED else match.group(0).upper()
+
+
+def _normalize_path(path: str) -> str:
+    if "%" in path:
+        path = _PERCENT_RE.sub(_normalize_percent, path)
+    segments: list[str] = []
+    for segment in path.split("/"):
+        if segment in ("", "."):
+            continue
+        if segment == "..":
+            if segments:
+                segments.pop()
+            continue
+        segments.append(segment)
+    if segments and segments[-1].lower() in INDEX_FILES:
+        segments.pop()
+    return "/" + "/".join(segments)
+
+
+def _normalize_query(query: str) -> str:
+    params = [
+        param
+        for param in query.split("&")
+        if param and not _is_tracking(param.split("=", 1)[0].lower())
+    ]
+    return "&".join(sorted(params))
+
+
+def _is_tracking(name: str) -> bool:
+    return name.startswith("utm_") or name in TRACKING_PARAMS
+
+
+@lru_cache(maxsize=65536)
+def normalize_url(url: str) -> str:
+    """같은 페이지를 가리키는 URL 변형을 하나로 모은 정규 URL
+
+    - 스킴/호스트 소문자화, 기본 포트(80/443)와 호스트 끝의 점 제거
+    - 프래그먼트 제거, ``.``/``..`` 경로와 중복 ``/`` 정리, 끝의 ``/`` 제거 (루트는 ``/``)
+    - ``index.html``/``index.htm``/``index.php``는 디렉토리와 같은 페이지로 봄
+    - 퍼센트 인코딩 통일 (불필요한 인코딩은 풀고 16진수는 대문자)
+    - 추적용 쿼리 파라미터(utm_*, gclid, fbclid 등) 제거 후 나머지는 정렬
+
+    경로의 대소문자는 서버마다 의미가 다르므로 그대로 둔다. 링크마다 반복되는 네비게이션
+    URL이 많으므로 결과를 캐시한다.
+
+    Example:
+        normalize_url("HTTPS://Docs.Example.com:443/a/./b/index.html?utm_source=x&b=2&a=1#top")
+        # "https://docs.example.com/a/b?a=1&b=2"
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    netloc = parts.netloc.lower()
+    if netloc:
+        userinfo, _, hostport = netloc.rpartition("@")
+        host, colon, port = hostport.rpartition(":") if not hostport.endswith("]") else (hostport, "", "")
+        if not colon or not port.isdigit():
+            host, port = hostport, ""
+        host = host.rstrip(".")
+        if port and int(port) == _DEFAULT_PORTS.get(scheme):
+            port = ""
+        netloc = (f"{userinfo}@" if userinfo else "") + host + (f":{port}" if port else "")
+    query = _normalize_query(parts.query) if parts.query else ""
+    return urlunsplit((scheme, netloc, _normalize_path(parts.path), query, ""))
+
+
+def url_hash(url: str, length: int = 8) -> str:
+    """정규 URL의 짧은 해시 (파일 이름 충돌 구분용)"""
+    return hashlib.blake2b(normalize_url(url).encode("utf-8"), digest_size=8).hexdigest()[:length]
+
+
+class VisitedIndex:
+    """방문한(또는 큐에 넣은) 정규 URL 집합
+
+    기본은 정규 URL의 64비트 해시를 담는 집합이다. ``capacity``를 주면 같은 개수를 약
+    1/30 메모리로 담는 Bloom filter를 쓴다. Bloom filter는 처음 보는 URL을 가끔(``error_rate``
+    확률로) 이미 본 것으로 판단하므로, 그만큼 페이지를 놓쳐도 되는 아주 큰 크롤에만 쓴다.
+
+    Example:
+        visited = VisitedIndex()
+        visited.add("https://docs.example.com/a/")       # True (처음 봄)
+        visited.add("https://docs.example.com/a?utm_source=x")  # False (같은 페이지)
+    """
+
+    # Bloom filter로 바꿀 최대 페이지 수 기준과 페이지당 예상 링크 수
+    BLOOM_MIN_PAGES = 200_000
+    LINKS_PER_PAGE = 20
+
+    def __init__(self, capacity: int | None = None, error_rate: float = 0.001):
+        """
+        Args:
+            capacity: Bloom filter에 담을 예상 URL 수 (None이면 해시 집합 사용)
+            error_rate: Bloom filter의 목표 오탐률
+        """
+        self.capacity = capacity
+        self._count = 0
+        self._hashes: set[int] | None = None
+        if capacity is None:
+            self._hashes = set()
+            return
+        bits = max(64, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self._bits = bits
+        self._rounds = max(1, round(bits / capacity * math.log(2)))
+        self._filter = bytearray((bits + 7) // 8)
+
+    @classmethod
+    def for_pages(cls, max_pages: int) -> "VisitedIndex":
+        """크롤 규모에 맞는 인덱스 (아주 큰 크롤만 Bloom filter)"""
+        if max_pages >= cls.BLOOM_MIN_PAGES:
+            return cls(capacity=max_pages * cls.LINKS_PER_PAGE)
+        return cls()
+
+    @property
+    def is_bloom(self) -> bool:
+        return self._hashes is None
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self._bits for i in range(self._rounds))
+
+    def add(self, url: str) -> bool:
+        """URL 추가 후 처음 본 URL이면 True"""
+        key = normalize_url(url)
+        if self._hashes is not None:
+            fingerprint = hash(key)
+            if fingerprint in self._hashes:
+                return False
+            self._hashes.add(fingerprint)
+            self._count += 1
+            return True
+
+        new = False
+        for position in self._positions(key):
+            byte, bit = divmod(position, 8)
+            if not self._filter[byte] & (1 << bit):
+                self._filter[byte] |= 1 << bit
+                new = True
+        self._count += new
+        return new
+
+    def __contains__(self, url: str) -> bool:
+        key = normalize_url(url)
+        if self._hashes is not None:
+            return hash(key) in self._hashes
+        return all(self._filter[position // 8] & (1 << position % 8) for position in self._positions(key))
+
+    def __len__(self) -> int:
+        return self._count
+
+    def memory_bytes(self) -> int:
+        """인덱스가 차지하는 대략적인 메모리 (해시 집합은 항목당 약 60바이트)"""
+        if self._hashes is not None:
+            return self._hashes.__sizeof__() + 32 * len(self._hashes)
+        return len(self._filter)
@@ -0,0 +1,154 @@
+"""Writer stage that cleans and saves pages off the event loop."""
+
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Awaitable, Callable, Generic, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def write_atomic(path: Path, text: str) -> None:
+    """임시 파일에 쓴 뒤 교체하여 읽는 쪽이 쓰다 만 파일을 보지 않도록 저장
+
+    임시 파일은 프로세스와 스레드마다 따로 쓰므로 같은 경로를 동시에 저장해도 서로의
+    임시 파일을 교체하지 않는다(마지막으로 교체한 내용이 남음).
+    """
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+class PageWriter(Generic[T, R]):
+    """크롤링 결과의 정리/저장을 스레드 풀에서 처리하는 단계
+
+    크롤러는 ``submit()``으로 항목을 넘기고 바로 다음 결과를 받는다. 큐가 가득 차면
+    ``submit()``이 대기하므로 디스크가 느릴 때 크롤러도 그만큼 늦춰진다(backpressure).
+    워커는 큐에 쌓인 항목을 최대 ``batch_size``개씩 묶어 스레드 풀에서 한 번에 처리하고,
+    처리 결과는 제출 순서와 상관없이 이벤트 루프에서 ``on_done``으로 전달된다.
+
+    한 항목의 처리가 예외로 끝나도 같은 배치의 다른 항목은 그대로 전달된다. 실패한 항목은
+    ``on_error``가 있으면 그 콜백으로 넘기고 계속 진행하며, 없으면 워커가 멈추고 그 예외가
+    ``submit()``이나 블록 종료 시 다시 발생한다.
+
+    Example:
+        async with PageWriter(process=write_page, on_done=record) as writer:
+            async for result in crawl_results:
+                await writer.submit(result)
+        # 블록을 정상적으로 빠져나오면 남은 항목이 모두 처리된 상태
+    """
+
+    def __init__(
+        self,
+        process: Callable[[T], R],
+        on_done: Callable[[R], Awaitable[None]],
+        on_error: Callable[[T, Exception], Awaitable[None]] | None = None,
+        max_pending: int = 64,
+        workers: int = 4,
+        batch_size: int = 8,
+    ):
+        """
+        Args:
+            process: 스레드에서 실행할 처리 함수 (정리, 파일 저장 등)
+            on_done: 처리 결과를 받는 비동기 콜백 (이벤트 루프에서 실행)
+            on_error: 처리에 실패한 항목과 예외를 받는 비동기 콜백 (None이면 실패 시 중단)
+            max_pending: 처리 대기 중인 최대 항목 수
+            workers: 동시에 처리하는 배치 수 (스레드 수)
+            batch_size: 한 번에 처리할 최대 항목 수
+        """
+        self.process = process
+        self.on_done = on_done
+        self.on_error = on_error
+        self.workers = workers
+        self.batch_size = batch_size
+        self._queue: asyncio.Queue[T] = asyncio.Queue(maxsize=max_pending)
+        self._executor: ThreadPoolExecutor | None = None
+        self._tasks: list[asyncio.Task] = []
+        self._error: BaseException | None = None
+
+    async def __aenter__(self) -> "PageWriter[T, R]":
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="page-writer")
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        try:
+            if exc_type is None:
+                # 정상 종료: 남은 항목을 모두 처리할 때까지 대기
+                await self._join()
+        finally:
+            for task in self._tasks:
+                task.cancel()
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+            self._executor.shutdown(wait=True)
+
+        if exc_type is None and self._error is not None:
+            raise self._error
+
+    async def submit(self, item: T) -> None:
+        """항목 제출 (큐가 가득 차면 자리가 날 때까지 대기)
+
+        Raises:
+            Exception: 워커가 처리 중 예외로 멈췄을 때 그 예외
+        """
+        if self._error is not None:
+            raise self._error
+        if not self._queue.full():
+            self._queue.put_nowait(item)
+            return
+
+        # 기다리는 동안 워커가 모두 멈추면 자리가 나지 않으므로 워커 종료도 함께 감시
+        put = asyncio.ensure_future(self._queue.put(item))
+        try:
+            await asyncio.wait([put, *self._tasks], return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            if not put.done():
+                put.cancel()
+        if not put.done() or put.cancelled():
+            raise self._error or RuntimeError("Page writer stopped")
+
+    async def _join(self) -> None:
+        join = asyncio.create_task(self._queue.join())
+        # 워커가 예외로 멈추면 join이 끝나지 않으므로 워커 종료도 함께 감시
+        await asyncio.wait([join, *self._tasks], return_when=asyncio.FIRST_COMPLETED)
+        join.cancel()
+
+    async def _worker(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            try:
+                results = await loop.run_in_executor(self._executor, self._process_batch, batch)
+                failure = None
+                for item, (result, error) in zip(batch, results):
+                    if error is None:
+                        await self.on_done(result)
+                    elif self.on_error is not None:
+                        await self.on_error(item, error)
+                    elif failure is None:
+                        failure = error
+                if failure is not None:
+                    raise failure
+            except Exception as e:
+                self._error = e
+                raise
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _process_batch(self, batch: list[T]) -> list[tuple[R | None, Exception | None]]:
+        """배치의 항목을 차례로 처리 (항목마다 결과 또는 예외)"""
+        results = []
+        for item in batch:
+            try:
+                results.append((self.process(item), None))
+            except Exception as e:
+                results.append((None, e))
+        return results
@@ -0,0 +1,152 @@
+"""PageCache size bookkeeping, eviction and LRU updates."""
+
+import sqlite3
+import tempfile
+import unittest
+from contextlib import closing
+from pathlib import Path
+
+from crawl4ai.models import AsyncCrawlResponse
+
+from crawl4ai_mcp_server import cache as cache_module
+from crawl4ai_mcp_server.cache import PageCache
+from crawl4ai_mcp_server.strategies.fetch import CachingCrawlerStrategy, fetch_context
+
+
+class PageCacheTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache = PageCache(self._tmp.name, max_bytes=10_000)
+
+    def tearDown(self):
+        if self.cache._conn is not None:
+            self.cache._conn.close()
+        self._tmp.cleanup()
+
+    def _totals(self) -> tuple[int, int]:
+        db = self.cache._db()
+        (kept,) = db.execute("SELECT total_bytes FROM cache_stats").fetchone()
+        (summed,) = db.execute("SELECT COALESCE(SUM(html_size + markdown_size), 0) FROM pages").fetchone()
+        return kept, summed
+
+    def test_running_total_matches_pages(self):
+        for i in range(5):
+            self.cache.put_html(f"https://example.com/{i}", "h" * 1000)
+            self.cache.put_markdown(f"https://example.com/{i}", "m" * 500)
+        # 같은 URL을 다시 저장하면 이전 크기를 빼고 새 크기를 더함
+        self.cache.put_html("https://example.com/0", "x" * 200)
+        self.cache.put_markdown("https://example.com/1", "y" * 100)
+        kept, summed = self._totals()
+        self.assertEqual(kept, summed)
+        self.assertEqual(kept, 200 + 1000 + 100 + 3 * 1500)
+
+    def test_evicts_least_recently_used_and_unreferenced_blobs(self):
+        for i in range(8):
+            self.cache.put_html(f"https://example.com/{i}", f"{i}" * 2000)
+        kept, summed = self._totals()
+        self.assertEqual(kept, summed)
+        self.assertLessEqual(kept, 10_000)
+        self.assertIsNone(self.cache.get("https://example.com/0"))
+        self.assertIsNotNone(self.cache.get("https://example.com/7"))
+        blobs = [path for path in Path(self._tmp.name, "blobs").rglob("*") if path.is_file()]
+        self.assertEqual(len(blobs), 5)
+
+    def test_existing_index_gets_its_total_on_open(self):
+        self.cache.put_html("https://example.com/a", "a" * 300)
+        db = self.cache._db()
+        db.execute("DROP TABLE cache_stats")
+        db.commit()
+        self.cache._conn.close()
+        self.cache = PageCache(self._tmp.name, max_bytes=10_000)
+        self.assertEqual(self._totals(), (300, 300))
+
+    def test_get_updates_accessed_at_only_when_stale(self):
+        url = "https://example.com/page"
+        self.cache.put_html(url, "<html></html>")
+        db = self.cache._db()
+
+        def accessed_at() -> float:
+            return db.execute("SELECT accessed_at FROM pages").fetchone()[0]
+
+        before = accessed_at()
+        self.cache.get(url)
+        self.assertEqual(accessed_at(), before)
+
+        db.execute("UPDATE pages SET accessed_at = accessed_at - ?", (cache_module._ACCESS_RESOLUTION + 1,))
+        db.commit()
+        stale = accessed_at()
+        self.cache.get(url)
+        self.assertGreater(accessed_at(), stale)
+
+    def test_blob_lookups_use_hash_indexes(self):
+        db = self.cache._db()
+        for column in ("html_hash", "markdown_hash"):
+            plan = " ".join(
+                row[-1] for row in db.execute(f"EXPLAIN QUERY PLAN SELECT 1 FROM pages WHERE {column} = ?", ("x",))
+            )
+            self.assertIn(f"pages_{column}", plan)
+
+    def test_fetch_mode_decides_which_requests_an_entry_serves(self):
+        self.cache.put_html("https://example.com/http", "<html></html>", fetch_mode="http")
+        self.cache.put_html("https://example.com/auto", "<html></html>", fetch_mode="auto")
+        self.cache.put_html("https://example.com/browser", "<html></html>", fetch_mode="browser")
+        served = {
+            fetched: [mode for mode in ("http", "auto", "browser") if self.cache.get(f"https://example.com/{fetched}").serves(mode)]
+            for fetched in ("http", "auto", "browser")
+        }
+        self.assertEqual(served, {"http": ["http"], "auto": ["http", "auto"], "browser": ["http", "auto", "browser"]})
+
+    def test_existing_index_gets_fetch_mode_column(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            with closing(sqlite3.connect(Path(tmp) / "index.sqlite")) as db:
+                db.execute(
+                    "CREATE TABLE pages (url_key TEXT PRIMARY KEY, url TEXT NOT NULL, html_hash TEXT, "
+                    "markdown_hash TEXT, etag TEXT, last_modified TEXT, fetched_at REAL NOT NULL, "
+                    "accessed_at REAL NOT NULL, html_size INTEGER NOT NULL DEFAULT 0, "
+                    "markdown_size INTEGER NOT NULL DEFAULT 0)"
+                )
+                db.execute("INSERT INTO pages VALUES ('https://example.com/', 'https://example.com/', 'x', NULL, NULL, NULL, 0, 0, 1, 0)")
+                db.commit()
+
+            cache = PageCache(tmp)
+            try:
+                entry = cache.get("https://example.com/")
+            finally:
+                cache._conn.close()
+        # 가져온 방식이 없는 이전 항목은 http로 가져온 것으로 봄
+        self.assertIsNone(entry.fetch_mode)
+        self.assertTrue(entry.serves("http"))
+        self.assertFalse(entry.serves("browser"))
+
+
+class _FakeStrategy:
+    def __init__(self):
+        self.fetched = []
+
+    async def crawl(self, url, config=None, **kwargs):
+        self.fetched.append(url)
+        return AsyncCrawlResponse(html=f"<html>{len(self.fetched)}</html>", response_headers={}, status_code=200)
+
+
+class CachingCrawlerStrategyTest(unittest.IsolatedAsyncioTestCase):
+    async def test_http_entry_is_a_miss_for_browser_requests(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = PageCache(tmp)
+            url = "https://example.com/app"
+            http, browser = _FakeStrategy(), _FakeStrategy()
+            try:
+                with fetch_context(cache=cache, cache_mode="prefer"):
+                    await CachingCrawlerStrategy(http, mode="http").crawl(url)
+                    response = await CachingCrawlerStrategy(browser, mode="browser").crawl(url)
+                    self.assertEqual((browser.fetched, response.html), ([url], "<html>1</html>"))
+                    self.assertEqual(cache.get(url).fetch_mode, "browser")
+
+                    # 렌더링된 항목은 http 요청에도 사용
+                    response = await CachingCrawlerStrategy(http, mode="http").crawl(url)
+                    self.assertEqual((len(http.fetched), response.html), (1, "<html>1</html>"))
+            finally:
+                await cache.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
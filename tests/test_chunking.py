@@ -0,0 +1,43 @@
+"""split_chunks heading boundaries and chunk ids."""
+
+import unittest
+
+from crawl4ai_mcp_server.chunking import split_chunks
+
+
+class SplitChunksTest(unittest.TestCase):
+    def test_duplicate_headings_get_unique_ids(self):
+        markdown = "\n\n".join(f"# {title}\n\ntext {i}" for i, title in enumerate(["Foo", "Foo-1", "Foo", "Foo", "Bar"]))
+        ids = [chunk.id for chunk in split_chunks(markdown)]
+        self.assertEqual(ids, ["foo", "foo-1", "foo-2", "foo-3", "bar"])
+
+    def test_headings_inside_code_fences_are_body(self):
+        markdown = (
+            "intro text\n\n"
+            "# Guide\n\n"
+            "```bash\n# install\npip install crawl4ai\n```\n\n"
+            "## Install\n\n"
+            "~~~\n# not a heading\n~~~\n"
+        )
+        chunks = split_chunks(markdown)
+        self.assertEqual([chunk.id for chunk in chunks], ["intro", "guide", "install"])
+        self.assertEqual(chunks[2].heading, "Guide > Install")
+        self.assertIn("# install\npip install crawl4ai", chunks[1].text)
+        self.assertIn("# not a heading", chunks[2].text)
+
+    def test_long_section_splits_at_paragraphs_with_unique_ids(self):
+        paragraphs = "\n\n".join("word " * 50 for _ in range(4))
+        chunks = split_chunks(f"# Foo\n\n{paragraphs}\n\n# Foo-1\n\nshort", max_tokens=100)
+        ids = [chunk.id for chunk in chunks]
+        self.assertEqual(len(ids), len(set(ids)))
+        self.assertEqual(ids[:2], ["foo", "foo-1"])
+        self.assertEqual(chunks[-1].heading, "Foo-1")
+        self.assertTrue(all(chunk.tokens <= 150 for chunk in chunks))
+
+    def test_heading_without_body_is_skipped(self):
+        chunks = split_chunks("# Guide\n## Install\n\npip install crawl4ai")
+        self.assertEqual([(chunk.id, chunk.heading) for chunk in chunks], [("install", "Guide > Install")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+"""Concurrent writes from writer threads (PageCache blobs, atomic file saves)."""
+
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from crawl4ai_mcp_server.cache import PageCache
+from crawl4ai_mcp_server.writer import write_atomic
+
+THREADS = 8
+TRIALS = 30
+
+
+def _run_together(target) -> list[BaseException]:
+    """``THREADS``개 스레드에서 ``target``을 동시에 시작하고 발생한 예외 반환"""
+    barrier = threading.Barrier(THREADS)
+    errors = []
+
+    def run():
+        barrier.wait()
+        try:
+            target()
+        except BaseException as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run) for _ in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return errors
+
+
+class ConcurrentWriteTest(unittest.TestCase):
+    def test_same_blob_from_many_threads(self):
+        # soft-404나 미러 페이지처럼 정리된 마크다운이 같은 페이지를 여러 writer 스레드가 동시에 저장
+        markdown = "# Page not found\n\n" + "This page does not exist. " * 200
+        for _ in range(TRIALS):
+            with tempfile.TemporaryDirectory() as tmp:
+                cache = PageCache(tmp)
+                self.assertEqual(_run_together(lambda: cache._write_blob(markdown)), [])
+                digest, _ = cache._write_blob(markdown)
+                self.assertEqual(cache._read_blob(digest), markdown)
+                self.assertEqual(list(Path(tmp).rglob("*.tmp")), [])
+
+    def test_write_atomic_same_path_from_many_threads(self):
+        for _ in range(TRIALS):
+            with tempfile.TemporaryDirectory() as tmp:
+                path = Path(tmp) / "index.md"
+                self.assertEqual(_run_together(lambda: write_atomic(path, "same content")), [])
+                self.assertEqual(path.read_text(encoding="utf-8"), "same content")
+                self.assertEqual(list(Path(tmp).glob("*.tmp")), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+"""CorpusWriter appending to or replacing an existing corpus.pack."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from crawl4ai_mcp_server.corpus import CorpusReader, CorpusWriter
+
+
+class CorpusWriterTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.output = Path(self._tmp.name)
+        with CorpusWriter(self.output) as corpus:
+            for i in range(3):
+                corpus.append(f"https://docs.example.com/{i}", f"page {i} " * 100)
+        self.size = (self.output / "corpus.pack").stat().st_size
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_append_keeps_previous_records(self):
+        with CorpusWriter(self.output) as corpus:
+            corpus.append("https://docs.example.com/0", "changed")
+        self.assertGreater((self.output / "corpus.pack").stat().st_size, self.size)
+        with CorpusReader(self.output) as reader:
+            self.assertEqual(len(reader), 3)
+            self.assertEqual(reader.get("https://docs.example.com/0"), "changed")
+            self.assertEqual(reader.get("https://docs.example.com/2"), "page 2 " * 100)
+
+    def test_new_pack_does_not_grow_across_runs(self):
+        reader = CorpusReader(self.output)
+        try:
+            for _ in range(3):
+                with CorpusWriter(self.output, append=False) as corpus:
+                    for i in range(3):
+                        corpus.append(f"https://docs.example.com/{i}", f"page {i} " * 100)
+                self.assertEqual((self.output / "corpus.pack").stat().st_size, self.size)
+            # 새 팩을 만들기 전에 연 reader는 이전 팩을 계속 읽음
+            self.assertEqual(reader.get("https://docs.example.com/1"), "page 1 " * 100)
+        finally:
+            reader.close()
+
+        with CorpusWriter(self.output, append=False) as corpus:
+            corpus.append("https://docs.example.com/new", "new")
+        with CorpusReader(self.output) as reader:
+            self.assertEqual([url for url, _ in reader], ["https://docs.example.com/new"])
+            self.assertIsNone(reader.get("https://docs.example.com/0"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,194 @@
+"""SharedFrontier leases, budget accounting and file path assignment."""
+
+import asyncio
+import sqlite3
+import tempfile
+import time
+import unittest
+from contextlib import closing
+from pathlib import Path
+
+from crawl4ai_mcp_server.frontier import SharedFrontier
+
+START = "https://docs.example.com/"
+
+
+class SharedFrontierTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "frontier.sqlite"
+        self.options = {"output_dir": str(Path(self._tmp.name) / "out"), "max_pages": 10, "max_depth": 2}
+        self.frontiers: list[SharedFrontier] = []
+
+    async def asyncTearDown(self):
+        for frontier in self.frontiers:
+            frontier.close()
+        self._tmp.cleanup()
+
+    def _create(self, **kwargs) -> SharedFrontier:
+        frontier = SharedFrontier.create(self.path, START, self.options, **kwargs)
+        self.frontiers.append(frontier)
+        return frontier
+
+    def _worker(self, name: str) -> SharedFrontier:
+        # 같은 프로세스에서 다른 워커처럼 보이도록 워커 ID를 바꿈
+        frontier = SharedFrontier.open(self.path)
+        frontier.worker = name
+        self.frontiers.append(frontier)
+        return frontier
+
+    def _budget(self) -> int:
+        with closing(sqlite3.connect(self.path)) as db:
+            return int(db.execute("SELECT value FROM meta WHERE key = 'budget'").fetchone()[0])
+
+    def _row(self, url: str) -> tuple:
+        with closing(sqlite3.connect(self.path)) as db:
+            return db.execute("SELECT state, worker, attempts, error FROM urls WHERE url = ?", (url,)).fetchone()
+
+    async def test_lease_in_depth_order_and_complete_queues_links(self):
+        self._create()
+        worker = self._worker("a")
+        [root] = await worker.lease(5)
+        self.assertEqual((root.url, root.depth, root.file), (START, 0, "index.md"))
+
+        await worker.complete(root.key, [START + "a", START + "b"])
+        items = await worker.lease(5)
+        self.assertEqual([item.url for item in items], [START + "a", START + "b"])
+        self.assertEqual({item.depth for item in items}, {1})
+        self.assertEqual(self._budget(), 10 - 3)
+
+        # max_depth를 넘는 링크는 큐에 넣지 않음
+        await worker.complete(items[0].key, [START + "a/deep"])
+        [deep] = await worker.lease(5)
+        await worker.complete(deep.key, [START + "a/deep/deeper"])
+        self.assertEqual(await worker.lease(5), [])
+        await worker.complete(items[1].key, [])
+        self.assertTrue(await worker.finished())
+
+        completed = await worker.completed()
+        index_file = str(Path(self.options["output_dir"]) / "index.md")
+        self.assertEqual(completed[0], {"url": START, "depth": 0, "file": index_file})
+        self.assertEqual((await worker.progress())["done"], 4)
+
+    async def test_budget_limits_leases_and_failures_refund_it(self):
+        self.options["max_pages"] = 2
+        self._create()
+        worker = self._worker("a")
+        [root] = await worker.lease(5)
+        await worker.complete(root.key, [START + "a", START + "b", START + "c"])
+        [page] = await worker.lease(5)
+        self.assertEqual(await worker.lease(5), [])
+
+        await worker.fail(page.key, "HTTP 500")
+        self.assertEqual(self._row(page.url)[0::3], (3, "HTTP 500"))
+        self.assertEqual(self._budget(), 1)
+        [retry] = await worker.lease(5)
+        self.assertNotEqual(retry.url, page.url)
+        await worker.complete(retry.key, [])
+        self.assertTrue(await worker.finished())
+
+    async def test_expired_lease_goes_to_another_worker(self):
+        self._create(lease_ttl=0.05)
+        a, b = self._worker("a"), self._worker("b")
+        [item] = await a.lease(1)
+        self.assertEqual(await b.lease(1), [])
+        self.assertFalse(await b.finished())
+
+        await asyncio.sleep(0.1)
+        [again] = await b.lease(1)
+        self.assertEqual((again.key, again.file), (item.key, item.file))
+        self.assertEqual(self._row(item.url)[:3], (1, "b", 2))
+        self.assertEqual(self._budget(), 9)
+
+        # 리스를 잃은 워커의 실패 보고는 새 리스에 영향을 주지 않음
+        await a.fail(item.key, "timeout")
+        self.assertEqual(self._row(item.url)[:2], (1, "b"))
+        self.assertEqual(self._budget(), 9)
+
+        # 먼저 끝낸 쪽의 결과를 기록하고, 나중 보고는 무시
+        await a.complete(item.key, [])
+        await b.complete(item.key, [])
+        self.assertEqual(self._row(item.url)[:2], (2, "a"))
+        self.assertEqual(self._budget(), 9)
+
+    async def test_renew_keeps_lease(self):
+        self._create(lease_ttl=0.2)
+        a, b = self._worker("a"), self._worker("b")
+        await a.lease(1)
+        for _ in range(4):
+            await asyncio.sleep(0.1)
+            await a.renew()
+            self.assertEqual(await b.lease(1), [])
+        self.assertEqual((await a.progress())["workers"], {"a": 0})
+
+    async def test_lease_expiring_too_often_fails_url(self):
+        self._create(lease_ttl=0.01, max_attempts=2)
+        worker = self._worker("a")
+        for _ in range(2):
+            [item] = await worker.lease(1)
+            await asyncio.sleep(0.05)
+        self.assertEqual(await worker.lease(1), [])
+        self.assertEqual(self._row(item.url)[0::3], (3, "Lease expired too many times"))
+        self.assertEqual(self._budget(), 10)
+        self.assertTrue(await worker.finished())
+
+    async def test_release_returns_leases_without_using_attempts(self):
+        self._create()
+        a, b = self._worker("a"), self._worker("b")
+        await a.renew()
+        [item] = await a.lease(1)
+        await a.release()
+        self.assertEqual(self._row(item.url)[:3], (0, None, 0))
+        self.assertEqual(self._budget(), 10)
+        self.assertEqual((await b.progress())["workers"], {})
+        self.assertEqual([again.key for again in await b.lease(1)], [item.key])
+
+    async def test_case_colliding_urls_get_distinct_files_across_workers(self):
+        self._create()
+        a, b = self._worker("a"), self._worker("b")
+        [root] = await a.lease(1)
+        await a.complete(root.key, [START + "API", START + "api", START + "Guide"])
+        [upper] = await a.lease(1)
+        lower, guide = await b.lease(2)
+
+        self.assertEqual(upper.file, "API.md")
+        self.assertTrue(lower.file.startswith("api-") and lower.file.endswith(".md"))
+        self.assertEqual(guide.file, "Guide.md")
+        files = [upper.file, lower.file, guide.file, root.file]
+        self.assertEqual(len({file.casefold() for file in files}), len(files))
+
+        # 다시 리스해도 같은 경로
+        await b.release()
+        self.assertEqual({item.file for item in await a.lease(5)}, {lower.file, guide.file})
+
+    async def test_create_resume_and_open(self):
+        self._create()
+        with self.assertRaises(ValueError):
+            SharedFrontier.create(self.path, "https://other.example.com/", self.options, resume=True)
+        resumed = self._create(resume=True)
+        self.assertEqual(resumed.start_url, START)
+        with self.assertRaises(FileNotFoundError):
+            SharedFrontier.open(Path(self._tmp.name) / "missing.sqlite")
+
+    async def test_event_loop_keeps_running_while_another_worker_holds_the_lock(self):
+        self._create()
+        worker = self._worker("a")
+        other = sqlite3.connect(self.path, isolation_level=None)
+        other.execute("BEGIN IMMEDIATE")
+        try:
+            lease = asyncio.ensure_future(worker.lease(1))
+            start = time.monotonic()
+            ticks = 0
+            while time.monotonic() - start < 0.5:
+                await asyncio.sleep(0.01)
+                ticks += 1
+            self.assertFalse(lease.done())
+            self.assertGreater(ticks, 20)
+        finally:
+            other.execute("COMMIT")
+            other.close()
+        self.assertEqual(len(await asyncio.wait_for(lease, timeout=5)), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
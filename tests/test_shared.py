@@ -0,0 +1,81 @@
+"""SharedState writes while another process holds the SQLite write lock."""
+
+import asyncio
+import sqlite3
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from crawl4ai_mcp_server.shared import SharedState
+
+
+class SharedStateLockTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "state.sqlite"
+        self.shared = SharedState(self.path)
+        await self.shared.start()
+        # 다른 프로세스가 쓰기 트랜잭션을 잡고 있는 상황
+        self.other = sqlite3.connect(self.path, isolation_level=None)
+        self.other.execute("BEGIN IMMEDIATE")
+
+    async def asyncTearDown(self):
+        if self.other.in_transaction:
+            self.other.execute("ROLLBACK")
+        self.other.close()
+        await self.shared.close()
+        self._tmp.cleanup()
+
+    async def test_event_loop_keeps_running_while_waiting_for_lock(self):
+        take = asyncio.ensure_future(self.shared.take_token("https://example.com", 1.0, 1))
+        start = time.monotonic()
+        ticks = 0
+        while time.monotonic() - start < 0.5:
+            await asyncio.sleep(0.01)
+            ticks += 1
+        self.assertFalse(take.done())
+        self.assertGreater(ticks, 20)
+
+        self.other.execute("COMMIT")
+        self.assertEqual(await asyncio.wait_for(take, timeout=5), 0)
+
+    async def test_cancelled_release_still_frees_lease(self):
+        self.other.execute("ROLLBACK")
+        lease = await self.shared.acquire("pages")
+        self.other.execute("BEGIN IMMEDIATE")
+
+        release = asyncio.ensure_future(self.shared.release(lease))
+        await asyncio.sleep(0.1)
+        release.cancel()
+        self.other.execute("COMMIT")
+
+        for _ in range(100):
+            if self.shared.stats()["pages"] == 0:
+                break
+            await asyncio.sleep(0.05)
+        self.assertEqual(self.shared.stats()["pages"], 0)
+
+
+class SharedChunkedPageTest(unittest.IsolatedAsyncioTestCase):
+    async def test_other_process_reads_chunked_page_until_it_expires(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "state.sqlite"
+            first, second = SharedState(path), SharedState(path)
+            try:
+                await first.put_chunked_page("https://example.com/guide/?utm_source=x", "# Guide\n\ntext", ttl=60)
+                self.assertEqual(await second.get_chunked_page("https://example.com/guide", ttl=60), "# Guide\n\ntext")
+                self.assertIsNone(await second.get_chunked_page("https://example.com/other", ttl=60))
+
+                await asyncio.sleep(0.05)
+                self.assertIsNone(await second.get_chunked_page("https://example.com/guide", ttl=0.01))
+                # 저장할 때 오래된 페이지는 지워짐
+                await second.put_chunked_page("https://example.com/other", "other", ttl=0.01)
+                self.assertIsNone(await first.get_chunked_page("https://example.com/guide", ttl=60))
+            finally:
+                await first.close()
+                await second.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+"""URL normalization, the visited-URL index and file path assignment."""
+
+import unittest
+from pathlib import Path
+
+from crawl4ai_mcp_server.utils.path import FilePathRegistry
+from crawl4ai_mcp_server.utils.url import VisitedIndex, normalize_url
+
+
+class NormalizeUrlTest(unittest.TestCase):
+    def test_collapses_variants_of_the_same_page(self):
+        expected = "https://docs.example.com/a/b?a=1&b=2"
+        for url in (
+            "HTTPS://Docs.Example.com:443/a/./b/index.html?utm_source=x&b=2&a=1#top",
+            "https://docs.example.com./a//b/?a=1&gclid=abc&b=2",
+            "https://docs.example.com/a/c/../b/?b=2&a=1",
+        ):
+            self.assertEqual(normalize_url(url), expected, url)
+
+    def test_root_port_and_percent_encoding(self):
+        self.assertEqual(normalize_url("http://example.com"), "http://example.com/")
+        self.assertEqual(normalize_url("http://example.com:8080/"), "http://example.com:8080/")
+        self.assertEqual(normalize_url("https://example.com/%7euser/a%2fb"), "https://example.com/~user/a%2Fb")
+
+    def test_keeps_path_case_and_content_params(self):
+        self.assertEqual(normalize_url("https://example.com/API"), "https://example.com/API")
+        # ref는 브랜치/버전 선택에 쓰이므로 추적용 파라미터로 보지 않음
+        self.assertEqual(
+            normalize_url("https://example.com/docs?ref=v2&ref_src=nav"), "https://example.com/docs?ref=v2&ref_src=nav"
+        )
+        self.assertNotEqual(normalize_url("https://example.com/docs?ref=v1"), normalize_url("https://example.com/docs?ref=v2"))
+
+
+class VisitedIndexTest(unittest.TestCase):
+    def _check(self, visited: VisitedIndex) -> None:
+        self.assertTrue(visited.add("https://docs.example.com/a/"))
+        self.assertFalse(visited.add("https://docs.example.com/a?utm_source=x"))
+        self.assertTrue(visited.add("https://docs.example.com/b"))
+        self.assertIn("https://docs.example.com/a#intro", visited)
+        self.assertNotIn("https://docs.example.com/c", visited)
+        self.assertEqual(len(visited), 2)
+
+    def test_hash_set(self):
+        visited = VisitedIndex()
+        self.assertFalse(visited.is_bloom)
+        self._check(visited)
+
+    def test_bloom_filter(self):
+        visited = VisitedIndex(capacity=1000)
+        self.assertTrue(visited.is_bloom)
+        self._check(visited)
+
+        urls = [f"https://docs.example.com/page/{i}" for i in range(1000)]
+        self.assertEqual(sum(visited.add(url) for url in urls), 1000)
+        self.assertTrue(all(url in visited for url in urls))
+        unseen = sum(f"https://docs.example.com/other/{i}" in visited for i in range(1000))
+        self.assertLess(unseen, 20)
+
+    def test_for_pages_uses_bloom_only_for_huge_crawls(self):
+        self.assertFalse(VisitedIndex.for_pages(1000).is_bloom)
+        self.assertTrue(VisitedIndex.for_pages(VisitedIndex.BLOOM_MIN_PAGES).is_bloom)
+
+
+class FilePathRegistryTest(unittest.TestCase):
+    def setUp(self):
+        self.base = Path("out")
+        self.paths = FilePathRegistry(self.base)
+
+    def test_path_for_maps_url_to_markdown_file(self):
+        self.assertEqual(self.paths.path_for("https://docs.example.com/"), self.base / "index.md")
+        self.assertEqual(self.paths.path_for("https://docs.example.com/core/deep/"), self.base / "core/deep.md")
+        self.assertEqual(self.paths.path_for("https://docs.example.com/api/index.html"), self.base / "api.md")
+        search = self.paths.path_for("https://docs.example.com/search?q=a")
+        self.assertRegex(search.as_posix(), r"^out/search-[0-9a-f]{8}\.md$")
+        # 같은 페이지의 변형은 같은 파일
+        self.assertEqual(self.paths.path_for("https://docs.example.com/core/deep?utm_source=x"), self.base / "core/deep.md")
+
+    def test_case_colliding_urls_get_distinct_paths(self):
+        upper = self.paths.path_for("https://docs.example.com/API")
+        lower = self.paths.path_for("https://docs.example.com/api")
+        self.assertEqual(upper, self.base / "API.md")
+        self.assertRegex(lower.as_posix(), r"^out/api-[0-9a-f]{8}\.md$")
+        self.assertEqual(self.paths.path_for("https://docs.example.com/api/"), lower)
+
+    def test_claim_keeps_previous_path_and_reserves_it(self):
+        self.paths.claim("https://docs.example.com/api", "api-old.md")
+        self.paths.claim("https://docs.example.com/Guide", "guide.md")
+        self.assertEqual(self.paths.path_for("https://docs.example.com/api"), self.base / "api-old.md")
+        self.assertEqual(self.paths.path_for("https://docs.example.com/Guide"), self.base / "guide.md")
+        # 이미 배정된 경로와 겹치는 새 URL은 해시를 붙인 경로를 받음
+        other = self.paths.path_for("https://docs.example.com/guide")
+        self.assertRegex(other.as_posix(), r"^out/guide-[0-9a-f]{8}\.md$")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+"""PageWriter failure handling: per-item errors and producers blocked on a full queue."""
+
+import asyncio
+import threading
+import unittest
+
+from crawl4ai_mcp_server.writer import PageWriter
+
+
+def _process(item: int) -> int:
+    if item == 3:
+        raise OSError(f"cannot write {item}")
+    return item
+
+
+class PageWriterTest(unittest.IsolatedAsyncioTestCase):
+    async def test_failed_item_does_not_drop_its_batch(self):
+        done, failed = [], []
+
+        async def on_done(result: int) -> None:
+            done.append(result)
+
+        async def on_error(item: int, error: Exception) -> None:
+            failed.append((item, type(error)))
+
+        async with PageWriter(process=_process, on_done=on_done, on_error=on_error, workers=1, batch_size=8) as writer:
+            for item in range(8):
+                await writer.submit(item)
+
+        self.assertEqual(sorted(done), [0, 1, 2, 4, 5, 6, 7])
+        self.assertEqual(failed, [(3, OSError)])
+
+    async def test_failure_without_on_error_stops_after_delivering_batch(self):
+        done = []
+
+        async def on_done(result: int) -> None:
+            done.append(result)
+
+        with self.assertRaises(OSError):
+            async with PageWriter(process=_process, on_done=on_done, workers=1, batch_size=8) as writer:
+                for item in range(8):
+                    await writer.submit(item)
+        self.assertEqual(sorted(done), [0, 1, 2, 4, 5, 6, 7])
+
+    async def test_submit_raises_instead_of_hanging_when_workers_stop(self):
+        release = threading.Event()
+
+        def process(item: int) -> int:
+            release.wait(5)
+            raise OSError("disk full")
+
+        async def on_done(result: int) -> None:
+            pass
+
+        async def produce(writer: PageWriter) -> None:
+            for item in range(10):
+                await writer.submit(item)
+
+        # submit()이 가득 찬 큐에서 기다리기 시작한 뒤에 워커를 실패시킴
+        asyncio.get_running_loop().call_later(0.2, release.set)
+        timed_out = False
+        with self.assertRaises(OSError):
+            async with PageWriter(process=process, on_done=on_done, max_pending=1, workers=1, batch_size=1) as writer:
+                try:
+                    await asyncio.wait_for(produce(writer), timeout=5)
+                except TimeoutError:
+                    timed_out = True
+                    raise
+        self.assertFalse(timed_out)
+
+
+if __name__ == "__main__":
+    unittest.main()